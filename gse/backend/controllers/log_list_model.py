@@ -0,0 +1,187 @@
+r"""
+\file log_list_model.py
+\brief Modelo de lista (QAbstractListModel) dos logs exibidos na UI.
+
+\details
+Expõe ao QML as últimas entradas de log (\c LogRingBuffer) como linhas de
+um \c ListView, que só desenha as linhas visíveis, em vez de concatenar
+cada mensagem em um \c TextArea cada vez maior. As mensagens recebidas
+são acumuladas e inseridas em lote a cada \c LOG_MODEL_FLUSH_MS; o filtro
+por nível mínimo e por alvo é aplicado no Python.
+"""
+
+import datetime
+
+from PySide6.QtCore import (
+    Property,
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
+
+from backend.logsGSE.log_buffer import LOG_BUFFER_CAPACITY, LogRingBuffer, make_entry
+from backend.logsGSE.log_levels import TRACE, level_name, parse_log_level
+
+# ============================================================================
+# REQ: GSE-HLR-91: Intervalo de Inserção em Lote
+# Descrição: Intervalo (ms) entre a chegada da primeira mensagem de um lote e
+#            sua inserção no modelo.
+# ============================================================================
+LOG_MODEL_FLUSH_MS = 100
+
+
+class LogListModel(QAbstractListModel):
+    r"""
+    \class LogListModel
+    \brief Entradas de log visíveis (buffer circular filtrado) para o QML.
+
+    \details
+    Papéis: \c timestamp (s desde a época), \c time (``HH:MM:SS.mmm``),
+    \c level (nome do nível), \c source (alvo ou ``GSE``), \c text e
+    \c display (linha completa).
+    """
+
+    TimestampRole = Qt.UserRole + 1
+    TimeRole = Qt.UserRole + 2
+    LevelRole = Qt.UserRole + 3
+    SourceRole = Qt.UserRole + 4
+    TextRole = Qt.UserRole + 5
+
+    countChanged = Signal()
+    filterChanged = Signal()
+
+    def __init__(
+        self,
+        capacity: int = LOG_BUFFER_CAPACITY,
+        flush_interval_ms: int = LOG_MODEL_FLUSH_MS,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._buffer = LogRingBuffer(capacity)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    # --- QAbstractListModel ---------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._buffer)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._buffer):
+            return None
+        entry = self._buffer[index.row()]
+        if role == self.TextRole:
+            return entry.text
+        if role == self.TimeRole or role == Qt.DisplayRole:
+            now = datetime.datetime.fromtimestamp(entry.timestamp)
+            stamp = f"{now:%H:%M:%S}.{now.microsecond // 1000:03d}"
+            if role == self.TimeRole:
+                return stamp
+            return f"[{stamp}] [{entry.source}] {entry.text}"
+        if role == self.LevelRole:
+            return level_name(entry.level)
+        if role == self.SourceRole:
+            return entry.source
+        if role == self.TimestampRole:
+            return entry.timestamp
+        return None
+
+    def roleNames(self):
+        return {
+            Qt.DisplayRole: QByteArray(b"display"),
+            self.TimestampRole: QByteArray(b"timestamp"),
+            self.TimeRole: QByteArray(b"time"),
+            self.LevelRole: QByteArray(b"level"),
+            self.SourceRole: QByteArray(b"source"),
+            self.TextRole: QByteArray(b"text"),
+        }
+
+    # --- Inserção em lote -----------------------------------------------------
+
+    # ============================================================================
+    # REQ: GSE-HLR-91: Inserção de Mensagens no Modelo
+    # Descrição: appendMessage(message) deve apenas acumular a entrada e
+    #   agendar o flush; flush() deve remover do início as linhas descartadas
+    #   pela capacidade e inserir ao fim as novas linhas visíveis, cada um em
+    #   um único par begin/end, emitindo countChanged.
+    # ============================================================================
+    @Slot(str)
+    def appendMessage(self, message: str):
+        self._buffer.append(make_entry(message))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def flush(self):
+        self._timer.stop()
+        removed, inserted = self._buffer.flush(apply=False)
+        if not removed and not inserted:
+            return
+        if removed:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            self._buffer.remove_visible(removed)
+            self.endRemoveRows()
+        if inserted:
+            first = len(self._buffer)
+            self.beginInsertRows(QModelIndex(), first, first + len(inserted) - 1)
+            self._buffer.extend_visible(inserted)
+            self.endInsertRows()
+        self.countChanged.emit()
+
+    @Slot()
+    def clear(self):
+        self.beginResetModel()
+        self._buffer.clear()
+        self.endResetModel()
+        self.countChanged.emit()
+
+    # --- Filtro ---------------------------------------------------------------
+
+    # ============================================================================
+    # REQ: GSE-HLR-91: Filtro de Logs (Slots)
+    # Descrição: setMinLevel(name) e setSourceFilter(source) ("" = todos os
+    #   alvos) devem refiltrar o buffer no Python e reiniciar o modelo;
+    #   sources() lista os alvos presentes para a seleção na UI.
+    # ============================================================================
+    def _get_min_level(self) -> str:
+        return level_name(self._buffer.min_level)
+
+    @Slot(str)
+    def setMinLevel(self, name: str):
+        self._apply_filter(parse_log_level(name) if name else TRACE, self._buffer.source)
+
+    def _get_source_filter(self) -> str:
+        return self._buffer.source or ""
+
+    @Slot(str)
+    def setSourceFilter(self, source: str):
+        self._apply_filter(self._buffer.min_level, source or None)
+
+    def _apply_filter(self, min_level, source):
+        self.beginResetModel()
+        self._buffer.set_filter(min_level, source)
+        self.endResetModel()
+        self.filterChanged.emit()
+        self.countChanged.emit()
+
+    @Slot(result=list)
+    def sources(self) -> list:
+        self.flush()
+        return self._buffer.sources()
+
+    def _get_count(self) -> int:
+        return len(self._buffer)
+
+    def _get_capacity(self) -> int:
+        return self._buffer.capacity
+
+    minLevel = Property(str, _get_min_level, setMinLevel, notify=filterChanged)
+    sourceFilter = Property(str, _get_source_filter, setSourceFilter, notify=filterChanged)
+    count = Property(int, _get_count, notify=countChanged)
+    capacity = Property(int, _get_capacity, constant=True)
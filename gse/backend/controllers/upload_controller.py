@@ -12,13 +12,33 @@ em uma thread separada.
 
 import os
 import shutil  # Importado para operações de cópia de arquivo
-from PySide6.QtCore import QObject, QThreadPool, Signal, Slot, QCoreApplication
+import threading
+from PySide6.QtCore import QObject, QThreadPool, Signal, Slot, QCoreApplication, Property
 
 # Importa o novo Worker e os Sinais
 from backend.workers.arinc_worker import ArincWorker, WorkerSignals
+from backend.workers.fleet_worker import FleetWorker, FleetWorkerSignals
 
 # Importa o logger de arquivo
+from backend.controllers.log_list_model import LogListModel
 from backend.logsGSE.gse_logger import GseLogger
+from backend.logsGSE.log_index import LogIndex
+from backend.logsGSE.log_levels import (
+    ERROR,
+    INFO,
+    get_log_level,
+    level_name,
+    level_of,
+    set_log_level,
+)
+
+# Cache persistente de SHA-256 das imagens importadas
+from backend.protocols.hash_cache import HASH_CACHE_FILENAME, HashCache
+from backend.protocols.resume_checkpoint import (
+    CHECKPOINT_FILENAME,
+    TransferCheckpointStore,
+)
+from backend.protocols.fleet_upload import FLEET_MAX_CONCURRENCY
 
 # ============================================================================
 # REQ: GSE-LLR-151: Constante de Armazenamento Interno
@@ -76,6 +96,24 @@ class UploadController(QObject):
     transferFinished = Signal(bool)
     fileDetailsReady = Signal(str, str)
 
+    # ============================================================================
+    # REQ: GSE-HLR-102: Sinais do Upload em Frota (UI)
+    # Descrição: fleetTargetProgress(str, int) e fleetTargetFinished(str, bool)
+    #   reportam cada alvo; fleetSummaryReady(list) entrega a tabela de
+    #   resultados (uma linha por alvo) ao fim da frota. O progresso agregado
+    #   usa progressChanged e o fim, transferFinished.
+    # ============================================================================
+    fleetTargetProgress = Signal(str, int)
+    fleetTargetFinished = Signal(str, bool)
+    fleetSummaryReady = Signal(list)
+
+    # ============================================================================
+    # REQ: GSE-HLR-90: Nível de Log (UI)
+    # Descrição: logLevelChanged(str) notifica a propriedade logLevel
+    #   ("TRACE", "DEBUG", "INFO", "WARN" ou "ERROR").
+    # ============================================================================
+    logLevelChanged = Signal(str)
+
     # ============================================================================
     # REQ: GSE-LLR-158: Inicialização (Pool de Threads)
     # Descrição: A interface de inicialização do controlador DEVE instanciar
@@ -107,10 +145,21 @@ class UploadController(QObject):
 
         # GSE-LLR-159
         self.file_logger = GseLogger()
+        # GSE-HLR-91: logs exibidos na UI (buffer circular, inserção em lote)
+        self.log_model = LogListModel(parent=self)
 
         self.selected_path = ""
         self.selected_pn = ""
 
+        # GSE-HLR-96: cache de hash junto ao armazenamento interno
+        self.hash_cache = HashCache(
+            os.path.join(os.path.abspath(GSE_STORAGE_DIR), HASH_CACHE_FILENAME)
+        )
+        # GSE-HLR-84: checkpoints para retomar envios interrompidos
+        self.checkpoint_store = TransferCheckpointStore(
+            os.path.join(os.path.abspath(GSE_STORAGE_DIR), CHECKPOINT_FILENAME)
+        )
+
         # GSE-LLR-160
         self._log_handler(f"--- SESSÃO GSE INICIADA ---")
         self._log_handler(
@@ -119,6 +168,12 @@ class UploadController(QObject):
         # GSE-LLR-161
         self._log_handler(f"Log de sessão salvo em: {self.file_logger.get_log_path()}")
 
+        # GSE-HLR-92/93: comprime e aplica a retenção às sessões anteriores e
+        # atualiza o índice, sem travar a UI
+        threading.Thread(
+            target=self._maintain_logs, name="gse-log-index", daemon=True
+        ).start()
+
     # ============================================================================
     # REQ: GSE-LLR-162: Interface Interna (Handler de Log)
     # Descrição: DEVE existir uma interface de logging central (handler de log)
@@ -149,11 +204,16 @@ class UploadController(QObject):
         """
         # GSE-LLR-165
         try:
-            if "[erro]" in message.lower() or "[auth-erro]" in message.lower():
+            # GSE-HLR-90: mensagens abaixo do nível de log não vão à UI nem ao arquivo
+            level = level_of(message)
+            if level < get_log_level():
+                return
+            if level >= ERROR:
                 print(message)
 
             # GSE-LLR-163
             self.logMessage.emit(message)
+            self.log_model.appendMessage(message)
 
             # GSE-LLR-164
             if self.file_logger:
@@ -162,6 +222,78 @@ class UploadController(QObject):
         except Exception as e:
             print(f"ERRO NO LOG HANDLER: {e}")
 
+    # ============================================================================
+    # REQ: GSE-HLR-92: Métricas de Upload no Log Estruturado
+    # Descrição: Cada upload concluído (individual ou por alvo da frota) deve
+    #   gerar um registro "upload_result" no log estruturado da sessão com
+    #   alvo, PN, sucesso, duração, bytes, retransmissões e duração por fase
+    #   (nível ERROR em caso de falha). Na inicialização, uma thread de fundo
+    #   comprime as sessões anteriores, aplica a retenção (GSE-HLR-93) e
+    #   atualiza o índice SQLite dos logs (LogIndex).
+    # ============================================================================
+    def _record_upload(self, fields: dict):
+        if self.file_logger:
+            level = INFO if fields.get("success") else ERROR
+            self.file_logger.write_record("upload_result", level, **fields)
+
+    def _record_fleet_summary(self, summary: dict):
+        for row in summary["targets"]:
+            self._record_upload(
+                {
+                    "target": row["ip"],
+                    "pn": self.selected_pn,
+                    "success": row["success"],
+                    "duration_s": row["elapsed_s"],
+                    "bytes": row["bytes"],
+                    "phases": row["phases"],
+                    "error": row["error"] or None,
+                }
+            )
+
+    def _maintain_logs(self):
+        try:
+            self.file_logger.maintain()
+        except Exception as e:
+            print(f"[LOG-AVISO] Falha na retenção dos logs: {e}")
+        try:
+            with LogIndex(log_dir=self.file_logger.log_dir) as index:
+                index.update()
+        except Exception as e:
+            print(f"[LOG-AVISO] Falha ao atualizar o índice de logs: {e}")
+
+    # ============================================================================
+    # REQ: GSE-HLR-90: Interface de Nível de Log (Slot)
+    # Descrição: setLogLevel(name) deve alterar o nível global de log em
+    #   tempo de execução (os pontos de trace por bloco passam a valer na
+    #   próxima transferência de arquivo), registrar a alteração e emitir
+    #   logLevelChanged; nome inválido é registrado como erro e ignorado.
+    # ============================================================================
+    def _get_log_level(self) -> str:
+        return level_name(get_log_level())
+
+    @Slot(str)
+    def setLogLevel(self, name: str):
+        try:
+            level = set_log_level(name)
+        except ValueError as e:
+            self._log_handler(f"[erro] {e}")
+            return
+        self._log_handler(f"[CONFIG-AVISO] Nível de log alterado para {level_name(level)}")
+        self.logLevelChanged.emit(level_name(level))
+
+    logLevel = Property(str, _get_log_level, setLogLevel, notify=logLevelChanged)
+
+    # ============================================================================
+    # REQ: GSE-HLR-91: Modelo de Logs (UI)
+    # Descrição: logModel expõe ao QML o LogListModel alimentado pelo
+    #   handler de log (GSE-LLR-162), com capacidade limitada e filtros por
+    #   nível e alvo aplicados no Python.
+    # ============================================================================
+    def _get_log_model(self) -> QObject:
+        return self.log_model
+
+    logModel = Property(QObject, _get_log_model, constant=True)
+
     # ============================================================================
     # REQ: GSE-LLR-166: Interface Interna (Análise de PN)
     # Descrição: DEVE existir uma interface interna de análise de PN que
@@ -467,6 +599,10 @@ class UploadController(QObject):
         self.progressChanged.emit(0)
         self.transferStarted.emit(ip_address)
 
+        # GSE-HLR-92: contexto dos registros estruturados desta transferência
+        if self.file_logger:
+            self.file_logger.set_context(target=ip_address, pn=self.selected_pn, phase=None)
+
         # GSE-LLR-182
         worker_signals = WorkerSignals()
         worker = ArincWorker(
@@ -474,16 +610,90 @@ class UploadController(QObject):
             file_path=self.selected_path,  # Agora usa o caminho interno
             pn=self.selected_pn,
             signals=worker_signals,
+            hash_cache=self.hash_cache,
+            checkpoint_store=self.checkpoint_store,
         )
 
         # GSE-LLR-183
         worker_signals.log.connect(self._log_handler)
         worker_signals.progress.connect(self.progressChanged)
         worker_signals.finished.connect(self.transferFinished)
+        worker_signals.phase.connect(lambda name: self.file_logger.set_context(phase=name))
+        worker_signals.result.connect(self._record_upload)
 
         # GSE-LLR-184
         self.threadpool.start(worker)
 
+    # ============================================================================
+    # REQ: GSE-HLR-102: Interface de Upload em Frota (Slot)
+    # Descrição: startFleetTransfer(ip_addresses, max_concurrency) deve aplicar
+    #   a mesma validação de arquivo/PN de startTransfer (GSE-LLR-179), ignorar
+    #   IPs vazios, registrar operador e alvos, emitir progressChanged(0) e
+    #   transferStarted por alvo, e iniciar um FleetWorker com o hash_cache
+    #   compartilhado (max_concurrency <= 0 usa FLEET_MAX_CONCURRENCY).
+    # ============================================================================
+    # REQ: GSE-HLR-104: Upload em Frota Multiprocesso (Slot)
+    # Descrição: processes > 1 distribui as sessões entre processos de
+    #   transferência; processes < 0 usa um processo por núcleo.
+    # ============================================================================
+    @Slot(list, int)
+    @Slot(list, int, int)
+    def startFleetTransfer(
+        self, ip_addresses: list, max_concurrency: int = 0, processes: int = 1
+    ):
+        if not self.selected_path or not self.selected_pn:
+            self._log_handler("[erro] Nenhum arquivo ou PN válido selecionado.")
+            return
+        if "PN_NAO_ENCONTRADO" in self.selected_pn:
+            self._log_handler(
+                "[erro] PN inválido. Não é possível iniciar a transferência."
+            )
+            return
+
+        targets = [str(ip).strip() for ip in ip_addresses if str(ip).strip()]
+        if not targets:
+            self._log_handler("[erro] Nenhum alvo informado para o upload em frota.")
+            return
+        if max_concurrency <= 0:
+            max_concurrency = FLEET_MAX_CONCURRENCY
+        if processes < 0:
+            processes = os.cpu_count() or 1
+
+        self.username = "OPERADOR_PADRAO"
+        self._log_handler(f"Usuário [{self.username}] iniciou upload em frota.")
+        self._log_handler(f"Alvos (BC): {', '.join(targets)}")
+
+        self.progressChanged.emit(0)
+        for ip in targets:
+            self.transferStarted.emit(ip)
+
+        # GSE-HLR-92: o alvo de cada mensagem vem do prefixo "[IP] "
+        if self.file_logger:
+            self.file_logger.set_context(target=None, pn=self.selected_pn, phase=None)
+
+        worker_signals = FleetWorkerSignals()
+        worker = FleetWorker(
+            targets=targets,
+            file_path=self.selected_path,
+            pn=self.selected_pn,
+            signals=worker_signals,
+            max_concurrency=max_concurrency,
+            hash_cache=self.hash_cache,
+            processes=processes,
+        )
+
+        worker_signals.log.connect(self._log_handler)
+        worker_signals.progress.connect(self.progressChanged)
+        worker_signals.targetProgress.connect(self.fleetTargetProgress)
+        worker_signals.targetFinished.connect(self.fleetTargetFinished)
+        worker_signals.summary.connect(
+            lambda summary: self.fleetSummaryReady.emit(summary["targets"])
+        )
+        worker_signals.summary.connect(self._record_fleet_summary)
+        worker_signals.finished.connect(self.transferFinished)
+
+        self.threadpool.start(worker)
+
     # ============================================================================
     # REQ: GSE-LLR-190: Interface de Logout (Slot)
     # Descrição: DEVE existir uma interface de logout da sessão exposta à
@@ -519,6 +729,8 @@ class UploadController(QObject):
         # GSE-LLR-192
         if self.file_logger:
             self.file_logger.close()
+        # GSE-HLR-96: ordem de uso do cache de hash mantida em memória
+        self.hash_cache.close()
 
         # GSE-LLR-193
         QCoreApplication.quit()
@@ -12,12 +12,55 @@ com timestamp no nome, dentro do diretório ``logs/``.
 O objetivo é fornecer um mecanismo simples e consistente para registrar
 eventos, mensagens de depuração e rastreamento de fluxo durante a execução
 da aplicação.
+
+A escrita em disco é feita por uma thread dedicada: \c write_log apenas
+enfileira a mensagem (fila limitada) e a thread grava as linhas em lotes,
+descarregando o buffer ao atingir um limite de bytes ou de tempo. Mensagens
+de erro e o fechamento da sessão forçam \c fsync.
+
+Junto ao texto, cada sessão grava um arquivo JSON Lines
+(``GSE_Sessao_<timestamp>.jsonl``) com um registro por mensagem (sessão,
+alvo, PN, fase, nível e texto) e registros de eventos com métricas
+(\c write_record), indexados por \c backend.logsGSE.log_index.LogIndex.
+
+Sessões longas são divididas em segmentos (``GSE_Sessao_<timestamp>_parteN``)
+ao atingir \c rotate_bytes ou \c rotate_age; os segmentos fechados são
+comprimidos em segundo plano e a retenção (\c LogMaintenance) limita a
+idade e o espaço ocupado pelos logs.
 """
 
+import atexit
 import datetime
-from typing import TextIO
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional, TextIO
 from pathlib import Path
 
+from backend.logsGSE.log_buffer import DEFAULT_SOURCE, make_entry
+from backend.logsGSE.log_levels import ERROR, INFO, level_name, level_of
+from backend.logsGSE.log_retention import (
+    LOG_COMPRESSION,
+    LOG_ROTATE_AGE_SEC,
+    LOG_ROTATE_BYTES,
+    LogMaintenance,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-89: Escrita Assíncrona do Log de Sessão
+# Descrição: Limites da escrita em lote: capacidade da fila entre
+#            write_log e a thread de escrita (write_log bloqueia quando
+#            cheia, sem perder linhas), bytes pendentes e intervalo máximo
+#            (s) até o flush do arquivo.
+# ============================================================================
+LOG_QUEUE_SIZE = 10000
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_FLUSH_INTERVAL_SEC = 0.5
+
+_CLOSE = object()
+
 
 class GseLogger:
     """
@@ -33,19 +76,66 @@ class GseLogger:
 
     LOG_DIR = Path(__file__).resolve().parents[2] / "logs"
 
-    def __init__(self):
+    def __init__(
+        self,
+        log_dir: Optional[Path] = None,
+        flush_bytes: int = LOG_FLUSH_BYTES,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SEC,
+        queue_size: int = LOG_QUEUE_SIZE,
+        structured: bool = True,
+        rotate_bytes: Optional[int] = LOG_ROTATE_BYTES,
+        rotate_age: Optional[float] = LOG_ROTATE_AGE_SEC,
+        compression: Optional[str] = LOG_COMPRESSION,
+        maintenance: Optional[LogMaintenance] = None,
+    ):
         """
         \brief Construtor do logger.
 
         \details
-        Inicializa o logger, cria o diretório de logs (se necessário)
-        e abre o arquivo de log da sessão.  
+        Inicializa o logger, cria o diretório de logs (se necessário),
+        abre o arquivo de log da sessão e inicia a thread de escrita.  
         O caminho completo do arquivo criado pode ser recuperado por
         \ref get_log_path().
+
+        \param log_dir Diretório dos logs (padrão: \c LOG_DIR).
+        \param flush_bytes Bytes pendentes que disparam o flush.
+        \param flush_interval Intervalo máximo (s) entre a escrita e o flush.
+        \param queue_size Capacidade da fila de mensagens.
+        \param structured Grava também o arquivo JSON Lines da sessão.
+        \param rotate_bytes Bytes gravados que encerram o segmento (None: sem limite).
+        \param rotate_age Idade (s) que encerra o segmento (None: sem limite).
+        \param compression Codec dos segmentos fechados (``"gzip"``, ``"zstd"`` ou None).
+        \param maintenance Compressão/retenção dos logs (padrão: limites de
+               \c log_retention para \c log_dir).
         """
+        self.log_dir = Path(log_dir) if log_dir is not None else self.LOG_DIR
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.structured = structured
+        self.rotate_bytes = rotate_bytes
+        self.rotate_age = rotate_age
+        self.maintenance = maintenance or LogMaintenance(self.log_dir, codec=compression)
+        self.part = 1
+        self._segment_bytes = 0
+        self._segment_started = time.monotonic()
         self.log_file: TextIO | None = None
         self.log_path: str = ""
+        self.jsonl_file: TextIO | None = None
+        self.jsonl_path: str = ""
+        self.session_id: str = ""
+        # Contexto (alvo, PN, fase) anexado aos registros JSON; substituído, nunca alterado
+        self._context: Dict[str, Any] = {}
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer: threading.Thread | None = None
+        self._close_lock = threading.Lock()
         self._init_log_file()
+        if self.log_file:
+            self._writer = threading.Thread(
+                target=self._write_loop, name="gse-log-writer", daemon=True
+            )
+            self._writer.start()
+            # Linhas ainda na fila não se perdem se a aplicação sair sem close()
+            atexit.register(self.close)
 
     def _init_log_file(self):
         """
@@ -58,15 +148,11 @@ class GseLogger:
         continuar sessões interrompidas ou acrescentar novas entradas.
         """
         try:
-            log_dir_path = self.LOG_DIR
+            log_dir_path = self.log_dir
             log_dir_path.mkdir(parents=True, exist_ok=True)
 
-            now_str = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"GSE_Sessao_{now_str}.txt"
-            log_path = log_dir_path / filename
-
-            self.log_path = str(log_path)
-            self.log_file = log_path.open("a", encoding="utf-8")
+            self.session_id = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            self._open_segment()
 
             print(f"Sessão de log iniciada. Arquivo: {self.log_path}")
 
@@ -74,6 +160,25 @@ class GseLogger:
             print(f"ERRO CRÍTICO: Falha ao inicializar logger de arquivo: {e}")
             self.log_file = None
 
+    def _open_segment(self):
+        name = f"GSE_Sessao_{self.session_id}"
+        if self.part > 1:
+            name += f"_parte{self.part}"
+        log_path = self.log_dir / f"{name}.txt"
+        self.log_path = str(log_path)
+        self.log_file = log_path.open("a", encoding="utf-8")
+        self._segment_bytes = 0
+        self._segment_started = time.monotonic()
+
+        if self.structured:
+            try:
+                jsonl_path = log_path.with_suffix(".jsonl")
+                self.jsonl_path = str(jsonl_path)
+                self.jsonl_file = jsonl_path.open("a", encoding="utf-8")
+            except Exception as e:
+                print(f"ERRO CRÍTICO: Falha ao abrir o log estruturado: {e}")
+                self.jsonl_file = None
+
     def get_log_path(self) -> str:
         """
         \brief Retorna o caminho do arquivo de log atual.
@@ -92,24 +197,235 @@ class GseLogger:
 
         ``[HH:MM:SS.mmm] Mensagem...``
 
+        O instante é capturado aqui; a formatação e a escrita ocorrem na
+        thread de escrita. Com a fila cheia, a chamada aguarda espaço.
+
         \param message Texto da mensagem a ser registrada.
         """
-        if not self.log_file:
+        if not self.log_file or self._writer is None:
             print(f"LOG (sem arquivo): {message}")
             return
 
-        try:
-            now = datetime.datetime.now()
-            timestamp = now.strftime("%H:%M:%S")
-            ms = now.microsecond // 1000
+        self._queue.put((time.time(), message, self._context))
+
+    # ============================================================================
+    # REQ: GSE-HLR-92: Contexto e Eventos do Log Estruturado
+    # Descrição: set_context(**campos) deve definir os campos (target, pn,
+    #            phase, ...) anexados aos registros JSON seguintes (None
+    #            remove o campo). write_record(event, level, **campos) deve
+    #            gravar apenas no JSON Lines um registro de evento com o
+    #            contexto corrente e os campos informados (ex.: métricas do
+    #            upload), sem linha no log de texto.
+    # ============================================================================
+    def set_context(self, **fields):
+        context = {**self._context, **fields}
+        self._context = {key: value for key, value in context.items() if value is not None}
+
+    def write_record(self, event: str, level: int = INFO, **fields):
+        if not self.jsonl_file or self._writer is None:
+            return
+        record = {**self._context, **fields, "event": event, "level": level}
+        self._queue.put((time.time(), None, record))
+
+    def flush(self):
+        r"""
+        \brief Aguarda a gravação das mensagens já enfileiradas.
+
+        \details
+        Enfileira um marcador e bloqueia até a thread de escrita
+        descarregar (flush) tudo o que estava antes dele.
+        """
+        if self._writer is None or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    @staticmethod
+    def _format_line(timestamp: float, message: str) -> str:
+        now = datetime.datetime.fromtimestamp(timestamp)
+        return f"[{now:%H:%M:%S}.{now.microsecond // 1000:03d}] {message}\n"
+
+    # ============================================================================
+    # REQ: GSE-HLR-92: Registro JSON Lines
+    # Descrição: Cada mensagem gera um objeto JSON por linha com ts (s desde
+    #            a época), session, level (nome), target (prefixo "[IP] " da
+    #            mensagem ou o do contexto), pn, phase e msg; registros de
+    #            evento trazem event e os campos de write_record.
+    # ============================================================================
+    def _format_record(self, timestamp: float, message: Optional[str], context: Dict[str, Any]) -> str:
+        if message is None:
+            record = {"ts": round(timestamp, 3), "session": self.session_id, **context}
+            record["level"] = level_name(record["level"])
+        else:
+            entry = make_entry(message, timestamp)
+            record = {
+                "ts": round(timestamp, 3),
+                "session": self.session_id,
+                "level": level_name(entry.level),
+                "target": context.get("target"),
+                "pn": context.get("pn"),
+                "phase": context.get("phase"),
+                "msg": entry.text,
+            }
+            if entry.source != DEFAULT_SOURCE:
+                record["target"] = entry.source
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+
+    # ============================================================================
+    # REQ: GSE-HLR-89: Thread de Escrita do Log
+    # Descrição: A thread de escrita deve retirar da fila todas as mensagens
+    #            disponíveis, gravá-las em uma única escrita e fazer flush do
+    #            arquivo quando os bytes pendentes atingirem flush_bytes ou a
+    #            escrita mais antiga pendente tiver flush_interval segundos;
+    #            um lote com mensagem de nível ERROR (level_of, GSE-HLR-90)
+    #            deve ser descarregado com fsync imediatamente. Ao receber o
+    #            marcador de fechamento, grava o restante, faz fsync e fecha
+    #            o arquivo.
+    # ============================================================================
+    def _write_loop(self):
+        pending = 0
+        deadline = None
+        closing = False
+        while not closing:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            records = []
+            waiters = []
+            sync = False
+            for item in items:
+                if item is _CLOSE:
+                    closing = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    timestamp, message, context = item
+                    if message is not None:
+                        lines.append(self._format_line(timestamp, message))
+                        sync = sync or level_of(message) >= ERROR
+                    else:
+                        sync = sync or context["level"] >= ERROR
+                    if self.jsonl_file:
+                        records.append(self._format_record(timestamp, message, context))
+
+            try:
+                for file, chunk in ((self.log_file, lines), (self.jsonl_file, records)):
+                    if chunk:
+                        chunk = "".join(chunk)
+                        file.write(chunk)
+                        pending += len(chunk)
+                        self._segment_bytes += len(chunk)
+                        if deadline is None:
+                            deadline = time.monotonic() + self.flush_interval
+                if pending and (
+                    sync
+                    or closing
+                    or waiters
+                    or pending >= self.flush_bytes
+                    or time.monotonic() >= deadline
+                ):
+                    for file in self._open_files():
+                        file.flush()
+                        if sync or closing:
+                            os.fsync(file.fileno())
+                    pending = 0
+                    deadline = None
+                if not closing and self._should_rotate():
+                    # Sem próximo segmento não há onde gravar: a thread termina
+                    closing = not self._rotate()
+                    pending = 0
+                    deadline = None
+            except Exception as e:
+                print(f"ERRO CRÍTICO: Falha ao escrever no log: {e}")
+            finally:
+                for done in waiters:
+                    done.set()
+
+        for file in self._open_files():
+            try:
+                file.close()
+            except Exception as e:
+                print(f"ERRO CRÍTICO: Falha ao fechar o log: {e}")
 
-            formatted_message = f"[{timestamp}.{ms:03d}] {message}\n"
+        # Itens enfileirados após uma rotação malsucedida vão ao console e
+        # quem aguarda flush() é liberado
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not _CLOSE and item[1] is not None:
+                print(f"LOG (sem arquivo): {item[1]}")
 
-            self.log_file.write(formatted_message)
-            self.log_file.flush()
+    def _open_files(self):
+        return [file for file in (self.log_file, self.jsonl_file) if file]
 
+    # ============================================================================
+    # REQ: GSE-HLR-93: Rotação do Log de Sessão
+    # Descrição: Quando o segmento atual atingir rotate_bytes (texto + JSON)
+    #            ou rotate_age segundos, a thread de escrita deve registrar no
+    #            texto o nome do próximo segmento, fazer fsync e fechar os
+    #            arquivos, abrir GSE_Sessao_<timestamp>_parteN (.txt/.jsonl)
+    #            e comprimir em segundo plano os arquivos fechados, aplicando
+    #            a retenção sem tocar no segmento ativo. Se o novo segmento não
+    #            puder ser aberto, log_file/jsonl_file passam a None, _rotate()
+    #            retorna False e a thread de escrita termina.
+    # ============================================================================
+    def _should_rotate(self) -> bool:
+        if self.rotate_bytes is not None and self._segment_bytes >= self.rotate_bytes:
+            return True
+        return (
+            self.rotate_age is not None
+            and self._segment_bytes > 0
+            and time.monotonic() - self._segment_started >= self.rotate_age
+        )
+
+    def _rotate(self) -> bool:
+        closed = [path for path in (self.log_path, self.jsonl_path) if path]
+        self.part += 1
+        next_name = f"GSE_Sessao_{self.session_id}_parte{self.part}.txt"
+        self.log_file.write(self._format_line(time.time(), f"--- LOG CONTINUA EM {next_name} ---"))
+        for file in self._open_files():
+            file.flush()
+            os.fsync(file.fileno())
+            file.close()
+        # log_file só é trocado aqui: close() nunca o vê como None durante a rotação
+        try:
+            self._open_segment()
         except Exception as e:
-            print(f"ERRO CRÍTICO: Falha ao escrever no log: {e}")
+            print(f"ERRO CRÍTICO: Falha ao abrir o próximo segmento do log: {e}")
+            # Nenhum arquivo aberto: write_log() passa a usar o console
+            self.log_file = None
+            self.jsonl_file = None
+            return False
+        self.maintenance.run_in_background(active=self.session_paths(), paths=closed)
+        return True
+
+    def session_paths(self) -> list:
+        """Arquivos do segmento ativo (excluídos da compressão e da retenção)."""
+        return [path for path in (self.log_path, self.jsonl_path) if path]
+
+    def maintain(self):
+        r"""
+        \brief Comprime as sessões anteriores e aplica a retenção.
+
+        \details
+        Execução síncrona (chamada da thread de manutenção do controlador);
+        os arquivos do segmento ativo são preservados.
+        """
+        self.maintenance.run(active=self.session_paths())
 
     def close(self):
         """
@@ -120,9 +436,20 @@ class GseLogger:
 
         ``--- SESSÃO GSE FINALIZADA ---``
 
-        Após o fechamento, o atributo \c log_file passa a ser ``None``.
+        Aguarda a thread de escrita gravar as mensagens pendentes e
+        sincronizar o arquivo em disco (\c fsync). Após o fechamento, o
+        atributo \c log_file passa a ser ``None``.
         """
-        if self.log_file:
-            self.write_log("--- SESSÃO GSE FINALIZADA ---")
-            self.log_file.close()
+        with self._close_lock:
+            if not self.log_file:
+                return
+            if self._writer is not None:
+                self.write_log("--- SESSÃO GSE FINALIZADA ---")
+                self._queue.put(_CLOSE)
+                self._writer.join()
+                self._writer = None
+                atexit.unregister(self.close)
+            else:
+                self.log_file.close()
             self.log_file = None
+            self.jsonl_file = None
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+r"""
+\file log_buffer.py
+\brief Buffer circular de entradas de log para a UI.
+
+\details
+Define \c LogEntry (instante, nível, origem e texto) e \c LogRingBuffer,
+o núcleo sem Qt do modelo de lista de logs da UI
+(\c backend.controllers.log_list_model.LogListModel). O buffer guarda no
+máximo \c capacity entradas (as mais antigas são descartadas), acumula as
+novas entradas até \c flush() e mantém a visão filtrada (nível mínimo e
+alvo) já calculada, de modo que a UI receba apenas as linhas visíveis
+inseridas e removidas a cada lote.
+"""
+
+import re
+import time
+from collections import deque
+from typing import List, NamedTuple, Optional, Tuple
+
+from backend.logsGSE.log_levels import TRACE, level_of
+
+# ============================================================================
+# REQ: GSE-HLR-91: Capacidade do Buffer de Logs da UI
+# Descrição: Número máximo de entradas mantidas para exibição quando não
+#            informado; entradas mais antigas são descartadas.
+# ============================================================================
+LOG_BUFFER_CAPACITY = 5000
+
+# Origem das mensagens sem alvo ("[192.168.4.1] ..." identifica o alvo)
+DEFAULT_SOURCE = "GSE"
+_TARGET_PREFIX = re.compile(r"^\[(\d{1,3}(?:\.\d{1,3}){3})\] ")
+
+
+class LogEntry(NamedTuple):
+    timestamp: float
+    level: int
+    source: str
+    text: str
+
+
+def make_entry(message: str, timestamp: Optional[float] = None) -> LogEntry:
+    r"""
+    \brief Cria a entrada de uma mensagem de log.
+
+    \details
+    O nível vem da tag da mensagem (\ref level_of) e a origem do prefixo
+    ``[IP] `` usado pelo upload em frota, removido do texto.
+    """
+    source = DEFAULT_SOURCE
+    match = _TARGET_PREFIX.match(message)
+    if match:
+        source = match.group(1)
+        message = message[match.end():]
+    return LogEntry(
+        time.time() if timestamp is None else timestamp,
+        level_of(message),
+        source,
+        message,
+    )
+
+
+class LogRingBuffer:
+    r"""
+    \class LogRingBuffer
+    \brief Últimas \c capacity entradas de log e a visão filtrada delas.
+    """
+
+    def __init__(self, capacity: int = LOG_BUFFER_CAPACITY):
+        if capacity < 1:
+            raise ValueError(f"capacity deve ser >= 1: {capacity}")
+        self.capacity = capacity
+        self.min_level = TRACE
+        self.source: Optional[str] = None
+        # Entradas descartadas por capacidade desde a criação
+        self.dropped = 0
+        self._entries: deque = deque()
+        self._visible: deque = deque()
+        self._pending: List[LogEntry] = []
+
+    def __len__(self) -> int:
+        return len(self._visible)
+
+    def __getitem__(self, row: int) -> LogEntry:
+        return self._visible[row]
+
+    @property
+    def total(self) -> int:
+        """Entradas armazenadas (visíveis ou não), sem as pendentes."""
+        return len(self._entries)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def matches(self, entry: LogEntry) -> bool:
+        return entry.level >= self.min_level and (
+            self.source is None or entry.source == self.source
+        )
+
+    def append(self, entry: LogEntry):
+        """Acumula a entrada até o próximo flush()."""
+        self._pending.append(entry)
+        if len(self._pending) > 2 * self.capacity:
+            # Sem flush por muito tempo: só as últimas capacity podem ser exibidas
+            self.dropped += len(self._pending) - self.capacity
+            del self._pending[: -self.capacity]
+
+    # ============================================================================
+    # REQ: GSE-HLR-91: Inserção em Lote
+    # Descrição: flush() deve mover as entradas pendentes para o buffer,
+    #            descartando as mais antigas além de capacity, e retornar
+    #            (removidas, inseridas): quantas linhas visíveis saíram do
+    #            início da visão filtrada e as novas entradas visíveis,
+    #            acrescentadas ao fim, na ordem de chegada. Com apply=False a
+    #            visão só muda em remove_visible()/extend_visible(), para o
+    #            modelo Qt notificar as views antes de cada alteração.
+    # ============================================================================
+    def flush(self, apply: bool = True) -> Tuple[int, List[LogEntry]]:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return 0, []
+        if len(pending) > self.capacity:
+            self.dropped += len(pending) - self.capacity
+            pending = pending[-self.capacity :]
+
+        removed = 0
+        for _ in range(len(self._entries) + len(pending) - self.capacity):
+            oldest = self._entries.popleft()
+            self.dropped += 1
+            # As entradas visíveis descartadas são sempre um prefixo da visão
+            if removed < len(self._visible) and self._visible[removed] is oldest:
+                removed += 1
+        self._entries.extend(pending)
+        inserted = [entry for entry in pending if self.matches(entry)]
+        if apply:
+            self.remove_visible(removed)
+            self.extend_visible(inserted)
+        return removed, inserted
+
+    def remove_visible(self, count: int):
+        for _ in range(count):
+            self._visible.popleft()
+
+    def extend_visible(self, entries: List[LogEntry]):
+        self._visible.extend(entries)
+
+    # ============================================================================
+    # REQ: GSE-HLR-91: Filtro por Nível e Alvo
+    # Descrição: set_filter(min_level, source) deve recalcular a visão a
+    #            partir das entradas armazenadas (source None: todas as
+    #            origens). As entradas pendentes são incorporadas antes.
+    # ============================================================================
+    def set_filter(self, min_level: int = TRACE, source: Optional[str] = None):
+        self.flush()
+        self.min_level = min_level
+        self.source = source or None
+        self._visible = deque(entry for entry in self._entries if self.matches(entry))
+
+    def sources(self) -> List[str]:
+        """Origens presentes no buffer, na ordem em que apareceram."""
+        return list(dict.fromkeys(entry.source for entry in self._entries))
+
+    def clear(self):
+        self._entries.clear()
+        self._visible.clear()
+        self._pending.clear()
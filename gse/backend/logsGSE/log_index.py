@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+r"""
+\file log_index.py
+\brief Índice SQLite incremental dos logs estruturados de sessão.
+
+\details
+Indexa os arquivos JSON Lines (``GSE_Sessao_<timestamp>.jsonl``) gravados
+pelo \c GseLogger no diretório ``logs/``. Cada arquivo é lido a partir do
+último byte indexado (apenas linhas completas), de modo que \c update()
+custa proporcionalmente ao que foi escrito desde a última chamada; as
+consultas por PN, alvo, evento e período usam índices do SQLite em vez de
+varrer milhares de sessões. Segmentos comprimidos (``.jsonl.gz``/``.zst``,
+GSE-HLR-93) são lidos sem descompressão manual; um arquivo já indexado e
+depois comprimido apenas troca de caminho no índice.
+
+Uso pela linha de comando::
+
+    python -m backend.logsGSE.log_index --pn EMB-0001 --since-days 7
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.logsGSE.gse_logger import GseLogger
+from backend.logsGSE.log_retention import is_compressed, is_session_log, open_log
+
+INDEX_FILENAME = "index.sqlite3"
+LOG_GLOB = "GSE_Sessao_*.jsonl*"
+
+# Campos do registro com coluna própria; os demais vão para "data" (JSON)
+_COLUMNS = (
+    "ts", "session", "level", "event", "target", "pn", "phase", "msg",
+    "success", "duration_s", "bytes", "retries",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    file_id INTEGER NOT NULL,
+    ts REAL, session TEXT, level TEXT, event TEXT,
+    target TEXT, pn TEXT, phase TEXT, msg TEXT,
+    success INTEGER, duration_s REAL, bytes INTEGER, retries INTEGER,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS records_file ON records (file_id);
+CREATE INDEX IF NOT EXISTS records_ts ON records (ts);
+CREATE INDEX IF NOT EXISTS records_pn ON records (pn, ts);
+CREATE INDEX IF NOT EXISTS records_target ON records (target, ts);
+CREATE INDEX IF NOT EXISTS records_event ON records (event, ts);
+"""
+
+
+def _is_jsonl(path: Path) -> bool:
+    name = path.stem if is_compressed(path) else path.name
+    return is_session_log(path) and name.endswith(".jsonl")
+
+
+def _row(file_id: int, record: Dict[str, Any]) -> tuple:
+    extra = {key: value for key, value in record.items() if key not in _COLUMNS}
+    success = record.get("success")
+    return (
+        file_id,
+        *(record.get(column) for column in _COLUMNS[:8]),
+        None if success is None else int(bool(success)),
+        *(record.get(column) for column in _COLUMNS[9:]),
+        json.dumps(extra, ensure_ascii=False) if extra else None,
+    )
+
+
+def _parse_rows(file_id: int, lines) -> List[tuple]:
+    rows = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            rows.append(_row(file_id, record))
+    return rows
+
+
+class LogIndex:
+    r"""
+    \class LogIndex
+    \brief Índice incremental dos registros JSON Lines de \c log_dir.
+    """
+
+    def __init__(self, db_path=None, log_dir=None):
+        r"""
+        \param db_path Arquivo SQLite (padrão: ``<log_dir>/index.sqlite3``).
+        \param log_dir Diretório dos logs (padrão: \c GseLogger.LOG_DIR).
+        """
+        self.log_dir = Path(log_dir) if log_dir is not None else GseLogger.LOG_DIR
+        self.db_path = Path(db_path) if db_path is not None else self.log_dir / INDEX_FILENAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path))
+        self._db.row_factory = sqlite3.Row
+        # WAL: consultas da UI/CLI não bloqueiam a atualização do índice
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ============================================================================
+    # REQ: GSE-HLR-92: Atualização Incremental do Índice
+    # Descrição: update() deve indexar apenas os bytes acrescentados a cada
+    #            arquivo JSON Lines desde a última atualização (até a última
+    #            linha completa), reindexar arquivos truncados e remover do
+    #            índice os arquivos apagados, em uma única transação.
+    #            Retorna o número de registros novos.
+    # ---
+    # REQ: GSE-HLR-93: Índice de Logs Comprimidos
+    # Descrição: Arquivos .jsonl.gz/.jsonl.zst devem ser indexados por
+    #            inteiro (descompressão transparente). Se o .jsonl original
+    #            já estava totalmente indexado e a compressão preservou sua
+    #            data de modificação, seus registros passam ao arquivo
+    #            comprimido sem releitura.
+    # ============================================================================
+    def update(self) -> int:
+        known = {
+            row["path"]: row
+            for row in self._db.execute("SELECT id, path, size, mtime_ns, offset FROM files")
+        }
+        added = 0
+        with self._db:
+            for path in sorted(self.log_dir.glob(LOG_GLOB)):
+                if not _is_jsonl(path):
+                    continue
+                compressed = is_compressed(path)
+                if compressed and path.with_suffix("").exists():
+                    continue  # compressão em andamento: o original ainda vale
+                stat = path.stat()
+                row = known.pop(str(path), None)
+                if row is not None and (row["size"], row["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                    continue
+                if not compressed:
+                    added += self._index_file(path, stat, row)
+                elif row is None and self._adopt(path, stat, known):
+                    continue
+                else:
+                    added += self._index_compressed(path, stat, row)
+            for row in known.values():
+                self._forget(row["id"])
+        return added
+
+    def _index_file(self, path: Path, stat, row) -> int:
+        offset = 0
+        if row is None:
+            file_id = self._db.execute(
+                "INSERT INTO files (path, size, mtime_ns, offset) VALUES (?, 0, 0, 0)",
+                (str(path),),
+            ).lastrowid
+        else:
+            file_id, offset = row["id"], row["offset"]
+            if stat.st_size < offset:
+                # Arquivo truncado ou substituído: reindexa do início
+                self._db.execute("DELETE FROM records WHERE file_id = ?", (file_id,))
+                offset = 0
+
+        with path.open("rb") as file:
+            file.seek(offset)
+            chunk = file.read(max(stat.st_size - offset, 0))
+        complete = chunk.rfind(b"\n") + 1
+        rows = _parse_rows(file_id, chunk[:complete].splitlines())
+        self._insert(rows)
+        self._db.execute(
+            "UPDATE files SET size = ?, mtime_ns = ?, offset = ? WHERE id = ?",
+            (stat.st_size, stat.st_mtime_ns, offset + complete, file_id),
+        )
+        return len(rows)
+
+    def _adopt(self, path: Path, stat, known) -> bool:
+        original = known.get(str(path.with_suffix("")))
+        if (
+            original is None
+            or original["offset"] != original["size"]
+            or original["mtime_ns"] != stat.st_mtime_ns
+        ):
+            return False
+        del known[original["path"]]
+        self._db.execute(
+            "UPDATE files SET path = ?, size = ?, offset = ? WHERE id = ?",
+            (str(path), stat.st_size, stat.st_size, original["id"]),
+        )
+        return True
+
+    def _index_compressed(self, path: Path, stat, row) -> int:
+        try:
+            with open_log(path) as file:
+                lines = file.read().splitlines()
+        except Exception as e:
+            print(f"[LOG-AVISO] Falha ao ler {path.name}: {e}")
+            if row is not None:
+                self._forget(row["id"])
+            return 0
+        if row is None:
+            file_id = self._db.execute(
+                "INSERT INTO files (path, size, mtime_ns, offset) VALUES (?, 0, 0, 0)",
+                (str(path),),
+            ).lastrowid
+        else:
+            file_id = row["id"]
+            self._db.execute("DELETE FROM records WHERE file_id = ?", (file_id,))
+        rows = _parse_rows(file_id, lines)
+        self._insert(rows)
+        self._db.execute(
+            "UPDATE files SET size = ?, mtime_ns = ?, offset = ? WHERE id = ?",
+            (stat.st_size, stat.st_mtime_ns, stat.st_size, file_id),
+        )
+        return len(rows)
+
+    def _insert(self, rows: List[tuple]):
+        self._db.executemany(
+            f"INSERT INTO records VALUES ({', '.join('?' * (len(_COLUMNS) + 2))})", rows
+        )
+
+    def _forget(self, file_id: int):
+        self._db.execute("DELETE FROM records WHERE file_id = ?", (file_id,))
+        self._db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    # ============================================================================
+    # REQ: GSE-HLR-92: Consulta aos Logs Indexados
+    # Descrição: query() deve filtrar os registros por PN, alvo, sessão,
+    #            evento, nível, fase e período (ts em s desde a época),
+    #            retornando dicionários em ordem cronológica.
+    # ============================================================================
+    def query(
+        self,
+        pn: Optional[str] = None,
+        target: Optional[str] = None,
+        session: Optional[str] = None,
+        event: Optional[str] = None,
+        level: Optional[str] = None,
+        phase: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        for column, value in (
+            ("pn", pn), ("target", target), ("session", session),
+            ("event", event), ("level", level), ("phase", phase),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        sql = f"SELECT {', '.join(_COLUMNS)}, data FROM records"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        results = []
+        for row in self._db.execute(sql, params):
+            record = {key: row[key] for key in _COLUMNS if row[key] is not None}
+            if "success" in record:
+                record["success"] = bool(record["success"])
+            if row["data"]:
+                record.update(json.loads(row["data"]))
+            results.append(record)
+        return results
+
+    def uploads(self, **filters) -> List[Dict[str, Any]]:
+        """Resultados de upload (evento ``upload_result``) com os filtros de query()."""
+        return self.query(event="upload_result", **filters)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Consulta os logs estruturados de sessão indexados em SQLite."
+    )
+    parser.add_argument("--log-dir", default=None)
+    parser.add_argument("--pn")
+    parser.add_argument("--target")
+    parser.add_argument("--event")
+    parser.add_argument("--level", type=str.upper)
+    parser.add_argument("--since-days", type=float)
+    parser.add_argument("--limit", type=int)
+    args = parser.parse_args(argv)
+
+    since = None if args.since_days is None else time.time() - args.since_days * 86400
+    with LogIndex(log_dir=args.log_dir) as index:
+        index.update()
+        for record in index.query(
+            pn=args.pn, target=args.target, event=args.event,
+            level=args.level, since=since, limit=args.limit,
+        ):
+            print(json.dumps(record, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
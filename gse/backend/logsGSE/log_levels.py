@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+r"""
+\file log_levels.py
+\brief Níveis de log do GSE (TRACE/DEBUG/INFO/WARN/ERROR).
+
+\details
+Define o nível global de log, ajustável em tempo de execução pela UI
+(\c UploadController.setLogLevel) ou pela linha de comando
+(``--log-level``), e a fachada \c LevelLogger usada pelo transporte TFTP,
+pela sessão ARINC e pelo worker.
+
+O nível de uma mensagem é dado pela tag já usada no GSE:
+``[TFTP-ERRO]``/``[erro]``/``[✗]`` são ERROR, ``[TFTP-AVISO]`` é WARN,
+``[TFTP-DEBUG]`` é DEBUG, ``[TFTP-TRACE]`` é TRACE e as demais são INFO.
+Assim os consumidores a jusante (arquivo de log, UI) classificam a
+mensagem sem alterar a interface ``Callable[[str], None]`` dos loggers.
+
+Mensagens abaixo do nível corrente são descartadas antes de formatadas:
+\c LevelLogger.trace e \c LevelLogger.debug recebem o formato e os
+argumentos separados (estilo ``%``) e só formatam quando o nível está
+habilitado. Nos laços por bloco, o custo é removido de vez consultando
+\c log_enabled uma vez por transferência.
+"""
+
+from typing import Callable, Union
+
+# ============================================================================
+# REQ: GSE-HLR-90: Níveis de Log
+# Descrição: Os níveis são inteiros ordenados (compatíveis com o módulo
+#            logging, com TRACE abaixo de DEBUG); DEFAULT_LOG_LEVEL é o
+#            nível inicial da aplicação.
+# ============================================================================
+TRACE = 5
+DEBUG = 10
+INFO = 20
+WARN = 30
+ERROR = 40
+
+LEVEL_NAMES = {TRACE: "TRACE", DEBUG: "DEBUG", INFO: "INFO", WARN: "WARN", ERROR: "ERROR"}
+DEFAULT_LOG_LEVEL = INFO
+
+_level = DEFAULT_LOG_LEVEL
+
+
+def parse_log_level(value: Union[int, str]) -> int:
+    r"""
+    \brief Converte nome ("debug", "WARN", "WARNING") ou número em nível.
+
+    Lança ValueError para nível desconhecido.
+    """
+    if isinstance(value, int):
+        if value not in LEVEL_NAMES:
+            raise ValueError(f"Nível de log inválido: {value}")
+        return value
+    name = value.strip().upper()
+    if name == "WARNING":
+        name = "WARN"
+    for level, level_name in LEVEL_NAMES.items():
+        if level_name == name:
+            return level
+    raise ValueError(f"Nível de log inválido: {value}")
+
+
+def set_log_level(level: Union[int, str]) -> int:
+    r"""
+    \brief Ajusta o nível global de log (vale para todos os LevelLogger).
+
+    \return O nível aplicado.
+    """
+    global _level
+    _level = parse_log_level(level)
+    return _level
+
+
+def get_log_level() -> int:
+    return _level
+
+
+def log_enabled(level: int) -> bool:
+    return level >= _level
+
+
+def level_name(level: int) -> str:
+    return LEVEL_NAMES.get(level, str(level))
+
+
+# ============================================================================
+# REQ: GSE-HLR-90: Nível de uma Mensagem
+# Descrição: level_of(message) deve classificar a mensagem pela tag:
+#            "erro]" ou "[✗]" -> ERROR, "aviso]" -> WARN, "-debug]" ->
+#            DEBUG, "-trace]" -> TRACE (sem diferenciar maiúsculas);
+#            demais -> INFO.
+# ============================================================================
+def level_of(message: str) -> int:
+    text = message.lower()
+    if "erro]" in text or "[✗]" in text:
+        return ERROR
+    if "aviso]" in text:
+        return WARN
+    if "-trace]" in text:
+        return TRACE
+    if "-debug]" in text:
+        return DEBUG
+    return INFO
+
+
+class LevelLogger:
+    r"""
+    \class LevelLogger
+    \brief Fachada com níveis sobre um logger ``Callable[[str], None]``.
+
+    \details
+    Chamada diretamente (``log(msg)``), classifica a mensagem pela tag
+    (\ref level_of) e a repassa ao sink apenas se o nível estiver
+    habilitado. Os métodos \c trace, \c debug, \c info, \c warn e \c error
+    recebem formato e argumentos e formatam somente quando habilitados.
+    """
+
+    __slots__ = ("sink",)
+
+    def __init__(self, sink: Callable[[str], None]):
+        # Evita filtrar duas vezes quando recebe outro LevelLogger
+        self.sink = sink.sink if isinstance(sink, LevelLogger) else sink
+
+    def __call__(self, message: str):
+        if level_of(message) >= _level:
+            self.sink(message)
+
+    def enabled(self, level: int) -> bool:
+        return level >= _level
+
+    def log(self, level: int, fmt: str, *args):
+        if level >= _level:
+            self.sink(fmt % args if args else fmt)
+
+    def trace(self, fmt: str, *args):
+        if TRACE >= _level:
+            self.sink(fmt % args if args else fmt)
+
+    def debug(self, fmt: str, *args):
+        if DEBUG >= _level:
+            self.sink(fmt % args if args else fmt)
+
+    def info(self, fmt: str, *args):
+        if INFO >= _level:
+            self.sink(fmt % args if args else fmt)
+
+    def warn(self, fmt: str, *args):
+        if WARN >= _level:
+            self.sink(fmt % args if args else fmt)
+
+    def error(self, fmt: str, *args):
+        if ERROR >= _level:
+            self.sink(fmt % args if args else fmt)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+r"""
+\file log_retention.py
+\brief Compressão e retenção dos arquivos de log de sessão.
+
+\details
+Os segmentos de log já fechados (``GSE_Sessao_*.txt`` e ``*.jsonl``) são
+comprimidos com gzip ou, se o pacote opcional \c zstandard estiver
+instalado, com zstd; \c open_log lê qualquer um deles como texto, de modo
+que o índice (\c backend.logsGSE.log_index.LogIndex) continue consultando
+as sessões comprimidas. A retenção apaga os arquivos mais antigos que
+\c LOG_RETENTION_DAYS e, em seguida, os mais antigos até o diretório caber
+em \c LOG_RETENTION_BYTES.
+"""
+
+import gzip
+import io
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, TextIO
+
+try:
+    import zstandard
+except ImportError:  # dependência opcional
+    zstandard = None
+
+# ============================================================================
+# REQ: GSE-HLR-93: Limites de Rotação e Retenção dos Logs
+# Descrição: Tamanho (bytes) e idade (s) de um segmento de log antes da
+#            rotação; idade máxima (dias) e espaço total (bytes) dos logs
+#            mantidos em logs/; codec de compressão dos segmentos fechados.
+# ============================================================================
+LOG_ROTATE_BYTES = 8 * 1024 * 1024
+LOG_ROTATE_AGE_SEC = 24 * 60 * 60
+LOG_RETENTION_DAYS = 90
+LOG_RETENTION_BYTES = 512 * 1024 * 1024
+LOG_COMPRESSION = "gzip"
+
+LOG_PREFIX = "GSE_Sessao_"
+LOG_SUFFIXES = (".txt", ".jsonl")
+CODEC_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+_CHUNK = 1024 * 1024
+
+
+def available_codec(codec: Optional[str] = LOG_COMPRESSION) -> Optional[str]:
+    r"""Codec utilizável: zstd sem o pacote \c zstandard recai em gzip."""
+    if codec not in (None, "gzip", "zstd"):
+        raise ValueError(f"codec de compressão inválido: {codec}")
+    if codec == "zstd" and zstandard is None:
+        return "gzip"
+    return codec
+
+
+def is_compressed(path) -> bool:
+    return Path(path).suffix in CODEC_SUFFIXES.values()
+
+
+def is_session_log(path) -> bool:
+    """Arquivo de sessão (segmento de texto ou JSON Lines, comprimido ou não)."""
+    path = Path(path)
+    name = path.stem if is_compressed(path) else path.name
+    return path.name.startswith(LOG_PREFIX) and name.endswith(LOG_SUFFIXES)
+
+
+def open_log(path) -> TextIO:
+    r"""
+    \brief Abre um arquivo de log para leitura de texto (UTF-8).
+
+    \details
+    Arquivos ``.gz`` e ``.zst`` são descomprimidos de forma transparente.
+    """
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"pacote zstandard necessário para ler {path.name}")
+        stream = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+# ============================================================================
+# REQ: GSE-HLR-93: Compressão de Segmentos Fechados
+# Descrição: compress_log(path) deve gravar <path>.gz (ou .zst) em um
+#            arquivo temporário renomeado ao fim, preservar a data de
+#            modificação do original e só então apagá-lo; uma interrupção
+#            nunca deixa um arquivo comprimido incompleto.
+# ============================================================================
+def compress_log(path, codec: Optional[str] = LOG_COMPRESSION) -> Path:
+    path = Path(path)
+    codec = available_codec(codec)
+    if codec is None or is_compressed(path):
+        return path
+    target = path.with_name(path.name + CODEC_SUFFIXES[codec])
+    partial = target.with_name(target.name + ".part")
+    stat = path.stat()
+    with path.open("rb") as source, partial.open("wb") as raw:
+        if codec == "zstd":
+            writer = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        else:
+            writer = gzip.GzipFile(fileobj=raw, mode="wb", mtime=int(stat.st_mtime))
+        with writer:
+            while True:
+                chunk = source.read(_CHUNK)
+                if not chunk:
+                    break
+                writer.write(chunk)
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.utime(partial, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(partial, target)
+    path.unlink()
+    return target
+
+
+class LogMaintenance:
+    r"""
+    \class LogMaintenance
+    \brief Compressão e retenção dos logs de sessão de um diretório.
+    """
+
+    def __init__(
+        self,
+        log_dir,
+        codec: Optional[str] = LOG_COMPRESSION,
+        max_age_days: Optional[float] = LOG_RETENTION_DAYS,
+        max_bytes: Optional[int] = LOG_RETENTION_BYTES,
+        logger=print,
+    ):
+        r"""
+        \param log_dir Diretório dos logs de sessão.
+        \param codec ``"gzip"``, ``"zstd"`` ou None (sem compressão).
+        \param max_age_days Idade máxima dos arquivos (None: sem limite).
+        \param max_bytes Espaço máximo ocupado pelos logs (None: sem limite).
+        \param logger Callback de mensagens de log.
+        """
+        self.log_dir = Path(log_dir)
+        self.codec = available_codec(codec)
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self.log = logger
+        self._lock = threading.Lock()
+
+    def session_files(self, exclude: Iterable = ()) -> List[Path]:
+        r"""Arquivos de sessão, do mais antigo ao mais recente, sem \c exclude."""
+        skip = {Path(path).resolve() for path in exclude if path}
+        files = [
+            path for path in self.log_dir.glob(LOG_PREFIX + "*")
+            if is_session_log(path) and path.resolve() not in skip
+        ]
+        return sorted(files, key=lambda path: (path.stat().st_mtime_ns, path.name))
+
+    def compress(self, paths: Iterable) -> List[Path]:
+        compressed = []
+        for path in paths:
+            path = Path(path)
+            if is_compressed(path) or not path.exists():
+                continue
+            try:
+                compressed.append(compress_log(path, self.codec))
+            except Exception as e:
+                self.log(f"[LOG-AVISO] Falha ao comprimir {path.name}: {e}")
+        return compressed
+
+    # ============================================================================
+    # REQ: GSE-HLR-93: Retenção dos Logs
+    # Descrição: enforce_retention(active) deve apagar os arquivos de sessão
+    #            mais antigos que max_age_days e, se o total ainda exceder
+    #            max_bytes, os mais antigos até caber na cota. Os arquivos da
+    #            sessão ativa nunca são apagados. Retorna os apagados.
+    # ============================================================================
+    def enforce_retention(self, active: Iterable = ()) -> List[Path]:
+        files = [(path, path.stat()) for path in self.session_files(exclude=active)]
+        removed = []
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400
+            removed += [path for path, stat in files if stat.st_mtime < cutoff]
+        if self.max_bytes is not None:
+            kept = [(path, stat) for path, stat in files if path not in removed]
+            total = sum(stat.st_size for _, stat in kept)
+            for path, stat in kept:
+                if total <= self.max_bytes:
+                    break
+                removed.append(path)
+                total -= stat.st_size
+        for path in removed:
+            try:
+                path.unlink()
+            except OSError as e:
+                self.log(f"[LOG-AVISO] Falha ao apagar {path.name}: {e}")
+        if removed:
+            self.log(f"[LOG] Retenção: {len(removed)} arquivo(s) de log antigo(s) apagado(s).")
+        return removed
+
+    def run(self, active: Iterable = ()):
+        """Comprime os segmentos fechados e aplica a retenção (sem a sessão ativa)."""
+        active = list(active)
+        with self._lock:
+            # Compressões interrompidas (aplicação encerrada durante a escrita)
+            stale = time.time() - 3600
+            for partial in self.log_dir.glob(LOG_PREFIX + "*.part"):
+                if partial.stat().st_mtime < stale:
+                    partial.unlink(missing_ok=True)
+            if self.codec is not None:
+                self.compress(
+                    path for path in self.session_files(exclude=active) if not is_compressed(path)
+                )
+            self.enforce_retention(active)
+
+    def run_in_background(self, active: Iterable = (), paths: Iterable = ()) -> threading.Thread:
+        r"""
+        \brief Executa a manutenção em uma thread de fundo.
+
+        \details
+        Com \c paths, apenas esses arquivos são comprimidos (segmentos
+        recém-rotacionados); caso contrário, executa \c run(active).
+        """
+        active, paths = list(active), list(paths)
+
+        def work():
+            if paths:
+                with self._lock:
+                    self.compress(paths)
+                    self.enforce_retention(active)
+            else:
+                self.run(active)
+
+        thread = threading.Thread(target=work, name="gse-log-maintenance", daemon=True)
+        thread.start()
+        return thread
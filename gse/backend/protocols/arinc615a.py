@@ -14,11 +14,28 @@ Não contém dependências do Qt (PySide6).
 """
 
 import os
-from typing import Callable
+import time
+from functools import partial
+from typing import Callable, Optional, Union
 
+from backend.logsGSE.log_levels import LevelLogger
 from backend.protocols.tftp_client import TFTPClient
+from backend.protocols.hash_cache import HashCache, file_key
+from backend.protocols.image_source import ImageSource
+from backend.protocols.packet_cache import ImagePacketCache
+from backend.protocols.progress import PROGRESS_MAX_RATE_HZ, ProgressCoalescer
+from backend.protocols.resume_checkpoint import TransferCheckpointStore
+from backend.protocols.upload_timing import (
+    PHASE_AUTH,
+    PHASE_BIN,
+    PHASE_LUI,
+    PHASE_LUR,
+    PHASE_LUS_FINAL,
+    PHASE_LUS_INIT,
+    PhaseTiming,
+    UploadResult,
+)
 import backend.protocols.arinc_models as models
-from backend.protocols.hash_utils import calculate_file_hash
 
 # ============ CONSTANTES ============
 
@@ -44,6 +61,10 @@ class Arinc615ASession:
         tftp_client: TFTPClient,
         logger: Callable[[str], None] = None,
         progress_callback: Callable[[int], None] = None,
+        hash_cache: Optional[HashCache] = None,
+        progress_max_rate_hz: Optional[float] = PROGRESS_MAX_RATE_HZ,
+        checkpoint_store: Optional[TransferCheckpointStore] = None,
+        phase_callback: Callable[[PhaseTiming], None] = None,
     ):
         """
         Inicializa a sessão ARINC.
@@ -51,6 +72,13 @@ class Arinc615ASession:
         :param tftp_client: Uma instância já conectada de TFTPClient.
         :param logger: Callback para enviar mensagens de log (ex: self.signals.log.emit)
         :param progress_callback: Callback para enviar progresso 0-100 (ex: self.signals.progress.emit)
+        :param hash_cache: Cache persistente de SHA-256 das imagens (opcional).
+        :param progress_max_rate_hz: Limite de eventos/s do progresso do envio
+            do BIN (None: apenas mudanças de percentual).
+        :param checkpoint_store: Checkpoints de envio para retomada do BIN
+            após uma falha (opcional, GSE-HLR-84).
+        :param phase_callback: Callback chamado no início e no fim de cada
+            fase do fluxo com o PhaseTiming da fase (opcional, GSE-HLR-88).
         """
 
         # ============================================================================
@@ -73,18 +101,98 @@ class Arinc615ASession:
         # Autor: Julia | Revisor: Fabrício
         # ============================================================================
 
-        self.log = logger or (lambda msg: print(msg))
+        # GSE-HLR-90: mensagens abaixo do nível global de log são descartadas
+        self.log = LevelLogger(logger or (lambda msg: print(msg)))
         self.progress = progress_callback or (lambda pct: None)
+        self.hash_cache = hash_cache
+        self.progress_max_rate_hz = progress_max_rate_hz
+        self.checkpoint_store = checkpoint_store
+        self.phase_callback = phase_callback or (lambda phase: None)
+        self.last_result: Optional[UploadResult] = None
 
-    def run_upload_flow(self, file_path: str, part_number: str) -> bool:
+    def run_upload_flow(
+        self,
+        file_path: str,
+        part_number: str,
+        image: Optional[Union[ImageSource, ImagePacketCache]] = None,
+        hash_data: Optional[bytes] = None,
+    ) -> UploadResult:
         """
         Executa a sequência completa de upload ARINC 615A.
         Lança exceções em caso de falha.
 
         :param file_path: Caminho completo para o arquivo binário a ser enviado.
         :param part_number: O Part Number (PN) a ser incluído no LUR.
-        :return: True se bem-sucedido.
+        :param image: Imagem já aberta (ex.: memoryview compartilhado entre
+            sessões, GSE-HLR-102, ou ImagePacketCache, GSE-HLR-103); se None,
+            file_path é mapeado no PASSO 4.
+        :param hash_data: SHA-256 já calculado da imagem; se None, usa o
+            hash_cache ou calcula durante o envio.
+        :return: UploadResult com os tempos por fase; verdadeiro se bem-sucedido.
         """
+        result = self._start_result(file_path, part_number)
+        try:
+            result.finish(
+                self._run_blocking(
+                    self._upload_steps(result, file_path, part_number, image, hash_data)
+                )
+            )
+        except Exception as e:
+            self._fail_open_phase(result, e)
+            result.finish(False)
+            raise
+        finally:
+            self._log_result(result)
+        return result
+
+    # ============================================================================
+    # REQ: GSE-HLR-98 – Passos do fluxo independentes do transporte
+    # Tipo: Requisito Não Funcional
+    # Descrição: Os passos 0..5 DEVEM ser um único gerador que entrega cada
+    #            operação do TFTP (chamada sem argumentos sobre self.tftp) ao
+    #            executor e recebe de volta o resultado ou a exceção:
+    #            _run_blocking() a chama diretamente (TFTPClient) e
+    #            _run_async() aguarda a corrotina (AsyncTFTPClient).
+    # ============================================================================
+    def _run_blocking(self, steps):
+        try:
+            call = next(steps)
+            while True:
+                try:
+                    value = call()
+                except Exception as e:
+                    call = steps.throw(e)
+                else:
+                    call = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            steps.close()
+
+    async def _run_async(self, steps):
+        try:
+            call = next(steps)
+            while True:
+                try:
+                    value = await call()
+                except Exception as e:
+                    call = steps.throw(e)
+                else:
+                    call = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            steps.close()
+
+    def _upload_steps(
+        self,
+        result: UploadResult,
+        file_path: str,
+        part_number: str,
+        image: Optional[Union[ImageSource, ImagePacketCache]],
+        hash_data: Optional[bytes],
+    ) -> bool:
+        """Passos 0..5 do fluxo de upload, medindo cada fase em result."""
 
         # ============================================================================
         # REQ: GSE-LLR-63 – Pré-validação dos parâmetros do fluxo
@@ -113,14 +221,21 @@ class Arinc615ASession:
         # ============================================================================
 
         self.log("[ARINC] PASSO 0/5: Verificando chave estática (Handshake)...")
+        phase = self._begin_phase(result, PHASE_AUTH)
         try:
             # ATUALIZADO: Chamando a nova função de handshake (4 etapas)
-            if not self.tftp.perform_authentication(GSE_STATIC_KEY, EXPECTED_BC_KEY):
+            authenticated = yield partial(
+                self.tftp.perform_authentication, GSE_STATIC_KEY, EXPECTED_BC_KEY
+            )
+            if not authenticated:
                 self.log("[erro] Falha na verificação da chave estática. Abortando.")
+                self._end_phase(phase, error="chave estática rejeitada")
                 return False  # Aborta o fluxo
             self.log("[ARINC] Handshake OK.")
+            self._end_phase(phase, len(GSE_STATIC_KEY) + len(EXPECTED_BC_KEY))
         except Exception as e:
             self.log(f"[erro] Erro fatal na verificação de chave: {e}")
+            self._end_phase(phase, error=str(e))
             return False  # Aborta o fluxo
 
         # ============================================================================
@@ -136,13 +251,15 @@ class Arinc615ASession:
         # ============================================================================
 
         self.log("[ARINC] PASSO 1/5: Lendo LUI (system.LUI)...")
-        lui_data = self.tftp.read_file("system.LUI")
+        phase = self._begin_phase(result, PHASE_LUI)
+        lui_data = yield partial(self.tftp.read_file, "system.LUI")
         lui_info = models.parse_lui_response(lui_data)
 
         if "error" in lui_info:
             raise Exception(f"Falha ao parsear LUI: {lui_info['error']}")
 
         self.log("[ARINC] LUI recebido e processado.")
+        self._end_phase(phase, len(lui_data))
         # print(f"[DEBUG] Conteúdo de lui_info: {lui_info}")
 
         # ============================================================================
@@ -182,9 +299,11 @@ class Arinc615ASession:
         # ============================================================================
 
         self.log("[ARINC] PASSO 2/5: Aguardando LUS inicial (INIT_LOAD.LUS)...")
-        lus_data_inicial = self.tftp.receive_wrq_and_data()
+        phase = self._begin_phase(result, PHASE_LUS_INIT)
+        lus_data_inicial = yield self.tftp.receive_wrq_and_data
         progress_inicial = models.parse_lus_progress(lus_data_inicial)
         self.log(f"[ARINC] LUS inicial recebido.")
+        self._end_phase(phase, len(lus_data_inicial))
 
         # ============================================================================
         # REQ: GSE-LLR-69 – Progresso após PASSO 2
@@ -208,14 +327,16 @@ class Arinc615ASession:
         # ============================================================================
 
         self.log("[ARINC] PASSO 3/5: Enviando LUR (test.LUR)...")
+        phase = self._begin_phase(result, PHASE_LUR)
         lur_payload = models.build_lur_packet(header_filename, part_number)
 
-        if not self.tftp.write_file("test.LUR", lur_payload):
+        if not (yield partial(self.tftp.write_file, "test.LUR", lur_payload)):
             raise Exception("Falha ao enviar LUR (write_file falhou)")
 
         self.log(
             f"[ARINC] LUR enviado com sucesso para {header_filename} (PN: {part_number})."
         )
+        self._end_phase(phase, len(lur_payload))
 
         # ============================================================================
         # REQ: GSE-LLR-71 – Progresso após PASSO 3
@@ -231,26 +352,36 @@ class Arinc615ASession:
         # ============================================================================
         # REQ: GSE-LLR-72 – Leitura do arquivo e cálculo de SHA-256
         # Tipo: Requisito Funcional
-        # Descrição: A sessão DEVE ler o arquivo indicado por file_path e calcular o
-        #            hash SHA-256 via calculate_file_hash(bytes), registrando tamanho
-        #            lido e hash em hexadecimal; em falha de leitura, deve logar e
-        #            propagar a exceção.
+        # Descrição: A sessão DEVE verificar o arquivo indicado por file_path,
+        #            registrando o tamanho; em falha de leitura, deve logar e
+        #            propagar a exceção. O arquivo não é carregado inteiro na memória
+        #            (GSE-HLR-94) e o hash SHA-256 é calculado durante o envio, em
+        #            uma única passada pela imagem (GSE-HLR-95).
         # Autor: Julia | Revisor: Fabrício
         # ============================================================================
 
         self.log(f"[ARINC] PASSO 4/5: Preparando para servir {header_filename}...")
+        phase = self._begin_phase(result, PHASE_BIN)
         try:
             self.log(f"[ARINC] Lendo arquivo local: {file_path}")
-            with open(file_path, "rb") as f:
-                file_data = f.read()
+            file_size = os.path.getsize(file_path)
         except Exception as e:
             self.log(f"[ARINC-ERRO] Não foi possível ler o arquivo binário local: {e}")
             raise  # Propaga o erro
 
-        self.log(f"[ARINC] Lidos {len(file_data)} bytes. Calculando HASH SHA-256...")
-        hash_data = calculate_file_hash(file_data)
-        # self.log(f"[ARINC] HASH: {hash_data.hex()}")
-        self.log(f"[ARINC] HASH Calculado com sucesso.")
+        # ============================================================================
+        # REQ: GSE-HLR-96 – Reuso do HASH em cache
+        # Tipo: Requisito Não Funcional
+        # Descrição: Com hash_cache, a sessão DEVE reutilizar o digest registrado
+        #            para a imagem quando (tamanho, mtime_ns, inode) ainda coincidirem;
+        #            senão, o hash é calculado durante o envio e registrado com a
+        #            chave lida antes do envio.
+        # ============================================================================
+        cache_key = None
+        if hash_data is not None:
+            self.log(f"[ARINC] Arquivo com {file_size} bytes. HASH SHA-256 já calculado.")
+        else:
+            hash_data, cache_key = self._lookup_image_hash(file_path, file_size)
 
         # ============================================================================
         # REQ: GSE-LLR-73 – Mapeamento de progresso para a UI (40–70)
@@ -261,29 +392,42 @@ class Arinc615ASession:
         # Autor: Julia | Revisor: Fabrício
         # ============================================================================
 
-        def tftp_progress_callback(pct_0_100: int):
-            total_progress = 40 + int(pct_0_100 * 0.30)
-            self.progress(total_progress)
+        # ============================================================================
+        # REQ: GSE-HLR-101 – Progresso do envio agregado
+        # Tipo: Requisito Não Funcional
+        # Descrição: O progresso por ACK do envio do BIN DEVE passar por um
+        #            ProgressCoalescer (limite progress_max_rate_hz), entregando
+        #            à UI apenas mudanças de percentual e sempre o evento final.
+        # ============================================================================
+        tftp_progress_callback = self._make_tftp_progress_callback()
 
         # ============================================================================
         # REQ: GSE-LLR-74 – Servir BIN seguido do HASH ao RRQ
         # Tipo: Requisito Funcional
         # Descrição: A sessão DEVE atender ao RRQ do alvo servindo primeiro todos os
         #            blocos DATA (1..N) do arquivo BIN e, em seguida, um bloco DATA
-        #            contendo o HASH calculado, por meio de
-        #            tftp.serve_file_on_rrq(expected_filename, file_data, hash_data, progress_callback),
+        #            contendo o HASH calculado durante o envio, por meio de
+        #            tftp.serve_file_on_rrq(expected_filename, file_path, hash_data, progress_callback),
         #            propagando exceções de transporte quando ocorrerem.
         # Autor: Julia | Revisor: Fabrício
         # ============================================================================
 
-        self.tftp.serve_file_on_rrq(
+        yield partial(
+            self.tftp.serve_file_on_rrq,
             expected_filename=header_filename,
-            file_data=file_data,
+            file_data=file_path if image is None else image,
             hash_data=hash_data,
             progress_callback=tftp_progress_callback,
+            **self._checkpoint_kwargs(),
         )
+        tftp_progress_callback.flush()
+
+        if self.hash_cache is not None and hash_data is None:
+            self.hash_cache.put(file_path, self.tftp.last_served_hash, cache_key)
 
+        # self.log(f"[ARINC] HASH: {self.tftp.last_served_hash.hex()}")
         self.log("[ARINC] BIN e HASH servidos com sucesso.")
+        self._end_phase(phase, file_size + len(self.tftp.last_served_hash or b""))
 
         # ============================================================================
         # REQ: GSE-LLR-75 – Progresso mínimo ao fim do PASSO 4
@@ -321,8 +465,9 @@ class Arinc615ASession:
         # ============================================================================
 
         self.log("[ARINC] PASSO 5/5: Aguardando LUS 100%...")
+        phase = self._begin_phase(result, PHASE_LUS_FINAL)
         try:
-            lus_100_data = self.tftp.receive_wrq_and_data()
+            lus_100_data = yield self.tftp.receive_wrq_and_data
         except TimeoutError:
             self.log(
                 "[ARINC-ERRO] Timeout! O dispositivo não enviou o LUS 100% a tempo."
@@ -333,6 +478,7 @@ class Arinc615ASession:
 
         prog_100 = models.parse_lus_progress(lus_100_data)
         self.log(f"[ARINC] LUS 100% recebido.")
+        self._end_phase(phase, len(lus_100_data))
 
         # ============================================================================
         # REQ: GSE-LLR-78 – Aviso quando progresso final != 100%
@@ -369,5 +515,125 @@ class Arinc615ASession:
         # Descrição: A rotina run_upload_flow DEVE retornar True quando todos os
         #            passos (1..5) forem concluídos sem exceções.
         # Autor: Julia | Revisor: Fabrício
+        # Nota: Desde GSE-HLR-88, run_upload_flow retorna o UploadResult, cujo
+        #       valor-verdade é este retorno.
         # ============================================================================
         return True
+
+    # ============================================================================
+    # REQ: GSE-HLR-88 – Tempos por fase do fluxo de upload
+    # Tipo: Requisito Não Funcional
+    # Descrição: A sessão DEVE registrar, para cada fase (auth, lui, lus_init,
+    #            lur, bin, lus_final), instantes monotônicos de início e fim,
+    #            bytes trocados e retransmissões do TFTPClient; notificar
+    #            phase_callback no início e no fim de cada fase; marcar a fase
+    #            em curso com o erro quando o fluxo falhar; e registrar no log
+    #            da sessão uma linha "[ARINC-TEMPO]" com o resumo do resultado,
+    #            que fica disponível em self.last_result.
+    # ============================================================================
+    def _start_result(self, file_path: str, part_number: str) -> UploadResult:
+        result = UploadResult(file_path, part_number)
+        self.last_result = result
+        return result
+
+    def _begin_phase(self, result: UploadResult, name: str) -> PhaseTiming:
+        phase = PhaseTiming(name)
+        phase.started = time.monotonic()
+        # Retransmissões são contadas pela diferença no fim da fase
+        phase.retries = getattr(self.tftp, "retransmit_count", 0)
+        result.phases[name] = phase
+        self.phase_callback(phase)
+        return phase
+
+    def _end_phase(self, phase: PhaseTiming, nbytes: int = 0, error: Optional[str] = None):
+        phase.ended = time.monotonic()
+        phase.bytes = nbytes
+        phase.retries = getattr(self.tftp, "retransmit_count", 0) - phase.retries
+        phase.error = error
+        self.phase_callback(phase)
+
+    def _fail_open_phase(self, result: UploadResult, error: Exception):
+        for phase in result.phases.values():
+            if not phase.finished:
+                self._end_phase(phase, error=str(error) or type(error).__name__)
+
+    def _log_result(self, result: UploadResult):
+        status = "OK" if result.success else "FALHA"
+        self.log(f"[ARINC-TEMPO] {status}: {result.summary()}")
+
+    def _make_tftp_progress_callback(self) -> Callable[[int], None]:
+        """
+        Mapeia o progresso do TFTP (0–100) para a faixa 40–70 da UI
+        (GSE-LLR-73) e agrega os eventos na escala da UI (GSE-HLR-101).
+        O callback expõe flush() para entregar o último valor suprimido.
+        """
+        coalescer = ProgressCoalescer(
+            self.progress, self.progress_max_rate_hz, final_pct=70
+        )
+
+        def tftp_progress_callback(pct_0_100: int):
+            total_progress = 40 + int(pct_0_100 * 0.30)
+            coalescer(total_progress)
+
+        tftp_progress_callback.flush = coalescer.flush
+        return tftp_progress_callback
+
+    def _lookup_image_hash(self, file_path: str, file_size: int):
+        """
+        Consulta o hash_cache (GSE-HLR-96) antes do PASSO 4.
+
+        :return: (hash_data ou None, chave do arquivo lida antes do envio)
+        """
+        hash_data = None
+        cache_key = None
+        if self.hash_cache is not None:
+            cache_key = file_key(file_path)
+            hash_data = self.hash_cache.get(file_path)
+
+        if hash_data is not None:
+            self.log(f"[ARINC] Arquivo com {file_size} bytes. HASH SHA-256 obtido do cache.")
+        else:
+            self.log(
+                f"[ARINC] Arquivo com {file_size} bytes. HASH SHA-256 será calculado durante o envio."
+            )
+        return hash_data, cache_key
+
+    def _checkpoint_kwargs(self) -> dict:
+        """Repassa o checkpoint_store a serve_file_on_rrq somente quando configurado."""
+        if self.checkpoint_store is None:
+            return {}
+        return {"checkpoint_store": self.checkpoint_store}
+
+    # ============================================================================
+    # REQ: GSE-HLR-98 – Fluxo de upload assíncrono
+    # Tipo: Requisito Não Funcional
+    # Descrição: run_upload_flow_async() DEVE executar o mesmo gerador de passos
+    #            0..5 de run_upload_flow (GSE-LLR-63 a GSE-LLR-80), com os mesmos
+    #            logs, progresso e exceções, sobre um AsyncTFTPClient conectado,
+    #            de modo que várias sessões compartilhem um único laço asyncio.
+    # ============================================================================
+    async def run_upload_flow_async(
+        self,
+        file_path: str,
+        part_number: str,
+        image: Optional[Union[ImageSource, ImagePacketCache]] = None,
+        hash_data: Optional[bytes] = None,
+    ) -> UploadResult:
+        """
+        Versão asyncio de run_upload_flow (self.tftp deve ser um AsyncTFTPClient).
+        Parâmetros e retorno como em run_upload_flow.
+        """
+        result = self._start_result(file_path, part_number)
+        try:
+            result.finish(
+                await self._run_async(
+                    self._upload_steps(result, file_path, part_number, image, hash_data)
+                )
+            )
+        except Exception as e:
+            self._fail_open_phase(result, e)
+            result.finish(False)
+            raise
+        finally:
+            self._log_result(result)
+        return result
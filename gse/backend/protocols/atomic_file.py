@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Módulo de Gravação Atômica de Arquivos
+
+Define 'write_json_atomic()', usada pelos registros persistentes do GSE
+('HashCache' e 'TransferCheckpointStore') para regravar seus arquivos JSON
+sem corromper o conteúdo anterior em caso de falha durante a escrita.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import json
+import os
+import tempfile
+
+
+# ============================================================================
+# REQ: GSE-HLR-96: Gravação Atômica de JSON
+# Descrição: write_json_atomic(path, data) deve criar o diretório de path se
+#            necessário, gravar data em um arquivo temporário no mesmo
+#            diretório e substituí-lo atomicamente (os.replace). Se qualquer
+#            etapa falhar, o arquivo temporário é removido e a exceção é
+#            repassada ao chamador; o arquivo anterior permanece intacto.
+# ============================================================================
+def write_json_atomic(path: str, data) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    replaced = False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        replaced = True
+    finally:
+        if not replaced:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Módulo de Upload em Frota Multiprocesso
+
+Define a classe 'ProcessFleetUploadScheduler', variante do
+'FleetUploadScheduler' que distribui os alvos entre processos de
+transferência, contornando o GIL (análise de pacotes e log de muitas
+sessões em um só núcleo). A imagem é copiada uma única vez para um bloco
+'multiprocessing.shared_memory', mapeado por todos os processos sem cópia.
+Log, progresso e conclusão de cada alvo voltam ao processo principal por
+uma fila e são entregues aos mesmos callbacks do agendador por threads.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import multiprocessing
+import os
+import queue
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.logsGSE.log_levels import get_log_level, set_log_level
+from backend.protocols.fleet_upload import (
+    FLEET_MAX_CONCURRENCY,
+    FLEET_PACKET_BLOCK_SIZES,
+    FleetUploadScheduler,
+)
+from backend.protocols.hash_cache import HashCache
+from backend.protocols.tftp_client import TFTPClient
+
+# Intervalo de verificação de processos encerrados sem resultado
+_EVENT_POLL_SEC = 0.5
+
+
+class ProcessFleetUploadScheduler(FleetUploadScheduler):
+    """
+    Upload em frota com as sessões distribuídas entre processos.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-104: Inicialização do Agendador Multiprocesso
+    # Descrição: Além dos parâmetros de FleetUploadScheduler, o construtor deve
+    #            aceitar o número de processos (None: os.cpu_count()) e o
+    #            contexto multiprocessing (None: "spawn", seguro com threads
+    #            Qt ativas). max_concurrency continua sendo o total de sessões
+    #            simultâneas, repartido entre os processos. client_factory deve
+    #            ser serializável (função ou classe de módulo).
+    # ============================================================================
+    def __init__(
+        self,
+        max_concurrency: int = FLEET_MAX_CONCURRENCY,
+        processes: Optional[int] = None,
+        hash_cache: Optional[HashCache] = None,
+        logger: Callable[[str], None] = None,
+        progress_callback: Callable[[str, int, int], None] = None,
+        target_finished_callback: Callable[[str, bool], None] = None,
+        client_factory: Callable[[str, Callable[[str], None]], TFTPClient] = None,
+        mp_context=None,
+        packet_block_sizes: Tuple[int, ...] = FLEET_PACKET_BLOCK_SIZES,
+    ):
+        super().__init__(
+            max_concurrency=max_concurrency,
+            hash_cache=hash_cache,
+            logger=logger,
+            progress_callback=progress_callback,
+            target_finished_callback=target_finished_callback,
+            client_factory=client_factory,
+            packet_block_sizes=packet_block_sizes,
+        )
+        processes = processes or os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError(f"processes deve ser >= 1: {processes}")
+        self.processes = processes
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    # ============================================================================
+    # REQ: GSE-HLR-104: Execução Distribuída entre Processos
+    # Descrição: Os alvos devem ser repartidos entre até `processes` processos;
+    #            a imagem é copiada uma vez para memória compartilhada e o
+    #            SHA-256 já calculado é repassado a todos; cada processo
+    #            pré-codifica os pacotes (GSE-HLR-103) antes de iniciar suas
+    #            sessões. Os eventos de log, progresso e conclusão são
+    #            consumidos da fila à medida que chegam. Um processo que termine sem resultado marca seus alvos
+    #            como falha. A memória compartilhada é liberada ao final.
+    # ============================================================================
+    def _run_targets(
+        self,
+        targets: List[str],
+        file_path: str,
+        part_number: str,
+        image: memoryview,
+        digest: bytes,
+    ) -> List[Dict[str, Any]]:
+        n_shards = min(self.processes, len(targets))
+        shards = [targets[i::n_shards] for i in range(n_shards)]
+        per_shard = max(1, -(-self.max_concurrency // n_shards))
+        size = len(image)
+        self.log(
+            f"[FROTA] {len(targets)} alvo(s) em {n_shards} processo(s), "
+            f"até {per_shard} sessão(ões) por processo"
+        )
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            shm.buf[:size] = image
+            events = self.mp_context.Queue()
+            workers = [
+                self.mp_context.Process(
+                    target=_run_shard,
+                    args=(
+                        index,
+                        shm.name,
+                        size,
+                        shard,
+                        file_path,
+                        part_number,
+                        digest,
+                        per_shard,
+                        self.client_factory,
+                        self.packet_block_sizes,
+                        events,
+                        get_log_level(),
+                    ),
+                    daemon=True,
+                )
+                for index, shard in enumerate(shards)
+            ]
+            for worker in workers:
+                worker.start()
+
+            results: Dict[int, List[Dict[str, Any]]] = {}
+            while len(results) < n_shards:
+                try:
+                    event = events.get(timeout=_EVENT_POLL_SEC)
+                except queue.Empty:
+                    for index, worker in enumerate(workers):
+                        if index not in results and not worker.is_alive():
+                            results[index] = self._lost_shard(shards[index], worker.exitcode)
+                    continue
+                self._dispatch(event, results)
+
+            for worker in workers:
+                worker.join()
+        finally:
+            shm.close()
+            shm.unlink()
+
+        rows_by_ip = {row["ip"]: row for rows in results.values() for row in rows}
+        return [rows_by_ip[ip] for ip in targets]
+
+    def _dispatch(self, event: tuple, results: Dict[int, List[Dict[str, Any]]]):
+        kind = event[0]
+        if kind == "log":
+            self.log(event[1])
+        elif kind == "progress":
+            self._report_progress(event[1], event[2])
+        elif kind == "finished":
+            self.target_finished(event[1], event[2])
+        elif kind == "done":
+            results[event[1]] = event[2]
+
+    def _lost_shard(self, shard: List[str], exitcode: Optional[int]) -> List[Dict[str, Any]]:
+        error = f"Processo de transferência encerrado (código {exitcode})"
+        self.log(f"[FROTA-ERRO] {error}: {', '.join(shard)}")
+        for ip in shard:
+            self.target_finished(ip, False)
+        return [_failed_row(ip, error) for ip in shard]
+
+
+def _failed_row(ip: str, error: str) -> Dict[str, Any]:
+    return {
+        "ip": ip,
+        "success": False,
+        "error": error,
+        "elapsed_s": 0.0,
+        "bytes": 0,
+        "throughput_Bps": 0.0,
+        "phases": {},
+    }
+
+
+class _ShardScheduler(FleetUploadScheduler):
+    """Agendador do processo filho: encaminha os eventos pela fila."""
+
+    def __init__(self, max_concurrency: int, client_factory, packet_block_sizes, events):
+        super().__init__(
+            max_concurrency=max_concurrency,
+            logger=lambda msg: events.put(("log", msg)),
+            target_finished_callback=lambda ip, ok: events.put(("finished", ip, ok)),
+            client_factory=client_factory,
+            packet_block_sizes=packet_block_sizes,
+        )
+        self._events = events
+
+    def _report_progress(self, ip: str, pct: int):
+        self._events.put(("progress", ip, pct))
+
+
+def _run_shard(
+    index: int,
+    shm_name: str,
+    size: int,
+    targets: List[str],
+    file_path: str,
+    part_number: str,
+    digest: bytes,
+    max_concurrency: int,
+    client_factory,
+    packet_block_sizes: Tuple[int, ...],
+    events,
+    log_level: int,
+):
+    # GSE-HLR-90: o processo filho (spawn) não herda o nível global de log
+    set_log_level(log_level)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        scheduler = _ShardScheduler(max_concurrency, client_factory, packet_block_sizes, events)
+        with shm.buf[:size] as raw, raw.toreadonly() as image:
+            rows = scheduler._run_targets(targets, file_path, part_number, image, digest)
+    except Exception as e:
+        events.put(("log", f"[FROTA-ERRO] Processo de transferência: {e}"))
+        for ip in targets:
+            events.put(("finished", ip, False))
+        rows = [_failed_row(ip, str(e)) for ip in targets]
+    finally:
+        shm.close()
+    events.put(("done", index, rows))
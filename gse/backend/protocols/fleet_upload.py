@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Módulo de Upload em Frota
+
+Define a classe 'FleetUploadScheduler', que carrega a mesma imagem (mesmo
+PN) em vários BCs, executando um fluxo 'Arinc615ASession' por alvo em
+paralelo, limitado por max_concurrency. A imagem é mapeada e o SHA-256
+calculado uma única vez (ou obtido do hash_cache) e compartilhados por
+todas as sessões, assim como os pacotes DATA e o HASH pré-codificados
+('ImagePacketCache') antes da primeira sessão. O resultado agrega, por alvo e no total, conclusão,
+tempo e vazão.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.protocols.arinc615a import Arinc615ASession
+from backend.protocols.hash_cache import HashCache, file_key
+from backend.protocols.hash_utils import calculate_image_hash
+from backend.protocols.image_source import open_image_view
+from backend.protocols.packet_cache import ImagePacketCache
+from backend.protocols.tftp_client import (
+    BLOCK_SIZE,
+    PREFERRED_BLOCK_SIZE,
+    PREFERRED_WINDOW_SIZE,
+    TFTPClient,
+)
+from backend.protocols.upload_timing import UploadResult
+
+# ============================================================================
+# REQ: GSE-HLR-102: Concorrência Padrão do Upload em Frota
+# Descrição: Número máximo de alvos carregados simultaneamente quando não
+#            informado pelo operador.
+# ============================================================================
+FLEET_MAX_CONCURRENCY = 4
+
+# ============================================================================
+# REQ: GSE-HLR-103: Tamanhos de Bloco Pré-codificados na Frota
+# Descrição: Tamanhos de bloco cujos pacotes DATA (com rollover 0) são
+#            codificados antes de as sessões começarem: BLOCK_SIZE para alvos
+#            que não negociam opções (firmware) e PREFERRED_BLOCK_SIZE,
+#            anunciado pelo cliente padrão da frota.
+# ============================================================================
+FLEET_PACKET_BLOCK_SIZES = (BLOCK_SIZE, PREFERRED_BLOCK_SIZE)
+
+
+def _default_client_factory(ip: str, logger: Callable[[str], None]) -> TFTPClient:
+    return TFTPClient(
+        ip,
+        logger=logger,
+        blksize=PREFERRED_BLOCK_SIZE,
+        windowsize=PREFERRED_WINDOW_SIZE,
+    )
+
+
+class FleetUploadScheduler:
+    """
+    Executa o fluxo ARINC 615A em vários alvos, com imagem e HASH compartilhados.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-102: Inicialização do Agendador de Frota
+    # Descrição: O construtor deve aceitar o limite de concorrência, o
+    #            hash_cache opcional, callbacks de log (mensagem já prefixada
+    #            com o IP), de progresso por alvo (ip, pct, pct_agregado) e de
+    #            conclusão por alvo (ip, sucesso), uma fábrica de clientes
+    #            TFTP (ip, logger) para cada alvo e os tamanhos de bloco a
+    #            pré-codificar (GSE-HLR-103).
+    # ============================================================================
+    def __init__(
+        self,
+        max_concurrency: int = FLEET_MAX_CONCURRENCY,
+        hash_cache: Optional[HashCache] = None,
+        logger: Callable[[str], None] = None,
+        progress_callback: Callable[[str, int, int], None] = None,
+        target_finished_callback: Callable[[str, bool], None] = None,
+        client_factory: Callable[[str, Callable[[str], None]], TFTPClient] = None,
+        packet_block_sizes: Tuple[int, ...] = FLEET_PACKET_BLOCK_SIZES,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency deve ser >= 1: {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self.hash_cache = hash_cache
+        self.log = logger or (lambda msg: print(msg))
+        self.progress = progress_callback or (lambda ip, pct, total: None)
+        self.target_finished = target_finished_callback or (lambda ip, ok: None)
+        self.client_factory = client_factory or _default_client_factory
+        self.packet_block_sizes = tuple(packet_block_sizes)
+        self._lock = threading.Lock()
+        self._target_progress: Dict[str, int] = {}
+
+    # ============================================================================
+    # REQ: GSE-HLR-102: Execução do Upload em Frota
+    # Descrição: run() deve mapear a imagem e obter seu SHA-256 uma única vez,
+    #            compartilhando também o cache de pacotes DATA (GSE-HLR-103),
+    #            executar uma sessão por alvo (alvos repetidos são ignorados)
+    #            com no máximo max_concurrency simultâneas, isolar a falha de
+    #            um alvo dos demais e retornar o resumo: uma linha por alvo
+    #            (ip, success, error, elapsed_s, bytes, throughput_Bps) e os
+    #            totais (completed, failed, elapsed_s, total_bytes,
+    #            throughput_Bps).
+    # ============================================================================
+    def run(self, targets: List[str], file_path: str, part_number: str) -> Dict[str, Any]:
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            raise ValueError("Nenhum alvo informado para o upload em frota")
+
+        self._target_progress = {ip: 0 for ip in targets}
+        started = time.monotonic()
+        self.log(
+            f"[FROTA] Upload de {os.path.basename(file_path)} para {len(targets)} alvo(s), "
+            f"até {self.max_concurrency} simultâneo(s)"
+        )
+
+        with open_image_view(file_path) as image:
+            digest = self._image_hash(file_path, image)
+            rows = self._run_targets(targets, file_path, part_number, image, digest)
+
+        elapsed = time.monotonic() - started
+        total_bytes = sum(row["bytes"] for row in rows)
+        completed = sum(1 for row in rows if row["success"])
+        summary = {
+            "targets": rows,
+            "completed": completed,
+            "failed": len(rows) - completed,
+            "elapsed_s": elapsed,
+            "total_bytes": total_bytes,
+            "throughput_Bps": total_bytes / elapsed if elapsed > 0 else 0.0,
+        }
+        for line in format_results_table(summary).splitlines():
+            self.log(f"[FROTA] {line}")
+        return summary
+
+    def _image_hash(self, file_path: str, image: memoryview) -> bytes:
+        digest = self.hash_cache.get(file_path) if self.hash_cache is not None else None
+        if digest is not None:
+            self.log("[FROTA] HASH SHA-256 obtido do cache.")
+            return digest
+
+        key = file_key(file_path)
+        digest = calculate_image_hash(image)
+        if self.hash_cache is not None:
+            self.hash_cache.put(file_path, digest, key)
+        self.log("[FROTA] HASH SHA-256 calculado uma vez para todos os alvos.")
+        return digest
+
+    def _run_targets(
+        self,
+        targets: List[str],
+        file_path: str,
+        part_number: str,
+        image: memoryview,
+        digest: bytes,
+    ) -> List[Dict[str, Any]]:
+        with ImagePacketCache(image, hash_data=digest) as packets:
+            self._prepare_packets(packets)
+            workers = min(self.max_concurrency, len(targets))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        self._run_target, ip, file_path, part_number, packets, digest
+                    )
+                    for ip in targets
+                ]
+                return [future.result() for future in futures]
+
+    # ============================================================================
+    # REQ: GSE-HLR-103: Codificação Antecipada dos Pacotes
+    # Descrição: Os pacotes DATA e o HASH de cada tamanho de bloco de
+    #            packet_block_sizes devem ser codificados antes da primeira
+    #            sessão, fora do caminho OACK -> DATA(1) das transferências.
+    # ============================================================================
+    def _prepare_packets(self, packets: ImagePacketCache):
+        for block_size in self.packet_block_sizes:
+            if packets.prepare(block_size, 0) is None:
+                self.log(
+                    f"[FROTA] Limite do cache atingido; blocos de {block_size} bytes serão montados a cada envio"
+                )
+
+    def _report_progress(self, ip: str, pct: int):
+        with self._lock:
+            self._target_progress[ip] = pct
+            total = sum(self._target_progress.values()) // len(self._target_progress)
+        self.progress(ip, pct, total)
+
+    def _run_target(
+        self,
+        ip: str,
+        file_path: str,
+        part_number: str,
+        packets: ImagePacketCache,
+        digest: bytes,
+    ) -> Dict[str, Any]:
+        def logger(msg: str):
+            self.log(f"[{ip}] {msg}")
+
+        def progress(pct: int):
+            self._report_progress(ip, pct)
+
+        started = time.monotonic()
+        success = False
+        error = ""
+        client = None
+        session = None
+        try:
+            client = self.client_factory(ip, logger)
+            if client.connect() is False:
+                raise Exception("Falha ao criar socket UDP")
+            session = Arinc615ASession(
+                tftp_client=client,
+                logger=logger,
+                progress_callback=progress,
+            )
+            success = bool(
+                session.run_upload_flow(
+                    file_path, part_number, image=packets, hash_data=digest
+                )
+            )
+            if not success:
+                error = "Fluxo ARINC abortado (handshake)"
+        except Exception as e:
+            error = str(e)
+            logger(f"[FROTA-ERRO] {e}")
+        finally:
+            if client:
+                client.close()
+
+        elapsed = time.monotonic() - started
+        sent = len(packets.image) if success else 0
+        result = session.last_result if session else None
+        self.target_finished(ip, success)
+        return {
+            "ip": ip,
+            "success": success,
+            "error": error,
+            "elapsed_s": elapsed,
+            "bytes": sent,
+            "throughput_Bps": sent / elapsed if elapsed > 0 else 0.0,
+            # GSE-HLR-88: duração (s) de cada fase concluída
+            "phases": phase_durations(result),
+        }
+
+
+def phase_durations(result: Optional[UploadResult]) -> Dict[str, float]:
+    """Durações por fase de um UploadResult (vazio se o fluxo não começou)."""
+    if result is None:
+        return {}
+    return {
+        name: phase.duration
+        for name, phase in result.phases.items()
+        if phase.duration is not None
+    }
+
+
+# ============================================================================
+# REQ: GSE-HLR-102: Tabela de Resultados da Frota
+# Descrição: format_results_table() deve produzir uma tabela de texto com uma
+#            linha por alvo (IP, status, tempo, vazão, erro) e uma linha de
+#            totais (concluídos/falhas, tempo total, vazão agregada).
+# ============================================================================
+def format_results_table(summary: Dict[str, Any]) -> str:
+    lines = [f"{'ALVO':<17}{'STATUS':<8}{'TEMPO (s)':>10}{'KiB/s':>11}  ERRO"]
+    for row in summary["targets"]:
+        status = "OK" if row["success"] else "FALHA"
+        lines.append(
+            f"{row['ip']:<17}{status:<8}{row['elapsed_s']:>10.2f}"
+            f"{row['throughput_Bps'] / 1024:>11.1f}  {row['error']}"
+        )
+    done = f"{summary['completed']}/{len(summary['targets'])}"
+    lines.append(
+        f"{'TOTAL':<17}{done:<8}{summary['elapsed_s']:>10.2f}"
+        f"{summary['throughput_Bps'] / 1024:>11.1f}"
+    )
+    return "\n".join(lines)
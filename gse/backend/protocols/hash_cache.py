@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Módulo de Cache de Hash
+
+Define a classe 'HashCache', um cache persistente (JSON em disco) de
+digests SHA-256 de imagens importadas. Cada entrada é indexada pelo
+caminho absoluto e validada por (tamanho, mtime_ns, inode); entradas
+desatualizadas são descartadas e o número de entradas é limitado (LRU).
+A ordem de uso é mantida em memória: o arquivo só é regravado por put(),
+invalidate() e close(), nunca a cada consulta.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Optional, Tuple
+
+from backend.protocols.atomic_file import write_json_atomic
+
+# ============================================================================
+# REQ: GSE-HLR-96: Constantes do Cache de Hash
+# Descrição: O arquivo do cache (HASH_CACHE_FILENAME) fica dentro do
+#            diretório de armazenamento do GSE e o número de entradas é
+#            limitado por HASH_CACHE_MAX_ENTRIES.
+# ============================================================================
+HASH_CACHE_FILENAME = ".hash_cache.json"
+HASH_CACHE_MAX_ENTRIES = 256
+
+FileKey = Tuple[int, int, int]  # (size, mtime_ns, inode)
+
+
+def file_key(path: str) -> FileKey:
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class HashCache:
+    """
+    Cache persistente de SHA-256 por arquivo, seguro entre threads.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-96: Inicialização do Cache de Hash
+    # Descrição: O construtor deve aceitar o caminho do arquivo de cache, o
+    #            limite de entradas e um logger opcional, carregando o conteúdo
+    #            existente; arquivo ausente ou corrompido resulta em cache vazio.
+    # ============================================================================
+    def __init__(
+        self,
+        cache_path: str,
+        max_entries: int = HASH_CACHE_MAX_ENTRIES,
+        logger: Callable[[str], None] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError(f"max_entries deve ser >= 1: {max_entries}")
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.logger = logger or (lambda msg: None)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._dirty = False  # ordem LRU/remoções ainda não persistidas
+
+    # ============================================================================
+    # REQ: GSE-HLR-96: Consulta ao Cache
+    # Descrição: get() deve retornar o digest armazenado apenas se (tamanho,
+    #            mtime_ns, inode) atuais do arquivo coincidirem com os
+    #            registrados; caso contrário (ou se o arquivo não existir), a
+    #            entrada é invalidada e None é retornado. A ordem de uso e as
+    #            remoções são mantidas em memória, sem regravar o arquivo.
+    # ============================================================================
+    def get(self, path: str) -> Optional[bytes]:
+        path = os.path.abspath(path)
+        try:
+            key = file_key(path)
+        except OSError:
+            key = None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            if key is None or tuple(entry["key"]) != key:
+                self.logger(f"[HASH-CACHE] Entrada desatualizada para {path}")
+                del self._entries[path]
+                self._dirty = True
+                return None
+            # Reinsere no fim: a ordem do dicionário é a ordem de uso (LRU)
+            self._entries[path] = self._entries.pop(path)
+            self._dirty = True
+            return bytes.fromhex(entry["digest"])
+
+    # ============================================================================
+    # REQ: GSE-HLR-96: Registro no Cache
+    # Descrição: put() deve registrar o digest de 32 bytes com a chave do
+    #            arquivo (capturada pelo chamador antes do cálculo, ou lida
+    #            agora) e persistir o cache; o hash nulo bytes(32) de
+    #            GSE-LLR-86 nunca é registrado. Ao exceder max_entries, as
+    #            entradas menos recentemente usadas são removidas.
+    # ============================================================================
+    def put(self, path: str, digest: bytes, key: Optional[FileKey] = None):
+        if len(digest) != 32 or digest == bytes(32):
+            return
+        path = os.path.abspath(path)
+        if key is None:
+            try:
+                key = file_key(path)
+            except OSError:
+                return
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = {"key": list(key), "digest": digest.hex()}
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._save()
+
+    def invalidate(self, path: str):
+        with self._lock:
+            if self._entries.pop(os.path.abspath(path), None) is not None:
+                self._save()
+
+    def close(self):
+        """Persiste a ordem de uso e as remoções feitas por get()."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ============================================================================
+    # REQ: GSE-HLR-96: Persistência do Cache
+    # Descrição: O cache deve ser gravado de forma atômica (write_json_atomic)
+    #            para que uma falha durante a escrita não corrompa o conteúdo
+    #            anterior; falhas de E/S são registradas e não interrompem o
+    #            fluxo de upload.
+    # ============================================================================
+    def _load(self) -> dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                raise ValueError("formato inesperado")
+            return entries
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger(f"[HASH-CACHE] Cache ignorado ({e})")
+            return {}
+
+    def _save(self):
+        try:
+            write_json_atomic(self.cache_path, self._entries)
+            self._dirty = False
+        except Exception as e:
+            self.logger(f"[HASH-CACHE] Falha ao gravar cache: {e}")
@@ -17,6 +17,11 @@ especificamente o cálculo de hash SHA-256.
 import hashlib
 from typing import Union
 
+from backend.protocols.image_source import ImageSource, open_image_view
+
+# Tamanho das fatias entregues ao hashlib ao processar imagens
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def calculate_file_hash(data: Union[bytes, bytearray, memoryview]) -> bytes:
     """
@@ -89,3 +94,74 @@ def calculate_file_hash(data: Union[bytes, bytearray, memoryview]) -> bytes:
         # ============================================================================
         print(f"[HASH-ERRO] Falha ao calcular hash: {e}")
         return bytes(32)
+
+
+# ============================================================================
+# REQ: GSE-HLR-95 – Hasher incremental (streaming)
+# Tipo: Requisito Funcional
+# Descrição: StreamingHasher DEVE acumular o SHA-256 de uma sequência de fatias
+#            bytes-like entregues em ordem por update(), sem copiá-las, e
+#            produzir o digest de 32 bytes em digest(). Falhas seguem
+#            GSE-LLR-86: a mensagem "[HASH-ERRO]" é registrada e digest()
+#            retorna bytes(32).
+# ============================================================================
+class StreamingHasher:
+    """
+    Acumula o hash SHA-256 de dados entregues em fatias.
+    """
+
+    def __init__(self):
+        self.bytes_hashed = 0
+        self._failed = False
+        try:
+            self._h = hashlib.sha256()
+        except Exception as e:
+            print(f"[HASH-ERRO] Falha ao calcular hash: {e}")
+            self._failed = True
+
+    def update(self, chunk: Union[bytes, bytearray, memoryview]):
+        if self._failed:
+            return
+        try:
+            self._h.update(chunk)
+            self.bytes_hashed += len(chunk)
+        except Exception as e:
+            print(f"[HASH-ERRO] Falha ao calcular hash: {e}")
+            self._failed = True
+
+    def digest(self) -> bytes:
+        if self._failed:
+            return bytes(32)
+        digest = self._h.digest()
+        if len(digest) != 32:
+            print("[HASH-ERRO] Digest SHA-256 com tamanho inesperado.")
+            return bytes(32)
+        return digest
+
+
+# ============================================================================
+# REQ: GSE-HLR-94 – Hash de imagem sem carregar o arquivo inteiro
+# Tipo: Requisito Não Funcional
+# Descrição: calculate_image_hash() DEVE calcular o SHA-256 de uma imagem
+#            (caminho, objeto de arquivo, mmap ou bytes-like) percorrendo-a em
+#            fatias memoryview de HASH_CHUNK_SIZE com StreamingHasher, sem
+#            copiar o conteúdo; erros seguem GSE-LLR-86 ("[HASH-ERRO]" e
+#            bytes(32)).
+# ============================================================================
+def calculate_image_hash(source: ImageSource) -> bytes:
+    """
+    Calcula o hash SHA-256 de uma imagem sem lê-la inteira para a memória.
+
+    :param source: Caminho, objeto de arquivo, mmap ou dados bytes-like.
+    :return: O hash SHA-256 "cru" (32 bytes).
+    """
+    hasher = StreamingHasher()
+    try:
+        with open_image_view(source) as view:
+            for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                with view[offset : offset + HASH_CHUNK_SIZE] as chunk:
+                    hasher.update(chunk)
+    except Exception as e:
+        print(f"[HASH-ERRO] Falha ao calcular hash: {e}")
+        return bytes(32)
+    return hasher.digest()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Módulo de Origem de Imagem
+
+Fornece open_image_view(), que expõe o conteúdo de uma imagem (BIN)
+como memoryview somente leitura, sem carregar o arquivo inteiro na
+memória. Aceita caminho, objeto de arquivo, mmap ou bytes-like.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
+
+ImageSource = Union[bytes, bytearray, memoryview, mmap.mmap, str, os.PathLike, BinaryIO]
+
+
+# ============================================================================
+# REQ: GSE-HLR-94: Origem de Imagem Mapeada em Memória
+# Descrição: open_image_view() deve fornecer um memoryview somente leitura da
+#            imagem: caminhos e arquivos em disco são mapeados com mmap
+#            (ACCESS_READ); mmap e bytes-like são expostos diretamente; objetos
+#            de arquivo sem descritor são lidos como fallback. Ao sair do
+#            contexto, o memoryview é liberado e o mapeamento/arquivo aberto
+#            pela rotina é fechado. Fatias do memoryview não copiam dados.
+# ============================================================================
+@contextmanager
+def open_image_view(source: ImageSource) -> Iterator[memoryview]:
+    owned = []  # recursos abertos aqui e que devem ser fechados na saída
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            f = open(source, "rb")
+            owned.append(f)
+            buffer = _map_file(f, owned)
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            buffer = source
+        elif isinstance(source, io.BytesIO):
+            buffer = source.getbuffer()
+            owned.append(buffer)
+        elif hasattr(source, "fileno"):
+            buffer = _map_file(source, owned)
+        else:
+            buffer = source.read()
+
+        raw = memoryview(buffer)
+        owned.append(raw)
+        view = raw.toreadonly()
+        owned.append(view)
+        yield view
+    finally:
+        for resource in reversed(owned):
+            if isinstance(resource, memoryview):
+                resource.release()
+            else:
+                resource.close()
+
+
+def _map_file(f: BinaryIO, owned: list):
+    try:
+        fileno = f.fileno()
+    except (OSError, io.UnsupportedOperation):
+        return f.read()
+    if os.fstat(fileno).st_size == 0:
+        # mmap não aceita arquivos vazios
+        return b""
+    mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    owned.append(mapped)
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        # Leitura sequencial: o kernel pode descartar páginas já enviadas
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Módulo de Cache de Pacotes DATA Pré-codificados
+
+Define a classe 'ImagePacketCache', que codifica uma única vez os pacotes
+DATA (cabeçalho + fatia da imagem) de uma imagem para cada combinação de
+tamanho de bloco e rollover negociada, e os compartilha, somente leitura,
+entre as sessões simultâneas do upload em frota. Os pacotes ficam em um
+arquivo temporário mapeado em memória (mmap), de modo que as páginas podem
+ser descartadas pelo kernel e o uso de RAM fica limitado; o total codificado
+por imagem é limitado por max_bytes. A codificação é feita por prepare(),
+antes de as sessões começarem; cada sessão passa a apenas enviar fatias
+memoryview do mapeamento (e o pacote do HASH) e acompanhar os ACKs.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import mmap
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+from backend.protocols.tftp_codec import (
+    HEADER_SIZE,
+    HEADER_STRUCT,
+    OP_DATA,
+    block_number,
+    build_data,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-103: Limite do Cache de Pacotes
+# Descrição: Por padrão, no máximo PACKET_CACHE_MAX_BYTES bytes de pacotes
+#            pré-codificados por imagem; acima disso as sessões voltam a
+#            montar os pacotes a cada envio.
+# ============================================================================
+PACKET_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+class EncodedImage:
+    """
+    Pacotes DATA de uma imagem para um tamanho de bloco e rollover, em mmap.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-103: Codificação dos Pacotes DATA
+    # Descrição: Cada pacote ocupa um registro de HEADER_SIZE + block_size
+    #            bytes no arquivo de apoio (cabeçalho DATA com o número de
+    #            bloco já com rollover, seguido da fatia da imagem). A
+    #            sequência inclui o pacote final 0-byte quando o tamanho da
+    #            imagem é múltiplo de block_size, como em _send_file_windowed().
+    #            Com hash_data, hash_packet guarda também o DATA do HASH, no
+    #            bloco seguinte ao último da imagem.
+    # ============================================================================
+    def __init__(
+        self,
+        image: memoryview,
+        block_size: int,
+        rollover_to: int,
+        hash_data: Optional[bytes] = None,
+    ):
+        self.block_size = block_size
+        self.rollover_to = rollover_to
+        self.total_bytes = len(image)
+        self.count = encoded_packet_count(self.total_bytes, block_size)
+        self._stride = HEADER_SIZE + block_size
+        self.hash_packet: Optional[bytes] = None
+        if hash_data is not None:
+            self.hash_packet = build_data(block_number(self.count + 1, rollover_to), hash_data)
+
+        self._file = tempfile.TemporaryFile(prefix="gse-packets-")
+        size = max(self.count * self._stride, 1)  # mmap não aceita tamanho 0
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        for idx in range(self.count):
+            record = idx * self._stride
+            offset = idx * block_size
+            payload = image[offset : offset + block_size]
+            HEADER_STRUCT.pack_into(
+                self._mmap, record, OP_DATA, block_number(idx + 1, rollover_to)
+            )
+            self._mmap[record + HEADER_SIZE : record + HEADER_SIZE + len(payload)] = payload
+            payload.release()
+        self._view = memoryview(self._mmap).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        return self.count * self._stride
+
+    # ============================================================================
+    # REQ: GSE-HLR-103: Acesso aos Pacotes Pré-codificados
+    # Descrição: packet(idx) deve retornar, sem cópia, o pacote DATA completo
+    #            da posição de sequência idx (0 = bloco 1) como memoryview
+    #            somente leitura do mapeamento.
+    # ============================================================================
+    def packet(self, idx: int) -> memoryview:
+        record = idx * self._stride
+        payload_len = min(self.block_size, self.total_bytes - idx * self.block_size)
+        return self._view[record : record + HEADER_SIZE + max(payload_len, 0)]
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+def encoded_packet_count(total_bytes: int, block_size: int) -> int:
+    count = -(-total_bytes // block_size)
+    if total_bytes > 0 and total_bytes % block_size == 0:
+        count += 1
+    return count
+
+
+class ImagePacketCache:
+    """
+    Pacotes DATA de uma imagem, compartilhados entre sessões simultâneas.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-103: Cache de Pacotes por Imagem
+    # Descrição: O cache é criado para uma imagem (memoryview já aberto) e o
+    #            HASH opcional, e pode ser passado como file_data a
+    #            serve_file_on_rrq(). prepare(block_size, rollover_to) deve
+    #            codificar os pacotes (uma única vez por combinação) antes das
+    #            sessões e retornar o EncodedImage, ou None se a codificação
+    #            ultrapassar max_bytes no total. encoded() apenas consulta o
+    #            que já foi preparado (None se não houver), sem codificar
+    #            durante uma transferência. close() libera os mapeamentos e os
+    #            arquivos de apoio.
+    # ============================================================================
+    def __init__(
+        self,
+        image: memoryview,
+        max_bytes: int = PACKET_CACHE_MAX_BYTES,
+        hash_data: Optional[bytes] = None,
+    ):
+        self.image = image
+        self.max_bytes = max_bytes
+        self.hash_data = hash_data
+        self._lock = threading.Lock()
+        self._encoded: Dict[Tuple[int, int], EncodedImage] = {}
+        self._used = 0
+
+    def encoded(self, block_size: int, rollover_to: int) -> Optional[EncodedImage]:
+        with self._lock:
+            return self._encoded.get((block_size, rollover_to))
+
+    def prepare(self, block_size: int, rollover_to: int) -> Optional[EncodedImage]:
+        key = (block_size, rollover_to)
+        with self._lock:
+            encoded = self._encoded.get(key)
+            if encoded is not None:
+                return encoded
+            needed = encoded_packet_count(len(self.image), block_size) * (
+                HEADER_SIZE + block_size
+            )
+            if self._used + needed > self.max_bytes:
+                return None
+            encoded = EncodedImage(self.image, block_size, rollover_to, self.hash_data)
+            self._encoded[key] = encoded
+            self._used += encoded.nbytes
+            return encoded
+
+    def close(self):
+        with self._lock:
+            for encoded in self._encoded.values():
+                encoded.close()
+            self._encoded.clear()
+            self._used = 0
+
+    def __enter__(self) -> "ImagePacketCache":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
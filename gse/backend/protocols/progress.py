@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Módulo de Agregação de Progresso
+
+Define a classe 'ProgressCoalescer', que fica entre o laço de envio do
+TFTP (um callback por ACK) e o callback de progresso da UI, repassando
+apenas mudanças de percentual e no máximo max_rate_hz eventos por
+segundo; o evento de 100% é sempre entregue.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import time
+from typing import Callable, Optional
+
+# ============================================================================
+# REQ: GSE-HLR-101: Taxa Máxima de Eventos de Progresso
+# Descrição: Por padrão, no máximo PROGRESS_MAX_RATE_HZ eventos de progresso
+#            por segundo chegam à UI durante o envio da imagem.
+# ============================================================================
+PROGRESS_MAX_RATE_HZ = 20.0
+
+
+class ProgressCoalescer:
+    """
+    Callback de progresso (0-100) com supressão de repetições e limite de taxa.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-101: Agregação de Progresso
+    # Descrição: Cada chamada deve repassar o percentual ao callback somente se
+    #            ele mudou desde o último evento e se já passou 1/max_rate_hz
+    #            desde esse evento (max_rate_hz None ou 0: sem limite de taxa).
+    #            O valor suprimido fica pendente e é entregue por flush();
+    #            final_pct (padrão 100) é entregue imediatamente.
+    # ============================================================================
+    def __init__(
+        self,
+        callback: Callable[[int], None],
+        max_rate_hz: Optional[float] = PROGRESS_MAX_RATE_HZ,
+        final_pct: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.callback = callback
+        self.final_pct = final_pct
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self._clock = clock
+        self._last_pct = None
+        self._last_emit = None
+        self._pending = None
+
+    def __call__(self, pct: int):
+        if pct == self._last_pct:
+            self._pending = None
+            return
+        now = self._clock()
+        if (
+            pct >= self.final_pct
+            or self._last_emit is None
+            or now - self._last_emit >= self.min_interval
+        ):
+            self._emit(pct, now)
+        else:
+            self._pending = pct
+
+    def flush(self):
+        if self._pending is not None:
+            self._emit(self._pending, self._clock())
+
+    def _emit(self, pct: int, now: float):
+        self._pending = None
+        self._last_pct = pct
+        self._last_emit = now
+        self.callback(pct)
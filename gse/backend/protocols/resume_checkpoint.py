@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Módulo de Checkpoint de Transferência
+
+Define a classe 'TransferCheckpointStore', um registro persistente (JSON
+em disco) do último bloco confirmado de cada envio de imagem interrompido,
+indexado por (alvo, SHA-256 da imagem). Uma nova sessão com o mesmo alvo e
+a mesma imagem retoma o envio a partir desse ponto, negociado com a opção
+TFTP "resume" (GSE-HLR-84).
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import json
+import threading
+import time
+from typing import Callable
+
+from backend.protocols.atomic_file import write_json_atomic
+
+# ============================================================================
+# REQ: GSE-HLR-84: Constantes do Checkpoint de Transferência
+# Descrição: O arquivo de checkpoints (CHECKPOINT_FILENAME) fica dentro do
+#            diretório de armazenamento do GSE; o número de envios
+#            interrompidos registrados é limitado por CHECKPOINT_MAX_ENTRIES.
+# ============================================================================
+CHECKPOINT_FILENAME = ".transfer_checkpoints.json"
+CHECKPOINT_MAX_ENTRIES = 64
+
+
+def checkpoint_key(target: str, digest: bytes) -> str:
+    return f"{target}|{digest.hex()}"
+
+
+class TransferCheckpointStore:
+    """
+    Checkpoints persistentes de envio por (alvo, imagem), seguro entre threads.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-84: Inicialização do Registro de Checkpoints
+    # Descrição: O construtor deve aceitar o caminho do arquivo, o limite de
+    #            entradas e um logger opcional, carregando o conteúdo
+    #            existente; arquivo ausente ou corrompido resulta em registro
+    #            vazio.
+    # ============================================================================
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = CHECKPOINT_MAX_ENTRIES,
+        logger: Callable[[str], None] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError(f"max_entries deve ser >= 1: {max_entries}")
+        self.path = path
+        self.max_entries = max_entries
+        self.logger = logger or (lambda msg: None)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    # ============================================================================
+    # REQ: GSE-HLR-84: Consulta e Registro de Checkpoints
+    # Descrição: get() deve retornar quantos blocos do envio (alvo, digest)
+    #            foram confirmados, ou 0 se não houver checkpoint ou se ele foi
+    #            gravado com outro tamanho de bloco. save() deve registrar os
+    #            blocos confirmados (0 remove a entrada) e clear() deve
+    #            remover a entrada após um envio concluído. Ao exceder
+    #            max_entries, os checkpoints mais antigos são removidos.
+    # ============================================================================
+    def get(self, target: str, digest: bytes, block_size: int) -> int:
+        with self._lock:
+            entry = self._entries.get(checkpoint_key(target, digest))
+        if entry is None or entry["block_size"] != block_size:
+            return 0
+        return entry["acked_blocks"]
+
+    def save(self, target: str, digest: bytes, block_size: int, acked_blocks: int):
+        if acked_blocks <= 0:
+            self.clear(target, digest)
+            return
+        key = checkpoint_key(target, digest)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {
+                "block_size": block_size,
+                "acked_blocks": acked_blocks,
+                "updated": time.time(),
+            }
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._save()
+
+    def clear(self, target: str, digest: bytes):
+        with self._lock:
+            if self._entries.pop(checkpoint_key(target, digest), None) is not None:
+                self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ============================================================================
+    # REQ: GSE-HLR-84: Persistência dos Checkpoints
+    # Descrição: Gravação atômica (write_json_atomic), como no HashCache
+    #            (GSE-HLR-96); falhas de E/S são registradas e não
+    #            interrompem o fluxo de upload.
+    # ============================================================================
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                raise ValueError("formato inesperado")
+            return entries
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger(f"[CHECKPOINT] Registro ignorado ({e})")
+            return {}
+
+    def _save(self):
+        try:
+            write_json_atomic(self.path, self._entries)
+        except Exception as e:
+            self.logger(f"[CHECKPOINT] Falha ao gravar checkpoint: {e}")
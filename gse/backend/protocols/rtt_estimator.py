@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Módulo de Estimativa de RTT
+
+Define a classe 'RttEstimator', que mantém SRTT/RTTVAR a partir de
+amostras de tempo de ida e volta e calcula o timeout de retransmissão
+(RTO) no estilo do RFC 6298, com backoff exponencial e regra de Karn
+(amostras de pacotes retransmitidos são descartadas pelo chamador).
+
+Não contém dependências do Qt (PySide6).
+"""
+
+# ============================================================================
+# REQ: GSE-HLR-97: Constantes do Estimador de RTT
+# Descrição: INITIAL_RTO_SEC é o RTO antes da primeira amostra; MIN_RTO_SEC é o
+#            piso do RTO (evita retransmissões espúrias em enlaces rápidos);
+#            RTT_ALPHA/RTT_BETA/RTO_K e CLOCK_GRANULARITY_SEC seguem o RFC 6298.
+# ============================================================================
+INITIAL_RTO_SEC = 1.0
+MIN_RTO_SEC = 0.05
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTO_K = 4
+CLOCK_GRANULARITY_SEC = 0.001
+
+
+class RttEstimator:
+    """
+    Estimador de RTT e RTO para uma sessão com um mesmo par.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-97: Inicialização do Estimador
+    # Descrição: O construtor deve aceitar o RTO inicial e os limites mínimo e
+    #            máximo; o RTO efetivo fica sempre em [min_rto, max_rto].
+    # ============================================================================
+    def __init__(
+        self,
+        initial_rto: float = INITIAL_RTO_SEC,
+        min_rto: float = MIN_RTO_SEC,
+        max_rto: float = 60.0,
+    ):
+        if not 0 < min_rto <= max_rto:
+            raise ValueError(f"Limites de RTO inválidos: [{min_rto}, {max_rto}]")
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.srtt = None
+        self.rttvar = None
+        self._base_rto = self._clamp(initial_rto)
+        self._backoff = 1
+
+    @property
+    def rto(self) -> float:
+        return self._clamp(self._base_rto * self._backoff)
+
+    # ============================================================================
+    # REQ: GSE-HLR-97: Amostra de RTT
+    # Descrição: sample() deve atualizar SRTT/RTTVAR (primeira amostra:
+    #            SRTT = R, RTTVAR = R/2; demais: médias exponenciais com
+    #            RTT_BETA e RTT_ALPHA), recalcular o RTO como
+    #            SRTT + max(G, K*RTTVAR) e desfazer o backoff acumulado.
+    # ============================================================================
+    def sample(self, rtt: float):
+        if rtt < 0:
+            return
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+        self._base_rto = self._clamp(
+            self.srtt + max(CLOCK_GRANULARITY_SEC, RTO_K * self.rttvar)
+        )
+        self._backoff = 1
+
+    # ============================================================================
+    # REQ: GSE-HLR-97: Backoff em Timeout
+    # Descrição: backoff() deve dobrar o RTO a cada timeout (teto max_rto) até
+    #            a próxima amostra válida.
+    # ============================================================================
+    def backoff(self):
+        if self._base_rto * self._backoff < self.max_rto:
+            self._backoff *= 2
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min_rto), self.max_rto)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Módulo de Transporte TFTP Assíncrono (asyncio)
+
+Define a classe 'AsyncTFTPClient', que expõe as mesmas operações do
+'TFTPClient' (autenticação, read_file, write_file, receive_wrq_and_data,
+serve_file_on_rrq) como corrotinas sobre asyncio.DatagramProtocol.
+
+A lógica do protocolo não é duplicada: as etapas de transferência do
+TFTPClient são geradores que pedem (socket, timeout) a cada espera, e
+aqui são executadas pelo laço de eventos em vez de recvfrom() bloqueante.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import asyncio
+import socket
+from typing import Callable, Optional, Tuple, Union
+
+from backend.protocols.image_source import ImageSource
+from backend.protocols.packet_cache import ImagePacketCache
+from backend.protocols.resume_checkpoint import TransferCheckpointStore
+from backend.protocols.tftp_client import ReadSink, TFTPClient
+
+
+class _DatagramEndpoint(asyncio.DatagramProtocol):
+    """
+    Socket UDP assíncrono com a interface mínima usada pelas etapas do
+    TFTPClient (sendto, getsockname, settimeout/gettimeout, close).
+    """
+
+    def __init__(self, timeout: float):
+        self.transport = None
+        self._timeout = timeout
+        self._queue = asyncio.Queue()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        self._queue.put_nowait((data, addr))
+
+    def error_received(self, exc: Exception):
+        # ICMP (ex.: porta inalcançável): a retransmissão por RTO trata a perda
+        pass
+
+    def sendto(self, pkt: bytes, addr: Tuple[str, int]):
+        self.transport.sendto(pkt, addr)
+
+    def getsockname(self) -> Tuple[str, int]:
+        return self.transport.get_extra_info("sockname")
+
+    def settimeout(self, timeout: Optional[float]):
+        self._timeout = timeout
+
+    def gettimeout(self) -> Optional[float]:
+        return self._timeout
+
+    async def recvfrom(self, timeout: Optional[float] = None) -> Tuple[bytes, Tuple[str, int]]:
+        if timeout is None:
+            timeout = self._timeout
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout("timed out")
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+
+class AsyncTFTPClient(TFTPClient):
+    """
+    Cliente TFTP para asyncio: várias sessões compartilham um único laço
+    de eventos, sem uma thread por alvo.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-98: Conexão UDP Assíncrona
+    # Descrição: connect() deve criar o endpoint UDP principal no laço corrente
+    #            (local_addr opcional, padrão porta efêmera em todas as
+    #            interfaces), registrar sucesso/erro e retornar True/False.
+    # ============================================================================
+    async def connect(self, local_addr: Tuple[str, int] = ("0.0.0.0", 0)) -> bool:
+        try:
+            self.sock = await self._open_endpoint(local_addr)
+            self.log("[TFTP-OK] Socket UDP principal criado")
+            return True
+        except Exception as e:
+            self.log(f"[TFTP-ERRO] Erro ao criar socket: {e}")
+            return False
+
+    async def _open_endpoint(self, local_addr: Tuple[str, int]) -> _DatagramEndpoint:
+        loop = asyncio.get_running_loop()
+        _, endpoint = await loop.create_datagram_endpoint(
+            lambda: _DatagramEndpoint(self.timeout), local_addr=local_addr
+        )
+        return endpoint
+
+    # ============================================================================
+    # REQ: GSE-HLR-98: Execução Assíncrona das Etapas de Transferência
+    # Descrição: _run_async() deve executar as etapas geradoras do TFTPClient
+    #            aguardando cada datagrama no endpoint pedido pelo timeout pedido
+    #            e repassando socket.timeout/erros de recepção ao gerador, com o
+    #            mesmo contrato de _run_blocking(). O buffer de recepção opcional
+    #            (GSE-HLR-100) é ignorado: o datagrama já chega como bytes próprios.
+    #            Funções entregues pela etapa (trabalho de CPU, ex.: HASH) rodam
+    #            no executor padrão, sem bloquear o laço de eventos.
+    # ============================================================================
+    async def _run_async(self, steps):
+        loop = asyncio.get_running_loop()
+        try:
+            wait = next(steps)
+            while True:
+                try:
+                    if callable(wait):
+                        received = await loop.run_in_executor(None, wait)
+                    else:
+                        received = await wait[0].recvfrom(wait[1])
+                except Exception as e:
+                    wait = steps.throw(e)
+                else:
+                    wait = steps.send(received)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            steps.close()
+
+    # ============================================================================
+    # REQ: GSE-HLR-98: Sem Execução Bloqueante no Cliente Assíncrono
+    # Descrição: As operações herdadas que aguardam datagramas com
+    #            _run_blocking() (recvfrom síncrono) não funcionam sobre o
+    #            endpoint asyncio: recv_ack_packet()/recv_data_packet() são
+    #            corrotinas sobre _run_async(), e _run_blocking() lança
+    #            TypeError para qualquer outro caminho síncrono herdado.
+    #            send_ack() apenas envia (sendto não bloqueante) e é mantido.
+    # ============================================================================
+    def _run_blocking(self, steps):
+        steps.close()
+        raise TypeError(
+            "AsyncTFTPClient não executa etapas bloqueantes; use as corrotinas (await)"
+        )
+
+    async def recv_ack_packet(self) -> int:
+        if not self.sock:
+            raise RuntimeError("Socket não inicializado (recv_ack_packet).")
+        return await self._run_async(self._recv_ack_steps())
+
+    async def recv_data_packet(self) -> Optional[Tuple[int, bytes]]:
+        if not self.sock:
+            raise RuntimeError("Socket não inicializado (recv_data_packet).")
+        return await self._run_async(self._recv_data_steps())
+
+    async def perform_authentication(self, gse_key: bytes, expected_bc_key: bytes) -> bool:
+        """
+        Handshake de autenticação com o BC (GSE-LLR-098 a GSE-LLR-103).
+        O timeout curto é aplicado por espera; o do endpoint não é alterado.
+        """
+        self.log("[AUTH] Iniciando handshake de autenticação (DATA/ACK)...")
+        if not self.sock:
+            self.log("[AUTH-ERRO] Socket não está conectado.")
+            return False
+        return await self._run_async(self._authentication_steps(gse_key, expected_bc_key))
+
+    async def read_file(self, filename: str, mode: str = "octet") -> bytes:
+        data_buffer = bytearray()
+        await self.read_file_into(filename, data_buffer, mode)
+        return bytes(data_buffer)
+
+    async def read_file_into(self, filename: str, sink: ReadSink, mode: str = "octet") -> int:
+        return await self._run_async(self._read_file_steps(filename, sink, mode))
+
+    async def write_file(self, filename: str, data: bytes, mode: str = "octet") -> bool:
+        return await self._run_async(self._write_file_steps(filename, data, mode))
+
+    async def receive_wrq_and_data(self) -> bytes:
+        return await self._run_async(self._receive_wrq_steps())
+
+    async def serve_file_on_rrq(
+        self,
+        expected_filename: str,
+        file_data: Union[ImageSource, ImagePacketCache],
+        hash_data: Optional[bytes] = None,
+        progress_callback: Callable[[int], None] = None,
+        checkpoint_store: Optional[TransferCheckpointStore] = None,
+    ) -> bool:
+        rrq_addr, filename, accepted = await self._run_async(
+            self._await_rrq_steps(expected_filename)
+        )
+
+        transfer_sock = None
+        try:
+            transfer_sock = await self._open_endpoint(("0.0.0.0", 0))
+            self.log(f"[TFTP-ARINC] Socket de transferência (BIN)")
+            return await self._run_async(
+                self._serve_transfer_steps(
+                    transfer_sock,
+                    rrq_addr,
+                    filename,
+                    accepted,
+                    file_data,
+                    hash_data,
+                    progress_callback,
+                    checkpoint_store,
+                )
+            )
+
+        except Exception as e:
+            self.log(f"[TFTP-ERRO] Erro em serve_file_on_rrq: {e}")
+            raise
+        finally:
+            if transfer_sock:
+                transfer_sock.close()
+                self.log("[TFTP-ARINC] Socket de transferência (BIN) fechado")
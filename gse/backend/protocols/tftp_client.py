@@ -3,7 +3,8 @@
 Módulo de Protocolo TFTP
 
 Fornece uma classe TFTPClient "pura" para lidar com a
-transferência de arquivos TFTP (RFC 1350).
+transferência de arquivos TFTP (RFC 1350), com negociação opcional
+do tamanho de bloco (RFC 2347/2348).
 
 Esta classe é deliberadamente "burra" sobre o ARINC 615A.
 Ela apenas sabe como:
@@ -15,11 +16,34 @@ Ela apenas sabe como:
 Não contém dependências do Qt (PySide6).
 """
 
+import functools
 import socket
 import struct
 import time
 from enum import Enum
-from typing import Tuple, Callable, Optional
+from typing import Dict, Tuple, Callable, Optional, Union
+
+from backend.logsGSE.log_levels import TRACE, get_log_level, level_of, log_enabled
+from backend.protocols.hash_utils import StreamingHasher, calculate_image_hash
+from backend.protocols.image_source import ImageSource, open_image_view
+from backend.protocols.packet_cache import EncodedImage, ImagePacketCache
+from backend.protocols.resume_checkpoint import TransferCheckpointStore
+from backend.protocols.rtt_estimator import INITIAL_RTO_SEC, MIN_RTO_SEC, RttEstimator
+from backend.protocols.tftp_codec import (
+    HEADER_SIZE,
+    HEADER_STRUCT,
+    MAX_BLOCK_NUMBER,
+    OP_ACK,
+    OP_DATA,
+    OP_ERROR,
+    OP_OACK,
+    PacketWriter,
+    block_number,
+    build_ack,
+    build_data,
+    parse_header,
+    parse_opcode,
+)
 
 # ============================================================================
 # REQ: GSE-LLR-87: Constante de Porta TFTP
@@ -51,7 +75,68 @@ TIMEOUT_SEC = 10
 # Autor: Julia
 # Revisor: Fabrício
 # ============================================================================
-MAX_RETRIES = 1
+# REQ: GSE-HLR-97: Orçamento de Retentativas com RTO Adaptativo
+# Descrição: Com o RTO adaptativo, cada timeout dura pouco mais que o RTT
+#            medido e dobra a cada falha (teto TIMEOUT_SEC); 8 tentativas a
+#            partir do RTO mínimo somam mais de 10 s, preservando a tolerância a
+#            operações lentas de flash de GSE-LLR-89. Vale apenas quando o par
+#            aceitou blksize/windowsize em um OACK.
+# ============================================================================
+MAX_RETRIES = 8
+
+# ============================================================================
+# REQ: GSE-HLR-97: Lock-step sem Opções Negociadas
+# Descrição: Sem blksize/windowsize aceitos em OACK, o par pode ser um
+#            firmware que grava todo DATA recebido, inclusive repetidos. A
+#            transferência aguarda então TIMEOUT_SEC inteiro por resposta e
+#            não retransmite por conta própria (LOCKSTEP_MAX_RETRIES), como
+#            antes do RTO adaptativo.
+# ============================================================================
+LOCKSTEP_MAX_RETRIES = 1
+
+# Timeout curto do handshake de autenticação (GSE-LLR-99)
+AUTH_TIMEOUT_SEC = 5.0
+
+# ============================================================================
+# REQ: GSE-HLR-69: Negociação de Opções TFTP (blksize - RFC 2347/2348)
+# Descrição: O tamanho de bloco pode ser negociado via OACK entre MIN_BLOCK_SIZE
+#            e MAX_BLOCK_SIZE. PREFERRED_BLOCK_SIZE (1468) ocupa um quadro com
+#            MTU de 1500 bytes sem fragmentação IP. Se o par ignorar as opções,
+#            a transferência continua com BLOCK_SIZE (512).
+# ============================================================================
+MIN_BLOCK_SIZE = 8
+PREFERRED_BLOCK_SIZE = 1468
+MAX_BLOCK_SIZE = 8192
+# Maior datagrama TFTP aceito na recepção (DATA com o maior blksize)
+MAX_PACKET_SIZE = 4 + MAX_BLOCK_SIZE
+OPT_BLKSIZE = "blksize"
+
+# ============================================================================
+# REQ: GSE-HLR-105: Negociação de Janela TFTP (windowsize - RFC 7440)
+# Descrição: Até windowsize blocos DATA podem ficar em trânsito antes do ACK
+#            cumulativo. O valor 1 corresponde ao lock-step do RFC 1350 e
+#            dispensa a negociação.
+# ============================================================================
+PREFERRED_WINDOW_SIZE = 8
+MAX_WINDOW_SIZE = 65535
+OPT_WINDOWSIZE = "windowsize"
+
+# ============================================================================
+# REQ: GSE-HLR-106: Rollover do Número de Bloco (opção rollover)
+# Descrição: O número de bloco tem 16 bits. Após o bloco MAX_BLOCK_NUMBER a
+#            sequência continua em 0 ou 1, conforme a opção "rollover" (padrão 0),
+#            permitindo arquivos com mais de 65535 blocos.
+# ============================================================================
+OPT_ROLLOVER = "rollover"
+
+# ============================================================================
+# REQ: GSE-HLR-84: Retomada de Envio (opção resume)
+# Descrição: No RRQ, "resume" informa quantos blocos do arquivo o alvo já
+#            possui. O OACK responde com quantos blocos serão pulados (o menor
+#            entre o pedido e o checkpoint do GSE para o alvo e a imagem; 0
+#            sem checkpoint) e o envio continua no bloco seguinte.
+# ============================================================================
+OPT_RESUME = "resume"
 
 
 class TFTP_OPCODE(Enum):
@@ -60,6 +145,36 @@ class TFTP_OPCODE(Enum):
     DATA = 3
     ACK = 4
     ERROR = 5
+    OACK = 6
+
+
+# Tabela valor -> membro, evitando a chamada TFTP_OPCODE(valor) por pacote
+_OPCODE_BY_VALUE = {op.value: op for op in TFTP_OPCODE}
+
+
+def _opcode_enum(value: int) -> TFTP_OPCODE:
+    opcode = _OPCODE_BY_VALUE.get(value)
+    return opcode if opcode is not None else TFTP_OPCODE(value)
+
+
+# ============================================================================
+# REQ: GSE-HLR-100: Destino dos Dados Recebidos (Sink)
+# Descrição: read_file_into() grava cada payload recebido em um sink: um
+#            bytearray (estendido), um objeto com write() (ex.: arquivo aberto
+#            em modo binário) ou um callable que recebe um memoryview válido
+#            apenas durante a chamada.
+# ============================================================================
+ReadSink = Union[bytearray, Callable[[memoryview], object], object]
+
+
+def _sink_writer(sink: ReadSink) -> Callable[[memoryview], object]:
+    if isinstance(sink, bytearray):
+        return sink.extend
+    if hasattr(sink, "write"):
+        return sink.write
+    if callable(sink):
+        return sink
+    raise TypeError(f"Sink inválido para read_file_into: {type(sink).__name__}")
 
 
 class TFTP_ERROR(Enum):
@@ -71,6 +186,7 @@ class TFTP_ERROR(Enum):
     UNKNOWN_TID = 5
     FILE_EXISTS = 6
     NO_SUCH_USER = 7
+    OPTION_NEGOTIATION = 8
 
 
 class TFTPClient:
@@ -110,7 +226,24 @@ class TFTPClient:
         server_port: int = TFTP_PORT,
         timeout: int = TIMEOUT_SEC,
         logger: Callable[[str], None] = None,
+        blksize: int = BLOCK_SIZE,
+        windowsize: int = 1,
+        rollover: int = 0,
+        max_retries: int = MAX_RETRIES,
+        min_rto: float = MIN_RTO_SEC,
     ):
+        if not MIN_BLOCK_SIZE <= blksize <= MAX_BLOCK_SIZE:
+            raise ValueError(
+                f"blksize fora da faixa [{MIN_BLOCK_SIZE}, {MAX_BLOCK_SIZE}]: {blksize}"
+            )
+        if not 1 <= windowsize <= MAX_WINDOW_SIZE:
+            raise ValueError(
+                f"windowsize fora da faixa [1, {MAX_WINDOW_SIZE}]: {windowsize}"
+            )
+        if rollover not in (0, 1):
+            raise ValueError(f"rollover deve ser 0 ou 1: {rollover}")
+        if max_retries < 1:
+            raise ValueError(f"max_retries deve ser >= 1: {max_retries}")
         self.server_ip = server_ip
         self.server_port_69 = server_port
         self.timeout = timeout
@@ -118,9 +251,48 @@ class TFTPClient:
         self.server_tid = None
         self.logger = logger or (lambda msg: print(msg))
         self.authenticated: bool = False
-
+        # Tamanho de bloco máximo a negociar (BLOCK_SIZE desliga a negociação)
+        self.blksize = blksize
+        # Janela máxima a negociar (1 desliga a negociação)
+        self.windowsize = windowsize
+        # Bloco seguinte a MAX_BLOCK_NUMBER (0 ou 1)
+        self.rollover = rollover
+        # Tamanho de bloco, janela e rollover efetivos da transferência corrente
+        self.block_size = BLOCK_SIZE
+        self.window_size = 1
+        self.rollover_to = rollover
+        # Último HASH enviado por serve_file_on_rrq (GSE-HLR-95)
+        self.last_served_hash: Optional[bytes] = None
+        # REQ: GSE-HLR-97 - RTO adaptativo da sessão e orçamento de retentativas
+        self.max_retries = max_retries
+        # Ligado somente após OACK com blksize/windowsize (transferência corrente)
+        self.adaptive_rto = False
+        self.rtt = RttEstimator(
+            initial_rto=min(INITIAL_RTO_SEC, timeout), min_rto=min(min_rto, timeout), max_rto=timeout
+        )
+        # GSE-LLR-95: métrica de retransmissões da sessão
+        self.retransmit_count = 0
+        # GSE-HLR-84: blocos confirmados do envio corrente (para o checkpoint)
+        self.acked_blocks = 0
+        # GSE-HLR-99: buffer de envio reutilizável para DATA/ACK
+        self._writer = PacketWriter(MAX_BLOCK_SIZE)
+        # GSE-HLR-100: buffer de recepção reutilizável (recvfrom_into)
+        self._recv_view = memoryview(bytearray(MAX_PACKET_SIZE))
+
+    # ============================================================================
+    # REQ: GSE-HLR-90: Log com Níveis no Transporte
+    # Descrição: log(msg) deve repassar ao logger apenas mensagens cujo nível
+    #            (pela tag) esteja habilitado; trace(fmt, *args) só formata e
+    #            repassa quando TRACE estiver habilitado. Os laços por bloco
+    #            consultam log_enabled(TRACE) uma vez por transferência.
+    # ============================================================================
     def log(self, msg: str):
-        self.logger(msg)
+        if level_of(msg) >= get_log_level():
+            self.logger(msg)
+
+    def trace(self, fmt: str, *args):
+        if log_enabled(TRACE):
+            self.logger(fmt % args)
 
     # ============================================================================
     # REQ: GSE-LLR-96: Interface de Conexão UDP
@@ -150,6 +322,57 @@ class TFTPClient:
             self.sock = None
             self.log("[TFTP-OK] Socket principal fechado")
 
+    # ============================================================================
+    # REQ: GSE-HLR-98: Execução Bloqueante das Etapas de Transferência
+    # Descrição: As rotinas de transferência são geradores que entregam
+    #            (socket, timeout) a cada espera e recebem (pacote, endereço) ou
+    #            a exceção de recepção (ex.: socket.timeout). _run_blocking()
+    #            executa essas etapas com recvfrom() bloqueante, aplicando o
+    #            timeout pedido e restaurando ao final o timeout do socket
+    #            principal. O mesmo gerador é executado pelo transporte asyncio
+    #            (tftp_async.AsyncTFTPClient), sem duplicar a lógica do protocolo.
+    #            GSE-HLR-100: uma etapa pode entregar (socket, timeout, buffer);
+    #            o pacote é então recebido com recvfrom_into() no buffer e
+    #            entregue como memoryview, válido só até a próxima espera.
+    #            Uma etapa também pode entregar uma função sem argumentos
+    #            (trabalho de CPU, ex.: HASH da imagem); o resultado ou a
+    #            exceção volta ao gerador. Aqui ela é chamada diretamente.
+    # ============================================================================
+    def _run_blocking(self, steps):
+        main_sock = self.sock
+        main_timeout = main_sock.gettimeout() if main_sock is not None else None
+        try:
+            wait = next(steps)
+            while True:
+                if callable(wait):
+                    try:
+                        result = wait()
+                    except Exception as e:
+                        wait = steps.throw(e)
+                    else:
+                        wait = steps.send(result)
+                    continue
+                sock, timeout = wait[0], wait[1]
+                buffer = wait[2] if len(wait) > 2 else None
+                if timeout is not None:
+                    sock.settimeout(timeout)
+                try:
+                    if buffer is not None and hasattr(sock, "recvfrom_into"):
+                        size, addr = sock.recvfrom_into(buffer)
+                        received = (buffer[:size], addr)
+                    else:
+                        received = sock.recvfrom(MAX_PACKET_SIZE)
+                except Exception as e:
+                    wait = steps.throw(e)
+                else:
+                    wait = steps.send(received)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            steps.close()
+            if main_sock is not None and main_sock is self.sock:
+                main_sock.settimeout(main_timeout)
+
     # ============================================================================
     # REQ: GSE-LLR-98: Interface de Handshake (Definição)
     # Descrição: A rotina perform_authentication(gse_key, expected_bc_key) deve
@@ -203,22 +426,33 @@ class TFTPClient:
         try:
             # REQ: GSE-LLR-099
             original_timeout = self.sock.gettimeout()
-            self.sock.settimeout(5.0)  # Timeout curto para handshake
+            return self._run_blocking(
+                self._authentication_steps(gse_key, expected_bc_key)
+            )
+        finally:
+            # REQ: GSE-LLR-103
+            if original_timeout is not None:
+                self.sock.settimeout(original_timeout)
+                self.log(
+                    f"[AUTH] Timeout do socket restaurado para {original_timeout}s."
+                )
 
+    def _authentication_steps(self, gse_key: bytes, expected_bc_key: bytes):
+        try:
             self.server_tid = None  # Reseta TID
 
             # --- PASSO 1: Enviar chave GSE para o BC ---
             # REQ: GSE-LLR-100 (Parte 1)
-            self.log(f"[AUTH] Enviando chave GSE (DATA 1) para porta {TFTP_PORT}...")
+            self.log(f"[AUTH] Enviando chave GSE (DATA 1) para porta {self.server_port_69}...")
             pkt = struct.pack("!HH", TFTP_OPCODE.DATA.value, 1) + gse_key
-            self.sock.sendto(pkt, (self.server_ip, TFTP_PORT))
+            self.sock.sendto(pkt, (self.server_ip, self.server_port_69))
             self.log("[✓] DATA(1) com chave GSE enviado")
 
             # --- PASSO 2: Aguardar ACK(1) do BC ---
             # REQ: GSE-LLR-100 (Parte 2)
             self.log("[AUTH] Aguardando ACK(1) do BC...")
             # Usamos a nova helper function (GSE-LLR-133)
-            ack_block = self.recv_ack_packet()
+            ack_block = yield from self._recv_ack_steps(AUTH_TIMEOUT_SEC)
             if ack_block != 1:
                 self.log(f"[✗] ACK(1) não recebido, recebido Bloco={ack_block}")
                 return False  # REQ: GSE-LLR-102
@@ -229,7 +463,7 @@ class TFTPClient:
             # REQ: GSE-LLR-101 (Parte 1)
             self.log("[AUTH] Aguardando chave do BC (DATA 1)...")
             # Usamos a nova helper function (GSE-LLR-137)
-            result = self.recv_data_packet()
+            result = yield from self._recv_data_steps(AUTH_TIMEOUT_SEC)
             if not result:
                 self.log("[✗] Chave do BC não recebida (timeout ou erro)")
                 return False  # REQ: GSE-LLR-102
@@ -260,13 +494,6 @@ class TFTPClient:
             # REQ: GSE-LLR-102 (parcial)
             self.log(f"[✗] Erro durante autenticação: {e}")
             return False
-        finally:
-            # REQ: GSE-LLR-103
-            if original_timeout is not None:
-                self.sock.settimeout(original_timeout)
-                self.log(
-                    f"[AUTH] Timeout do socket restaurado para {original_timeout}s."
-                )
 
     # ============================================================================
     # INÍCIO - NOVOS HELPERS DE AUTENTICAÇÃO
@@ -283,8 +510,10 @@ class TFTPClient:
     def recv_ack_packet(self) -> int:
         if not self.sock:
             raise RuntimeError("Socket não inicializado (recv_ack_packet).")
+        return self._run_blocking(self._recv_ack_steps())
 
-        pkt, addr = self.sock.recvfrom(516)
+    def _recv_ack_steps(self, timeout: Optional[float] = None):
+        pkt, addr = yield (self.sock, timeout)
         opcode, block = self._parse_ack_packet(pkt)  # Usa GSE-LLR-128
 
         if opcode == TFTP_OPCODE.ERROR:  # Usa GSE-LLR-131
@@ -311,8 +540,10 @@ class TFTPClient:
     def recv_data_packet(self) -> Optional[Tuple[int, bytes]]:
         if not self.sock:
             raise RuntimeError("Socket não inicializado (recv_data_packet).")
+        return self._run_blocking(self._recv_data_steps())
 
-        pkt, addr = self.sock.recvfrom(4 + BLOCK_SIZE)
+    def _recv_data_steps(self, timeout: Optional[float] = None):
+        pkt, addr = yield (self.sock, timeout)
         opcode, block, payload = self._parse_data_packet(pkt)  # Usa GSE-LLR-127
 
         if opcode == TFTP_OPCODE.ERROR:  # Usa GSE-LLR-131
@@ -401,24 +632,74 @@ class TFTPClient:
     # Autor: Julia
     # Revisor: Fabrício
     # ============================================================================
+    # ============================================================================
+    # REQ: GSE-HLR-97: Recepção com RTO Adaptativo
+    # Descrição: read_file() deve aguardar cada DATA pelo RTO da sessão (o
+    #            primeiro, após o RRQ, por no mínimo INITIAL_RTO_SEC), amostrar
+    #            o RTT entre o RRQ/ACK enviado e o DATA seguinte quando não houve
+    #            retransmissão (Karn), e restaurar o timeout do socket ao final.
+    # ============================================================================
+    # ============================================================================
+    # REQ: GSE-HLR-100: Recepção sem Acúmulo Quadrático
+    # Descrição: read_file_into() deve receber cada DATA com recvfrom_into() em
+    #            um buffer reutilizado e gravar o payload no sink (sem concatenar
+    #            bytes), retornando o total de bytes recebidos. read_file()
+    #            mantém a interface anterior, retornando bytes.
+    # ============================================================================
     def read_file(self, filename: str, mode: str = "octet") -> bytes:
+        data_buffer = bytearray()
+        self.read_file_into(filename, data_buffer, mode)
+        return bytes(data_buffer)
+
+    def read_file_into(self, filename: str, sink: ReadSink, mode: str = "octet") -> int:
+        return self._run_blocking(self._read_file_steps(filename, sink, mode))
+
+    def _read_file_steps(self, filename: str, sink: ReadSink, mode: str):
         self.log(f"[TFTP] Lendo arquivo (RRQ): {filename}")
-        data_buffer = b""
+        trace = log_enabled(TRACE)  # GSE-HLR-90: consultado uma vez por leitura
+        write = _sink_writer(sink)
+        total_bytes = 0
+        expected_seq = 1  # posição do próximo bloco na sequência (sem rollover)
         expected_block = 1
         retry_count = 0
+        unacked = 0  # blocos recebidos desde o último ACK (RFC 7440)
+        gap_acked = False
         self.server_tid = None
+        self._reset_transfer_options()
+        options = self._request_options()
 
-        self._send_rrq(filename, mode, (self.server_ip, self.server_port_69))
+        self._send_rrq(filename, mode, (self.server_ip, self.server_port_69), options)
+        sent_at = time.monotonic()  # último RRQ/ACK ainda não amostrado
 
         while True:
             try:
-                data, addr = self.sock.recvfrom(4 + BLOCK_SIZE)
-                opcode, block, payload = self._parse_data_packet(data)
+                rto = self._ack_timeout()
+                if self.server_tid is None:
+                    rto = min(max(rto, INITIAL_RTO_SEC), self.timeout)
+                data, addr = yield (self.sock, rto, self._recv_view)
+                # REQ: GSE-HLR-99 - cabeçalho lido como inteiros (sem Enum)
+                opcode, block = parse_header(data)
 
-                if opcode == TFTP_OPCODE.ERROR:
-                    err_code, err_msg = self._parse_error_packet(data)
+                if opcode == OP_ERROR:
+                    err_code, err_msg = self._parse_error_packet(bytes(data))
                     raise Exception(f"Erro TFTP {err_code}: {err_msg}")
-                if opcode != TFTP_OPCODE.DATA:
+
+                # REQ: GSE-HLR-69 - OACK confirma as opções; respondemos ACK(0)
+                if (
+                    opcode == OP_OACK
+                    and options
+                    and self.server_tid is None
+                ):
+                    self.server_tid = addr[1]
+                    self._apply_oack(self._parse_oack_packet(bytes(data)), options, addr)
+                    if sent_at is not None:
+                        self.rtt.sample(time.monotonic() - sent_at)
+                    self._send_ack(0, (self.server_ip, self.server_tid))
+                    sent_at = time.monotonic()
+                    retry_count = 0
+                    continue
+
+                if opcode != OP_DATA:
                     self.log(f"[TFTP-AVISO] Pacote inesperado (opcode={opcode})")
                     continue
 
@@ -428,6 +709,10 @@ class TFTPClient:
                     #     f"[TFTP-OK] Servidor respondeu da porta {addr[0]}:{self.server_tid}"
                     # )
                     self.log(f"[TFTP-OK] Servidor respondeu da porta")
+                    if options:
+                        self.log(
+                            f"[TFTP-AVISO] Servidor ignorou as opções, usando blocos de {BLOCK_SIZE} bytes"
+                        )
                 if addr[1] != self.server_tid:
                     self.log(f"[TFTP-AVISO] DATA de TID inesperado {addr}")
                     continue
@@ -436,37 +721,67 @@ class TFTPClient:
                     self.log(
                         f"[TFTP-AVISO] Bloco fora de ordem: esperado {expected_block}, recebido {block}"
                     )
-                    self._send_ack(
-                        expected_block - 1, (self.server_ip, self.server_tid)
-                    )
+                    # Com janela, um único ACK por lacuna faz o servidor voltar
+                    if self.window_size == 1 or not gap_acked:
+                        self._send_ack(
+                            self._block_number(expected_seq - 1),
+                            (self.server_ip, self.server_tid),
+                        )
+                        gap_acked = True
+                        unacked = 0
                     continue
 
-                data_buffer += payload
-                self._send_ack(block, (self.server_ip, self.server_tid))
-
-                expected_block += 1
+                payload = data[HEADER_SIZE:]
+                if trace:
+                    self.trace("[TFTP-TRACE] RRQ DATA %d (%d bytes)", block, len(payload))
+                write(payload)
+                total_bytes += len(payload)
+                last_block = len(payload) < self.block_size
+                unacked += 1
+                if sent_at is not None:
+                    self.rtt.sample(time.monotonic() - sent_at)
+                    sent_at = None
+                # REQ: GSE-HLR-105 - ACK cumulativo ao fim de cada janela
+                if last_block or unacked >= self.window_size:
+                    self._send_ack(block, (self.server_ip, self.server_tid))
+                    sent_at = time.monotonic()
+                    unacked = 0
+
+                expected_seq += 1
+                expected_block = self._block_number(expected_seq)
                 retry_count = 0
+                gap_acked = False
 
-                if len(payload) < BLOCK_SIZE:
+                if last_block:
                     self.log(
-                        f"[TFTP-OK] Leitura (RRQ) de {filename} concluída ({len(data_buffer)} bytes)"
+                        f"[TFTP-OK] Leitura (RRQ) de {filename} concluída ({total_bytes} bytes)"
                     )
-                    return data_buffer
+                    return total_bytes
 
             except socket.timeout:
                 retry_count += 1
-                if retry_count >= MAX_RETRIES:
+                if retry_count >= self._retry_limit():
                     self.log(
                         f"[TFTP-ERRO] Timeout: Limite de tentativas atingido ao ler {filename}"
                     )
                     raise
                 self.log(
-                    f"[TFTP-AVISO] Timeout (RRQ), tentativa {retry_count}/{MAX_RETRIES}"
+                    f"[TFTP-AVISO] Timeout (RRQ), tentativa {retry_count}/{self._retry_limit()}"
                 )
-                if expected_block == 1:
+                self.rtt.backoff()
+                sent_at = None  # Karn: resposta a uma retransmissão não é amostrada
+                self.retransmit_count += 1
+                if expected_seq == 1 and self.server_tid is None:
                     self._send_rrq(
-                        filename, mode, (self.server_ip, self.server_port_69)
+                        filename, mode, (self.server_ip, self.server_port_69), options
+                    )
+                elif self.server_tid is not None:
+                    # Reenvia o último ACK (ACK(0) após OACK ou fim de janela perdido)
+                    self._send_ack(
+                        self._block_number(expected_seq - 1),
+                        (self.server_ip, self.server_tid),
                     )
+                    unacked = 0
                 continue
             except Exception as e:
                 self.log(f"[TFTP-ERRO] Erro em read_file: {e}")
@@ -489,22 +804,34 @@ class TFTPClient:
     # Revisor: Fabrício
     # ============================================================================
     def write_file(self, filename: str, data: bytes, mode: str = "octet") -> bool:
+        return self._run_blocking(self._write_file_steps(filename, data, mode))
+
+    def _write_file_steps(self, filename: str, data: bytes, mode: str):
         self.log(f"[TFTP] Escrevendo arquivo (WRQ): {filename}")
         self.server_tid = None
+        self._reset_transfer_options()
+        options = self._request_options()
 
-        self._send_wrq(filename, mode, (self.server_ip, self.server_port_69))
+        self._send_wrq(filename, mode, (self.server_ip, self.server_port_69), options)
 
         try:
-            ack_pkt, addr = self.sock.recvfrom(516)
+            ack_pkt, addr = yield (self.sock, self.timeout)
             opcode, ack_block = self._parse_ack_packet(ack_pkt)
 
             if opcode == TFTP_OPCODE.ERROR:
                 err_code, err_msg = self._parse_error_packet(ack_pkt)
                 raise Exception(f"Erro TFTP {err_code}: {err_msg}")
-            if opcode != TFTP_OPCODE.ACK or ack_block != 0:
+            # REQ: GSE-HLR-69 - OACK substitui o ACK(0) quando há opções aceitas
+            if opcode == TFTP_OPCODE.OACK and options:
+                self._apply_oack(self._parse_oack_packet(ack_pkt), options, addr)
+            elif opcode != TFTP_OPCODE.ACK or ack_block != 0:
                 raise Exception(
                     f"Resposta inválida ao WRQ: opcode={opcode} ack_block={ack_block}"
                 )
+            elif options:
+                self.log(
+                    f"[TFTP-AVISO] Servidor ignorou as opções, usando blocos de {BLOCK_SIZE} bytes"
+                )
 
             self.server_tid = addr[1]
             destination_addr = (self.server_ip, self.server_tid)
@@ -513,28 +840,21 @@ class TFTPClient:
             # )
             self.log(f"[TFTP-OK] Servidor aceitou o write request")
 
+            seq = 1
             block_num = 1
             offset = 0
             total = len(data)
             while offset < total:
-                chunk = data[offset : offset + BLOCK_SIZE]
-                self._send_data(block_num, chunk, destination_addr)
-
-                ack_pkt, _ = self.sock.recvfrom(516)
-                op2, ack_block = self._parse_ack_packet(ack_pkt)
-
-                if op2 == TFTP_OPCODE.ERROR:
-                    err_code, err_msg = self._parse_error_packet(ack_pkt)
-                    raise Exception(f"Erro TFTP {err_code}: {err_msg}")
-                if op2 != TFTP_OPCODE.ACK or ack_block != block_num:
-                    self.log(
-                        f"[TFTP-AVISO] ACK inválido. Esperado {block_num}, recebido {ack_block}"
-                    )
-                    raise Exception("Falha de ACK no envio de dados")
+                chunk = data[offset : offset + self.block_size]
+                # REQ: GSE-HLR-97 - DATA(N) retransmitido pelo RTO adaptativo
+                yield from self._send_data_and_wait_ack_steps(
+                    self.sock, block_num, chunk, destination_addr
+                )
 
                 offset += len(chunk)
-                block_num += 1
-                if len(chunk) < BLOCK_SIZE:
+                seq += 1
+                block_num = self._block_number(seq)
+                if len(chunk) < self.block_size:
                     break
 
             self.log(
@@ -558,9 +878,13 @@ class TFTPClient:
     # Revisor: Fabrício
     # ============================================================================
     def receive_wrq_and_data(self) -> bytes:
+        return self._run_blocking(self._receive_wrq_steps())
+
+    def _receive_wrq_steps(self):
         self.log("[TFTP-ARINC] Aguardando WRQ (LUS) no socket principal...")
+        self._reset_transfer_options()
 
-        wrq_pkt, wrq_addr = self.sock.recvfrom(516)
+        wrq_pkt, wrq_addr = yield (self.sock, self.timeout)
         opcode, filename = self._parse_wrq_packet(wrq_pkt)
         if opcode != TFTP_OPCODE.WRQ:
             raise Exception(f"Pacote inesperado (esperava WRQ), opcode={opcode}")
@@ -568,7 +892,7 @@ class TFTPClient:
         self.log(f"[TFTP-ARINC] WRQ para '{filename}' do módulo.")
         self._send_ack(0, wrq_addr)
 
-        data_pkt, data_addr = self.sock.recvfrom(4 + BLOCK_SIZE)
+        data_pkt, data_addr = yield (self.sock, self.timeout)
         opcode, block, payload = self._parse_data_packet(data_pkt)
 
         if opcode != TFTP_OPCODE.DATA or block != 1:
@@ -598,18 +922,83 @@ class TFTPClient:
     # Autor: Julia
     # Revisor: Fabrício
     # ============================================================================
+    # ============================================================================
+    # REQ: GSE-HLR-94: Imagem Servida sem Cópia
+    # Descrição: file_data pode ser caminho, objeto de arquivo, mmap ou bytes-like;
+    #            a imagem é aberta via open_image_view() e os blocos DATA são
+    #            fatias memoryview, mantendo o uso de memória independente do
+    #            tamanho da imagem.
+    # ============================================================================
+    # REQ: GSE-HLR-95: HASH Calculado Durante o Envio
+    # Descrição: Se hash_data for None, o SHA-256 da imagem deve ser acumulado
+    #            por StreamingHasher na primeira transmissão de cada bloco (as
+    #            retransmissões não são recontadas) e enviado como DATA final.
+    #            O hash enviado fica disponível em self.last_served_hash.
+    # ============================================================================
+    # REQ: GSE-HLR-103: Imagem com Pacotes Pré-codificados
+    # Descrição: file_data também pode ser um ImagePacketCache compartilhado por
+    #            várias sessões; se a combinação de opções negociada já foi
+    #            preparada, os blocos DATA (e o HASH, quando é o do cache) são
+    #            enviados a partir dele. A sessão nunca codifica pacotes.
+    # ============================================================================
+    # REQ: GSE-HLR-84: Checkpoint e Retomada do Envio
+    # Descrição: Com checkpoint_store, uma falha durante o envio grava os
+    #            blocos já confirmados por (alvo, HASH); um RRQ com a opção
+    #            resume retoma a partir deles, e o checkpoint é removido quando
+    #            o HASH é confirmado. Sem hash_data, o HASH da imagem inteira
+    #            só é calculado antes do envio se o RRQ pedir resume, ou na
+    #            falha, antes de gravar o checkpoint; caso contrário segue
+    #            acumulado durante o envio (GSE-HLR-95).
+    # ============================================================================
     def serve_file_on_rrq(
         self,
         expected_filename: str,
-        file_data: bytes,
-        hash_data: bytes,
+        file_data: Union[ImageSource, ImagePacketCache],
+        hash_data: Optional[bytes] = None,
         progress_callback: Callable[[int], None] = None,
+        checkpoint_store: Optional[TransferCheckpointStore] = None,
     ) -> bool:
+        rrq_addr, filename, accepted = self._run_blocking(
+            self._await_rrq_steps(expected_filename)
+        )
+
+        transfer_sock = None
+        try:
+            transfer_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            transfer_sock.settimeout(self.timeout)
+            transfer_sock.bind(("", 0))
+            transfer_port = transfer_sock.getsockname()[1]
+            # self.log(
+            #     f"[TFTP-ARINC] Socket de transferência (BIN) na porta {transfer_port}"
+            # )
+            self.log(f"[TFTP-ARINC] Socket de transferência (BIN)")
+            return self._run_blocking(
+                self._serve_transfer_steps(
+                    transfer_sock,
+                    rrq_addr,
+                    filename,
+                    accepted,
+                    file_data,
+                    hash_data,
+                    progress_callback,
+                    checkpoint_store,
+                )
+            )
+
+        except Exception as e:
+            self.log(f"[TFTP-ERRO] Erro em serve_file_on_rrq: {e}")
+            raise
+        finally:
+            if transfer_sock:
+                transfer_sock.close()
+                self.log("[TFTP-ARINC] Socket de transferência (BIN) fechado")
+
+    def _await_rrq_steps(self, expected_filename: str):
         self.log(f"[TFTP-ARINC] Aguardando RRQ para '{expected_filename}'...")
 
         # Erro do PN
         try:
-            rrq_pkt, rrq_addr = self.sock.recvfrom(516)
+            rrq_pkt, rrq_addr = yield (self.sock, self.timeout)
         except socket.timeout:
             self.log(
                 "[TFTP-ERRO] Isso pode indicar uma falha no Alvo ou que o PN é inválido/rejeitado."
@@ -632,54 +1021,124 @@ class TFTPClient:
         # self.log(f"[TFTP-ARINC] RRQ para '{filename}' de {rrq_addr[0]}:{rrq_addr[1]}")
         self.log(f"[TFTP-ARINC] RRQ para '{filename}'")
 
-        transfer_sock = None
-        try:
-            transfer_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            transfer_sock.settimeout(self.timeout)
-            transfer_sock.bind(("", 0))
-            transfer_port = transfer_sock.getsockname()[1]
-            # self.log(
-            #     f"[TFTP-ARINC] Socket de transferência (BIN) na porta {transfer_port}"
-            # )
-            self.log(f"[TFTP-ARINC] Socket de transferência (BIN)")
+        self._reset_transfer_options()
+        options = self._parse_request_options(rrq_pkt)
+        accepted = self._accept_request_options(options)
+        # REQ: GSE-HLR-84 - valor final definido em _serve_transfer_steps
+        resume = self._int_option(options, OPT_RESUME)
+        if resume is not None and resume >= 0:
+            accepted[OPT_RESUME] = str(resume)
+        return rrq_addr, filename, accepted
 
-            block_num = 1
-            offset = 0
-            total_bytes = len(file_data)
-            self.log(f"[TFTP-ARINC] Enviando {total_bytes} bytes para o módulo...")
-
-            while offset < total_bytes:
-                chunk = file_data[offset : offset + BLOCK_SIZE]
-                self._send_data_and_wait_ack(transfer_sock, block_num, chunk, rrq_addr)
+    def _serve_transfer_steps(
+        self,
+        transfer_sock,
+        rrq_addr: Tuple[str, int],
+        filename: str,
+        accepted: Dict[str, str],
+        file_data: Union[ImageSource, ImagePacketCache],
+        hash_data: Optional[bytes],
+        progress_callback: Callable[[int], None],
+        checkpoint_store: Optional[TransferCheckpointStore] = None,
+    ):
+        # REQ: GSE-HLR-103 - Pacotes DATA pré-codificados compartilhados
+        packets = None
+        if isinstance(file_data, ImagePacketCache):
+            packets = file_data
+            file_data = packets.image
+
+        with open_image_view(file_data) as image:
+            start = 0
+            if OPT_RESUME in accepted:
+                block_size = int(accepted.get(OPT_BLKSIZE, BLOCK_SIZE))
+                saved = 0
+                if checkpoint_store is not None:
+                    # REQ: GSE-HLR-84 - HASH calculado só quando há retomada,
+                    # pelo executor das etapas (fora do laço de eventos no asyncio)
+                    if hash_data is None:
+                        hash_data = yield functools.partial(calculate_image_hash, image)
+                    saved = checkpoint_store.get(self.server_ip, hash_data, block_size)
+                start = min(int(accepted[OPT_RESUME]), saved)
+                accepted[OPT_RESUME] = str(start)
+
+            # REQ: GSE-HLR-69 - Confirma as opções do RRQ com OACK e aguarda ACK(0)
+            if accepted:
+                yield from self._send_oack_and_wait_ack_steps(
+                    transfer_sock, accepted, rrq_addr
+                )
+                self.block_size = int(accepted.get(OPT_BLKSIZE, BLOCK_SIZE))
+                self.window_size = int(accepted.get(OPT_WINDOWSIZE, 1))
+                self.rollover_to = int(accepted.get(OPT_ROLLOVER, self.rollover))
+                # REQ: GSE-HLR-97 - ACK(0) confirma o OACK: RTO adaptativo liberado
+                self.adaptive_rto = OPT_BLKSIZE in accepted or OPT_WINDOWSIZE in accepted
+                self.log(
+                    f"[TFTP-ARINC] Opções aceitas: blocos de {self.block_size} bytes, janela {self.window_size}"
+                )
 
-                if progress_callback and total_bytes > 0:
-                    prog_pct = int(100 * ((offset + len(chunk)) / total_bytes))
-                    prog_pct = min(max(prog_pct, 0), 100)
-                    progress_callback(prog_pct)
+            total_bytes = len(image)
+            self.log(f"[TFTP-ARINC] Enviando {total_bytes} bytes para o módulo...")
 
-                offset += len(chunk)
-                block_num += 1
+            encoded = None
+            if packets is not None:
+                encoded = packets.encoded(self.block_size, self.rollover_to)
+                if encoded is None:
+                    self.log(
+                        f"[TFTP-AVISO] Pacotes de {self.block_size} bytes não pré-codificados; montando DATA a cada envio"
+                    )
 
-            if total_bytes > 0 and total_bytes % BLOCK_SIZE == 0:
+            if start:
                 self.log(
-                    f"[TFTP-ARINC] Enviando pacote final 0-byte (bloco {block_num})"
+                    f"[TFTP-ARINC] Retomando envio após o bloco {self._block_number(start)} ({start} blocos já confirmados)"
                 )
-                self._send_data_and_wait_ack(transfer_sock, block_num, b"", rrq_addr)
-                block_num += 1
-
-            self.log(f"[TFTP-ARINC] Transferência de {filename} concluída.")
-            self.log(f"[TFTP-ARINC] Enviando HASH (bloco {block_num})")
-            self._send_data_and_wait_ack(transfer_sock, block_num, hash_data, rrq_addr)
-            self.log("[TFTP-ARINC] HASH enviado e ACK recebido.")
-            return True
+            hasher = StreamingHasher() if hash_data is None else None
+            try:
+                block_num = yield from self._send_file_windowed_steps(
+                    transfer_sock,
+                    image,
+                    rrq_addr,
+                    progress_callback,
+                    hasher,
+                    encoded,
+                    start,
+                )
+            except Exception:
+                if checkpoint_store is not None:
+                    # REQ: GSE-HLR-84 - HASH da imagem inteira só ao gravar o checkpoint
+                    if hash_data is None:
+                        if hasher.bytes_hashed == total_bytes:
+                            hash_data = hasher.digest()
+                        else:
+                            hash_data = yield functools.partial(calculate_image_hash, image)
+                    checkpoint_store.save(
+                        self.server_ip, hash_data, self.block_size, self.acked_blocks
+                    )
+                    self.log(
+                        f"[TFTP-ARINC] Checkpoint gravado: {self.acked_blocks} blocos confirmados"
+                    )
+                raise
 
-        except Exception as e:
-            self.log(f"[TFTP-ERRO] Erro em serve_file_on_rrq: {e}")
-            raise
-        finally:
-            if transfer_sock:
-                transfer_sock.close()
-                self.log("[TFTP-ARINC] Socket de transferência (BIN) fechado")
+        self.log(f"[TFTP-ARINC] Transferência de {filename} concluída.")
+        if hasher is not None:
+            hash_data = hasher.digest()
+        self.last_served_hash = hash_data
+        self.log(f"[TFTP-ARINC] Enviando HASH (bloco {block_num})")
+        if (
+            encoded is not None
+            and encoded.hash_packet is not None
+            and packets.hash_data == hash_data
+        ):
+            # REQ: GSE-HLR-103 - DATA do HASH também pré-codificado
+            yield from self._send_and_wait_ack_steps(
+                transfer_sock, encoded.hash_packet, block_num, rrq_addr
+            )
+        else:
+            yield from self._send_data_and_wait_ack_steps(
+                transfer_sock, block_num, hash_data, rrq_addr
+            )
+        self.log("[TFTP-ARINC] HASH enviado e ACK recebido.")
+        if checkpoint_store is not None:
+            checkpoint_store.clear(self.server_ip, hash_data)
+        return True
 
     # ============================================================================
     # REQ: GSE-LLR-121: Interface Interna (Envio com Retentativa)
@@ -692,43 +1151,304 @@ class TFTPClient:
     # Autor: Julia
     # Revisor: Fabrício
     # ============================================================================
+    # ============================================================================
+    # REQ: GSE-HLR-105: Envio em Janela Deslizante (RFC 7440)
+    # Descrição: _send_file_windowed() deve manter até window_size blocos DATA em
+    #            trânsito, avançar a base a cada ACK cumulativo e, em timeout ou
+    #            lacuna (ACK repetido com janela > 1 ou no meio da janela),
+    #            voltar ao primeiro bloco não confirmado (go-back-N). Cada
+    #            lacuna recua uma única vez por base e conta como tentativa,
+    #            respeitando max_retries e o RTO adaptativo (GSE-HLR-97).
+    #            Demais ACKs de blocos já confirmados (repetidos com janela 1,
+    #            atrasados) são descartados sem retransmitir. O
+    #            backoff exponencial substitui o de GSE-LLR-120. O pacote final
+    #            0-byte faz parte da sequência quando total % block_size == 0.
+    #            A janela é controlada por posições de sequência; os números de
+    #            bloco (com rollover) só aparecem no envio e na leitura de ACKs.
+    #            Retorna o número do próximo bloco (usado para o HASH). Com
+    #            hasher, cada bloco é entregue a ele uma única vez, em ordem.
+    # ============================================================================
+    # REQ: GSE-HLR-103: Envio de Pacotes Pré-codificados
+    # Descrição: Com encoded (EncodedImage do mesmo block_size e rollover), os
+    #            pacotes DATA são enviados diretamente do cache compartilhado,
+    #            sem montar o cabeçalho nem copiar o payload por envio.
+    # ============================================================================
+    # REQ: GSE-HLR-84: Envio a partir de um Checkpoint
+    # Descrição: start (blocos já confirmados em uma sessão anterior) define a
+    #            primeira posição enviada; self.acked_blocks acompanha a base
+    #            da janela para o checkpoint em caso de falha. Com hasher,
+    #            start deve ser 0.
+    # ============================================================================
+    def _send_file_windowed(
+        self,
+        sock: socket.socket,
+        file_data: memoryview,
+        addr: Tuple[str, int],
+        progress_callback: Callable[[int], None] = None,
+        hasher: Optional[StreamingHasher] = None,
+        encoded: Optional[EncodedImage] = None,
+        start: int = 0,
+    ) -> int:
+        return self._run_blocking(
+            self._send_file_windowed_steps(
+                sock, file_data, addr, progress_callback, hasher, encoded, start
+            )
+        )
+
+    def _send_file_windowed_steps(
+        self,
+        sock: socket.socket,
+        file_data: memoryview,
+        addr: Tuple[str, int],
+        progress_callback: Callable[[int], None] = None,
+        hasher: Optional[StreamingHasher] = None,
+        encoded: Optional[EncodedImage] = None,
+        start: int = 0,
+    ):
+        block_size = self.block_size
+        window = self.window_size
+        total_bytes = len(file_data)
+        total_blocks = -(-total_bytes // block_size)
+        if total_bytes > 0 and total_bytes % block_size == 0:
+            self.log(
+                f"[TFTP-ARINC] Incluindo pacote final 0-byte (bloco {self._block_number(total_blocks + 1)})"
+            )
+            total_blocks += 1
+
+        trace = log_enabled(TRACE)  # GSE-HLR-90: consultado uma vez por envio
+        base = start  # blocos confirmados (índice do primeiro bloco sem ACK)
+        next_idx = start  # índice do próximo bloco a transmitir
+        hashed = start  # blocos já entregues ao hasher (= blocos já transmitidos)
+        self.acked_blocks = start
+        sent_at = {}  # índice -> instante da primeira transmissão (regra de Karn)
+        retries = 0
+        gap_base = None  # base da última lacuna atendida (um recuo por base)
+        while base < total_blocks:
+            limit = min(base + window, total_blocks)
+            while next_idx < limit:
+                if encoded is not None:
+                    packet = encoded.packet(next_idx)
+                    sock.sendto(packet, addr)
+                    chunk = packet[HEADER_SIZE:]
+                    packet.release()
+                else:
+                    offset = next_idx * block_size
+                    chunk = file_data[offset : offset + block_size]
+                    self._send_data(self._block_number(next_idx + 1), chunk, addr, sock)
+                # Fatia sem cópia; liberada logo após o envio
+                with chunk:
+                    if next_idx == hashed:
+                        sent_at[next_idx] = time.monotonic()
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        hashed += 1
+                    else:
+                        # Retransmissão: o RTT deste bloco deixa de ser confiável
+                        sent_at.pop(next_idx, None)
+                        self.retransmit_count += 1
+                if trace:
+                    self.trace(
+                        "[TFTP-TRACE] DATA %d enviado (%d/%d)",
+                        self._block_number(next_idx + 1), next_idx + 1, total_blocks,
+                    )
+                next_idx += 1
+
+            try:
+                ack_pkt, ack_addr = yield (sock, self._ack_timeout())
+                opcode, ack_block = parse_header(ack_pkt)
+                if trace:
+                    self.trace(
+                        "[TFTP-TRACE] opcode %d bloco %d recebido (base %d, RTO %.3fs)",
+                        opcode, ack_block, self._block_number(base + 1), self._ack_timeout(),
+                    )
+
+                if ack_addr != addr:
+                    self.log(f"[TFTP-AVISO] ACK de endereço inesperado {ack_addr}")
+                    continue
+
+                if opcode == OP_ERROR:
+                    err_code, err_msg = self._parse_error_packet(ack_pkt)
+                    raise Exception(f"Erro TFTP {err_code}: {err_msg}")
+
+                # ACK(n) confirma todos os blocos até n
+                acked = self._blocks_after(base, ack_block)
+                if opcode == OP_ACK and 0 < acked <= next_idx - base:
+                    sent = sent_at.get(base + acked - 1)
+                    if sent is not None:
+                        self.rtt.sample(time.monotonic() - sent)
+                    for idx in range(base, base + acked):
+                        sent_at.pop(idx, None)
+                    base += acked
+                    self.acked_blocks = base
+                    retries = 0
+                    if progress_callback and total_bytes > 0:
+                        sent = min(base * block_size, total_bytes)
+                        prog_pct = int(100 * (sent / total_bytes))
+                        progress_callback(min(max(prog_pct, 0), 100))
+                    if base == next_idx:
+                        continue
+                    # ACK no meio da janela: o receptor perdeu o bloco seguinte
+                    gap = True
+                elif opcode == OP_ACK:
+                    # ACK repetido com janela: o receptor detectou lacuna. Os
+                    # demais ACKs de blocos já confirmados (repetidos em
+                    # lock-step ou atrasados) são descartados sem retransmitir,
+                    # evitando a duplicação em cascata (Sorcerer's Apprentice)
+                    if acked != 0 or window == 1:
+                        if trace:
+                            self.trace("[TFTP-TRACE] ACK %d já confirmado, descartado", ack_block)
+                        continue
+                    gap = True
+                else:
+                    gap = False
+
+                # Lacuna (RFC 7440): recua uma única vez por base, contando
+                # como retentativa; ACKs repetidos da mesma base são descartados
+                if gap:
+                    if gap_base == base:
+                        continue
+                    gap_base = base
+                    retries += 1
+                    self.log(
+                        f"[TFTP-AVISO] Lacuna reportada, retransmitindo a partir do bloco {self._block_number(base + 1)}, tentativa {retries}"
+                    )
+                    next_idx = base
+                else:
+                    self.log(
+                        f"[TFTP-AVISO] ACK inválido. Esperado {self._block_number(base + 1)}, recebido {ack_block}"
+                    )
+                    retries += 1
+                    next_idx = base
+
+            except socket.timeout:
+                retries += 1
+                gap_base = None
+                self.log(
+                    f"[TFTP-AVISO] Timeout ACK (bloco {self._block_number(base + 1)}, RTO {self._ack_timeout():.3f}s), tentativa {retries}"
+                )
+                next_idx = base
+                # Backoff exponencial: o RTO dobra até a próxima amostra válida
+                self.rtt.backoff()
+
+            if retries >= self._retry_limit():
+                raise Exception(
+                    f"Falha: ACK não recebido para bloco {self._block_number(base + 1)} após {retries} tentativas"
+                )
+
+        return self._block_number(total_blocks + 1)
+
+    # ============================================================================
+    # REQ: GSE-HLR-106: Aritmética de Número de Bloco com Rollover
+    # Descrição: _block_number(seq) deve mapear a posição seq (1, 2, ...) para o
+    #            número de bloco de 16 bits, continuando em rollover_to após
+    #            MAX_BLOCK_NUMBER. _blocks_after(seq, block) deve retornar quantos
+    #            blocos após a posição seq está o número de bloco recebido.
+    # ============================================================================
+    def _block_number(self, seq: int) -> int:
+        return block_number(seq, self.rollover_to)
+
+    def _blocks_after(self, seq: int, block: int) -> int:
+        reference = self._block_number(seq)
+        distance = (block - reference) % (MAX_BLOCK_NUMBER + 1)
+        if self.rollover_to == 1 and block < reference:
+            # Com rollover em 1, o número 0 não existe após o wrap
+            distance -= 1
+        return distance
+
+    # ============================================================================
+    # REQ: GSE-HLR-97: Política de Espera da Transferência
+    # Descrição: _ack_timeout() deve retornar o RTO adaptativo e
+    #            _retry_limit() o max_retries da sessão apenas com adaptive_rto;
+    #            sem opções negociadas, TIMEOUT_SEC e LOCKSTEP_MAX_RETRIES.
+    # ============================================================================
+    def _ack_timeout(self) -> float:
+        return self.rtt.rto if self.adaptive_rto else self.timeout
+
+    def _retry_limit(self) -> int:
+        return self.max_retries if self.adaptive_rto else LOCKSTEP_MAX_RETRIES
+
     def _send_data_and_wait_ack(
         self, sock: socket.socket, block: int, data: bytes, addr: Tuple[str, int]
+    ):
+        self._run_blocking(self._send_data_and_wait_ack_steps(sock, block, data, addr))
+
+    def _send_data_and_wait_ack_steps(
+        self, sock: socket.socket, block: int, data: bytes, addr: Tuple[str, int]
+    ):
+        pkt = self._build_data_packet(block, data)
+        yield from self._send_and_wait_ack_steps(sock, pkt, block, addr)
+
+    def _send_oack_and_wait_ack(
+        self, sock: socket.socket, options: Dict[str, str], addr: Tuple[str, int]
+    ):
+        self._run_blocking(self._send_oack_and_wait_ack_steps(sock, options, addr))
+
+    def _send_oack_and_wait_ack_steps(
+        self, sock: socket.socket, options: Dict[str, str], addr: Tuple[str, int]
+    ):
+        pkt = self._build_oack_packet(options)
+        yield from self._send_and_wait_ack_steps(sock, pkt, 0, addr)
+
+    # ============================================================================
+    # REQ: GSE-HLR-97: Espera de ACK com RTO Adaptativo
+    # Descrição: _send_and_wait_ack() deve aguardar cada ACK por _ack_timeout()
+    #            até _retry_limit() tentativas, amostrar o RTT apenas quando o pacote não foi
+    #            retransmitido (regra de Karn), dobrar o RTO a cada timeout e
+    #            ignorar ACK duplicado do bloco anterior sem retransmitir.
+    # ============================================================================
+    def _send_and_wait_ack(
+        self, sock: socket.socket, pkt: bytes, block: int, addr: Tuple[str, int]
+    ):
+        self._run_blocking(self._send_and_wait_ack_steps(sock, pkt, block, addr))
+
+    def _send_and_wait_ack_steps(
+        self, sock: socket.socket, pkt: bytes, block: int, addr: Tuple[str, int]
     ):
         retries = 0
-        while retries < MAX_RETRIES:
-            self._send_data(block, data, addr, sock)
-            try:
-                ack_pkt, ack_addr = sock.recvfrom(516)
-                opcode, ack_block = self._parse_ack_packet(ack_pkt)
+        previous_block = (block - 1) & MAX_BLOCK_NUMBER
+        while retries < self._retry_limit():
+            if retries:
+                self.retransmit_count += 1
+            sent_at = time.monotonic()
+            sock.sendto(pkt, addr)
+            while True:
+                try:
+                    ack_pkt, ack_addr = yield (sock, self._ack_timeout())
+                except socket.timeout:
+                    retries += 1
+                    self.log(
+                        f"[TFTP-AVISO] Timeout ACK (bloco {block}, RTO {self._ack_timeout():.3f}s), tentativa {retries}"
+                    )
+                    self.rtt.backoff()
+                    break
+
+                opcode, ack_block = parse_header(ack_pkt)
 
                 if ack_addr != addr:
                     self.log(f"[TFTP-AVISO] ACK de endereço inesperado {ack_addr}")
                     continue
 
-                if opcode == TFTP_OPCODE.ERROR:
+                if opcode == OP_ERROR:
                     err_code, err_msg = self._parse_error_packet(ack_pkt)
                     raise Exception(f"Erro TFTP {err_code}: {err_msg}")
 
-                if opcode == TFTP_OPCODE.ACK and ack_block == block:
+                if opcode == OP_ACK and ack_block == block:
+                    if retries == 0:
+                        self.rtt.sample(time.monotonic() - sent_at)
                     return
 
+                # ACK atrasado do bloco anterior (retransmissão já atendida)
+                if opcode == OP_ACK and ack_block == previous_block:
+                    continue
+
                 self.log(
                     f"[TFTP-AVISO] ACK inválido. Esperado {block}, recebido {ack_block}"
                 )
                 retries += 1
-
-            except socket.timeout:
-                retries += 1
-                self.log(
-                    f"[TFTP-AVISO] Timeout ACK (bloco {block}), tentativa {retries}"
-                )
-                # Backoff exponencial simples (base 0.25 s, teto 2.0 s)
-                delay = min(2.0, 0.25 * (2 ** (retries - 1)))
-                time.sleep(delay)
+                break
 
         raise Exception(
-            f"Falha: ACK não recebido para bloco {block} após {MAX_RETRIES} tentativas"
+            f"Falha: ACK não recebido para bloco {block} após {retries} tentativas"
         )
 
     # ============================================================================
@@ -742,13 +1462,20 @@ class TFTPClient:
     # Autor: Julia
     # Revisor: Fabrício
     # ============================================================================
-    def _send_rrq(self, filename: str, mode: str, addr: Tuple[str, int]):
+    def _send_rrq(
+        self,
+        filename: str,
+        mode: str,
+        addr: Tuple[str, int],
+        options: Optional[Dict[str, str]] = None,
+    ):
         filename = self._sanitize_filename(filename)
         # Garantir que o modo de transferência seja sempre 'octet' (binário)
         mode = "octet"
         pkt = struct.pack("!H", TFTP_OPCODE.RRQ.value)
         pkt += filename.encode() + b"\0"
         pkt += mode.encode() + b"\0"
+        pkt += self._encode_options(options)
         self.sock.sendto(pkt, addr)
         self.log(f"[TFTP-SEND] RRQ: {filename} para {addr[0]}:{addr[1]}")
 
@@ -758,13 +1485,20 @@ class TFTPClient:
     # Autor: Julia
     # Revisor: Fabrício
     # ============================================================================
-    def _send_wrq(self, filename: str, mode: str, addr: Tuple[str, int]):
+    def _send_wrq(
+        self,
+        filename: str,
+        mode: str,
+        addr: Tuple[str, int],
+        options: Optional[Dict[str, str]] = None,
+    ):
         filename = self._sanitize_filename(filename)
         # Garantir que o modo de transferência seja sempre 'octet' (binário)
         mode = "octet"
         pkt = struct.pack("!H", TFTP_OPCODE.WRQ.value)
         pkt += filename.encode() + b"\0"
         pkt += mode.encode() + b"\0"
+        pkt += self._encode_options(options)
         self.sock.sendto(pkt, addr)
         self.log(f"[TFTP-SEND] WRQ: {filename} para {addr[0]}:{addr[1]}")
 
@@ -775,8 +1509,7 @@ class TFTPClient:
     # Revisor: Fabrício
     # ============================================================================
     def _send_ack(self, block: int, addr: Tuple[str, int], sock: socket.socket = None):
-        pkt = struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
-        (sock or self.sock).sendto(pkt, addr)
+        (sock or self.sock).sendto(build_ack(block), addr)
 
     # ============================================================================
     # REQ: GSE-LLR-126: Interface Interna (Construção de DATA)
@@ -787,11 +1520,47 @@ class TFTPClient:
     def _send_data(
         self, block: int, data: bytes, addr: Tuple[str, int], sock: socket.socket = None
     ):
-        if len(data) > BLOCK_SIZE:
+        if len(data) > self.block_size:
+            raise ValueError("DATA maior que BLOCK_SIZE")
+        # REQ: GSE-HLR-99 - montado no buffer reutilizável (sendto copia)
+        (sock or self.sock).sendto(self._writer.data(block, data), addr)
+
+    def _build_data_packet(self, block: int, data: bytes) -> bytes:
+        if len(data) > self.block_size:
             raise ValueError("DATA maior que BLOCK_SIZE")
-        pkt = struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + data
+        return build_data(block, data)
+
+    # ============================================================================
+    # REQ: GSE-HLR-69: Construção de OACK e ERROR
+    # Descrição: _build_oack_packet() deve produzir (Opcode 6) + pares
+    #            nome\0valor\0; _send_error() deve enviar (Opcode 5) + código +
+    #            mensagem\0, usado para recusar opções inválidas.
+    # ============================================================================
+    def _build_oack_packet(self, options: Dict[str, str]) -> bytes:
+        return struct.pack("!H", TFTP_OPCODE.OACK.value) + self._encode_options(
+            options
+        )
+
+    def _send_error(
+        self,
+        code: TFTP_ERROR,
+        msg: str,
+        addr: Tuple[str, int],
+        sock: socket.socket = None,
+    ):
+        pkt = struct.pack("!HH", TFTP_OPCODE.ERROR.value, code.value)
+        pkt += msg.encode("ascii", errors="replace") + b"\0"
         (sock or self.sock).sendto(pkt, addr)
 
+    @staticmethod
+    def _encode_options(options: Optional[Dict[str, str]]) -> bytes:
+        if not options:
+            return b""
+        return b"".join(
+            name.encode() + b"\0" + str(value).encode() + b"\0"
+            for name, value in options.items()
+        )
+
     # ============================================================================
     # REQ: GSE-LLR-127: Interface Interna (Análise de DATA)
     # Descrição: A rotina _parse_data_packet() deve retornar (None, 0, b"") quando o tamanho do pacote for inferior a 4 bytes; caso contrário, deve retornar (Opcode, block, payload).
@@ -801,10 +1570,8 @@ class TFTPClient:
     def _parse_data_packet(self, data: bytes) -> Tuple[TFTP_OPCODE, int, bytes]:
         if len(data) < 4:
             return (None, 0, b"")
-        opcode = struct.unpack("!H", data[0:2])[0]
-        block = struct.unpack("!H", data[2:4])[0]
-        payload = data[4:]
-        return (TFTP_OPCODE(opcode), block, payload)
+        opcode, block = HEADER_STRUCT.unpack_from(data)
+        return (_opcode_enum(opcode), block, data[HEADER_SIZE:])
 
     # ============================================================================
     # REQ: GSE-LLR-128: Interface Interna (Análise de ACK)
@@ -815,9 +1582,8 @@ class TFTPClient:
     def _parse_ack_packet(self, data: bytes) -> Tuple[TFTP_OPCODE, int]:
         if len(data) < 4:
             return (None, 0)
-        opcode = struct.unpack("!H", data[0:2])[0]
-        block = struct.unpack("!H", data[2:4])[0]
-        return (TFTP_OPCODE(opcode), block)
+        opcode, block = HEADER_STRUCT.unpack_from(data)
+        return (_opcode_enum(opcode), block)
 
     # ============================================================================
     # REQ: GSE-LLR-129: Interface Interna (Análise de RRQ/WRQ)
@@ -828,13 +1594,116 @@ class TFTPClient:
     def _parse_rrq_packet(self, data: bytes) -> Tuple[TFTP_OPCODE, str]:
         if len(data) < 4:
             return (None, "")
-        opcode = struct.unpack("!H", data[0:2])[0]
+        opcode = parse_opcode(data)
         filename = data[2:].decode("utf-8", errors="ignore").split("\0")[0]
-        return (TFTP_OPCODE(opcode), filename)
+        return (_opcode_enum(opcode), filename)
 
     def _parse_wrq_packet(self, data: bytes) -> Tuple[TFTP_OPCODE, str]:
         return self._parse_rrq_packet(data)
 
+    # ============================================================================
+    # REQ: GSE-HLR-69: Análise de Opções (RRQ/WRQ/OACK)
+    # Descrição: _parse_request_options() deve retornar as opções que seguem o
+    #            modo em um RRQ/WRQ e _parse_oack_packet() as opções de um OACK,
+    #            ambos como dicionário {nome em minúsculas: valor}, descartando
+    #            pares incompletos.
+    # ============================================================================
+    def _parse_request_options(self, data: bytes) -> Dict[str, str]:
+        if len(data) < 4:
+            return {}
+        fields = data[2:].decode("utf-8", errors="ignore").split("\0")
+        # fields[0]=filename, fields[1]=mode, depois pares nome/valor
+        return self._options_from_fields(fields[2:])
+
+    def _parse_oack_packet(self, data: bytes) -> Dict[str, str]:
+        if len(data) < 2:
+            return {}
+        fields = data[2:].decode("utf-8", errors="ignore").split("\0")
+        return self._options_from_fields(fields)
+
+    @staticmethod
+    def _options_from_fields(fields) -> Dict[str, str]:
+        options = {}
+        for i in range(0, len(fields) - 1, 2):
+            name, value = fields[i], fields[i + 1]
+            if name:
+                options[name.lower()] = value
+        return options
+
+    # ============================================================================
+    # REQ: GSE-HLR-69: Política de Negociação de Opções
+    # Descrição: Como cliente, anunciar blksize/windowsize apenas quando
+    #            diferentes de BLOCK_SIZE/1 (acompanhados de rollover) e
+    #            aceitar no OACK somente opções pedidas, com valores entre o
+    #            mínimo da opção e o valor pedido (recusando com ERROR 8 ao
+    #            endereço que enviou o OACK). Como servidor, aceitar
+    #            min(pedido, limite local), ignorando blksize inferior a
+    #            BLOCK_SIZE, que não traz ganho.
+    # ============================================================================
+    def _reset_transfer_options(self):
+        self.block_size = BLOCK_SIZE
+        self.window_size = 1
+        self.rollover_to = self.rollover
+        self.adaptive_rto = False
+
+    def _request_options(self) -> Dict[str, str]:
+        options = {}
+        if self.blksize != BLOCK_SIZE:
+            options[OPT_BLKSIZE] = str(self.blksize)
+        if self.windowsize > 1:
+            options[OPT_WINDOWSIZE] = str(self.windowsize)
+        if options:
+            options[OPT_ROLLOVER] = str(self.rollover)
+        return options
+
+    def _apply_oack(
+        self, oack: Dict[str, str], requested: Dict[str, str], addr: Tuple[str, int]
+    ):
+        minimums = {OPT_BLKSIZE: MIN_BLOCK_SIZE, OPT_WINDOWSIZE: 1, OPT_ROLLOVER: 0}
+        negotiated = {}
+        for name, value in oack.items():
+            try:
+                value = int(value)
+                valid = name in requested and (
+                    minimums[name] <= value <= int(requested[name])
+                )
+            except (KeyError, ValueError):
+                valid = False
+            if not valid:
+                # ERROR 8 vai ao TID que enviou o OACK (RFC 2347)
+                self._send_error(TFTP_ERROR.OPTION_NEGOTIATION, "Opcoes invalidas", addr)
+                raise Exception(f"OACK inválido recebido: {oack}")
+            negotiated[name] = value
+
+        self.block_size = negotiated.get(OPT_BLKSIZE, BLOCK_SIZE)
+        self.window_size = negotiated.get(OPT_WINDOWSIZE, 1)
+        self.rollover_to = negotiated.get(OPT_ROLLOVER, self.rollover)
+        self.adaptive_rto = OPT_BLKSIZE in negotiated or OPT_WINDOWSIZE in negotiated
+        self.log(
+            f"[TFTP-OK] OACK recebido: blocos de {self.block_size} bytes, janela {self.window_size}"
+        )
+
+    def _accept_request_options(self, options: Dict[str, str]) -> Dict[str, str]:
+        accepted = {}
+        blksize = self._int_option(options, OPT_BLKSIZE)
+        if self.blksize != BLOCK_SIZE and blksize and blksize >= BLOCK_SIZE:
+            accepted[OPT_BLKSIZE] = str(min(blksize, self.blksize))
+        windowsize = self._int_option(options, OPT_WINDOWSIZE)
+        if self.windowsize > 1 and windowsize and windowsize >= 1:
+            accepted[OPT_WINDOWSIZE] = str(min(windowsize, self.windowsize))
+        # O rollover pedido pelo par é sempre aceito (não há custo local)
+        rollover = self._int_option(options, OPT_ROLLOVER)
+        if rollover in (0, 1):
+            accepted[OPT_ROLLOVER] = str(rollover)
+        return accepted
+
+    @staticmethod
+    def _int_option(options: Dict[str, str], name: str) -> Optional[int]:
+        try:
+            return int(options[name])
+        except (KeyError, ValueError):
+            return None
+
     # ============================================================================
     # REQ: GSE-LLR-130: Interface Interna (Análise de ERROR)
     # Descrição: A rotina _parse_error_packet() deve retornar (0, "Pacote de erro malformado") quando o pacote possuir menos de 5 bytes; caso contrário, deve retornar (error_code, error_msg) com mensagem decodificada e sem NUL final.
@@ -844,7 +1713,7 @@ class TFTPClient:
     def _parse_error_packet(self, data: bytes) -> Tuple[int, str]:
         if len(data) < 5:
             return (0, "Pacote de erro malformado")
-        error_code = struct.unpack("!H", data[2:4])[0]
+        error_code = HEADER_STRUCT.unpack_from(data)[1]
         error_msg = data[4:].decode("utf-8", errors="ignore").rstrip("\0")
         return (error_code, error_msg)
 
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Módulo de Codificação de Pacotes TFTP
+
+Codec do caminho quente do TFTP: structs pré-compilados (struct.Struct),
+leitura com unpack_from() direto sobre o buffer recebido (sem fatias
+intermediárias), opcodes como inteiros (sem construir o Enum TFTP_OPCODE
+por pacote) e um buffer de envio reutilizável preenchido com pack_into().
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import struct
+from typing import Tuple
+
+# ============================================================================
+# REQ: GSE-HLR-99: Opcodes Inteiros do Caminho Quente
+# Descrição: Os valores coincidem com TFTP_OPCODE (RFC 1350/2347) e são usados
+#            nas comparações por pacote, evitando TFTP_OPCODE(valor).
+# ============================================================================
+OP_RRQ = 1
+OP_WRQ = 2
+OP_DATA = 3
+OP_ACK = 4
+OP_ERROR = 5
+OP_OACK = 6
+
+HEADER_SIZE = 4
+MAX_BLOCK_NUMBER = 0xFFFF
+
+# Structs pré-compilados (big-endian, rede)
+OPCODE_STRUCT = struct.Struct("!H")
+HEADER_STRUCT = struct.Struct("!HH")  # opcode + bloco (DATA/ACK) ou código (ERROR)
+
+
+# ============================================================================
+# REQ: GSE-HLR-99: Leitura de Cabeçalho sem Cópia
+# Descrição: parse_header() deve retornar (opcode, bloco) como inteiros lidos
+#            com unpack_from() sobre bytes, bytearray ou memoryview, ou (0, 0)
+#            quando o pacote tiver menos de HEADER_SIZE bytes.
+# ============================================================================
+def parse_header(packet) -> Tuple[int, int]:
+    if len(packet) < HEADER_SIZE:
+        return (0, 0)
+    return HEADER_STRUCT.unpack_from(packet)
+
+
+def parse_opcode(packet) -> int:
+    if len(packet) < 2:
+        return 0
+    return OPCODE_STRUCT.unpack_from(packet)[0]
+
+
+# ============================================================================
+# REQ: GSE-HLR-106: Número de Bloco com Rollover
+# Descrição: block_number(seq, rollover_to) deve mapear a posição seq (1, 2,
+#            ...) para o número de bloco de 16 bits, continuando em rollover_to
+#            (0 ou 1) após MAX_BLOCK_NUMBER. Compartilhado pelo cliente TFTP e
+#            pelo cache de pacotes pré-codificados.
+# ============================================================================
+def block_number(seq: int, rollover_to: int) -> int:
+    if seq <= MAX_BLOCK_NUMBER:
+        return seq
+    period = MAX_BLOCK_NUMBER + 1 - rollover_to
+    return rollover_to + (seq - MAX_BLOCK_NUMBER - 1) % period
+
+
+# ============================================================================
+# REQ: GSE-HLR-99: Construção de Pacotes
+# Descrição: build_ack()/build_data() devem produzir pacotes imutáveis (usados
+#            quando o pacote é guardado ou é pequeno); PacketWriter deve
+#            montar DATA em um bytearray reutilizável com pack_into() e
+#            devolver um memoryview válido somente até a próxima montagem.
+# ============================================================================
+def build_ack(block: int) -> bytes:
+    return HEADER_STRUCT.pack(OP_ACK, block)
+
+
+def build_data(block: int, payload) -> bytes:
+    return HEADER_STRUCT.pack(OP_DATA, block) + payload
+
+
+class PacketWriter:
+    """
+    Buffer de envio reutilizável para DATA (um por cliente TFTP).
+    """
+
+    def __init__(self, max_payload: int):
+        self._buffer = bytearray(HEADER_SIZE + max_payload)
+        self._view = memoryview(self._buffer)
+        self._max_payload = max_payload
+
+    def data(self, block: int, payload) -> memoryview:
+        size = len(payload)
+        if size > self._max_payload:
+            raise ValueError("DATA maior que o buffer de envio")
+        HEADER_STRUCT.pack_into(self._buffer, 0, OP_DATA, block)
+        self._view[HEADER_SIZE : HEADER_SIZE + size] = payload
+        return self._view[: HEADER_SIZE + size]
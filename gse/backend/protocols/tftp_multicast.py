@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Módulo de Distribuição TFTP Multicast (RFC 2090)
+
+Define a classe 'MulticastTFTPClient', que acrescenta ao 'TFTPClient' o
+modo serve_file_multicast(): vários BCs pedem a mesma imagem com a opção
+"multicast" e os blocos DATA são transmitidos uma única vez para um grupo
+multicast, em vez de uma cópia por alvo. Como na RFC 2090, somente o
+"master client" confirma os blocos; ao terminar, o próximo cliente é
+promovido a master e pede apenas os blocos que perdeu.
+
+O HASH (DATA final do fluxo ARINC 615A) é enviado em unicast a cada
+cliente, após ele ter todos os blocos da imagem.
+
+O modo multicast é uma API do transporte: o fluxo de upload
+('Arinc615ASession', 'FleetUploadScheduler') não o utiliza, pois o
+firmware do BC não pede a opção "multicast".
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import socket
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.protocols.hash_utils import calculate_image_hash
+from backend.protocols.image_source import ImageSource, open_image_view
+from backend.protocols.tftp_client import (
+    BLOCK_SIZE,
+    MAX_BLOCK_NUMBER,
+    OPT_BLKSIZE,
+    TFTP_ERROR,
+    TFTP_OPCODE,
+    TFTPClient,
+)
+from backend.protocols.tftp_codec import OP_ACK, OP_ERROR, build_data, parse_header
+
+# ============================================================================
+# REQ: GSE-HLR-83: Grupo Multicast Padrão
+# Descrição: Endereço do grupo (escopo administrativo, RFC 2365) e porta
+#            (tftp-mcast, IANA 1758) anunciados no OACK quando não
+#            informados. O TTL 1 mantém o tráfego no segmento do ponto de
+#            acesso do hangar.
+# ============================================================================
+MULTICAST_GROUP = "239.255.69.1"
+MULTICAST_PORT = 1758
+MULTICAST_TTL = 1
+OPT_MULTICAST = "multicast"
+
+
+class MulticastTFTPClient(TFTPClient):
+    """
+    TFTPClient com distribuição multicast de uma imagem a um grupo de BCs.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-83: Servir Imagem por Multicast
+    # Descrição: serve_file_multicast() deve aguardar o RRQ (com a opção
+    #            multicast) de expected_clients alvos no socket principal,
+    #            negociar um blksize comum (o menor aceito) e responder a cada
+    #            um com OACK "multicast=grupo,porta,mc", sendo mc=1 somente no
+    #            master. O OACK mc=0 de cada demais alvo é reenviado (RTO
+    #            adaptativo, até max_retries) até o seu ACK; alvos que não
+    #            confirmam são descartados. Os blocos DATA vão para o grupo; a cada ACK(k) do
+    #            master o bloco k+1 é transmitido (RFC 2090), com o RTO
+    #            adaptativo e max_retries da sessão. Concluída a imagem, o
+    #            master recebe o HASH em unicast e o próximo alvo é promovido
+    #            com um novo OACK mc=1, retomando a partir do bloco que ele
+    #            confirmar. RRQs sem a opção multicast recebem ERROR 8. A
+    #            imagem deve caber em MAX_BLOCK_NUMBER blocos (sem rollover).
+    #            Retorna a lista de alvos atendidos, na ordem de promoção.
+    # ============================================================================
+    def serve_file_multicast(
+        self,
+        expected_filename: str,
+        file_data: ImageSource,
+        expected_clients: int,
+        hash_data: Optional[bytes] = None,
+        group: Tuple[str, int] = (MULTICAST_GROUP, MULTICAST_PORT),
+        interface: str = "0.0.0.0",
+        progress_callback: Callable[[int], None] = None,
+    ) -> List[Tuple[str, int]]:
+        if expected_clients < 1:
+            raise ValueError(f"expected_clients deve ser >= 1: {expected_clients}")
+
+        clients, block_size = self._run_blocking(
+            self._await_multicast_rrqs_steps(expected_filename, expected_clients)
+        )
+        self._reset_transfer_options()
+        self.block_size = block_size
+        # Todos os alvos pediram a opção multicast: RTO adaptativo (GSE-HLR-97)
+        self.adaptive_rto = True
+
+        transfer_sock = None
+        try:
+            transfer_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            transfer_sock.settimeout(self.timeout)
+            transfer_sock.setsockopt(
+                socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, MULTICAST_TTL
+            )
+            transfer_sock.setsockopt(
+                socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+            )
+            transfer_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            transfer_sock.bind(("", 0))
+            self.log(
+                f"[TFTP-ARINC] Socket de transferência multicast (grupo {group[0]}:{group[1]})"
+            )
+
+            with open_image_view(file_data) as image:
+                if hash_data is None:
+                    hash_data = calculate_image_hash(image)
+                self.last_served_hash = hash_data
+                return self._run_blocking(
+                    self._serve_multicast_steps(
+                        transfer_sock,
+                        clients,
+                        image,
+                        hash_data,
+                        group,
+                        progress_callback,
+                    )
+                )
+
+        except Exception as e:
+            self.log(f"[TFTP-ERRO] Erro em serve_file_multicast: {e}")
+            raise
+        finally:
+            if transfer_sock:
+                transfer_sock.close()
+                self.log("[TFTP-ARINC] Socket de transferência multicast fechado")
+
+    def _await_multicast_rrqs_steps(self, expected_filename: str, expected_clients: int):
+        self.log(
+            f"[TFTP-ARINC] Aguardando RRQ multicast de {expected_clients} alvo(s) para '{expected_filename}'..."
+        )
+        clients: Dict[Tuple[str, int], Dict[str, str]] = {}
+        while len(clients) < expected_clients:
+            try:
+                rrq_pkt, rrq_addr = yield (self.sock, self.timeout)
+            except socket.timeout:
+                raise Exception(
+                    f"Timeout ao aguardar RRQ multicast: {len(clients)} de {expected_clients} alvo(s)"
+                )
+
+            opcode, filename = self._parse_rrq_packet(rrq_pkt)
+            if opcode != TFTP_OPCODE.RRQ or rrq_addr in clients:
+                continue
+            if filename != expected_filename:
+                self.log(
+                    f"[TFTP-AVISO] {rrq_addr[0]} pediu '{filename}', esperávamos '{expected_filename}'"
+                )
+                self._send_error(TFTP_ERROR.FILE_NOT_FOUND, "Arquivo invalido", rrq_addr)
+                continue
+            options = self._parse_request_options(rrq_pkt)
+            if OPT_MULTICAST not in options:
+                self._send_error(
+                    TFTP_ERROR.OPTION_NEGOTIATION, "Opcao multicast requerida", rrq_addr
+                )
+                continue
+            clients[rrq_addr] = options
+            self.log(
+                f"[TFTP-ARINC] RRQ multicast de {rrq_addr[0]} ({len(clients)}/{expected_clients})"
+            )
+
+        # Um único fluxo no grupo: blksize comum a todos os alvos
+        block_size = min(
+            int(self._accept_request_options(options).get(OPT_BLKSIZE, BLOCK_SIZE))
+            for options in clients.values()
+        )
+        return list(clients.items()), block_size
+
+    def _serve_multicast_steps(
+        self,
+        sock: socket.socket,
+        clients: List[Tuple[Tuple[str, int], Dict[str, str]]],
+        image: memoryview,
+        hash_data: bytes,
+        group: Tuple[str, int],
+        progress_callback: Callable[[int], None],
+    ):
+        total_bytes = len(image)
+        total_blocks = -(-total_bytes // self.block_size)
+        if total_bytes > 0 and total_bytes % self.block_size == 0:
+            total_blocks += 1
+        if total_blocks + 1 > MAX_BLOCK_NUMBER:
+            raise Exception(
+                f"Imagem grande demais para multicast: {total_blocks} blocos de {self.block_size} bytes"
+            )
+
+        def oack_options(options: Dict[str, str], master: bool) -> Dict[str, str]:
+            oack = {}
+            if OPT_BLKSIZE in self._accept_request_options(options):
+                oack[OPT_BLKSIZE] = str(self.block_size)
+            oack[OPT_MULTICAST] = f"{group[0]},{group[1]},{1 if master else 0}"
+            return oack
+
+        # Todos os alvos entram no grupo; o primeiro é o master
+        members = yield from self._join_group_steps(
+            sock,
+            [
+                (addr, self._build_oack_packet(oack_options(options, False)))
+                for addr, options in clients[1:]
+            ],
+        )
+        clients = clients[:1] + [client for client in clients[1:] if client[0] in members]
+
+        served = []
+        for index, (master, options) in enumerate(clients):
+            self.log(f"[TFTP-ARINC] Master client: {master[0]}")
+            start = yield from self._promote_master_steps(
+                sock, self._build_oack_packet(oack_options(options, True)), master
+            )
+            self.log(
+                f"[TFTP-ARINC] {master[0]} já possui {start} de {total_blocks} blocos"
+            )
+            # Somente a primeira passagem (imagem completa) reporta progresso
+            yield from self._multicast_blocks_steps(
+                sock,
+                image,
+                start,
+                total_blocks,
+                group,
+                master,
+                progress_callback if index == 0 else None,
+            )
+            self.log(f"[TFTP-ARINC] Enviando HASH para {master[0]} (bloco {total_blocks + 1})")
+            yield from self._send_data_and_wait_ack_steps(
+                sock, total_blocks + 1, hash_data, master
+            )
+            served.append(master)
+
+        self.log(
+            f"[TFTP-ARINC] Distribuição multicast concluída para {len(served)} alvo(s)"
+        )
+        return served
+
+    def _join_group_steps(
+        self, sock: socket.socket, members: List[Tuple[Tuple[str, int], bytes]]
+    ):
+        """
+        Envia o OACK mc=0 a cada alvo não master e o reenvia, a cada RTO,
+        aos que ainda não confirmaram com ACK. Retorna os endereços que
+        confirmaram; um ERROR do alvo ou o fim das tentativas o descarta.
+        """
+        pending = dict(members)
+        confirmed = set()
+        retries = 0
+        while pending and retries < self.max_retries:
+            if retries:
+                self.retransmit_count += len(pending)
+            for addr, oack in pending.items():
+                sock.sendto(oack, addr)
+            deadline = time.monotonic() + self.rtt.rto
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pkt, addr = yield (sock, remaining)
+                except socket.timeout:
+                    break
+                if addr not in pending:
+                    continue
+                opcode, _block = parse_header(pkt)
+                if opcode == OP_ERROR:
+                    err_code, err_msg = self._parse_error_packet(pkt)
+                    self.log(
+                        f"[TFTP-AVISO] {addr[0]} recusou o OACK (erro {err_code}: {err_msg})"
+                    )
+                    del pending[addr]
+                elif opcode == OP_ACK:
+                    del pending[addr]
+                    confirmed.add(addr)
+            if pending:
+                retries += 1
+                self.rtt.backoff()
+        for addr in pending:
+            self.log(
+                f"[TFTP-AVISO] {addr[0]} não confirmou o OACK após {retries} tentativas; alvo descartado"
+            )
+        return confirmed
+
+    def _promote_master_steps(self, sock: socket.socket, oack: bytes, master: Tuple[str, int]):
+        """Envia OACK mc=1 e retorna quantos blocos o novo master já possui."""
+        retries = 0
+        while retries < self.max_retries:
+            sock.sendto(oack, master)
+            block = yield from self._await_master_ack_steps(
+                sock, master, lambda block: True, time.monotonic() + self.rtt.rto
+            )
+            if block is not None:
+                return block
+            retries += 1
+            self.rtt.backoff()
+        raise Exception(
+            f"Falha: {master[0]} não confirmou a promoção a master após {self.max_retries} tentativas"
+        )
+
+    def _await_master_ack_steps(
+        self,
+        sock: socket.socket,
+        master: Tuple[str, int],
+        accept: Callable[[int], bool],
+        deadline: float,
+    ):
+        """
+        Aguarda, até deadline (monotônico), um ACK do master aceito por
+        accept(bloco) e retorna o bloco; None no timeout. Pacotes de outros
+        alvos, ACKs duplicados ou fora da faixa são descartados sem
+        retransmissão (RFC 2090: só o master confirma).
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                pkt, addr = yield (sock, remaining)
+            except socket.timeout:
+                return None
+            if addr != master:
+                continue
+            opcode, block = parse_header(pkt)
+            if opcode == OP_ERROR:
+                err_code, err_msg = self._parse_error_packet(pkt)
+                raise Exception(f"Erro TFTP {err_code}: {err_msg}")
+            if opcode == OP_ACK and accept(block):
+                return block
+
+    def _multicast_blocks_steps(
+        self,
+        sock: socket.socket,
+        image: memoryview,
+        start: int,
+        total_blocks: int,
+        group: Tuple[str, int],
+        master: Tuple[str, int],
+        progress_callback: Callable[[int], None],
+    ):
+        block_size = self.block_size
+        total_bytes = len(image)
+        next_idx = start  # ACK(k) do master: blocos 1..k recebidos
+        retries = 0
+        retransmit = False
+        while next_idx < total_blocks:
+            offset = next_idx * block_size
+            with image[offset : offset + block_size] as chunk:
+                pkt = build_data(next_idx + 1, chunk)
+            sent_at = time.monotonic()
+            sock.sendto(pkt, group)
+            # Só um ACK novo do master (ou o RTO) leva a uma nova transmissão
+            ack_block = yield from self._await_master_ack_steps(
+                sock,
+                master,
+                lambda block: next_idx < block <= total_blocks,
+                sent_at + self.rtt.rto,
+            )
+            if ack_block is None:
+                retries += 1
+                self.retransmit_count += 1
+                retransmit = True
+                self.log(
+                    f"[TFTP-AVISO] Timeout ACK do master (bloco {next_idx + 1}, RTO {self.rtt.rto:.3f}s), tentativa {retries}"
+                )
+                self.rtt.backoff()
+                if retries >= self.max_retries:
+                    raise Exception(
+                        f"Falha: master {master[0]} não confirmou o bloco {next_idx + 1} após {self.max_retries} tentativas"
+                    )
+                continue
+
+            if ack_block == next_idx + 1 and not retransmit:
+                self.rtt.sample(time.monotonic() - sent_at)
+            # O master pede o bloco seguinte ao último contíguo que possui
+            next_idx = ack_block
+            retries = 0
+            retransmit = False
+            if progress_callback and total_bytes > 0:
+                sent = min(next_idx * block_size, total_bytes)
+                progress_callback(int(100 * sent / total_bytes))
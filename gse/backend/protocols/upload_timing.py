@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Módulo de Tempos do Fluxo de Upload
+
+Define 'PhaseTiming' (instantes monotônicos, duração, bytes e
+retransmissões de um passo do fluxo ARINC 615A) e 'UploadResult', o
+resultado de Arinc615ASession.run_upload_flow, com as fases na ordem de
+execução. UploadResult é verdadeiro apenas quando o fluxo foi concluído,
+preservando o contrato booleano de run_upload_flow (GSE-LLR-80).
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+# ============================================================================
+# REQ: GSE-HLR-88: Fases do Fluxo de Upload
+# Descrição: Nomes das fases medidas, na ordem dos PASSOS 0..5 de
+#            run_upload_flow.
+# ============================================================================
+PHASE_AUTH = "auth"
+PHASE_LUI = "lui"
+PHASE_LUS_INIT = "lus_init"
+PHASE_LUR = "lur"
+PHASE_BIN = "bin"
+PHASE_LUS_FINAL = "lus_final"
+UPLOAD_PHASES = (
+    PHASE_AUTH,
+    PHASE_LUI,
+    PHASE_LUS_INIT,
+    PHASE_LUR,
+    PHASE_BIN,
+    PHASE_LUS_FINAL,
+)
+
+
+class PhaseTiming:
+    """
+    Tempo, bytes e retransmissões de uma fase do fluxo de upload.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started: Optional[float] = None  # time.monotonic()
+        self.ended: Optional[float] = None
+        self.bytes = 0
+        self.retries = 0
+        self.error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.ended is not None
+
+    @property
+    def ok(self) -> bool:
+        return self.finished and self.error is None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started is None or self.ended is None:
+            return None
+        return self.ended - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "started": self.started,
+            "ended": self.ended,
+            "duration_s": self.duration,
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "error": self.error,
+        }
+
+
+class UploadResult:
+    """
+    Resultado de um fluxo de upload: sucesso e tempos por fase.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-88: Resultado do Fluxo de Upload
+    # Descrição: UploadResult deve registrar o arquivo, o PN, o início
+    #            (monotônico e horário de parede), o fim e as fases na ordem
+    #            de execução; bool(resultado) é o sucesso do fluxo. duration,
+    #            bytes e retries agregam o fluxo; to_dict() serializa o
+    #            resultado (JSON) e summary() o resume em uma linha de log.
+    # ============================================================================
+    def __init__(self, file_path: str, part_number: str):
+        self.file_path = file_path
+        self.part_number = part_number
+        self.success = False
+        self.started = time.monotonic()
+        self.started_at = time.time()
+        self.ended: Optional[float] = None
+        self.phases: Dict[str, PhaseTiming] = {}
+
+    def __bool__(self) -> bool:
+        return self.success
+
+    def __repr__(self) -> str:
+        return f"UploadResult(success={self.success}, {self.summary()})"
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.ended is None:
+            return None
+        return self.ended - self.started
+
+    @property
+    def bytes(self) -> int:
+        return sum(phase.bytes for phase in self.phases.values())
+
+    @property
+    def retries(self) -> int:
+        return sum(phase.retries for phase in self.phases.values())
+
+    def finish(self, success: bool):
+        self.success = success
+        self.ended = time.monotonic()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file_path": self.file_path,
+            "part_number": self.part_number,
+            "success": self.success,
+            "started_at": self.started_at,
+            "duration_s": self.duration,
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "phases": [phase.to_dict() for phase in self.phases.values()],
+        }
+
+    def summary(self) -> str:
+        parts = []
+        for phase in self.phases.values():
+            duration = phase.duration
+            text = f"{phase.name} {duration:.3f}s" if duration is not None else f"{phase.name} -"
+            if phase.error is not None:
+                text += " (falha)"
+            parts.append(text)
+        total = f"{self.duration:.3f}s" if self.duration is not None else "-"
+        parts.append(f"total {total}, {self.bytes} bytes, {self.retries} retransmissões")
+        return " | ".join(parts)
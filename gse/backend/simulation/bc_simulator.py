@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+Módulo Simulador de BC
+
+Define a classe 'BCSimulator', um BC (modulo_bc) em Python puro que atende
+ao fluxo ARINC 615A completo do GSE em localhost, seguindo as etapas dos
+estados do firmware (MAINT_WAIT, UPLOAD_PREP, UPLOADING, VERIFY e TEARDOWN):
+
+1. Handshake de autenticação (DATA/ACK com as chaves estáticas);
+2. Atende ao RRQ de "system.LUI";
+3. Envia o INIT_LOAD.LUS por WRQ ao GSE;
+4. Recebe o .LUR por WRQ do GSE;
+5. Pede o BIN por RRQ ao GSE, recebe os blocos e o bloco de HASH;
+6. Confere o SHA-256 e envia o FINAL_LOAD.LUS.
+
+Por padrão o recebimento do BIN reproduz make_rrq (tftp.c): todo pacote DATA
+é gravado, entra no SHA-256 e é confirmado com o próprio número de bloco,
+sem conferir a sequência; um bloco retransmitido (ACK perdido) ou fora de
+ordem corrompe a imagem e o HASH não confere. Com ideal_receiver=True, o
+simulador descarta duplicatas e trata lacunas como um receptor RFC 1350/7440.
+
+Latência de escrita em flash, perda, reordenação, duplicação de ACKs e banda
+da fase de transferência do BIN são configuráveis, com sorteios determinísticos
+(seed). Cada instância escuta em uma porta própria e roda em sua thread,
+permitindo várias instâncias em paralelo para testes de desempenho sem
+hardware.
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import hashlib
+import random
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.protocols.arinc615a import EXPECTED_BC_KEY, GSE_STATIC_KEY
+from backend.protocols.arinc_models import (
+    ARINC_STATUS_ACCEPTED,
+    ARINC_STATUS_COMPLETED_OK,
+)
+from backend.protocols.tftp_client import (
+    BLOCK_SIZE,
+    MAX_PACKET_SIZE,
+    OPT_BLKSIZE,
+    OPT_ROLLOVER,
+    OPT_WINDOWSIZE,
+    TIMEOUT_SEC,
+)
+from backend.protocols.tftp_codec import (
+    OP_ACK,
+    OP_DATA,
+    OP_ERROR,
+    OP_OACK,
+    OP_RRQ,
+    OP_WRQ,
+    MAX_BLOCK_NUMBER,
+    OPCODE_STRUCT,
+    block_number,
+    build_ack,
+    build_data,
+    parse_header,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-85: Constantes do Simulador de BC
+# Descrição: Endereço padrão (loopback), timeout de retransmissão e limite de
+#            retentativas dos arquivos de controle (TFTP_TIMEOUT_SEC e
+#            TFTP_RETRY_LIMIT do firmware) e tempo máximo sem pacotes
+#            durante o recebimento do BIN (TIMEOUT_SEC do GSE).
+# ============================================================================
+SIM_HOST = "127.0.0.1"
+SIM_TIMEOUT_SEC = 2.0
+SIM_RETRY_LIMIT = 1
+SIM_IDLE_TIMEOUT_SEC = TIMEOUT_SEC
+SIM_POLL_SEC = 0.2
+
+# Layout dos arquivos do firmware (lui_data_t / lus_data_t, packed)
+LUI_STRUCT = struct.Struct("!L2sHB256s")
+LUS_STRUCT = struct.Struct("!L2sHB256sHHH3s")
+
+
+def build_lui(status_code: int, description: str) -> bytes:
+    desc = description.encode("ascii")[:255]
+    return LUI_STRUCT.pack(LUI_STRUCT.size, b"A4", status_code, len(desc), desc)
+
+
+def build_lus(status_code: int, description: str, counter: int, ratio: str) -> bytes:
+    desc = description.encode("ascii")[:255]
+    return LUS_STRUCT.pack(
+        LUS_STRUCT.size,
+        b"A4",
+        status_code,
+        len(desc),
+        desc,
+        counter,
+        0,
+        0,
+        ratio.encode("ascii"),
+    )
+
+
+def parse_lur(data: bytes) -> Tuple[str, str]:
+    """Retorna (header_filename, part_number) de um .LUR (parse_lur do firmware)."""
+    if len(data) < 10 or data[4:6] != b"A4":
+        raise ValueError("LUR inválido")
+    name_len = data[8]
+    name = data[9 : 9 + name_len]
+    pn_len = data[9 + name_len]
+    pn = data[10 + name_len : 10 + name_len + pn_len]
+    if len(name) != name_len or len(pn) != pn_len:
+        raise ValueError("LUR truncado")
+    return name.decode("ascii"), pn.decode("ascii")
+
+
+def _request_packet(opcode: int, filename: str, options: Dict[str, str] = None) -> bytes:
+    pkt = OPCODE_STRUCT.pack(opcode) + filename.encode("ascii") + b"\0octet\0"
+    for name, value in (options or {}).items():
+        pkt += f"{name}\0{value}\0".encode("ascii")
+    return pkt
+
+
+def _parse_options(fields: List[bytes]) -> Dict[str, str]:
+    return {
+        fields[i].decode("ascii", "ignore").lower(): fields[i + 1].decode("ascii", "ignore")
+        for i in range(0, len(fields) - 1, 2)
+    }
+
+
+def _parse_request(pkt: bytes) -> Tuple[str, Dict[str, str]]:
+    fields = bytes(pkt[2:]).split(b"\0")
+    return fields[0].decode("ascii", "ignore"), _parse_options(fields[2:])
+
+
+class _ImpairedLink:
+    """
+    Recepção de DATA e envio de ACK do BIN com perda, reordenação,
+    duplicação de ACKs e banda.
+    """
+
+    def __init__(
+        self,
+        rng: random.Random,
+        loss: float,
+        reorder: float,
+        bandwidth: Optional[float],
+        duplicate: float = 0.0,
+    ):
+        self.rng = rng
+        self.loss = loss
+        self.reorder = reorder
+        self.duplicate = duplicate
+        self.bandwidth = bandwidth
+        self.duplicate = duplicate
+        self.dropped = 0
+        self.reordered = 0
+        self.duplicated = 0
+        self._held = None
+        self._ready = deque()
+        self._free_at = 0.0
+
+    def recv(self, sock: socket.socket, timeout: float):
+        if self._ready:
+            return self._ready.popleft()
+        while True:
+            sock.settimeout(timeout)
+            try:
+                pkt, addr = sock.recvfrom(MAX_PACKET_SIZE)
+            except socket.timeout:
+                # Nada mais chegou: o pacote retido é entregue atrasado
+                if self._held is not None:
+                    held, self._held = self._held, None
+                    return held
+                raise
+            self._pace(len(pkt))
+            if self.loss and self.rng.random() < self.loss:
+                self.dropped += 1
+                continue
+            if self._held is None and self.reorder and self.rng.random() < self.reorder:
+                self._held = (pkt, addr)
+                self.reordered += 1
+                continue
+            if self._held is not None:
+                self._ready.append(self._held)
+                self._held = None
+            return pkt, addr
+
+    def send(self, sock: socket.socket, pkt: bytes, addr: Tuple[str, int]):
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        sock.sendto(pkt, addr)
+        if self.duplicate and self.rng.random() < self.duplicate:
+            self.duplicated += 1
+            sock.sendto(pkt, addr)
+
+    def _pace(self, nbytes: int):
+        # Enlace gargalo: cada pacote ocupa nbytes*8/banda segundos
+        if not self.bandwidth:
+            return
+        now = time.monotonic()
+        self._free_at = max(self._free_at, now) + nbytes * 8 / self.bandwidth
+        delay = self._free_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class BCSimulator:
+    """
+    BC simulado em localhost que atende a ciclos de upload ARINC 615A.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-85: Inicialização do Simulador de BC
+    # Descrição: O construtor deve aceitar o endereço de escuta (porta 0:
+    #            efêmera), as opções pedidas no RRQ do BIN (blksize e
+    #            windowsize; os padrões do firmware não pedem opções), a
+    #            latência de escrita em flash por bloco (s), as taxas de perda
+    #            e reordenação (0..1), a taxa de ACKs duplicados no enlace
+    #            (0..1), a banda do enlace (bit/s, None: sem
+    #            limite), os PNs aceitos (None: todos), a semente dos sorteios,
+    #            os timeouts, o modo de recepção do BIN (ideal_receiver) e um
+    #            logger opcional. O socket é aberto no
+    #            construtor, de modo que a porta já é conhecida antes de
+    #            start().
+    # ============================================================================
+    def __init__(
+        self,
+        port: int = 0,
+        host: str = SIM_HOST,
+        blksize: int = BLOCK_SIZE,
+        windowsize: int = 1,
+        flash_write_latency: float = 0.0,
+        loss: float = 0.0,
+        reorder: float = 0.0,
+        duplicate: float = 0.0,
+        bandwidth: Optional[float] = None,
+        supported_pns: Optional[List[str]] = None,
+        seed: Optional[int] = None,
+        timeout: float = SIM_TIMEOUT_SEC,
+        idle_timeout: float = SIM_IDLE_TIMEOUT_SEC,
+        ideal_receiver: bool = False,
+        logger: Callable[[str], None] = None,
+    ):
+        if not 0.0 <= loss < 1.0:
+            raise ValueError(f"loss fora da faixa [0, 1): {loss}")
+        if not 0.0 <= reorder < 1.0:
+            raise ValueError(f"reorder fora da faixa [0, 1): {reorder}")
+        if not 0.0 <= duplicate < 1.0:
+            raise ValueError(f"duplicate fora da faixa [0, 1): {duplicate}")
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError(f"bandwidth deve ser > 0: {bandwidth}")
+        if flash_write_latency < 0:
+            raise ValueError(f"flash_write_latency deve ser >= 0: {flash_write_latency}")
+        self.blksize = blksize
+        self.windowsize = windowsize
+        self.flash_write_latency = flash_write_latency
+        self.loss = loss
+        self.reorder = reorder
+        self.duplicate = duplicate
+        self.bandwidth = bandwidth
+        self.supported_pns = None if supported_pns is None else set(supported_pns)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.ideal_receiver = ideal_receiver
+        self.logger = logger or (lambda msg: None)
+        self._rng = random.Random(seed)
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.address = self.sock.getsockname()
+        # Um registro por ciclo de upload atendido (sucesso ou falha)
+        self.results: List[Dict] = []
+        self._results_cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return self.address[0]
+
+    @property
+    def port(self) -> int:
+        return self.address[1]
+
+    def log(self, msg: str):
+        self.logger(f"[BC-SIM {self.port}] {msg}")
+
+    # ============================================================================
+    # REQ: GSE-HLR-85: Ciclo de Vida do Simulador
+    # Descrição: start() deve atender a ciclos de upload em uma thread até
+    #            stop(), que encerra a thread e o socket; o simulador também é
+    #            um context manager. wait_for_uploads(count, timeout) aguarda
+    #            count ciclos registrados em self.results.
+    # ============================================================================
+    def start(self) -> "BCSimulator":
+        self._thread = threading.Thread(
+            target=self._serve, name=f"bc-sim-{self.port}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            # Datagrama vazio acorda a thread bloqueada no socket principal
+            self.sock.sendto(b"", self.address)
+            self._thread.join()
+            self._thread = None
+        self.sock.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def wait_for_uploads(self, count: int, timeout: float) -> bool:
+        with self._results_cond:
+            return self._results_cond.wait_for(lambda: len(self.results) >= count, timeout)
+
+    def _serve(self):
+        while not self._stop.is_set():
+            result = {"error": None}
+            try:
+                gse = self._await_authentication()
+                if gse is None:
+                    continue
+                result["gse"] = gse
+                self._run_upload(gse, result)
+            except Exception as e:
+                if self._stop.is_set():
+                    return
+                result["error"] = str(e)
+                self.log(f"Ciclo de upload abortado: {e}")
+            with self._results_cond:
+                self.results.append(result)
+                self._results_cond.notify_all()
+
+    # ============================================================================
+    # REQ: GSE-HLR-85: Sequência de Upload do Simulador
+    # Descrição: Após a autenticação, o ciclo deve servir o LUI, enviar o
+    #            INIT_LOAD.LUS (status 0x0001, "000"), receber o LUR, recusar
+    #            PNs não suportados (sem RRQ, como o firmware), receber o BIN e
+    #            o HASH e, se o SHA-256 conferir, enviar o FINAL_LOAD.LUS
+    #            (status 0x0003, "100"). O resultado registra arquivo, PN,
+    #            bytes, blocos, duplicatas, pacotes perdidos/reordenados,
+    #            ACKs duplicados, tempo e vazão da transferência do BIN e hash_ok.
+    # ============================================================================
+    def _run_upload(self, gse: Tuple[str, int], result: Dict):
+        self._serve_lui()
+        self._send_status_file(
+            gse,
+            "INIT_LOAD.LUS",
+            build_lus(ARINC_STATUS_ACCEPTED, "Operation Accepted", 0, "000"),
+        )
+        header_filename, part_number = self._receive_lur()
+        result.update(filename=header_filename, part_number=part_number)
+        if self.supported_pns is not None and part_number not in self.supported_pns:
+            raise Exception(f"PN não suportado: {part_number}")
+
+        stats = self._receive_image(gse, header_filename)
+        result.update(stats)
+        if not stats["hash_ok"]:
+            raise Exception("Hash SHA-256 não confere! Arquivo corrompido.")
+        self.log(
+            f"{header_filename} recebido: {stats['bytes']} bytes em {stats['elapsed']:.3f}s"
+        )
+        self._send_status_file(
+            gse,
+            "FINAL_LOAD.LUS",
+            build_lus(ARINC_STATUS_COMPLETED_OK, "Load Completed Successfully", 2, "100"),
+        )
+
+    def _recv(self, sock: socket.socket, timeout: float):
+        sock.settimeout(timeout)
+        return sock.recvfrom(MAX_PACKET_SIZE)
+
+    def _await_authentication(self) -> Optional[Tuple[str, int]]:
+        """Aguarda a chave do GSE; retorna o endereço do GSE ou None (sem pedido)."""
+        try:
+            pkt, gse = self._recv(self.sock, SIM_POLL_SEC)
+        except socket.timeout:
+            return None
+        opcode, block = parse_header(pkt)
+        if opcode != OP_DATA or block != 1 or pkt[4:] != GSE_STATIC_KEY:
+            self.log(f"Pacote ignorado fora de um upload (opcode={opcode})")
+            return None
+        self.sock.sendto(build_ack(1), gse)
+        self._send_and_wait_ack(self.sock, build_data(1, EXPECTED_BC_KEY), gse, 1)
+        self.log(f"GSE {gse[0]}:{gse[1]} autenticado")
+        return gse
+
+    def _send_and_wait_ack(
+        self, sock: socket.socket, pkt: bytes, addr: Tuple[str, int], block: int
+    ) -> Tuple[str, int]:
+        """Envia pkt e aguarda ACK(block) do IP de addr; retorna o remetente do ACK."""
+        for _ in range(SIM_RETRY_LIMIT + 1):
+            sock.sendto(pkt, addr)
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    ack, ack_addr = self._recv(sock, remaining)
+                except socket.timeout:
+                    break
+                if ack_addr[0] == addr[0] and parse_header(ack) == (OP_ACK, block):
+                    return ack_addr
+        raise TimeoutError(f"ACK({block}) não recebido de {addr[0]}")
+
+    def _serve_lui(self):
+        pkt, addr = self._recv(self.sock, self.idle_timeout)
+        filename, _options = _parse_request(pkt)
+        if OPCODE_STRUCT.unpack_from(pkt)[0] != OP_RRQ or not filename.endswith(".LUI"):
+            raise Exception(f"Esperava RRQ do LUI, recebido '{filename}'")
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as transfer:
+            transfer.bind((self.host, 0))
+            lui = build_lui(ARINC_STATUS_ACCEPTED, "Operation Accepted")
+            self._send_and_wait_ack(transfer, build_data(1, lui), addr, 1)
+
+    def _send_status_file(self, gse: Tuple[str, int], filename: str, lus: bytes):
+        ack_addr = self._send_and_wait_ack(self.sock, _request_packet(OP_WRQ, filename), gse, 0)
+        self._send_and_wait_ack(self.sock, build_data(1, lus), ack_addr, 1)
+
+    def _receive_lur(self) -> Tuple[str, str]:
+        pkt, addr = self._recv(self.sock, self.idle_timeout)
+        filename, _options = _parse_request(pkt)
+        if OPCODE_STRUCT.unpack_from(pkt)[0] != OP_WRQ or not filename.endswith(".LUR"):
+            raise Exception(f"Esperava WRQ do LUR, recebido '{filename}'")
+        # Opções ignoradas, como no firmware: ACK(0) e blocos de BLOCK_SIZE
+        data = bytearray()
+        block = 0
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as transfer:
+            transfer.bind((self.host, 0))
+            transfer.sendto(build_ack(0), addr)
+            while True:
+                pkt, data_addr = self._recv(transfer, self.idle_timeout)
+                opcode, received = parse_header(pkt)
+                if data_addr != addr or opcode != OP_DATA:
+                    continue
+                if received == block + 1:
+                    data += pkt[4:]
+                    block = received
+                transfer.sendto(build_ack(received), addr)
+                if received == block and len(pkt) - 4 < BLOCK_SIZE:
+                    break
+        return parse_lur(bytes(data))
+
+    # ============================================================================
+    # REQ: GSE-HLR-85: Recepção do BIN e do HASH
+    # Descrição: O RRQ do BIN deve sair do socket principal para o GSE, com
+    #            blksize/windowsize quando configurados. Um OACK fixa as opções
+    #            (confirmado com ACK(0)); um DATA(1) direto indica blocos de
+    #            BLOCK_SIZE e janela 1. Por padrão, como make_rrq do firmware,
+    #            todo DATA é "gravado em flash" (flash_write_latency), entra no
+    #            SHA-256 e é confirmado com o próprio número, sem conferir a
+    #            sequência; o pacote seguinte ao primeiro bloco curto é o HASH.
+    #            Com ideal_receiver, só o bloco esperado é gravado, o ACK é
+    #            enviado ao fim de cada janela ou no último bloco, fora de
+    #            ordem o último bloco contíguo é reconfirmado uma vez por
+    #            lacuna, e o HASH é o bloco seguinte ao último. Em ambos, sem
+    #            pacotes por timeout o último ACK é reenviado; "duplicates"
+    #            conta os DATA fora da sequência esperada.
+    # ============================================================================
+    def _receive_image(self, gse: Tuple[str, int], filename: str) -> Dict:
+        options = {}
+        if self.blksize != BLOCK_SIZE:
+            options[OPT_BLKSIZE] = str(self.blksize)
+        if self.windowsize > 1:
+            options[OPT_WINDOWSIZE] = str(self.windowsize)
+        link = _ImpairedLink(
+            self._rng, self.loss, self.reorder, self.bandwidth, self.duplicate
+        )
+        hasher = hashlib.sha256()
+        block_size, window, rollover_to = BLOCK_SIZE, 1, 0
+        total = 0
+        duplicates = 0
+
+        started = time.monotonic()
+        self.sock.sendto(_request_packet(OP_RRQ, filename, options), gse)
+        tid = None
+        seq = 1  # posição do próximo bloco esperado
+        next_block = 1  # sucessor do último bloco gravado (modo firmware)
+        in_window = 0
+        last_ack = None
+        gap_acked = False  # uma única reconfirmação por lacuna (RFC 7440)
+        idle_since = time.monotonic()
+        image_done = False
+        while True:
+            try:
+                pkt, addr = link.recv(self.sock, self.timeout)
+            except socket.timeout:
+                if time.monotonic() - idle_since >= self.idle_timeout:
+                    raise TimeoutError(f"Sem dados do GSE por {self.idle_timeout}s")
+                if last_ack is not None:
+                    link.send(self.sock, last_ack, tid)
+                gap_acked = False
+                continue
+            idle_since = time.monotonic()
+            if addr[0] != gse[0] or (tid is not None and addr != tid):
+                continue
+            opcode, block = parse_header(pkt)
+            if opcode == OP_ERROR:
+                raise Exception(f"Erro TFTP {block} recebido do GSE")
+            if tid is None:
+                tid = addr
+                if opcode == OP_OACK:
+                    oack = _parse_options(bytes(pkt[2:]).split(b"\0"))
+                    block_size = int(oack.get(OPT_BLKSIZE, BLOCK_SIZE))
+                    window = int(oack.get(OPT_WINDOWSIZE, 1))
+                    rollover_to = int(oack.get(OPT_ROLLOVER, 0))
+                    last_ack = build_ack(0)
+                    link.send(self.sock, last_ack, tid)
+                    continue
+            if opcode == OP_OACK:
+                link.send(self.sock, build_ack(0), tid)
+                continue
+            if opcode != OP_DATA:
+                continue
+
+            expected = block_number(seq, rollover_to) if self.ideal_receiver else next_block
+            if block != expected and (self.ideal_receiver or not image_done):
+                duplicates += 1
+                if not self.ideal_receiver:
+                    # Firmware: sem conferência de sequência, o bloco é gravado
+                    self.log(f"Bloco {block} fora de sequência gravado na imagem")
+                else:
+                    # Janela 1: ACK perdido e bloco reenviado; janela > 1: lacuna
+                    if (window > 1 and not gap_acked) or (
+                        window == 1 and block == block_number(seq - 1, rollover_to)
+                    ):
+                        last_ack = build_ack(block_number(seq - 1, rollover_to))
+                        link.send(self.sock, last_ack, tid)
+                        gap_acked = True
+                        in_window = 0
+                    continue
+
+            payload = pkt[4:]
+            if image_done:
+                # Bloco seguinte ao último: HASH esperado (state_uploading.c)
+                self.sock.sendto(build_ack(block), tid)
+                elapsed = time.monotonic() - started
+                return {
+                    "bytes": total,
+                    "blocks": seq - 1,
+                    "block_size": block_size,
+                    "window_size": window,
+                    "duplicates": duplicates,
+                    "dropped": link.dropped,
+                    "reordered": link.reordered,
+                    "duplicated": link.duplicated,
+                    "elapsed": elapsed,
+                    "mbps": total / elapsed / 1e6 if elapsed > 0 else 0.0,
+                    "sha256": hasher.hexdigest(),
+                    "hash_ok": bytes(payload) == hasher.digest(),
+                }
+
+            if self.flash_write_latency:
+                time.sleep(self.flash_write_latency)
+            hasher.update(payload)
+            total += len(payload)
+            seq += 1
+            next_block = block + 1 if block < MAX_BLOCK_NUMBER else rollover_to
+            in_window += 1
+            gap_acked = False
+            image_done = len(payload) < block_size
+            if image_done or in_window >= window:
+                last_ack = build_ack(block)
+                link.send(self.sock, last_ack, tid)
+                in_window = 0
+
+
+# ============================================================================
+# REQ: GSE-HLR-85: Instâncias em Paralelo
+# Descrição: start_simulators(count, **options) deve iniciar count
+#            simuladores, cada um em sua porta efêmera e com semente própria
+#            (seed + índice) quando seed for informada.
+# ============================================================================
+def start_simulators(count: int, seed: Optional[int] = None, **options) -> List[BCSimulator]:
+    simulators = []
+    try:
+        for index in range(count):
+            sim_seed = None if seed is None else seed + index
+            simulators.append(BCSimulator(seed=sim_seed, **options).start())
+    except Exception:
+        for sim in simulators:
+            sim.stop()
+        raise
+    return simulators
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Módulo Proxy de Degradação de Rede (netem em espaço de usuário)
+
+Define a classe 'NetemProxy', um proxy UDP colocado entre o 'TFTPClient'
+e um par (BC real ou 'BCSimulator') que injeta latência, jitter, perda,
+duplicação, reordenação e limite de banda, com sorteios determinísticos
+(seed), sem precisar de root nem de "tc netem".
+
+O TFTP troca de porta a cada transferência (TIDs efêmeros dos dois lados),
+então o proxy mapeia cada endereço do par em um socket de frente próprio e
+cada endereço do cliente em um socket de saída próprio: o cliente enxerga
+os TIDs do par como portas distintas do proxy e vice-versa.
+
+Uso (a partir de gse/):
+    python -m backend.simulation.netem_proxy --target 127.0.0.1:6969 \
+        --profile wifi --seed 1 [--listen-port 0] [--loss 0.02 ...]
+
+Não contém dependências do Qt (PySide6).
+"""
+
+import argparse
+import heapq
+import itertools
+import random
+import selectors
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from backend.protocols.tftp_client import MAX_PACKET_SIZE
+
+# ============================================================================
+# REQ: GSE-HLR-86: Perfis de Degradação
+# Descrição: Perfis nomeados (parâmetros de NetemProxy) para benchmarks e
+#            testes: sem degradação, LAN, Wi-Fi do hangar e enlace ruim.
+#            Latência e jitter em segundos, banda em bit/s.
+# ============================================================================
+IMPAIRMENT_PROFILES: Dict[str, Dict[str, float]] = {
+    "none": {},
+    "lan": {"latency": 0.0005, "jitter": 0.0002},
+    "wifi": {
+        "latency": 0.003,
+        "jitter": 0.002,
+        "loss": 0.005,
+        "reorder": 0.005,
+        "bandwidth": 20e6,
+    },
+    "lossy": {
+        "latency": 0.02,
+        "jitter": 0.01,
+        "loss": 0.03,
+        "duplicate": 0.01,
+        "reorder": 0.02,
+        "bandwidth": 2e6,
+    },
+}
+
+PROXY_HOST = "127.0.0.1"
+PROXY_QUEUE_LIMIT = 1000
+PROXY_REORDER_GAP_SEC = 0.005
+PROXY_POLL_SEC = 0.05
+
+CLIENT_TO_PEER = "client_to_peer"
+PEER_TO_CLIENT = "peer_to_client"
+
+
+class _Direction:
+    """Degradação e contadores de um sentido do enlace."""
+
+    def __init__(self, name: str, seed: Optional[int], proxy: "NetemProxy"):
+        # Uma semente por sentido: os sorteios de um sentido não dependem
+        # da intercalação com o outro
+        self.name = name
+        self.rng = random.Random(None if seed is None else f"{seed}:{name}")
+        self.proxy = proxy
+        self.free_at = 0.0
+        self.last_at = 0.0
+        self.stats = {
+            "packets": 0,
+            "bytes": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "duplicated": 0,
+            "reordered": 0,
+        }
+
+    def schedule(self, faults: bool = True) -> list:
+        """Retorna (atraso, reordenado) de cada cópia do pacote (vazio: descartado)."""
+        proxy = self.proxy
+        if faults and proxy.loss and self.rng.random() < proxy.loss:
+            self.stats["dropped"] += 1
+            return []
+        copies = 1
+        if faults and proxy.duplicate and self.rng.random() < proxy.duplicate:
+            self.stats["duplicated"] += 1
+            copies = 2
+        times = []
+        for _ in range(copies):
+            delay = proxy.latency
+            if proxy.jitter:
+                delay = max(0.0, delay + self.rng.uniform(-proxy.jitter, proxy.jitter))
+            reordered = faults and bool(proxy.reorder) and self.rng.random() < proxy.reorder
+            if reordered:
+                # Atrasado além dos seguintes, que o ultrapassam
+                self.stats["reordered"] += 1
+                delay += proxy.reorder_gap
+            times.append((delay, reordered))
+        return times
+
+
+class NetemProxy:
+    """
+    Proxy UDP com degradação de rede configurável e determinística.
+    """
+
+    # ============================================================================
+    # REQ: GSE-HLR-86: Inicialização do Proxy de Degradação
+    # Descrição: O construtor deve aceitar o endereço do par (target), a
+    #            porta de escuta (0: efêmera), latência e jitter (s, jitter
+    #            uniforme em ±jitter, sem reordenar), probabilidades de perda, duplicação e
+    #            reordenação (0..1), banda (bit/s por sentido, None: sem
+    #            limite), o atraso extra dos pacotes reordenados, o limite da
+    #            fila (pacotes acima dele são descartados), a semente, um
+    #            fault_filter(sentido, pacote) opcional que restringe perda,
+    #            duplicação e reordenação aos pacotes para os quais retorna
+    #            True (latência, jitter e banda valem para todos) e um logger
+    #            opcional. A mesma degradação vale para os dois
+    #            sentidos, com sorteios independentes por sentido.
+    # ============================================================================
+    def __init__(
+        self,
+        target: Tuple[str, int],
+        listen_port: int = 0,
+        host: str = PROXY_HOST,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        duplicate: float = 0.0,
+        reorder: float = 0.0,
+        bandwidth: Optional[float] = None,
+        reorder_gap: float = PROXY_REORDER_GAP_SEC,
+        queue_limit: int = PROXY_QUEUE_LIMIT,
+        seed: Optional[int] = None,
+        fault_filter: Optional[Callable[[str, bytes], bool]] = None,
+        logger: Callable[[str], None] = None,
+    ):
+        for name, value in (("loss", loss), ("duplicate", duplicate), ("reorder", reorder)):
+            if not 0.0 <= value < 1.0:
+                raise ValueError(f"{name} fora da faixa [0, 1): {value}")
+        if latency < 0 or jitter < 0 or reorder_gap < 0:
+            raise ValueError("latency, jitter e reorder_gap devem ser >= 0")
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError(f"bandwidth deve ser > 0: {bandwidth}")
+        self.target = (socket.gethostbyname(target[0]), target[1])
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.duplicate = duplicate
+        self.reorder = reorder
+        self.bandwidth = bandwidth
+        self.reorder_gap = reorder_gap
+        self.queue_limit = queue_limit
+        self.fault_filter = fault_filter
+        self.logger = logger or (lambda msg: None)
+        self._directions = {
+            CLIENT_TO_PEER: _Direction(CLIENT_TO_PEER, seed, self),
+            PEER_TO_CLIENT: _Direction(PEER_TO_CLIENT, seed, self),
+        }
+
+        self._selector = selectors.DefaultSelector()
+        # Endereço do par -> socket de frente (visto pelo cliente)
+        self._front: Dict[Tuple[str, int], socket.socket] = {}
+        # Endereço do cliente -> socket de saída (visto pelo par)
+        self._upstream: Dict[Tuple[str, int], socket.socket] = {}
+        self._queue = []  # (instante, ordem, socket, pacote, destino, sentido)
+        self._order = itertools.count()
+        self._stop = threading.Event()
+        self._thread = None
+        self.address = self._front_socket(self.target, listen_port).getsockname()
+
+    @classmethod
+    def from_profile(cls, target: Tuple[str, int], profile: str, **overrides) -> "NetemProxy":
+        if profile not in IMPAIRMENT_PROFILES:
+            raise ValueError(f"Perfil de degradação desconhecido: {profile}")
+        return cls(target, **{**IMPAIRMENT_PROFILES[profile], **overrides})
+
+    @property
+    def port(self) -> int:
+        return self.address[1]
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: dict(d.stats) for name, d in self._directions.items()}
+
+    # ============================================================================
+    # REQ: GSE-HLR-86: Ciclo de Vida do Proxy
+    # Descrição: start() deve encaminhar pacotes em uma thread até stop(), que
+    #            encerra a thread e fecha todos os sockets; o proxy também é um
+    #            context manager.
+    # ============================================================================
+    def start(self) -> "NetemProxy":
+        self._thread = threading.Thread(
+            target=self._run, name=f"netem-proxy-{self.port}", daemon=True
+        )
+        self._thread.start()
+        self.logger(f"[NETEM] Proxy {self.address[0]}:{self.port} -> {self.target[0]}:{self.target[1]}")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for sock in list(self._front.values()) + list(self._upstream.values()):
+            self._selector.unregister(sock)
+            sock.close()
+        self._front.clear()
+        self._upstream.clear()
+        self._selector.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ============================================================================
+    # REQ: GSE-HLR-86: Encaminhamento com Mapeamento de TIDs
+    # Descrição: Um pacote do cliente C recebido no socket de frente do par P
+    #            sai para P pelo socket de saída de C; um pacote de P recebido
+    #            no socket de saída de C volta a C pelo socket de frente de P.
+    #            Os sockets são criados sob demanda. Cada pacote recebe seus
+    #            instantes de entrega (perda, duplicação, latência, jitter,
+    #            reordenação) e, com banda limitada, entra na fila do sentido
+    #            após o tempo de serialização dos anteriores.
+    # ============================================================================
+    def _front_socket(self, peer: Tuple[str, int], port: int = 0) -> socket.socket:
+        sock = self._front.get(peer)
+        if sock is None:
+            sock = self._bind(port)
+            self._front[peer] = sock
+            self._selector.register(sock, selectors.EVENT_READ, (CLIENT_TO_PEER, peer))
+        return sock
+
+    def _upstream_socket(self, client: Tuple[str, int]) -> socket.socket:
+        sock = self._upstream.get(client)
+        if sock is None:
+            sock = self._bind(0)
+            self._upstream[client] = sock
+            self._selector.register(sock, selectors.EVENT_READ, (PEER_TO_CLIENT, client))
+        return sock
+
+    def _bind(self, port: int) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((self.host, port))
+        sock.setblocking(False)
+        return sock
+
+    def _run(self):
+        while not self._stop.is_set():
+            timeout = PROXY_POLL_SEC
+            if self._queue:
+                timeout = min(timeout, max(0.0, self._queue[0][0] - time.monotonic()))
+            for key, _events in self._selector.select(timeout):
+                self._receive(key.fileobj, *key.data)
+            self._deliver_due()
+
+    def _receive(self, sock: socket.socket, direction: str, bound: Tuple[str, int]):
+        while True:
+            try:
+                pkt, src = sock.recvfrom(MAX_PACKET_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                # ICMP port unreachable de um TID já encerrado
+                self.logger(f"[NETEM-AVISO] Erro de recepção ignorado: {e}")
+                return
+            if direction == CLIENT_TO_PEER:
+                out_sock, dest = self._upstream_socket(src), bound
+            else:
+                if src not in self._front and src[0] != self.target[0]:
+                    continue  # apenas o host do par tem acesso ao retorno
+                out_sock, dest = self._front_socket(src), bound
+            self._enqueue(self._directions[direction], out_sock, pkt, dest)
+
+    def _enqueue(self, direction: _Direction, sock, pkt: bytes, dest):
+        now = time.monotonic()
+        direction.stats["packets"] += 1
+        direction.stats["bytes"] += len(pkt)
+        faults = self.fault_filter is None or self.fault_filter(direction.name, pkt)
+        delays = direction.schedule(faults)
+        if not delays:
+            return
+        if len(self._queue) + len(delays) > self.queue_limit:
+            direction.stats["dropped"] += 1
+            return
+        start = now
+        if self.bandwidth:
+            # Serialização em um enlace gargalo por sentido
+            direction.free_at = max(direction.free_at, now) + len(pkt) * 8 / self.bandwidth
+            start = direction.free_at
+        for delay, reordered in delays:
+            at = start + delay
+            if not reordered:
+                # O jitter não reordena (fila FIFO por sentido); só reorder o faz
+                at = max(at, direction.last_at)
+                direction.last_at = at
+            heapq.heappush(self._queue, (at, next(self._order), sock, pkt, dest, direction))
+
+    def _deliver_due(self):
+        now = time.monotonic()
+        while self._queue and self._queue[0][0] <= now:
+            _at, _order, sock, pkt, dest, direction = heapq.heappop(self._queue)
+            try:
+                sock.sendto(pkt, dest)
+                direction.stats["delivered"] += 1
+            except OSError as e:
+                self.logger(f"[NETEM-AVISO] Falha ao encaminhar para {dest}: {e}")
+
+
+# ============================================================================
+# REQ: GSE-HLR-86: Interface de Linha de Comando do Proxy
+# Descrição: main(argv) deve iniciar o proxy para --target com o perfil
+#            (--profile) e sobreposições individuais, exibir a porta de
+#            escuta e, ao fim de --duration (ou Ctrl+C), as estatísticas de
+#            cada sentido.
+# ============================================================================
+def _parse_address(value: str) -> Tuple[str, int]:
+    host, _, port = value.rpartition(":")
+    return (host or PROXY_HOST, int(port))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Proxy UDP com degradação de rede")
+    parser.add_argument("--target", type=_parse_address, required=True, help="host:porta do par")
+    parser.add_argument("--listen-port", type=int, default=0)
+    parser.add_argument("--profile", choices=sorted(IMPAIRMENT_PROFILES), default="none")
+    for name in ("latency", "jitter", "loss", "duplicate", "reorder", "bandwidth"):
+        parser.add_argument(f"--{name}", type=float)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--duration", type=float, help="segundos (padrão: até Ctrl+C)")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        name: getattr(args, name)
+        for name in ("latency", "jitter", "loss", "duplicate", "reorder", "bandwidth")
+        if getattr(args, name) is not None
+    }
+    proxy = NetemProxy.from_profile(
+        args.target,
+        args.profile,
+        listen_port=args.listen_port,
+        seed=args.seed,
+        logger=print,
+        **overrides,
+    )
+    with proxy:
+        print(f"[NETEM] Escutando em {proxy.address[0]}:{proxy.port}", flush=True)
+        try:
+            if args.duration is None:
+                while True:
+                    time.sleep(1)
+            time.sleep(args.duration)
+        except KeyboardInterrupt:
+            pass
+    for name, stats in proxy.stats.items():
+        print(f"[NETEM] {name}: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -31,9 +31,18 @@ e a 'Arinc615ASession' (lógica pura).
 import traceback
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
+from backend.logsGSE.log_levels import LevelLogger
+
 # Importa os módulos de protocolo que criamos
-from backend.protocols.tftp_client import TFTPClient
+from backend.protocols.tftp_client import (
+    TFTPClient,
+    PREFERRED_BLOCK_SIZE,
+    PREFERRED_WINDOW_SIZE,
+)
 from backend.protocols.arinc615a import Arinc615ASession
+from backend.protocols.fleet_upload import phase_durations
+from backend.protocols.hash_cache import HashCache
+from backend.protocols.resume_checkpoint import TransferCheckpointStore
 from backend.protocols.wifi_utils import check_wifi_connection
 
 
@@ -70,6 +79,8 @@ class WorkerSignals(QObject):
       - log(str): mensagens de log de status/erro.
       - progress(int): progresso da transferência (0–100).
       - finished(bool): indica conclusão (True = sucesso, False = falha).
+      - phase(str): fase do fluxo ARINC iniciada (GSE-HLR-92).
+      - result(dict): métricas do upload para o log estruturado (GSE-HLR-92).
     """
 
     ## @brief Sinal de log textual.
@@ -84,6 +95,15 @@ class WorkerSignals(QObject):
     #  @details Emite True em caso de sucesso e False em caso de falha.
     finished = Signal(bool)
 
+    # ============================================================================
+    # REQ: GSE-HLR-92: Sinais do Log Estruturado
+    # Descrição: phase(str) deve ser emitido no início de cada fase do fluxo
+    #   e result(dict) ao fim do fluxo (sucesso ou falha) com target, pn,
+    #   success, duration_s, bytes, retries e phases ({fase: duração}).
+    # ============================================================================
+    phase = Signal(str)
+    result = Signal(dict)
+
 
 # ============================================================================
 # REQ: GSE-LLR-136: Interface do Worker (Assíncrona)
@@ -116,7 +136,15 @@ class ArincWorker(QRunnable):
     # Autor: Julia
     # Revisor: Fabrício
     # ============================================================================
-    def __init__(self, ip: str, file_path: str, pn: str, signals: WorkerSignals):
+    def __init__(
+        self,
+        ip: str,
+        file_path: str,
+        pn: str,
+        signals: WorkerSignals,
+        hash_cache: HashCache = None,
+        checkpoint_store: TransferCheckpointStore = None,
+    ):
         """
         @brief Construtor do worker ARINC 615A.
 
@@ -128,12 +156,16 @@ class ArincWorker(QRunnable):
         @param file_path Caminho do arquivo a ser transferido.
         @param pn Part Number (PN) associado ao pacote de software.
         @param signals Instância de WorkerSignals para comunicação com a UI.
+        @param hash_cache Cache persistente de SHA-256 compartilhado (opcional).
+        @param checkpoint_store Checkpoints para retomada do envio (opcional).
         """
         super().__init__()
         self.ip = ip
         self.file_path = file_path
         self.pn = pn
         self.signals = signals
+        self.hash_cache = hash_cache
+        self.checkpoint_store = checkpoint_store
 
     # ============================================================================
     # REQ: GSE-LLR-138: Execução (Log de Início)
@@ -223,16 +255,21 @@ class ArincWorker(QRunnable):
         # GSE-LLR-138
         self.signals.log.emit(f"[WORKER] Iniciando thread para {self.ip}...")
         client = None
+        session = None
 
         # GSE-LLR-145
         try:
             # GSE-LLR-139
-            def logger(msg):
-                self.signals.log.emit(msg)
+            # GSE-HLR-90: descartado antes do sinal Qt se abaixo do nível de log
+            logger = LevelLogger(self.signals.log.emit)
 
             def progress(pct):
                 self.signals.progress.emit(pct)
 
+            def phase(timing):
+                if not timing.finished:
+                    self.signals.phase.emit(timing.name)
+
             # ==================================================================
             # [NOVO] PASSO 1: VERIFICAR O AMBIENTE (WI-FI) ANTES DE TUDO
             # ==================================================================
@@ -250,7 +287,14 @@ class ArincWorker(QRunnable):
             # PASSO 2: CRIAR E CONECTAR O CLIENTE TFTP (JÁ VERIFICADO)
             # ==================================================================
             # GSE-LLR-140
-            client = TFTPClient(self.ip, logger=logger)
+            # blksize/windowsize: negocia blocos maiores e janela deslizante;
+            # BCs sem suporte a opções seguem em lock-step com 512 bytes
+            client = TFTPClient(
+                self.ip,
+                logger=logger,
+                blksize=PREFERRED_BLOCK_SIZE,
+                windowsize=PREFERRED_WINDOW_SIZE,
+            )
 
             # GSE-LLR-141
             # Apenas conecta o socket. O Wi-Fi já foi checado.
@@ -259,7 +303,12 @@ class ArincWorker(QRunnable):
 
             # GSE-LLR-142
             session = Arinc615ASession(
-                tftp_client=client, logger=logger, progress_callback=progress
+                tftp_client=client,
+                logger=logger,
+                progress_callback=progress,
+                hash_cache=self.hash_cache,
+                checkpoint_store=self.checkpoint_store,
+                phase_callback=phase,
             )
 
             # GSE-LLR-143
@@ -283,8 +332,22 @@ class ArincWorker(QRunnable):
             self.signals.finished.emit(False)
 
         finally:
+            # GSE-HLR-92
+            if session and session.last_result is not None:
+                self.signals.result.emit(self._result_fields(session.last_result))
             # GSE-LLR-149
             if client:
                 client.close()
             # GSE-LLR-150
             self.signals.log.emit("[WORKER] Thread encerrada e sockets limpos.")
+
+    def _result_fields(self, result) -> dict:
+        return {
+            "target": self.ip,
+            "pn": self.pn,
+            "success": result.success,
+            "duration_s": result.duration,
+            "bytes": result.bytes,
+            "retries": result.retries,
+            "phases": phase_durations(result),
+        }
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Módulo do Worker de Upload em Frota
+
+Define o worker (QRunnable) que executa o 'FleetUploadScheduler' (ou,
+com mais de um processo, o 'ProcessFleetUploadScheduler') fora da
+thread da UI, repassando log, progresso por alvo e o resumo final ao
+'UploadController' através de sinais Qt.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+from backend.logsGSE.log_levels import LevelLogger
+from backend.protocols.fleet_process import ProcessFleetUploadScheduler
+from backend.protocols.fleet_upload import FleetUploadScheduler
+from backend.protocols.hash_cache import HashCache
+from backend.protocols.wifi_utils import check_wifi_connection
+
+
+# ============================================================================
+# REQ: GSE-HLR-102: Interface de Sinais do Worker de Frota
+# Descrição: log(str); targetProgress(str, int) com IP e progresso do alvo;
+#   progress(int) com o progresso agregado da frota; targetFinished(str, bool)
+#   por alvo; finished(bool) ao fim (True somente se todos os alvos
+#   concluíram) e summary(object) com o resumo de FleetUploadScheduler.run().
+# ============================================================================
+class FleetWorkerSignals(QObject):
+    log = Signal(str)
+    targetProgress = Signal(str, int)
+    progress = Signal(int)
+    targetFinished = Signal(str, bool)
+    finished = Signal(bool)
+    summary = Signal(object)
+
+
+# ============================================================================
+# REQ: GSE-HLR-102: Worker de Upload em Frota
+# Descrição: O worker deve verificar o Wi-Fi uma única vez, executar o
+#   agendador com os alvos, o limite de concorrência e o hash_cache
+#   compartilhado, e emitir finished(False) em caso de exceção, sem
+#   interromper a UI.
+# ============================================================================
+# REQ: GSE-HLR-104: Worker de Frota Multiprocesso
+# Descrição: Com processes > 1, as sessões são distribuídas entre processos
+#   por ProcessFleetUploadScheduler; os eventos chegam pela fila e são
+#   emitidos pelos mesmos sinais.
+# ============================================================================
+class FleetWorker(QRunnable):
+    def __init__(
+        self,
+        targets: list,
+        file_path: str,
+        pn: str,
+        signals: FleetWorkerSignals,
+        max_concurrency: int,
+        hash_cache: HashCache = None,
+        processes: int = 1,
+    ):
+        super().__init__()
+        self.targets = targets
+        self.file_path = file_path
+        self.pn = pn
+        self.signals = signals
+        self.max_concurrency = max_concurrency
+        self.hash_cache = hash_cache
+        self.processes = processes
+
+    @Slot()
+    def run(self):
+        self.signals.log.emit(
+            f"[WORKER] Iniciando upload em frota para {len(self.targets)} alvo(s)..."
+        )
+        try:
+
+            # GSE-HLR-90: descartado antes do sinal Qt se abaixo do nível de log
+            logger = LevelLogger(self.signals.log.emit)
+
+            def progress(ip, pct, total):
+                self.signals.targetProgress.emit(ip, pct)
+                self.signals.progress.emit(total)
+
+            EXPECTED_SSID = "FCC01"
+            check_wifi_connection(EXPECTED_SSID, logger)
+            self.signals.log.emit("[WORKER] Verificação de Wi-Fi OK.")
+
+            options = dict(
+                max_concurrency=self.max_concurrency,
+                hash_cache=self.hash_cache,
+                logger=logger,
+                progress_callback=progress,
+                target_finished_callback=self.signals.targetFinished.emit,
+            )
+            if self.processes > 1:
+                scheduler = ProcessFleetUploadScheduler(
+                    processes=self.processes, **options
+                )
+            else:
+                scheduler = FleetUploadScheduler(**options)
+            summary = scheduler.run(self.targets, self.file_path, self.pn)
+
+            self.signals.summary.emit(summary)
+            self.signals.finished.emit(summary["failed"] == 0)
+
+        except Exception as e:
+            self.signals.log.emit(f"[WORKER-ERRO] Erro fatal no upload em frota: {e}")
+            self.signals.finished.emit(False)
+
+        finally:
+            self.signals.log.emit("[WORKER] Upload em frota encerrado.")
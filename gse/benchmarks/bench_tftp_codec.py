@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark do codec de pacotes TFTP (GSE-HLR-99)
+
+Compara o custo por pacote da análise de ACK/DATA e da montagem de DATA
+entre a implementação anterior (struct.unpack em fatias + TFTP_OPCODE por
+pacote, concatenação de bytes) e o codec com structs pré-compilados.
+
+Uso (a partir de gse/):
+    python benchmarks/bench_tftp_codec.py [--number N]
+"""
+
+import argparse
+import struct
+import sys
+import timeit
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.tftp_client import TFTP_OPCODE  # noqa: E402
+from backend.protocols.tftp_codec import (  # noqa: E402
+    OP_ACK,
+    PacketWriter,
+    parse_header,
+)
+
+BLOCK_SIZE = 1468
+ACK_PKT = struct.pack("!HH", TFTP_OPCODE.ACK.value, 1234)
+PAYLOAD = memoryview(bytes(range(256)) * 6)[:BLOCK_SIZE]
+
+
+# Implementação anterior do caminho quente (referência)
+def legacy_parse_ack(data):
+    if len(data) < 4:
+        return (None, 0)
+    opcode = struct.unpack("!H", data[0:2])[0]
+    block = struct.unpack("!H", data[2:4])[0]
+    return (TFTP_OPCODE(opcode), block)
+
+
+def legacy_build_data(block, data):
+    return struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + data
+
+
+def legacy_ack_round():
+    opcode, block = legacy_parse_ack(ACK_PKT)
+    return opcode == TFTP_OPCODE.ACK and block == 1234
+
+
+def codec_ack_round():
+    opcode, block = parse_header(ACK_PKT)
+    return opcode == OP_ACK and block == 1234
+
+
+WRITER = PacketWriter(BLOCK_SIZE)
+
+
+def legacy_data_round():
+    return legacy_build_data(77, PAYLOAD)
+
+
+def codec_data_round():
+    return WRITER.data(77, PAYLOAD)
+
+
+def per_packet_ns(func, number: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rows = [
+        ("ACK (análise)", legacy_ack_round, codec_ack_round),
+        (f"DATA {BLOCK_SIZE} B (montagem)", legacy_data_round, codec_data_round),
+    ]
+    print(f"{'operação':<28}{'antes (ns)':>12}{'depois (ns)':>13}{'ganho':>8}")
+    for name, before, after in rows:
+        t_before = per_packet_ns(before, args.number)
+        t_after = per_packet_ns(after, args.number)
+        print(f"{name:<28}{t_before:>12.1f}{t_after:>13.1f}{t_before / t_after:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
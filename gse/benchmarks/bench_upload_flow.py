@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Benchmark de ponta a ponta do fluxo de upload (GSE-HLR-87)
+
+Executa Arinc615ASession.run_upload_flow contra o BC simulado
+(BCSimulator), atrás do proxy de degradação (NetemProxy), variando tamanho
+da imagem, tamanho de bloco e perfil de rede. Cada caso roda em um processo
+novo (pico de RSS por caso) e registra MB/s do BIN, RTT por bloco (p50 e
+p99), retransmissões e pico de RSS. O resultado é comparado a um baseline
+JSON: uma queda de vazão ou um aumento de RSS acima do limiar falha a
+execução (código de saída 1).
+
+Uso (a partir de gse/):
+    python benchmarks/bench_upload_flow.py [--sizes 256K,4M] [--blksizes 512,1468]
+        [--profiles none,lan,wifi] [--baseline ARQ] [--update-baseline]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_client import PREFERRED_WINDOW_SIZE, TFTPClient  # noqa: E402
+from backend.protocols.tftp_codec import OP_DATA, parse_header  # noqa: E402
+from backend.simulation.bc_simulator import BCSimulator  # noqa: E402
+from backend.simulation.netem_proxy import CLIENT_TO_PEER, NetemProxy  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "upload_baseline.json"
+DEFAULT_SIZES = "256K,4M"
+DEFAULT_BLKSIZES = "512,1468"
+DEFAULT_PROFILES = "none,lan,wifi"
+DEFAULT_THRESHOLD = 0.25
+BASELINE_VERSION = 1
+PART_NUMBER = "EMB-BENCH"
+SEED = 1
+
+# Métrica -> sentido da melhora (+1: maior é melhor, -1: menor é melhor)
+GATED_METRICS = {"mbps": +1, "peak_rss_kib": -1}
+
+
+def parse_size(value: str) -> int:
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    value = value.strip().upper()
+    if value[-1:] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def case_id(case: dict) -> str:
+    return f"{case['profile']}/{case['size']}/{case['blksize']}"
+
+
+def bin_data_only(direction: str, pkt: bytes) -> bool:
+    """Falhas (perda/duplicação/reordenação) só nos DATA do BIN, GSE -> BC.
+
+    As trocas de controle (autenticação, LUI, LUS, LUR) não têm
+    retransmissão no GSE e tornariam a vazão medida uma loteria.
+    """
+    if direction != CLIENT_TO_PEER or len(pkt) < 4:
+        return False
+    opcode, block = parse_header(pkt)
+    return opcode == OP_DATA and block >= 2
+
+
+def percentile(samples: list, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_kib():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss: KiB no Linux, bytes no macOS
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# ============================================================================
+# REQ: GSE-HLR-87: Execução de um Caso do Benchmark
+# Descrição: run_case(case) deve gerar a imagem, iniciar o BC simulado (com
+#            as opções do caso) atrás do proxy com o perfil do caso e
+#            executar o fluxo completo com um TFTPClient que negocia o mesmo
+#            blksize e windowsize. Retorna MB/s (bytes do BIN / tempo do RRQ
+#            ao HASH no BC), p50/p99 das amostras de RTT do RttEstimator
+#            (ms), retransmissões, tempo total do fluxo e pico de RSS.
+# ============================================================================
+def run_case(case: dict) -> dict:
+    size, blksize = case["size"], case["blksize"]
+    windowsize = case.get("windowsize", PREFERRED_WINDOW_SIZE)
+    with tempfile.TemporaryDirectory() as tmp:
+        image = Path(tmp) / "BENCH.bin"
+        pattern = bytes(range(256)) * 256
+        with open(image, "wb") as f:
+            for offset in range(0, size, len(pattern)):
+                f.write(pattern[: size - offset])
+
+        sim = BCSimulator(blksize=blksize, windowsize=windowsize, ideal_receiver=True)
+        proxy = NetemProxy.from_profile(
+            sim.address, case["profile"], seed=SEED, fault_filter=bin_data_only
+        )
+        client = TFTPClient(
+            "127.0.0.1",
+            server_port=proxy.port,
+            timeout=case.get("timeout", 5),
+            logger=lambda _msg: None,
+            blksize=blksize,
+            windowsize=windowsize,
+        )
+        rtts = []
+        sample = client.rtt.sample
+        client.rtt.sample = lambda rtt: (rtts.append(rtt), sample(rtt))
+        with sim, proxy:
+            assert client.connect()
+            try:
+                session = Arinc615ASession(client, logger=lambda _msg: None)
+                started = time.perf_counter()
+                ok = session.run_upload_flow(str(image), PART_NUMBER)
+                flow_s = time.perf_counter() - started
+            finally:
+                client.close()
+            sim.wait_for_uploads(1, timeout=5)
+
+    result = sim.results[0] if sim.results else {"error": "sem resultado do BC"}
+    if not ok or result.get("error") or not result.get("hash_ok"):
+        raise RuntimeError(f"Caso {case_id(case)} falhou: {result.get('error')}")
+    return {
+        "mbps": round(result["bytes"] / result["elapsed"] / 1e6, 3),
+        "rtt_p50_ms": round(percentile(rtts, 50) * 1e3, 3),
+        "rtt_p99_ms": round(percentile(rtts, 99) * 1e3, 3),
+        "retransmits": client.retransmit_count,
+        "flow_s": round(flow_s, 3),
+        "peak_rss_kib": peak_rss_kib(),
+    }
+
+
+def run_cases(cases: list, repeat: int = 1, isolated: bool = True) -> dict:
+    """Executa cada caso repeat vezes e mantém a execução de vazão mediana."""
+    results = {}
+    ctx = multiprocessing.get_context("spawn")
+    for case in cases:
+        if isolated:
+            # Um processo por execução: o pico de RSS é do próprio caso
+            with ctx.Pool(1, maxtasksperchild=1) as pool:
+                runs = [pool.apply(run_case, (case,)) for _ in range(repeat)]
+        else:
+            runs = [run_case(case) for _ in range(repeat)]
+        runs.sort(key=lambda run: run["mbps"])
+        results[case_id(case)] = runs[len(runs) // 2]
+    return results
+
+
+# ============================================================================
+# REQ: GSE-HLR-87: Portão de Regressão
+# Descrição: compare_with_baseline(results, baseline, threshold) deve
+#            retornar uma mensagem por métrica de GATED_METRICS que piorou
+#            mais que threshold (fração) em relação ao baseline; casos ou
+#            métricas ausentes do baseline não são comparados.
+# ============================================================================
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for cid, metrics in results.items():
+        reference = baseline.get(cid)
+        if reference is None:
+            continue
+        for name, better in GATED_METRICS.items():
+            current, base = metrics.get(name), reference.get(name)
+            if current is None or not base:
+                continue
+            change = (current - base) / base * better
+            if change < -threshold:
+                regressions.append(
+                    f"{cid}: {name} {current} vs baseline {base} ({change * 100:+.1f}%)"
+                )
+    return regressions
+
+
+def load_baseline(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Versão de baseline incompatível em {path}")
+    return data["cases"]
+
+
+def save_baseline(path: Path, results: dict):
+    data = {
+        "version": BASELINE_VERSION,
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "cases": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="ex.: 256K,4M")
+    parser.add_argument("--blksizes", default=DEFAULT_BLKSIZES)
+    parser.add_argument("--profiles", default=DEFAULT_PROFILES)
+    parser.add_argument("--windowsize", type=int, default=PREFERRED_WINDOW_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="JSON com os resultados desta execução")
+    args = parser.parse_args(argv)
+
+    cases = [
+        {"profile": profile, "size": parse_size(size), "blksize": int(blksize), "windowsize": args.windowsize}
+        for profile in args.profiles.split(",")
+        for size in args.sizes.split(",")
+        for blksize in args.blksizes.split(",")
+    ]
+    results = run_cases(cases, repeat=args.repeat)
+
+    print(f"{'caso':<28}{'MB/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'retx':>7}{'RSS KiB':>10}")
+    for cid, m in results.items():
+        print(
+            f"{cid:<28}{m['mbps']:>9.2f}{m['rtt_p50_ms']:>9.3f}{m['rtt_p99_ms']:>9.3f}"
+            f"{m['retransmits']:>7}{m['peak_rss_kib'] or 0:>10}"
+        )
+    if args.output:
+        save_baseline(args.output, results)
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline or not baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"Baseline gravado em {args.baseline}")
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSÃO {message}")
+    if regressions:
+        return 1
+    print(f"Sem regressões acima de {args.threshold * 100:.0f}% em relação a {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
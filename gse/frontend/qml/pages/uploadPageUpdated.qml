@@ -21,19 +21,16 @@ Item {
     property bool isTransferring: false
     property bool lastTransferFailed: false
    
+    // GSE-HLR-91: as mensagens vão para o modelo de logs do backend (buffer
+    // circular com inserção em lote); a lista só desenha as linhas visíveis
     function appendLog(msg) {
-        logsArea.text += msg + "\n"
-        logsArea.cursorPosition = logsArea.length
+        uploadBackend.logModel.appendMessage(msg)
     }
 
     // Conexões com o backend da tela de upload
     Connections {
         target: uploadBackend
 
-        function onLogMessage(msg) {
-            appendLog(msg)
-        }
-
         function onProgressChanged(pct) {
             uploadProgressBar.value = pct
         }
@@ -206,20 +203,27 @@ Item {
             anchors.left: parent.left
             anchors.leftMargin: pnRow.anchors.leftMargin + 80 + pnRow.spacing
 
-            ScrollView {
+            ListView {
+                id: logsList
                 anchors.fill: parent
+                anchors.margins: 4
                 clip: true
-
-                TextArea {
-                    id: logsArea
-                    readOnly: true
-                    wrapMode: TextArea.WrapAnywhere
-                    text: ""
+                model: uploadBackend.logModel
+                // Acompanha o fim da lista enquanto o usuário não rolar para cima
+                property bool followTail: true
+                onMovementEnded: followTail = atYEnd
+                onCountChanged: if (followTail) positionViewAtEnd()
+                ScrollBar.vertical: ScrollBar {}
+
+                delegate: Text {
+                    width: logsList.width
+                    text: model.display
+                    wrapMode: Text.WrapAnywhere
                     font.family: "monospace"
                     font.pixelSize: 12
-                    selectByMouse: true
-                    cursorVisible: false
-                    background: Rectangle { color: "transparent" }
+                    color: model.level === "ERROR" ? "#b91c1c"
+                         : model.level === "WARN" ? "#b45309"
+                         : "#1f2937"
                 }
             }
         }
@@ -14,7 +14,11 @@ Principais responsabilidades:
     - Instanciar e expor o BackendController para integração geral com o QML.
     - Instanciar e expor o UploadController para o fluxo de upload de FLS.
     - Configurar o ícone da aplicação.
+
+Opções de linha de comando:
+    --log-level {TRACE,DEBUG,INFO,WARN,ERROR}  nível inicial de log (padrão INFO).
 """
+import argparse
 import sys
 from pathlib import Path
 
@@ -22,6 +26,12 @@ from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QQmlApplicationEngine
 from backend.controllers.general import BackendController, set_application_icon
 from backend.controllers.upload_controller import UploadController
+from backend.logsGSE.log_levels import (
+    DEFAULT_LOG_LEVEL,
+    LEVEL_NAMES,
+    level_name,
+    set_log_level,
+)
 
 # -----------------------------------------------------------------------------
 # Função principal
@@ -41,7 +51,18 @@ from backend.controllers.upload_controller import UploadController
 # \return Código de saída da aplicação (0 em encerramento bem-sucedido,
 #         -1 em caso de falha ao carregar o QML).
 if __name__ == "__main__":
-    app = QGuiApplication(sys.argv)
+    # Opções próprias do GSE; as demais seguem para o Qt
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=list(LEVEL_NAMES.values()),
+        default=level_name(DEFAULT_LOG_LEVEL),
+    )
+    args, qt_argv = parser.parse_known_args(sys.argv[1:])
+    set_log_level(args.log_level)
+
+    app = QGuiApplication(sys.argv[:1] + qt_argv)
     engine = QQmlApplicationEngine()
 
     # Instancia e expõe controladores
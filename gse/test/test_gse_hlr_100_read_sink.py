@@ -0,0 +1,99 @@
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.tftp_client import TFTP_OPCODE, TFTPClient  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-100 – Recepção direta em sink
+# Descrição: read_file_into() deve gravar os payloads recebidos em um
+# bytearray, arquivo ou callback, sem acumular bytes imutáveis; read_file()
+# continua retornando bytes.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+FILE_DATA = bytes(range(256)) * 257  # 129 blocos de 512 bytes (último parcial)
+
+
+def make_data_packet(block, payload: bytes) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + payload
+
+
+@pytest.fixture
+def client_and_server():
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(5)
+    client = TFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None)
+    assert client.connect()
+    client.server_port_69 = server.getsockname()[1]
+
+    def stand_in_server():
+        _rrq, client_addr = server.recvfrom(2048)
+        transfer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        transfer.settimeout(5)
+        for block, offset in enumerate(range(0, len(FILE_DATA), 512), start=1):
+            transfer.sendto(make_data_packet(block, FILE_DATA[offset : offset + 512]), client_addr)
+            transfer.recvfrom(16)
+        transfer.close()
+
+    t = threading.Thread(target=stand_in_server)
+    t.start()
+    yield client
+    t.join(timeout=10)
+    server.close()
+    client.close()
+
+
+@pytest.mark.hlr100
+@pytest.mark.functional
+def test_read_file_into_bytearray(client_and_server):
+    sink = bytearray()
+    assert client_and_server.read_file_into("system.LUI", sink) == len(FILE_DATA)
+    assert sink == FILE_DATA
+
+
+@pytest.mark.hlr100
+@pytest.mark.functional
+def test_read_file_into_file_object(client_and_server, tmp_path):
+    target = tmp_path / "download.log"
+    with open(target, "wb") as f:
+        assert client_and_server.read_file_into("download.log", f) == len(FILE_DATA)
+    assert target.read_bytes() == FILE_DATA
+
+
+@pytest.mark.hlr100
+@pytest.mark.functional
+def test_read_file_into_callback_receives_views(client_and_server):
+    chunks = []
+
+    def on_chunk(view):
+        assert isinstance(view, memoryview)
+        chunks.append(bytes(view))  # o view só é válido durante a chamada
+
+    client_and_server.read_file_into("system.LUI", on_chunk)
+    assert b"".join(chunks) == FILE_DATA
+
+
+@pytest.mark.hlr100
+@pytest.mark.functional
+def test_read_file_keeps_bytes_api(client_and_server):
+    data = client_and_server.read_file("system.LUI")
+    assert isinstance(data, bytes)
+    assert data == FILE_DATA
+
+
+@pytest.mark.hlr100
+@pytest.mark.functional
+def test_invalid_sink_is_rejected():
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None)
+    with pytest.raises(TypeError):
+        client.read_file_into("system.LUI", b"immutable")
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.progress import ProgressCoalescer  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-101 – Progresso com taxa limitada
+# Descrição: O progresso do envio deve chegar à UI apenas quando o percentual
+# mudar, no máximo a uma taxa configurável, com o evento final garantido.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.hlr101
+@pytest.mark.functional
+def test_repeated_percentages_are_dropped():
+    events = []
+    coalescer = ProgressCoalescer(events.append, max_rate_hz=None)
+    for pct in (0, 0, 1, 1, 1, 2, 2, 100, 100):
+        coalescer(pct)
+    assert events == [0, 1, 2, 100]
+
+
+@pytest.mark.hlr101
+@pytest.mark.functional
+def test_rate_limit_keeps_last_value_pending():
+    events = []
+    clock = FakeClock()
+    coalescer = ProgressCoalescer(events.append, max_rate_hz=20, clock=clock)
+
+    coalescer(1)
+    clock.now = 0.01
+    coalescer(2)
+    coalescer(3)
+    assert events == [1]
+
+    clock.now = 0.06
+    coalescer(4)
+    assert events == [1, 4]
+
+    clock.now = 0.07
+    coalescer(5)
+    coalescer.flush()
+    assert events == [1, 4, 5]
+    coalescer.flush()  # nada pendente
+    assert events == [1, 4, 5]
+
+
+@pytest.mark.hlr101
+@pytest.mark.functional
+def test_final_100_is_never_suppressed():
+    events = []
+    clock = FakeClock()
+    coalescer = ProgressCoalescer(events.append, max_rate_hz=1, clock=clock)
+    coalescer(50)
+    coalescer(99)
+    coalescer(100)
+    assert events == [50, 100]
+
+
+@pytest.mark.hlr101
+@pytest.mark.functional
+def test_session_coalesces_per_block_progress():
+    events = []
+    session = Arinc615ASession(
+        tftp_client=object(),
+        logger=lambda _msg: None,
+        progress_callback=events.append,
+        progress_max_rate_hz=20,
+    )
+    callback = session._make_tftp_progress_callback()
+    total_blocks = 50_000
+    for block in range(1, total_blocks + 1):
+        callback(int(100 * block / total_blocks))
+    callback.flush()
+
+    assert len(events) <= 31  # faixa 40–70 da UI: no máximo um evento por valor
+    assert events[-1] == 70
@@ -0,0 +1,151 @@
+import hashlib
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.fleet_upload import (  # noqa: E402
+    FleetUploadScheduler,
+    format_results_table,
+)
+from backend.protocols.hash_cache import HashCache  # noqa: E402
+from backend.protocols.tftp_client import BLOCK_SIZE, PREFERRED_BLOCK_SIZE  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-102 – Upload em frota
+# Descrição: A mesma imagem deve ser carregada em vários alvos em paralelo,
+# com limite de concorrência, leitura/HASH únicos e resultado agregado.
+# Tipo: Requisito Funcional
+# ============================================================================
+
+FAILING_IP = "10.0.0.3"
+
+
+def make_status_file(status: int, progress: bytes = b"") -> bytes:
+    desc = b"OK"
+    body = b"A4" + struct.pack("!H", status) + bytes([len(desc)]) + desc + progress
+    return struct.pack("!L", 4 + len(body)) + body
+
+
+class FakeTFTPClient:
+    """Transporte sem rede: responde a cada passo do fluxo ARINC 615A."""
+
+    active = 0
+    peak = 0
+    served = []
+    prepared = []
+    lock = threading.Lock()
+
+    def __init__(self, ip, logger):
+        self.ip = ip
+        self.last_served_hash = None
+        self._lus = [make_status_file(1, b"000"), make_status_file(3, b"100")]
+
+    def connect(self):
+        return True
+
+    def close(self):
+        pass
+
+    def perform_authentication(self, gse_key, expected_bc_key):
+        return True
+
+    def read_file(self, filename):
+        if self.ip == FAILING_IP:
+            raise TimeoutError("BC não respondeu")
+        return make_status_file(1)
+
+    def receive_wrq_and_data(self):
+        return self._lus.pop(0)
+
+    def write_file(self, filename, data):
+        return True
+
+    def serve_file_on_rrq(self, expected_filename, file_data, hash_data, progress_callback):
+        with FakeTFTPClient.lock:
+            FakeTFTPClient.active += 1
+            FakeTFTPClient.peak = max(FakeTFTPClient.peak, FakeTFTPClient.active)
+            FakeTFTPClient.served.append((file_data, hash_data))
+            FakeTFTPClient.prepared.append(
+                [file_data.encoded(size, 0) for size in (BLOCK_SIZE, PREFERRED_BLOCK_SIZE)]
+            )
+        time.sleep(0.05)
+        progress_callback(50)
+        progress_callback(100)
+        self.last_served_hash = hash_data
+        with FakeTFTPClient.lock:
+            FakeTFTPClient.active -= 1
+        return True
+
+
+@pytest.fixture(autouse=True)
+def reset_fake():
+    FakeTFTPClient.active = 0
+    FakeTFTPClient.peak = 0
+    FakeTFTPClient.served = []
+    FakeTFTPClient.prepared = []
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "EMB-0001.bin"
+    path.write_bytes(bytes(range(256)) * 64)
+    return path
+
+
+@pytest.mark.hlr102
+@pytest.mark.functional
+def test_fleet_runs_targets_with_shared_image_and_cap(image, tmp_path):
+    targets = [f"10.0.0.{i}" for i in range(1, 7)]
+    progress = {}
+    finished = {}
+    cache = HashCache(str(tmp_path / ".hash_cache.json"))
+    scheduler = FleetUploadScheduler(
+        max_concurrency=2,
+        hash_cache=cache,
+        logger=lambda _msg: None,
+        progress_callback=lambda ip, pct, total: progress.__setitem__(ip, pct),
+        target_finished_callback=lambda ip, ok: finished.__setitem__(ip, ok),
+        client_factory=FakeTFTPClient,
+    )
+
+    summary = scheduler.run(targets, str(image), "EMB-0001")
+
+    digest = hashlib.sha256(image.read_bytes()).digest()
+    assert FakeTFTPClient.peak <= 2
+    assert len(FakeTFTPClient.served) == 5
+    # Uma única visão da imagem e um único HASH para todos os alvos
+    assert len({id(view) for view, _ in FakeTFTPClient.served}) == 1
+    assert all(h == digest for _, h in FakeTFTPClient.served)
+    assert cache.get(str(image)) == digest
+    # GSE-HLR-103: pacotes e HASH codificados antes da primeira sessão
+    for encoded in FakeTFTPClient.prepared[0]:
+        assert encoded is not None and encoded.hash_packet.endswith(digest)
+
+    assert summary["completed"] == 5
+    assert summary["failed"] == 1
+    assert summary["total_bytes"] == 5 * image.stat().st_size
+    rows = {row["ip"]: row for row in summary["targets"]}
+    assert not rows[FAILING_IP]["success"]
+    assert "BC não respondeu" in rows[FAILING_IP]["error"]
+    assert finished[FAILING_IP] is False
+    assert progress["10.0.0.1"] == 100
+
+    table = format_results_table(summary)
+    assert FAILING_IP in table and "FALHA" in table
+    assert table.splitlines()[-1].startswith("TOTAL")
+
+
+@pytest.mark.hlr102
+@pytest.mark.functional
+def test_fleet_requires_targets(image):
+    scheduler = FleetUploadScheduler(logger=lambda _msg: None)
+    with pytest.raises(ValueError):
+        scheduler.run([], str(image), "EMB-0001")
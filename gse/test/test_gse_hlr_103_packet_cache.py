@@ -0,0 +1,135 @@
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.packet_cache import ImagePacketCache  # noqa: E402
+from backend.protocols.tftp_client import (  # noqa: E402
+    BLOCK_SIZE,
+    MAX_BLOCK_NUMBER,
+    TFTP_OPCODE,
+    TFTPClient,
+)
+from backend.protocols.tftp_codec import build_data  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-103 – Cache de pacotes DATA pré-codificados
+# Descrição: Os pacotes DATA de uma imagem devem ser codificados uma única vez
+# por (tamanho de bloco, rollover) e compartilhados, somente leitura, entre as
+# sessões simultâneas, com memória limitada.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+@pytest.mark.hlr103
+@pytest.mark.functional
+def test_encoded_packets_match_built_packets():
+    image = memoryview(bytes(range(64)))
+    with ImagePacketCache(image) as packets:
+        encoded = packets.prepare(8, 0)
+        # 64 bytes em blocos de 8: 8 pacotes cheios e o pacote final 0-byte
+        assert encoded.count == 9
+        for idx in range(8):
+            assert bytes(encoded.packet(idx)) == build_data(
+                idx + 1, bytes(image[idx * 8 : idx * 8 + 8])
+            )
+        assert bytes(encoded.packet(8)) == build_data(9, b"")
+        assert encoded.packet(0).readonly
+
+
+@pytest.mark.hlr103
+@pytest.mark.functional
+def test_encoded_packets_wrap_block_number():
+    image = memoryview(bytes(MAX_BLOCK_NUMBER + 2))
+    with ImagePacketCache(image) as packets:
+        encoded = packets.prepare(1, 1)
+        last = struct.unpack("!HH", encoded.packet(MAX_BLOCK_NUMBER - 1)[:4])
+        wrapped = struct.unpack("!HH", encoded.packet(MAX_BLOCK_NUMBER)[:4])
+        assert last[1] == MAX_BLOCK_NUMBER
+        assert wrapped[1] == 1
+
+
+@pytest.mark.hlr103
+@pytest.mark.functional
+def test_encoded_once_and_bounded():
+    image = memoryview(bytes(4096))
+    with ImagePacketCache(image, max_bytes=9 * (512 + 4)) as packets:
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(packets.prepare(512, 0)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results[0] is not None
+        assert len({id(r) for r in results}) == 1
+        assert packets.encoded(512, 0) is results[0]
+        # Outra combinação ultrapassaria o limite: sem cache, sem erro
+        assert packets.prepare(1024, 0) is None
+
+
+@pytest.mark.hlr103
+@pytest.mark.functional
+def test_encoded_only_returns_prepared_packets():
+    """A sessão só consulta o cache; a codificação fica em prepare()."""
+    image = memoryview(bytes(range(64)))
+    with ImagePacketCache(image, hash_data=b"H" * 32) as packets:
+        assert packets.encoded(8, 0) is None
+        assert packets._encoded == {}
+        encoded = packets.prepare(8, 0)
+        # HASH no bloco seguinte ao pacote final 0-byte (bloco 9)
+        assert encoded.hash_packet == build_data(10, b"H" * 32)
+
+
+def serve_target(gse_addr, received):
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.settimeout(2)
+    peer.sendto(struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0", gse_addr)
+    data = bytearray()
+    while True:
+        pkt, tid = peer.recvfrom(2048)
+        block = struct.unpack("!H", pkt[2:4])[0]
+        peer.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, block), tid)
+        data += pkt[4:]
+        if len(pkt) - 4 < BLOCK_SIZE:
+            break
+    pkt, tid = peer.recvfrom(2048)
+    hash_block = struct.unpack("!H", pkt[2:4])[0]
+    peer.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, hash_block), tid)
+    received.append((bytes(data), pkt[4:]))
+    peer.close()
+
+
+@pytest.mark.hlr103
+@pytest.mark.functional
+def test_sessions_share_pre_encoded_packets():
+    file_data = bytes(range(256)) * 20 + b"tail"
+    hash_data = b"H" * 32
+    received = []
+    with ImagePacketCache(memoryview(file_data), hash_data=hash_data) as packets:
+        packets.prepare(BLOCK_SIZE, 0)
+        for _ in range(2):
+            client = TFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None)
+            assert client.connect()
+            client.sock.bind(("127.0.0.1", 0))
+            t = threading.Thread(
+                target=serve_target, args=(client.sock.getsockname(), received)
+            )
+            t.start()
+            try:
+                assert client.serve_file_on_rrq("fw.bin", packets, hash_data) is True
+            finally:
+                t.join(timeout=10)
+                client.close()
+        assert len(packets._encoded) == 1
+
+    assert received == [(file_data, hash_data)] * 2
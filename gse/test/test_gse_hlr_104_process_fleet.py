@@ -0,0 +1,123 @@
+import hashlib
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.fleet_process import ProcessFleetUploadScheduler  # noqa: E402
+from backend.protocols.packet_cache import ImagePacketCache  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-104 – Upload em frota multiprocesso
+# Descrição: As sessões da frota devem ser distribuídas entre processos, com a
+# imagem em memória compartilhada e log, progresso e resultados retornando ao
+# processo principal por uma fila.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+FAILING_IP = "10.0.0.3"
+
+
+def make_status_file(status: int, progress: bytes = b"") -> bytes:
+    desc = b"OK"
+    body = b"A4" + struct.pack("!H", status) + bytes([len(desc)]) + desc + progress
+    return struct.pack("!L", 4 + len(body)) + body
+
+
+class FakeTFTPClient:
+    """Transporte sem rede executado dentro do processo de transferência."""
+
+    def __init__(self, ip, logger):
+        self.ip = ip
+        self.log = logger
+        self.last_served_hash = None
+        self._lus = [make_status_file(1, b"000"), make_status_file(3, b"100")]
+
+    def connect(self):
+        return True
+
+    def close(self):
+        pass
+
+    def perform_authentication(self, gse_key, expected_bc_key):
+        return True
+
+    def read_file(self, filename):
+        if self.ip == FAILING_IP:
+            raise TimeoutError("BC não respondeu")
+        return make_status_file(1)
+
+    def receive_wrq_and_data(self):
+        return self._lus.pop(0)
+
+    def write_file(self, filename, data):
+        return True
+
+    def serve_file_on_rrq(self, expected_filename, file_data, hash_data, progress_callback):
+        assert isinstance(file_data, ImagePacketCache)
+        image_digest = hashlib.sha256(file_data.image).hexdigest()
+        self.log(f"pid={os.getpid()} imagem={image_digest}")
+        progress_callback(100)
+        self.last_served_hash = hash_data
+        return True
+
+
+def crashing_client_factory(ip, logger):
+    os._exit(3)
+
+
+@pytest.mark.hlr104
+@pytest.mark.functional
+def test_process_fleet_streams_events_from_worker_processes(tmp_path):
+    image = tmp_path / "EMB-0001.bin"
+    image.write_bytes(bytes(range(256)) * 64)
+    targets = [f"10.0.0.{i}" for i in range(1, 5)]
+    logs, progress, finished = [], {}, {}
+    scheduler = ProcessFleetUploadScheduler(
+        max_concurrency=4,
+        processes=2,
+        logger=logs.append,
+        progress_callback=lambda ip, pct, total: progress.__setitem__(ip, pct),
+        target_finished_callback=lambda ip, ok: finished.__setitem__(ip, ok),
+        client_factory=FakeTFTPClient,
+    )
+
+    summary = scheduler.run(targets, str(image), "EMB-0001")
+
+    served = [msg for msg in logs if "pid=" in msg]
+    pids = {msg.split("pid=")[1].split()[0] for msg in served}
+    digest = hashlib.sha256(image.read_bytes()).hexdigest()
+    assert len(served) == 3
+    assert len(pids) == 2 and str(os.getpid()) not in pids
+    assert all(msg.endswith(f"imagem={digest}") for msg in served)
+
+    assert [row["ip"] for row in summary["targets"]] == targets
+    assert summary["completed"] == 3 and summary["failed"] == 1
+    assert finished == {ip: ip != FAILING_IP for ip in targets}
+    assert progress["10.0.0.1"] == 100
+
+
+@pytest.mark.hlr104
+@pytest.mark.functional
+def test_process_fleet_reports_lost_worker(tmp_path):
+    image = tmp_path / "EMB-0001.bin"
+    image.write_bytes(b"\x01" * 1024)
+    finished = {}
+    scheduler = ProcessFleetUploadScheduler(
+        processes=1,
+        logger=lambda _msg: None,
+        target_finished_callback=lambda ip, ok: finished.__setitem__(ip, ok),
+        client_factory=crashing_client_factory,
+    )
+
+    summary = scheduler.run(["10.0.0.1", "10.0.0.2"], str(image), "EMB-0001")
+
+    assert summary["failed"] == 2
+    assert all("código 3" in row["error"] for row in summary["targets"])
+    assert finished == {"10.0.0.1": False, "10.0.0.2": False}
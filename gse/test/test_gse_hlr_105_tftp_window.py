@@ -0,0 +1,256 @@
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_client import (  # noqa: E402
+    BLOCK_SIZE,
+    TFTP_OPCODE,
+    TFTPClient,
+)
+from backend.simulation.bc_simulator import BCSimulator  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-105 – Janela deslizante TFTP
+# Descrição: Com windowsize negociado (RFC 7440), até N blocos DATA ficam em
+# trânsito por ACK cumulativo, com recuo ao primeiro bloco não confirmado em
+# lacuna ou timeout e descarte de ACKs repetidos ou atrasados.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+SERVER = ("127.0.0.1", 50000)
+
+
+def make_data_packet(block, payload: bytes) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + payload
+
+
+def make_ack_packet(block) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
+
+
+def make_oack_packet(**options) -> bytes:
+    body = b"".join(
+        k.encode() + b"\0" + str(v).encode() + b"\0" for k, v in options.items()
+    )
+    return struct.pack("!H", TFTP_OPCODE.OACK.value) + body
+
+
+class MockSocket:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+        self._timeout = 10
+
+    def settimeout(self, t):
+        self._timeout = t
+
+    def gettimeout(self):
+        return self._timeout
+
+    def sendto(self, pkt, addr):
+        self.sent.append((bytes(pkt), addr))
+
+    def recvfrom(self, n):
+        if not self._responses:
+            raise socket.timeout()
+        return self._responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_read_file_acks_once_per_window():
+    """Com windowsize negociado, o receptor envia apenas um ACK por janela."""
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None, windowsize=4)
+    blocks = [make_data_packet(i, b"D" * BLOCK_SIZE) for i in range(1, 7)]
+    blocks.append(make_data_packet(7, b"end"))
+    client.sock = MockSocket(
+        [(make_oack_packet(windowsize=4), SERVER)] + [(b, SERVER) for b in blocks]
+    )
+
+    data = client.read_file("big.log")
+
+    assert len(data) == 6 * BLOCK_SIZE + 3
+    acks = [struct.unpack("!HH", p)[1] for p, _ in client.sock.sent[1:]]
+    assert acks == [0, 4, 7]
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_read_file_reports_gap_once_per_window():
+    """Uma lacuna na janela gera um único ACK do último bloco em ordem."""
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None, windowsize=4)
+    client.sock = MockSocket(
+        [
+            (make_oack_packet(windowsize=4), SERVER),
+            (make_data_packet(1, b"1" * BLOCK_SIZE), SERVER),
+            (make_data_packet(3, b"3" * BLOCK_SIZE), SERVER),
+            (make_data_packet(4, b"4" * BLOCK_SIZE), SERVER),
+            (make_data_packet(2, b"2" * BLOCK_SIZE), SERVER),
+            (make_data_packet(3, b"3" * BLOCK_SIZE), SERVER),
+            (make_data_packet(4, b"4" * 10), SERVER),
+        ]
+    )
+
+    data = client.read_file("big.log")
+
+    assert data == b"1" * BLOCK_SIZE + b"2" * BLOCK_SIZE + b"3" * BLOCK_SIZE + b"4" * 10
+    acks = [struct.unpack("!HH", p)[1] for p, _ in client.sock.sent[1:]]
+    assert acks == [0, 1, 4]
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_serve_file_on_rrq_windowed_recovers_from_gap():
+    """O servidor mantém N blocos em trânsito e volta ao primeiro sem ACK."""
+    client = TFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None, windowsize=4)
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    gse_addr = client.sock.getsockname()
+
+    file_data = bytes(range(256)) * 20  # 5120 bytes = 10 blocos + final 0-byte
+    hash_data = b"H" * 32
+    received = {"acks": 0}
+
+    def target():
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.settimeout(2)
+        rrq = struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0windowsize\x004\0"
+        peer.sendto(rrq, gse_addr)
+        oack, tid = peer.recvfrom(2048)
+        received["oack"] = client._parse_oack_packet(oack)
+        peer.sendto(make_ack_packet(0), tid)
+
+        data, expected, in_window, dropped, gap = b"", 1, 0, False, False
+        while True:
+            pkt, _ = peer.recvfrom(2048)
+            block = struct.unpack("!H", pkt[2:4])[0]
+            if block == 3 and not dropped:
+                dropped = True  # simula perda do bloco 3 na primeira janela
+                continue
+            if block != expected:
+                if not gap:
+                    peer.sendto(make_ack_packet(expected - 1), tid)
+                    received["acks"] += 1
+                    gap, in_window = True, 0
+                continue
+            gap = False
+            data += pkt[4:]
+            in_window += 1
+            expected += 1
+            if len(pkt) - 4 < BLOCK_SIZE or in_window == 4:
+                peer.sendto(make_ack_packet(block), tid)
+                received["acks"] += 1
+                in_window = 0
+            if len(pkt) - 4 < BLOCK_SIZE:
+                break
+        received["data"] = data
+        pkt, _ = peer.recvfrom(2048)
+        received["hash"] = pkt[4:]
+        peer.sendto(make_ack_packet(struct.unpack("!H", pkt[2:4])[0]), tid)
+        peer.close()
+
+    t = threading.Thread(target=target)
+    t.start()
+    try:
+        assert client.serve_file_on_rrq("fw.bin", file_data, hash_data) is True
+    finally:
+        t.join(timeout=5)
+        client.close()
+
+    assert received["oack"] == {"windowsize": "4"}
+    assert received["data"] == file_data
+    assert received["hash"] == hash_data
+    # 11 blocos confirmados com bem menos ACKs que blocos
+    assert received["acks"] < 11
+
+
+def windowed_client(responses, max_retries=5, window=4):
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None, max_retries=max_retries)
+    client.window_size = window
+    client.adaptive_rto = True
+    sock = MockSocket([(pkt, SERVER) for pkt in responses])
+    image = memoryview(b"F" * (4 * BLOCK_SIZE + 10))
+    steps = client._send_file_windowed_steps(sock, image, SERVER)
+    return client, sock, steps
+
+
+def sent_blocks(sock):
+    return [struct.unpack("!HH", p[:4])[1] for p, _ in sock.sent]
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_windowed_send_rewinds_once_per_gap_base():
+    """ACKs repetidos da mesma base recuam a janela uma única vez."""
+    client, sock, steps = windowed_client(
+        [make_ack_packet(0)] * 3 + [make_ack_packet(4), make_ack_packet(5)]
+    )
+
+    assert client._run_blocking(steps) == 6
+    assert sent_blocks(sock) == [1, 2, 3, 4, 1, 2, 3, 4, 5]
+    assert client.retransmit_count == 4
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_windowed_send_counts_rewinds_as_retries():
+    """O recuo por lacuna consome uma das max_retries tentativas."""
+    client, sock, steps = windowed_client([make_ack_packet(0)], max_retries=3)
+
+    with pytest.raises(Exception, match="após 3 tentativas"):
+        client._run_blocking(steps)
+    # Janela inicial + recuo por lacuna + um único timeout
+    assert sent_blocks(sock) == [1, 2, 3, 4] * 3
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_lockstep_send_ignores_duplicate_acks():
+    """Janela 1: ACK repetido ou atrasado não retransmite nem conta tentativa."""
+    client, sock, steps = windowed_client(
+        [make_ack_packet(1), make_ack_packet(1), make_ack_packet(0)]
+        + [make_ack_packet(2), make_ack_packet(3), make_ack_packet(4), make_ack_packet(5)],
+        max_retries=1,
+        window=1,
+    )
+
+    assert client._run_blocking(steps) == 6
+    assert sent_blocks(sock) == [1, 2, 3, 4, 5]
+    assert client.retransmit_count == 0
+
+
+@pytest.mark.hlr105
+@pytest.mark.functional
+def test_duplicate_acks_do_not_corrupt_firmware_receiver(tmp_path):
+    """Sorcerer's Apprentice: ACKs duplicados pelo enlace não geram DATA repetido."""
+    image = tmp_path / "EMB-0001.bin"
+    image.write_bytes(bytes(range(256)) * 200 + b"tail")
+    with BCSimulator(blksize=1024, duplicate=0.3, seed=3) as sim:
+        client = TFTPClient(
+            sim.host, server_port=sim.port, timeout=2, logger=lambda _msg: None, blksize=1024
+        )
+        assert client.connect()
+        try:
+            session = Arinc615ASession(client, logger=lambda _msg: None)
+            assert session.run_upload_flow(str(image), "EMB-0001")
+        finally:
+            client.close()
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    result = sim.results[0]
+    assert result["block_size"] == 1024 and result["window_size"] == 1
+    assert result["duplicated"] > 0
+    assert result["duplicates"] == 0 and result["hash_ok"] is True
+    assert client.retransmit_count == 0
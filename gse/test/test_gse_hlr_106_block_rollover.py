@@ -0,0 +1,212 @@
+import hashlib
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.tftp_client import (  # noqa: E402
+    BLOCK_SIZE,
+    MAX_BLOCK_NUMBER,
+    TFTP_OPCODE,
+    TFTPClient,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-106 – Rollover do número de bloco TFTP
+# Descrição: Transferências com mais de 65535 blocos devem continuar após o
+# bloco 65535 em 0 ou 1 (opção rollover), tanto ao servir quanto ao ler.
+# Tipo: Requisito Funcional
+# ============================================================================
+
+WINDOW = 64
+
+
+def make_data_packet(block, payload: bytes) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + payload
+
+
+def make_ack_packet(block) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
+
+
+def parse_options(body: bytes) -> dict:
+    fields = body.split(b"\0")
+    return {
+        fields[i].decode().lower(): fields[i + 1].decode()
+        for i in range(0, len(fields) - 1, 2)
+    }
+
+
+@pytest.mark.hlr106
+@pytest.mark.functional
+@pytest.mark.parametrize(
+    "rollover, seq, expected",
+    [
+        (0, 1, 1),
+        (0, MAX_BLOCK_NUMBER, MAX_BLOCK_NUMBER),
+        (0, MAX_BLOCK_NUMBER + 1, 0),
+        (0, MAX_BLOCK_NUMBER + 2, 1),
+        (1, MAX_BLOCK_NUMBER + 1, 1),
+        (1, 2 * MAX_BLOCK_NUMBER + 1, 1),
+    ],
+)
+def test_block_number_wraps_to_rollover_value(rollover, seq, expected):
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None, rollover=rollover)
+    assert client._block_number(seq) == expected
+
+
+@pytest.mark.hlr106
+@pytest.mark.functional
+def test_blocks_after_crosses_wrap():
+    """ACK após o rollover deve confirmar os blocos anteriores ao wrap."""
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None)
+    assert client._blocks_after(MAX_BLOCK_NUMBER - 2, 1) == 4
+    client.rollover_to = 1
+    assert client._blocks_after(MAX_BLOCK_NUMBER - 2, 1) == 3
+
+
+@pytest.mark.hlr106
+@pytest.mark.functional
+def test_serve_file_on_rrq_streams_past_block_65535():
+    """Imagem com mais de 65535 blocos é servida a um alvo que não negocia rollover."""
+    client = TFTPClient(
+        "127.0.0.1", timeout=2, logger=lambda _msg: None, windowsize=WINDOW
+    )
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    gse_addr = client.sock.getsockname()
+
+    total_blocks = MAX_BLOCK_NUMBER + 100
+    file_data = bytes(range(256)) * (total_blocks * BLOCK_SIZE // 256) + b"tail"
+    hash_data = b"H" * 32
+    received = {}
+
+    def target():
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.settimeout(2)
+        rrq = (
+            struct.pack("!H", TFTP_OPCODE.RRQ.value)
+            + b"fw.bin\0octet\0windowsize\0"
+            + str(WINDOW).encode()
+            + b"\0"
+        )
+        peer.sendto(rrq, gse_addr)
+        oack, tid = peer.recvfrom(2048)
+        received["oack"] = parse_options(oack[2:])
+        peer.sendto(make_ack_packet(0), tid)
+
+        digest = hashlib.sha256()
+        expected, in_window, count, wrapped_at = 1, 0, 0, None
+        while True:
+            pkt, _ = peer.recvfrom(2048)
+            block = struct.unpack("!H", pkt[2:4])[0]
+            if block != expected:
+                peer.sendto(make_ack_packet((expected - 1) & 0xFFFF), tid)
+                in_window = 0
+                continue
+            if block == 0:
+                wrapped_at = count
+            digest.update(pkt[4:])
+            count += 1
+            expected = (expected + 1) & 0xFFFF
+            in_window += 1
+            last = len(pkt) - 4 < BLOCK_SIZE
+            if last or in_window == WINDOW:
+                peer.sendto(make_ack_packet(block), tid)
+                in_window = 0
+            if last:
+                break
+        received["count"] = count
+        received["digest"] = digest.digest()
+        received["wrapped_at"] = wrapped_at
+        pkt, _ = peer.recvfrom(2048)
+        received["hash"] = pkt[4:]
+        peer.sendto(make_ack_packet(struct.unpack("!H", pkt[2:4])[0]), tid)
+        peer.close()
+
+    t = threading.Thread(target=target)
+    t.start()
+    try:
+        assert client.serve_file_on_rrq("fw.bin", file_data, hash_data) is True
+    finally:
+        t.join(timeout=30)
+        client.close()
+
+    assert received["oack"] == {"windowsize": str(WINDOW)}
+    assert received["count"] == total_blocks + 1
+    # O bloco seguinte a 65535 é o 0 (padrão RFC sem opção rollover)
+    assert received["wrapped_at"] == MAX_BLOCK_NUMBER
+    assert received["digest"] == hashlib.sha256(file_data).digest()
+    assert received["hash"] == hash_data
+
+
+@pytest.mark.hlr106
+@pytest.mark.functional
+def test_read_file_receives_past_block_65535_with_rollover_1():
+    """O cliente negocia rollover=1 e recebe um arquivo com mais de 65535 blocos."""
+    blksize = 8
+    client = TFTPClient(
+        "127.0.0.1",
+        timeout=2,
+        logger=lambda _msg: None,
+        blksize=blksize,
+        windowsize=WINDOW,
+        rollover=1,
+    )
+    assert client.connect()
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(2)
+    client.server_port_69 = server.getsockname()[1]
+
+    total_blocks = MAX_BLOCK_NUMBER + 1000
+    file_data = bytes(range(256)) * (total_blocks * blksize // 256) + b"end"
+    received = {"blocks_after_wrap": []}
+
+    def stand_in_server():
+        rrq, client_addr = server.recvfrom(2048)
+        received["options"] = parse_options(rrq[2:].split(b"\0", 2)[2])
+        transfer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        transfer.settimeout(2)
+        oack = struct.pack("!H", TFTP_OPCODE.OACK.value) + (
+            f"blksize\0{blksize}\0windowsize\0{WINDOW}\0rollover\0001\0".encode()
+        )
+        transfer.sendto(oack, client_addr)
+        transfer.recvfrom(16)  # ACK(0)
+
+        chunks = [
+            file_data[i : i + blksize] for i in range(0, len(file_data), blksize)
+        ]
+        base = 0
+        while base < len(chunks):
+            window = chunks[base : base + WINDOW]
+            for offset, chunk in enumerate(window):
+                seq = base + offset + 1
+                block = seq if seq <= MAX_BLOCK_NUMBER else 1 + (seq - 0x10000) % 0xFFFF
+                if seq > MAX_BLOCK_NUMBER and len(received["blocks_after_wrap"]) < 2:
+                    received["blocks_after_wrap"].append(block)
+                transfer.sendto(make_data_packet(block, chunk), client_addr)
+            transfer.recvfrom(16)
+            base += len(window)
+        transfer.close()
+
+    t = threading.Thread(target=stand_in_server)
+    t.start()
+    try:
+        data = client.read_file("big.log")
+    finally:
+        t.join(timeout=30)
+        server.close()
+        client.close()
+
+    assert received["options"]["rollover"] == "1"
+    assert received["blocks_after_wrap"] == [1, 2]
+    assert client.rollover_to == 1
+    assert data == file_data
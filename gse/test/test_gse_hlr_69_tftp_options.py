@@ -0,0 +1,225 @@
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.tftp_client import (  # noqa: E402
+    BLOCK_SIZE,
+    TFTP_OPCODE,
+    TFTPClient,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-69 – Suporte à negociação de opções TFTP
+# Descrição: Suportar negociação/aceitação de opções (RFC 2347–2349, p.ex.,
+# blksize) mantendo compatibilidade com pares que ignoram opções.
+# Tipo: Requisito Funcional
+# ============================================================================
+
+SERVER = ("127.0.0.1", 50000)
+
+
+def make_data_packet(block, payload: bytes) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + payload
+
+
+def make_ack_packet(block) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
+
+
+def make_oack_packet(**options) -> bytes:
+    body = b"".join(
+        k.encode() + b"\0" + str(v).encode() + b"\0" for k, v in options.items()
+    )
+    return struct.pack("!H", TFTP_OPCODE.OACK.value) + body
+
+
+class MockSocket:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+        self._timeout = 10
+
+    def settimeout(self, t):
+        self._timeout = t
+
+    def gettimeout(self):
+        return self._timeout
+
+    def sendto(self, pkt, addr):
+        self.sent.append((bytes(pkt), addr))
+
+    def recvfrom(self, n):
+        if not self._responses:
+            raise socket.timeout()
+        return self._responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def tftp_client():
+    return TFTPClient("127.0.0.1", logger=lambda _msg: None, blksize=1024)
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_rrq_announces_blksize_option(tftp_client):
+    """RRQ deve anunciar blksize após o modo quando a negociação está ativa."""
+    tftp_client.sock = MockSocket([])
+    tftp_client._send_rrq("fw.bin", "octet", ("127.0.0.1", 69), {"blksize": "1024"})
+
+    pkt, _ = tftp_client.sock.sent[0]
+    assert pkt[2:].split(b"\0")[:4] == [b"fw.bin", b"octet", b"blksize", b"1024"]
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_default_client_sends_no_options():
+    """Com blksize padrão (512) o pedido permanece idêntico ao RFC 1350."""
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None)
+    client.sock = MockSocket([])
+    client._send_wrq("test.LUR", "octet", ("127.0.0.1", 69), client._request_options())
+
+    pkt, _ = client.sock.sent[0]
+    assert pkt.endswith(b"test.LUR\0octet\0")
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_read_file_uses_negotiated_block_size(tftp_client):
+    """Após OACK, o cliente responde ACK(0) e usa o bloco negociado."""
+    tftp_client.sock = MockSocket(
+        [
+            (make_oack_packet(blksize=1024), SERVER),
+            (make_data_packet(1, b"A" * 1024), SERVER),
+            (make_data_packet(2, b"B" * 600), SERVER),
+        ]
+    )
+
+    data = tftp_client.read_file("system.LUI")
+
+    assert data == b"A" * 1024 + b"B" * 600
+    assert tftp_client.block_size == 1024
+    acks = [struct.unpack("!HH", p)[1] for p, _ in tftp_client.sock.sent[1:]]
+    assert acks == [0, 1, 2]
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_read_file_falls_back_when_options_ignored(tftp_client):
+    """Se o servidor responder DATA(1) direto, a transferência segue com 512."""
+    tftp_client.sock = MockSocket(
+        [
+            (make_data_packet(1, b"A" * BLOCK_SIZE), SERVER),
+            (make_data_packet(2, b"tail"), SERVER),
+        ]
+    )
+
+    data = tftp_client.read_file("system.LUI")
+
+    assert data == b"A" * BLOCK_SIZE + b"tail"
+    assert tftp_client.block_size == BLOCK_SIZE
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_read_file_rejects_oack_above_request(tftp_client):
+    """OACK com blksize maior que o pedido deve ser recusado com ERROR 8."""
+    tftp_client.sock = MockSocket([(make_oack_packet(blksize=4096), SERVER)])
+
+    with pytest.raises(Exception, match="OACK inválido"):
+        tftp_client.read_file("system.LUI")
+
+    pkt, _ = tftp_client.sock.sent[-1]
+    assert struct.unpack("!HH", pkt[:4]) == (TFTP_OPCODE.ERROR.value, 8)
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_write_file_rejects_oack_at_sender_tid(tftp_client):
+    """No WRQ, o ERROR 8 vai ao TID que enviou o OACK, não à porta 69."""
+    tftp_client.sock = MockSocket([(make_oack_packet(blksize=4096), SERVER)])
+
+    with pytest.raises(Exception, match="OACK inválido"):
+        tftp_client.write_file("test.LUR", b"X" * 100)
+
+    pkt, addr = tftp_client.sock.sent[-1]
+    assert struct.unpack("!HH", pkt[:4]) == (TFTP_OPCODE.ERROR.value, 8)
+    assert addr == SERVER
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_write_file_chunks_with_negotiated_block_size(tftp_client):
+    """WRQ com OACK deve fatiar os dados no tamanho negociado."""
+    payload = b"X" * 1500
+    tftp_client.sock = MockSocket(
+        [
+            (make_oack_packet(blksize=1024), SERVER),
+            (make_ack_packet(1), SERVER),
+            (make_ack_packet(2), SERVER),
+        ]
+    )
+
+    assert tftp_client.write_file("test.LUR", payload) is True
+
+    data_pkts = [p for p, _ in tftp_client.sock.sent[1:]]
+    assert [len(p) - 4 for p in data_pkts] == [1024, 476]
+
+
+@pytest.mark.hlr69
+@pytest.mark.functional
+def test_serve_file_on_rrq_negotiates_blksize():
+    """O servidor de RRQ responde OACK e envia o BIN com o bloco pedido pelo alvo."""
+    client = TFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None, blksize=1468)
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    gse_addr = client.sock.getsockname()
+
+    file_data = bytes(range(256)) * 12  # 3072 bytes
+    hash_data = b"H" * 32
+    received = {}
+
+    def target():
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.settimeout(2)
+        rrq = struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0blksize\x001024\0"
+        peer.sendto(rrq, gse_addr)
+
+        oack, tid = peer.recvfrom(2048)
+        received["oack"] = client._parse_oack_packet(oack)
+        peer.sendto(make_ack_packet(0), tid)
+
+        blocks = []
+        while True:
+            pkt, _ = peer.recvfrom(2048)
+            block = struct.unpack("!H", pkt[2:4])[0]
+            blocks.append(pkt[4:])
+            peer.sendto(make_ack_packet(block), tid)
+            if pkt[4:] == hash_data:
+                break
+        received["blocks"] = blocks
+        peer.close()
+
+    t = threading.Thread(target=target)
+    t.start()
+    try:
+        assert client.serve_file_on_rrq("fw.bin", file_data, hash_data) is True
+    finally:
+        t.join(timeout=5)
+        client.close()
+
+    assert received["oack"] == {"blksize": "1024"}
+    blocks = received["blocks"]
+    # 3 blocos cheios + bloco final 0-byte + HASH
+    assert [len(b) for b in blocks] == [1024, 1024, 1024, 0, 32]
+    assert b"".join(blocks[:-1]) == file_data
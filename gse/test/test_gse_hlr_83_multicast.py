@@ -0,0 +1,236 @@
+import select
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.tftp_client import TFTP_OPCODE  # noqa: E402
+from backend.protocols.tftp_multicast import MulticastTFTPClient  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-83 – Distribuição multicast (RFC 2090)
+# Descrição: Uma única transmissão da imagem no grupo multicast deve atender N
+# alvos; apenas o master confirma, e os demais recuperam somente os blocos
+# perdidos quando promovidos a master.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+LOOPBACK = "127.0.0.1"
+GROUP = ("239.255.69.1", 17580)
+BLKSIZE = 512
+
+
+def parse_options(body: bytes) -> dict:
+    fields = body.split(b"\0")
+    return {
+        fields[i].decode().lower(): fields[i + 1].decode()
+        for i in range(0, len(fields) - 1, 2)
+    }
+
+
+class MulticastStandInBC(threading.Thread):
+    """BC substituto: cliente TFTP multicast (RFC 2090) que pode perder blocos."""
+
+    def __init__(self, gse_addr, drop=(), multicast_option=True, chatty=False, lost_oacks=0):
+        super().__init__(daemon=True)
+        self.gse_addr = gse_addr
+        self.drop = set(drop)  # blocos perdidos na primeira recepção
+        self.multicast_option = multicast_option
+        # Confirma todo bloco do grupo mesmo sem ser master, e em duplicata
+        self.chatty = chatty
+        self.lost_oacks = lost_oacks  # OACKs iniciais perdidos no enlace
+        self.oacks = 0
+        self.rrq_sent = threading.Event()
+        self.blocks = {}
+        self.group_packets = 0
+        self.hash = None
+        self.error = None
+        self.unicast = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.unicast.bind((LOOPBACK, 0))
+        # Entra no grupo antes do RRQ, para não depender da ordem dos OACKs
+        self.group_sock = self._join_group(*GROUP)
+        self.server = None
+        self.master = False
+        self.last_block = None
+
+    def contiguous(self):
+        count = 0
+        while count + 1 in self.blocks:
+            count += 1
+        return count
+
+    def join(self, timeout=None):
+        super().join(timeout)
+        self.unicast.close()
+        self.group_sock.close()
+
+    @staticmethod
+    def _join_group(group_ip, port):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("", port))
+        mreq = struct.pack("4s4s", socket.inet_aton(group_ip), socket.inet_aton(LOOPBACK))
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        return sock
+
+    def _ack(self, block):
+        self.unicast.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, block), self.server)
+
+    def run(self):
+        rrq = struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0"
+        if self.multicast_option:
+            rrq += b"multicast\0\0"
+        self.unicast.sendto(rrq, self.gse_addr)
+        self.rrq_sent.set()
+        while self.hash is None:
+            ready, _, _ = select.select([self.unicast, self.group_sock], [], [], 5)
+            if not ready:
+                return
+            for sock in ready:
+                pkt, addr = sock.recvfrom(2048)
+                opcode, block = struct.unpack("!HH", pkt[:4])
+                if opcode == TFTP_OPCODE.ERROR.value:
+                    self.error = block
+                    return
+                if opcode == TFTP_OPCODE.OACK.value:
+                    self.oacks += 1
+                    if self.oacks <= self.lost_oacks:
+                        continue
+                    self.server = addr
+                    mc = parse_options(pkt[2:])["multicast"].split(",")[2]
+                    self.master = mc == "1"
+                    # O master pede o próximo bloco; os demais confirmam com ACK(0)
+                    self._ack(self.contiguous() if self.master else 0)
+                elif sock is self.group_sock:
+                    self.group_packets += 1
+                    if block in self.drop:
+                        self.drop.discard(block)
+                        continue
+                    self.blocks[block] = bytes(pkt[4:])
+                    if len(pkt) - 4 < BLKSIZE:
+                        self.last_block = block
+                    if self.master:
+                        self._ack(self.contiguous())
+                    if self.chatty:
+                        self._ack(self.contiguous())
+                else:
+                    # HASH em unicast após a imagem completa
+                    self.hash = bytes(pkt[4:])
+                    self._ack(block)
+
+    def image(self):
+        return b"".join(self.blocks[i] for i in range(1, self.last_block + 1))
+
+
+@pytest.fixture
+def server():
+    client = MulticastTFTPClient(LOOPBACK, timeout=2, logger=lambda _msg: None)
+    assert client.connect()
+    client.sock.bind((LOOPBACK, 0))
+    yield client
+    client.close()
+
+
+@pytest.mark.hlr83
+@pytest.mark.functional
+def test_one_transmission_serves_every_target(server):
+    file_data = bytes(range(256)) * 40 + b"tail"  # 21 blocos
+    hash_data = b"H" * 32
+    gse_addr = server.sock.getsockname()
+    bcs = [
+        MulticastStandInBC(gse_addr),
+        MulticastStandInBC(gse_addr, drop={3, 7}),
+        MulticastStandInBC(gse_addr),
+    ]
+    for bc in bcs:
+        bc.start()
+    progress = []
+    try:
+        served = server.serve_file_multicast(
+            "fw.bin",
+            file_data,
+            expected_clients=3,
+            hash_data=hash_data,
+            group=GROUP,
+            interface=LOOPBACK,
+            progress_callback=progress.append,
+        )
+    finally:
+        for bc in bcs:
+            bc.join(timeout=10)
+
+    assert len(served) == 3
+    for bc in bcs:
+        assert bc.image() == file_data
+        assert bc.hash == hash_data
+    assert progress[-1] == 100
+    # 21 blocos na passagem inicial + os 2 perdidos pelo segundo alvo
+    assert bcs[2].group_packets == 21 + 2
+
+
+@pytest.mark.hlr83
+@pytest.mark.functional
+def test_rrq_without_multicast_option_is_refused(server):
+    gse_addr = server.sock.getsockname()
+    bc = MulticastStandInBC(gse_addr, multicast_option=False)
+    bc.start()
+    with pytest.raises(Exception, match="Timeout ao aguardar RRQ multicast"):
+        server.timeout = 0.5
+        server.serve_file_multicast("fw.bin", b"x" * 100, expected_clients=1, group=GROUP)
+    bc.join(timeout=10)
+    assert bc.error == 8
+
+
+@pytest.mark.hlr83
+@pytest.mark.functional
+def test_stray_acks_do_not_trigger_retransmission(server):
+    file_data = bytes(range(256)) * 40 + b"tail"  # 21 blocos
+    gse_addr = server.sock.getsockname()
+    bcs = [MulticastStandInBC(gse_addr, chatty=True) for _ in range(3)]
+    for bc in bcs:
+        bc.start()
+    try:
+        served = server.serve_file_multicast(
+            "fw.bin", file_data, expected_clients=3, hash_data=b"H" * 32,
+            group=GROUP, interface=LOOPBACK,
+        )
+    finally:
+        for bc in bcs:
+            bc.join(timeout=10)
+
+    assert len(served) == 3
+    # ACKs de não-masters e ACKs duplicados do master não geram DATA extra
+    assert [bc.group_packets for bc in bcs] == [21, 21, 21]
+    assert server.retransmit_count == 0
+
+
+@pytest.mark.hlr83
+@pytest.mark.functional
+def test_lost_non_master_oack_is_retransmitted(server):
+    file_data = bytes(range(256)) * 8  # 4 blocos + pacote final 0-byte
+    gse_addr = server.sock.getsockname()
+    bcs = [MulticastStandInBC(gse_addr), MulticastStandInBC(gse_addr, lost_oacks=1)]
+    # O primeiro RRQ define o master: o segundo alvo recebe o OACK mc=0
+    bcs[0].start()
+    bcs[0].rrq_sent.wait(5)
+    bcs[1].start()
+    try:
+        served = server.serve_file_multicast(
+            "fw.bin", file_data, expected_clients=2, hash_data=b"H" * 32,
+            group=GROUP, interface=LOOPBACK,
+        )
+    finally:
+        for bc in bcs:
+            bc.join(timeout=10)
+
+    assert len(served) == 2
+    assert bcs[1].image() == file_data and bcs[1].hash == b"H" * 32
+    # OACK mc=0 perdido e reenviado, seguido do OACK mc=1 da promoção
+    assert bcs[1].oacks == 3
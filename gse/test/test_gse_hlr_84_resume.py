@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols import tftp_client  # noqa: E402
+from backend.protocols.resume_checkpoint import TransferCheckpointStore  # noqa: E402
+from backend.protocols.tftp_async import AsyncTFTPClient  # noqa: E402
+from backend.protocols.tftp_client import BLOCK_SIZE, TFTP_OPCODE, TFTPClient  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-84 – Retomada de envio
+# Descrição: Um envio interrompido deve registrar o último bloco confirmado por
+# (alvo, imagem) e uma nova sessão, negociada com a opção resume, deve
+# continuar a partir dele.
+# Tipo: Requisito Funcional
+# ============================================================================
+
+FILE_DATA = bytes(range(256)) * 40 + b"tail"  # 21 blocos
+HASH_DATA = hashlib.sha256(FILE_DATA).digest()
+
+
+def parse_options(body: bytes) -> dict:
+    fields = body.split(b"\0")
+    return {
+        fields[i].decode().lower(): fields[i + 1].decode()
+        for i in range(0, len(fields) - 1, 2)
+    }
+
+
+class ResumableStandInBC(threading.Thread):
+    """BC substituto que guarda os blocos recebidos e pode perder o enlace."""
+
+    def __init__(self, gse_addr, stored: bytearray, drop_after=None, resume=True):
+        super().__init__(daemon=True)
+        self.gse_addr = gse_addr
+        self.stored = stored  # blocos persistidos entre sessões
+        self.drop_after = drop_after  # total de blocos após o qual o enlace cai
+        self.resume = resume  # False: RRQ sem opções (sessão nova)
+        self.oack = None
+        self.hash = None
+
+    def run(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.settimeout(2)
+        have = len(self.stored) // BLOCK_SIZE
+        rrq = struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0"
+        if self.resume:
+            rrq += f"resume\0{have}\0".encode()
+        sock.sendto(rrq, self.gse_addr)
+        try:
+            if self.resume:
+                oack, tid = sock.recvfrom(2048)
+                self.oack = parse_options(oack[2:])
+                skip = int(self.oack["resume"])
+                sock.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, 0), tid)
+            else:
+                skip = 0
+            del self.stored[skip * BLOCK_SIZE :]
+            complete = False
+            while self.hash is None:
+                pkt, tid = sock.recvfrom(2048)
+                block = struct.unpack("!H", pkt[2:4])[0]
+                if self.drop_after is not None and block > self.drop_after:
+                    return  # enlace perdido: nenhum ACK a partir daqui
+                if complete:
+                    self.hash = pkt[4:]  # DATA seguinte ao último bloco
+                elif block == len(self.stored) // BLOCK_SIZE + 1:
+                    self.stored += pkt[4:]
+                    complete = len(pkt) - 4 < BLOCK_SIZE
+                sock.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, block), tid)
+        finally:
+            sock.close()
+
+
+def make_client(timeout=2, max_retries=8):
+    client = TFTPClient(
+        "127.0.0.1", timeout=timeout, logger=lambda _msg: None, max_retries=max_retries
+    )
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    return client
+
+
+def serve(client, bc, store, hash_data=HASH_DATA):
+    bc.start()
+    try:
+        return client.serve_file_on_rrq(
+            "fw.bin", FILE_DATA, hash_data, checkpoint_store=store
+        )
+    finally:
+        bc.join(timeout=10)
+        client.close()
+
+
+@pytest.mark.hlr84
+@pytest.mark.functional
+def test_interrupted_upload_resumes_from_checkpoint(tmp_path):
+    store = TransferCheckpointStore(str(tmp_path / ".transfer_checkpoints.json"))
+    stored = bytearray()
+
+    client = make_client(timeout=0.2, max_retries=2)
+    bc = ResumableStandInBC(client.sock.getsockname(), stored, drop_after=12)
+    with pytest.raises(Exception, match="ACK não recebido"):
+        serve(client, bc, store)
+    assert bc.oack == {"resume": "0"}
+    assert store.get("127.0.0.1", HASH_DATA, BLOCK_SIZE) == 12
+
+    # Nova sessão (checkpoint relido do disco)
+    store = TransferCheckpointStore(str(tmp_path / ".transfer_checkpoints.json"))
+    client = make_client()
+    sent = []
+    original = client._send_data
+    client._send_data = lambda block, data, addr, sock=None: (
+        sent.append(block),
+        original(block, data, addr, sock),
+    )
+    bc = ResumableStandInBC(client.sock.getsockname(), stored)
+    assert serve(client, bc, store) is True
+
+    assert bc.oack == {"resume": "12"}
+    assert sent[0] == 13
+    assert bytes(stored) == FILE_DATA
+    assert bc.hash == HASH_DATA
+    assert len(store) == 0
+
+
+@pytest.mark.hlr84
+@pytest.mark.functional
+def test_resume_without_checkpoint_starts_from_first_block(tmp_path):
+    store = TransferCheckpointStore(str(tmp_path / ".transfer_checkpoints.json"))
+    stored = bytearray(FILE_DATA[: 5 * BLOCK_SIZE])  # dados de outra imagem/sessão
+    client = make_client()
+    bc = ResumableStandInBC(client.sock.getsockname(), stored)
+
+    assert serve(client, bc, store) is True
+    assert bc.oack == {"resume": "0"}
+    assert bytes(stored) == FILE_DATA
+    assert bc.hash == HASH_DATA
+
+
+@pytest.mark.hlr84
+@pytest.mark.functional
+def test_hash_computed_up_front_only_when_needed(tmp_path, monkeypatch):
+    # Sem hash_data: o HASH da imagem inteira só é calculado na falha (para o
+    # checkpoint) ou quando o RRQ pede resume; fora isso, durante o envio.
+    calls = []
+    original = tftp_client.calculate_image_hash
+    monkeypatch.setattr(
+        tftp_client, "calculate_image_hash", lambda image: calls.append(1) or original(image)
+    )
+    store = TransferCheckpointStore(str(tmp_path / ".transfer_checkpoints.json"))
+
+    client = make_client()
+    bc = ResumableStandInBC(client.sock.getsockname(), bytearray(), resume=False)
+    assert serve(client, bc, store, hash_data=None) is True
+    assert bc.hash == HASH_DATA and calls == []
+
+    stored = bytearray()
+    client = make_client(timeout=0.2, max_retries=2)
+    bc = ResumableStandInBC(client.sock.getsockname(), stored, drop_after=12, resume=False)
+    with pytest.raises(Exception, match="ACK não recebido"):
+        serve(client, bc, store, hash_data=None)
+    assert calls == [1]
+    assert store.get("127.0.0.1", HASH_DATA, BLOCK_SIZE) == 12
+
+    client = make_client()
+    bc = ResumableStandInBC(client.sock.getsockname(), stored)
+    assert serve(client, bc, store, hash_data=None) is True
+    assert calls == [1, 1]
+    assert bc.oack == {"resume": "12"}
+    assert bytes(stored) == FILE_DATA and bc.hash == HASH_DATA
+    assert client.last_served_hash == HASH_DATA
+    assert len(store) == 0
+
+
+@pytest.mark.hlr84
+@pytest.mark.functional
+def test_checkpoint_ignores_other_block_size(tmp_path):
+    store = TransferCheckpointStore(str(tmp_path / "cp.json"))
+    store.save("10.0.0.1", HASH_DATA, 512, 40)
+    assert store.get("10.0.0.1", HASH_DATA, 1468) == 0
+    assert store.get("10.0.0.1", HASH_DATA, 512) == 40
+    store.save("10.0.0.1", HASH_DATA, 512, 0)
+    assert len(store) == 0
+
+
+@pytest.mark.hlr84
+@pytest.mark.functional
+def test_async_resume_hashes_off_the_event_loop(tmp_path, monkeypatch):
+    # O HASH pedido pela retomada roda no executor, não no laço de eventos
+    threads = []
+    original = tftp_client.calculate_image_hash
+    monkeypatch.setattr(
+        tftp_client,
+        "calculate_image_hash",
+        lambda image: threads.append(threading.current_thread()) or original(image),
+    )
+    store = TransferCheckpointStore(str(tmp_path / ".transfer_checkpoints.json"))
+
+    async def main():
+        client = AsyncTFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None)
+        assert await client.connect(("127.0.0.1", 0))
+        bc = ResumableStandInBC(client.sock.getsockname(), bytearray())
+        bc.start()
+        try:
+            ok = await client.serve_file_on_rrq("fw.bin", FILE_DATA, checkpoint_store=store)
+            return ok, bc
+        finally:
+            await asyncio.get_running_loop().run_in_executor(None, bc.join, 10)
+            client.close()
+
+    ok, bc = asyncio.run(main())
+    assert ok is True and bc.hash == HASH_DATA
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
@@ -0,0 +1,135 @@
+import hashlib
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_client import TFTPClient  # noqa: E402
+from backend.simulation.bc_simulator import BCSimulator, start_simulators  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-85 – Simulador de BC para testes de desempenho
+# Descrição: Um BC simulado em Python deve atender ao fluxo ARINC 615A
+# completo do GSE em localhost (autenticação, LUI, LUS, LUR, BIN + HASH e LUS
+# final), com perda, reordenação e latência de flash configuráveis, e várias
+# instâncias devem atender em paralelo em portas distintas.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+PN = "EMB-0001"
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "EMB-0001.bin"
+    path.write_bytes(bytes(range(256)) * 200 + b"tail")  # 51204 bytes
+    return path
+
+
+def run_session(sim, image, timeout=2, **client_options):
+    client = TFTPClient(
+        sim.host,
+        server_port=sim.port,
+        timeout=timeout,
+        logger=lambda _msg: None,
+        **client_options,
+    )
+    assert client.connect()
+    try:
+        session = Arinc615ASession(client, logger=lambda _msg: None)
+        return bool(session.run_upload_flow(str(image), PN))
+    finally:
+        client.close()
+
+
+@pytest.mark.hlr85
+@pytest.mark.functional
+def test_upload_flow_against_impaired_simulator(image):
+    with BCSimulator(
+        blksize=1024,
+        windowsize=4,
+        loss=0.05,
+        reorder=0.05,
+        flash_write_latency=0.001,
+        seed=7,
+        ideal_receiver=True,
+    ) as sim:
+        assert run_session(sim, image, blksize=1024, windowsize=4) is True
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    result = sim.results[0]
+    assert result["error"] is None
+    assert result["filename"] == image.name and result["part_number"] == PN
+    assert result["bytes"] == image.stat().st_size
+    assert result["sha256"] == hashlib.sha256(image.read_bytes()).hexdigest()
+    assert result["hash_ok"] is True
+    assert result["block_size"] == 1024 and result["window_size"] == 4
+    assert result["dropped"] > 0 and result["reordered"] > 0
+
+
+@pytest.mark.hlr85
+@pytest.mark.functional
+def test_parallel_simulators_on_distinct_ports(image):
+    sims = start_simulators(3, seed=1, loss=0.02, blksize=1024, ideal_receiver=True)
+    outcomes = {}
+    try:
+        threads = [
+            threading.Thread(
+                target=lambda s=sim: outcomes.__setitem__(
+                    s.port, run_session(s, image, blksize=1024)
+                )
+            )
+            for sim in sims
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+        for sim in sims:
+            assert sim.wait_for_uploads(1, timeout=5)
+    finally:
+        for sim in sims:
+            sim.stop()
+
+    assert len({sim.port for sim in sims}) == 3
+    assert outcomes == {sim.port: True for sim in sims}
+    assert all(sim.results[0]["hash_ok"] for sim in sims)
+
+
+@pytest.mark.hlr85
+@pytest.mark.functional
+def test_lockstep_upload_never_retransmits_to_firmware(image):
+    # Como make_rrq (tftp.c), o receptor padrão grava todo DATA. Sem opções
+    # negociadas o GSE não retransmite: a perda encerra o envio por timeout,
+    # sem gravar um bloco repetido na imagem.
+    logs = []
+    with BCSimulator(loss=0.05, seed=2, idle_timeout=0.5, logger=logs.append) as sim:
+        with pytest.raises(Exception, match="após 1 tentativas"):
+            run_session(sim, image, timeout=0.3)
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    assert sim.results[0]["error"].startswith("Sem dados do GSE")
+    assert not any("fora de sequência" in msg for msg in logs)
+
+    # Com blksize aceito em OACK, o RTO adaptativo recupera as perdas
+    with BCSimulator(loss=0.05, seed=2, blksize=1024, ideal_receiver=True) as sim:
+        assert run_session(sim, image, timeout=0.3, blksize=1024) is True
+        assert sim.wait_for_uploads(1, timeout=5)
+    assert sim.results[0]["hash_ok"] is True
+
+
+@pytest.mark.hlr85
+@pytest.mark.functional
+def test_unsupported_pn_gets_no_rrq(image):
+    with BCSimulator(supported_pns=["EMB-9999"]) as sim:
+        with pytest.raises(Exception, match="Falha de PN"):
+            run_session(sim, image, timeout=0.5)
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    assert sim.results[0]["error"] == f"PN não suportado: {PN}"
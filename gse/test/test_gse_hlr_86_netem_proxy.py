@@ -0,0 +1,163 @@
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_client import TFTPClient  # noqa: E402
+from backend.simulation.bc_simulator import BCSimulator  # noqa: E402
+from backend.simulation.netem_proxy import NetemProxy, main  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-86 – Proxy de degradação de rede
+# Descrição: Um proxy UDP em espaço de usuário entre o TFTPClient e o par deve
+# injetar latência, jitter, perda, duplicação, reordenação e limite de banda,
+# de forma determinística pela semente, preservando os TIDs do TFTP.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+class EchoPeer(threading.Thread):
+    """Par UDP que devolve cada datagrama ao remetente."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.2)
+        self.running = True
+
+    def run(self):
+        while self.running:
+            try:
+                pkt, addr = self.sock.recvfrom(2048)
+            except socket.timeout:
+                continue
+            self.sock.sendto(pkt, addr)
+
+    def stop(self):
+        self.running = False
+        self.join()
+        self.sock.close()
+
+
+@pytest.fixture
+def echo():
+    peer = EchoPeer()
+    peer.start()
+    yield peer
+    peer.stop()
+
+
+def exchange(proxy, count, gap=0.0, size=16):
+    """Envia count datagramas numerados pelo proxy e devolve (ordem, instantes)."""
+    received, arrivals = [], []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(0.5)
+        started = time.monotonic()
+        for seq in range(count):
+            sock.sendto(struct.pack("!I", seq).ljust(size, b"\0"), proxy.address)
+            if gap:
+                time.sleep(gap)
+        try:
+            while True:
+                pkt, _addr = sock.recvfrom(2048)
+                received.append(struct.unpack("!I", pkt[:4])[0])
+                arrivals.append(time.monotonic() - started)
+        except socket.timeout:
+            pass
+    return received, arrivals
+
+
+@pytest.mark.hlr86
+@pytest.mark.functional
+def test_same_seed_reproduces_impairments(echo):
+    runs = []
+    for _ in range(2):
+        with NetemProxy(
+            echo.sock.getsockname(), loss=0.1, duplicate=0.1, reorder=0.1, seed=42
+        ) as proxy:
+            received, _arrivals = exchange(proxy, 200)
+        runs.append((sorted(received), proxy.stats))
+
+    assert runs[0] == runs[1]
+    stats = runs[0][1]
+    for direction in stats.values():
+        assert direction["dropped"] > 0 and direction["duplicated"] > 0
+    assert stats["client_to_peer"]["packets"] == 200
+
+    with NetemProxy(echo.sock.getsockname(), loss=0.1, seed=43) as proxy:
+        received, _arrivals = exchange(proxy, 200)
+    assert sorted(received) != runs[0][0]
+
+
+@pytest.mark.hlr86
+@pytest.mark.functional
+def test_reordered_packets_are_overtaken(echo):
+    with NetemProxy(echo.sock.getsockname(), reorder=0.1, reorder_gap=0.02, seed=5) as proxy:
+        received, _arrivals = exchange(proxy, 100, gap=0.001)
+
+    assert sorted(received) == list(range(100))
+    assert received != sorted(received)
+    assert proxy.stats["client_to_peer"]["reordered"] > 0
+
+
+@pytest.mark.hlr86
+@pytest.mark.functional
+def test_latency_and_bandwidth_cap(echo):
+    with NetemProxy(echo.sock.getsockname(), latency=0.02) as proxy:
+        _received, arrivals = exchange(proxy, 1)
+    assert arrivals[0] >= 0.04  # ida e volta
+
+    # 20 pacotes de 1000 bytes a 400 kbit/s: 20 ms de serialização cada
+    with NetemProxy(echo.sock.getsockname(), bandwidth=400e3) as proxy:
+        received, arrivals = exchange(proxy, 20, size=1000)
+    assert len(received) == 20
+    assert arrivals[-1] >= 0.38
+
+
+@pytest.mark.hlr86
+@pytest.mark.functional
+def test_upload_flow_through_proxy_keeps_tftp_tids(tmp_path):
+    image = tmp_path / "EMB-0001.bin"
+    image.write_bytes(bytes(range(256)) * 64 + b"x")
+    with BCSimulator(blksize=1024, windowsize=4) as sim, NetemProxy(
+        sim.address, latency=0.001, jitter=0.0005, bandwidth=50e6, seed=1
+    ) as proxy:
+        client = TFTPClient(
+            "127.0.0.1",
+            server_port=proxy.port,
+            timeout=2,
+            logger=lambda _msg: None,
+            blksize=1024,
+            windowsize=4,
+        )
+        assert client.connect()
+        try:
+            session = Arinc615ASession(client, logger=lambda _msg: None)
+            assert session.run_upload_flow(str(image), "EMB-0001")
+        finally:
+            client.close()
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    assert sim.results[0]["hash_ok"] is True
+    assert sim.results[0]["bytes"] == image.stat().st_size
+    assert proxy.stats["peer_to_client"]["delivered"] > 0
+
+
+@pytest.mark.hlr86
+@pytest.mark.functional
+def test_cli_reports_listen_port_and_stats(echo, capsys):
+    host, port = echo.sock.getsockname()
+    assert main(["--target", f"{host}:{port}", "--profile", "lan", "--duration", "0.1"]) == 0
+    out = capsys.readouterr().out
+    assert "[NETEM] Escutando em 127.0.0.1:" in out
+    assert "client_to_peer" in out and "peer_to_client" in out
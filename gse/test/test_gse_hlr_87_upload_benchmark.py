@@ -0,0 +1,72 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from benchmarks.bench_upload_flow import (  # noqa: E402
+    compare_with_baseline,
+    main,
+    parse_size,
+    run_cases,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-87 – Benchmark de vazão do upload com portão de regressão
+# Descrição: O benchmark deve executar o fluxo de upload completo contra o BC
+# simulado, registrar MB/s, RTT p50/p99, retransmissões e pico de RSS em um
+# baseline JSON e falhar quando uma métrica piorar além do limiar.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+@pytest.mark.hlr87
+@pytest.mark.functional
+def test_case_records_metrics():
+    case = {"profile": "lan", "size": parse_size("64K"), "blksize": 1024}
+    results = run_cases([case], isolated=False)
+
+    metrics = results["lan/65536/1024"]
+    assert metrics["mbps"] > 0
+    assert 0 < metrics["rtt_p50_ms"] <= metrics["rtt_p99_ms"]
+    assert metrics["retransmits"] == 0
+    assert set(metrics) >= {"flow_s", "peak_rss_kib"}
+
+
+@pytest.mark.hlr87
+@pytest.mark.functional
+def test_regression_gate_thresholds():
+    baseline = {"a": {"mbps": 10.0, "peak_rss_kib": 1000}, "b": {"mbps": 10.0}}
+    results = {
+        "a": {"mbps": 8.0, "peak_rss_kib": 1300},
+        "b": {"mbps": 7.0},
+        "new": {"mbps": 0.1},
+    }
+
+    assert compare_with_baseline(results, baseline, threshold=0.35) == []
+    regressions = compare_with_baseline(results, baseline, threshold=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a: peak_rss_kib 1300")
+    assert regressions[1].startswith("b: mbps 7.0")
+
+
+@pytest.mark.hlr87
+@pytest.mark.functional
+def test_cli_records_baseline_then_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    argv = [
+        "--sizes", "32K", "--blksizes", "512", "--profiles", "none",
+        "--repeat", "1", "--baseline", str(baseline),
+    ]
+    assert main(argv) == 0
+    recorded = json.loads(baseline.read_text())
+    assert list(recorded["cases"]) == ["none/32768/512"]
+
+    recorded["cases"]["none/32768/512"]["mbps"] *= 1000
+    baseline.write_text(json.dumps(recorded))
+    assert main(argv) == 1
+    assert "REGRESSÃO none/32768/512: mbps" in capsys.readouterr().out
@@ -0,0 +1,124 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_client import TFTPClient  # noqa: E402
+from backend.protocols.upload_timing import (  # noqa: E402
+    PHASE_AUTH,
+    PHASE_BIN,
+    UPLOAD_PHASES,
+)
+from backend.simulation.bc_simulator import BCSimulator  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-88 – Tempos por fase do fluxo de upload
+# Descrição: run_upload_flow deve retornar um UploadResult com instantes
+# monotônicos, duração, bytes e retransmissões de cada fase (auth, lui,
+# lus_init, lur, bin, lus_final), notificar os assinantes no início e no fim
+# de cada fase e registrar o resumo no log da sessão.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+PN = "EMB-0001"
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "EMB-0001.bin"
+    path.write_bytes(bytes(range(256)) * 100 + b"tail")  # 25604 bytes
+    return path
+
+
+def run_flow(sim, image, logs, events=None, timeout=2):
+    client = TFTPClient(
+        sim.host,
+        server_port=sim.port,
+        timeout=timeout,
+        logger=lambda _msg: None,
+        blksize=1024,
+        windowsize=4,
+    )
+    assert client.connect()
+    session = Arinc615ASession(
+        client,
+        logger=logs.append,
+        phase_callback=(lambda phase: events.append((phase.name, phase.finished)))
+        if events is not None
+        else None,
+    )
+    try:
+        return session, client, session.run_upload_flow(str(image), PN)
+    finally:
+        client.close()
+
+
+@pytest.mark.hlr88
+@pytest.mark.functional
+def test_result_records_every_phase(image):
+    logs, events = [], []
+    with BCSimulator(blksize=1024, windowsize=4, flash_write_latency=0.001) as sim:
+        session, _client, result = run_flow(sim, image, logs, events)
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    assert result and result.success
+    assert session.last_result is result
+    assert tuple(result.phases) == UPLOAD_PHASES
+    for phase in result.phases.values():
+        assert phase.ok and phase.duration >= 0 and phase.bytes > 0
+    ordered = list(result.phases.values())
+    for before, after in zip(ordered, ordered[1:]):
+        assert before.ended <= after.started
+    assert result.phases[PHASE_BIN].bytes == image.stat().st_size + 32
+    assert result.duration >= sum(p.duration for p in ordered)
+
+    assert events == [(name, done) for name in UPLOAD_PHASES for done in (False, True)]
+    assert logs[-1].startswith("[ARINC-TEMPO] OK: auth ")
+    assert json.loads(json.dumps(result.to_dict()))["phases"][4]["name"] == PHASE_BIN
+
+
+@pytest.mark.hlr88
+@pytest.mark.functional
+def test_retransmissions_are_attributed_to_phases(image):
+    with BCSimulator(blksize=1024, windowsize=4, loss=0.1, seed=3, ideal_receiver=True) as sim:
+        _session, client, result = run_flow(sim, image, [], timeout=0.3)
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    assert result.success
+    assert client.retransmit_count > 0
+    assert result.retries == client.retransmit_count
+
+
+@pytest.mark.hlr88
+@pytest.mark.functional
+def test_failed_phase_keeps_error_and_logs_summary(image):
+    logs = []
+    with BCSimulator(supported_pns=["EMB-9999"]) as sim:
+        with pytest.raises(Exception, match="Falha de PN"):
+            run_flow(sim, image, logs, timeout=0.5)
+        assert sim.wait_for_uploads(1, timeout=5)
+
+    [summary] = [line for line in logs if line.startswith("[ARINC-TEMPO]")]
+    assert summary.startswith("[ARINC-TEMPO] FALHA:")
+    assert "bin" in summary and "(falha)" in summary
+
+
+@pytest.mark.hlr88
+@pytest.mark.functional
+def test_rejected_handshake_returns_false_result():
+    class RejectingClient:
+        def perform_authentication(self, gse_key, bc_key):
+            return False
+
+    session = Arinc615ASession(RejectingClient(), logger=lambda _msg: None)
+    result = session.run_upload_flow("fw.bin", PN)
+
+    assert not result
+    assert list(result.phases) == [PHASE_AUTH]
+    assert result.phases[PHASE_AUTH].error == "chave estática rejeitada"
@@ -0,0 +1,103 @@
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+import backend.logsGSE.gse_logger as gse_logger  # noqa: E402
+from backend.logsGSE.gse_logger import GseLogger  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-89 – Escrita assíncrona do log de sessão
+# Descrição: write_log deve apenas enfileirar a mensagem; uma thread dedicada
+# grava as linhas em lotes, com flush por limite de bytes ou de tempo, e
+# fsync explícito em mensagens de erro e no close().
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+LINE = re.compile(r"^\[\d{2}:\d{2}:\d{2}\.\d{3}\] ")
+
+
+def wait_for_text(path, text, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if text in Path(path).read_text(encoding="utf-8"):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def count_fsyncs(monkeypatch):
+    calls = []
+    real_fsync = gse_logger.os.fsync
+    monkeypatch.setattr(gse_logger.os, "fsync", lambda fd: (calls.append(fd), real_fsync(fd)))
+    return calls
+
+
+@pytest.mark.hlr89
+@pytest.mark.functional
+def test_lines_are_written_in_order_and_synced_on_close(tmp_path, monkeypatch):
+    fsyncs = count_fsyncs(monkeypatch)
+    logger = GseLogger(log_dir=tmp_path, structured=False)
+    for i in range(500):
+        logger.write_log(f"mensagem {i}")
+    logger.close()
+    logger.close()  # idempotente
+
+    lines = Path(logger.get_log_path()).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 501
+    assert all(LINE.match(line) for line in lines)
+    assert [line[15:] for line in lines[:3]] == ["mensagem 0", "mensagem 1", "mensagem 2"]
+    assert lines[-1].endswith("--- SESSÃO GSE FINALIZADA ---")
+    assert len(fsyncs) == 1
+    assert logger.log_file is None
+
+
+@pytest.mark.hlr89
+@pytest.mark.functional
+def test_batches_stay_buffered_until_a_threshold(tmp_path, monkeypatch):
+    fsyncs = count_fsyncs(monkeypatch)
+    logger = GseLogger(log_dir=tmp_path, flush_bytes=1 << 20, flush_interval=60, structured=False)
+    try:
+        logger.write_log("[ARINC] PASSO 1/5: Lendo LUI (system.LUI)...")
+        time.sleep(0.1)
+        assert Path(logger.get_log_path()).read_text(encoding="utf-8") == ""
+
+        # Mensagem de erro: flush + fsync imediatos
+        logger.write_log("[ARINC-ERRO] Timeout!")
+        assert wait_for_text(logger.get_log_path(), "[ARINC-ERRO] Timeout!")
+        assert len(fsyncs) == 1
+
+        logger.write_log("[ARINC] depois do erro")
+        logger.flush()
+        assert "depois do erro" in Path(logger.get_log_path()).read_text(encoding="utf-8")
+        assert len(fsyncs) == 1
+
+        # Mesmo critério de nível da UI (level_of): "[✗]" também é erro
+        logger.write_log("[✗] Chave do BC inválida")
+        assert wait_for_text(logger.get_log_path(), "[✗] Chave do BC inválida")
+        assert len(fsyncs) == 2
+    finally:
+        logger.close()
+
+
+@pytest.mark.hlr89
+@pytest.mark.functional
+def test_size_and_time_thresholds_trigger_flush(tmp_path):
+    by_size = GseLogger(log_dir=tmp_path / "size", flush_bytes=200, flush_interval=60)
+    by_time = GseLogger(log_dir=tmp_path / "time", flush_bytes=1 << 20, flush_interval=0.05)
+    try:
+        for i in range(10):
+            by_size.write_log(f"linha {i:02d} " + "x" * 20)
+        by_time.write_log("uma linha")
+
+        assert wait_for_text(by_size.get_log_path(), "linha 09")
+        assert wait_for_text(by_time.get_log_path(), "uma linha")
+    finally:
+        by_size.close()
+        by_time.close()
@@ -0,0 +1,133 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.logsGSE.log_levels import (  # noqa: E402
+    DEBUG,
+    DEFAULT_LOG_LEVEL,
+    ERROR,
+    INFO,
+    TRACE,
+    WARN,
+    LevelLogger,
+    get_log_level,
+    level_of,
+    parse_log_level,
+    set_log_level,
+)
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_client import TFTPClient  # noqa: E402
+from backend.simulation.bc_simulator import BCSimulator  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-90 – Níveis de log com rastreamento desabilitado sem custo
+# Descrição: O GSE deve classificar as mensagens em TRACE/DEBUG/INFO/WARN/ERROR,
+# descartar as de nível desabilitado antes de formatá-las (incluindo os pontos
+# de trace por pacote do TFTP) e permitir trocar o nível em tempo de execução.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def restore_level():
+    yield
+    set_log_level(DEFAULT_LOG_LEVEL)
+
+
+class CountingArg:
+    """Argumento que conta quantas vezes foi formatado."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+@pytest.mark.hlr90
+@pytest.mark.functional
+def test_levels_are_parsed_and_inferred_from_tags():
+    assert parse_log_level("warning") == parse_log_level(" WARN ") == WARN
+    assert parse_log_level(TRACE) == TRACE
+    with pytest.raises(ValueError):
+        parse_log_level("verbose")
+
+    assert level_of("[TFTP-ERRO] Erro ao criar socket") == ERROR
+    assert level_of("[erro] Nenhum arquivo") == ERROR
+    assert level_of("[✗] Chave do BC inválida") == ERROR
+    assert level_of("[TFTP-AVISO] Timeout ACK") == WARN
+    assert level_of("[TFTP-DEBUG] opções") == DEBUG
+    assert level_of("[TFTP-TRACE] DATA 7 enviado") == TRACE
+    assert level_of("[ARINC] PASSO 1/5") == INFO
+
+
+@pytest.mark.hlr90
+@pytest.mark.functional
+def test_disabled_levels_are_not_formatted():
+    out = []
+    log = LevelLogger(out.append)
+    arg = CountingArg()
+
+    log.debug("[X-DEBUG] %s", arg)
+    log.trace("[X-TRACE] %s", arg)
+    log("[X-TRACE] direto")
+    log.warn("[X-AVISO] %s", arg)
+    assert out == ["[X-AVISO] arg"]
+    assert arg.formatted == 1
+
+    set_log_level("trace")
+    log.trace("[X-TRACE] %s", arg)
+    assert out[-1] == "[X-TRACE] arg"
+    assert LevelLogger(log).sink == out.append
+
+
+def run_flow(tmp_path, logs):
+    image = tmp_path / "EMB-0001.bin"
+    image.write_bytes(bytes(range(256)) * 20)
+    with BCSimulator(blksize=1024, windowsize=4) as sim:
+        client = TFTPClient(
+            sim.host, server_port=sim.port, timeout=2, logger=logs.append,
+            blksize=1024, windowsize=4,
+        )
+        assert client.connect()
+        try:
+            session = Arinc615ASession(client, logger=logs.append)
+            assert session.run_upload_flow(str(image), "EMB-0001")
+        finally:
+            client.close()
+        assert sim.wait_for_uploads(1, timeout=5)
+
+
+@pytest.mark.hlr90
+@pytest.mark.functional
+def test_per_packet_trace_only_when_enabled(tmp_path):
+    logs = []
+    run_flow(tmp_path, logs)
+    assert logs and not any("-TRACE]" in line for line in logs)
+
+    set_log_level(TRACE)
+    traced = []
+    run_flow(tmp_path, traced)
+    sent = [line for line in traced if line.startswith("[TFTP-TRACE] DATA")]
+    assert len(sent) >= 5  # 5120 bytes em blocos de 1024 + HASH
+    assert any(line.startswith("[TFTP-TRACE] RRQ DATA 1") for line in traced)
+
+
+@pytest.mark.hlr90
+@pytest.mark.functional
+def test_level_switch_applies_at_runtime(tmp_path):
+    set_log_level("ERROR")
+    assert get_log_level() == ERROR
+    logs = []
+    run_flow(tmp_path, logs)
+    assert logs == []
+
+    set_log_level("INFO")
+    run_flow(tmp_path, logs)
+    assert any(line.startswith("[ARINC] PASSO 4/5") for line in logs)
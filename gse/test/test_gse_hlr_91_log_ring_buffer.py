@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.logsGSE.log_buffer import DEFAULT_SOURCE, LogRingBuffer, make_entry  # noqa: E402
+from backend.logsGSE.log_levels import ERROR, INFO, TRACE, WARN  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-91 – Modelo de logs limitado para a UI
+# Descrição: Os logs exibidos na UI devem ficar em um buffer circular de
+# capacidade configurável (instante, nível, origem, texto), com inserção em
+# lote e filtro por nível e alvo calculado no Python.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+def texts(buffer):
+    return [buffer[row].text for row in range(len(buffer))]
+
+
+@pytest.mark.hlr91
+@pytest.mark.functional
+def test_entry_takes_level_and_target_from_message():
+    entry = make_entry("[10.0.0.7] [TFTP-AVISO] Timeout ACK", timestamp=12.5)
+    assert entry == (12.5, WARN, "10.0.0.7", "[TFTP-AVISO] Timeout ACK")
+
+    entry = make_entry("[ARINC] PASSO 1/5: Lendo LUI (system.LUI)...")
+    assert entry.source == DEFAULT_SOURCE and entry.level == INFO
+
+
+@pytest.mark.hlr91
+@pytest.mark.functional
+def test_appends_are_batched_and_capped():
+    buffer = LogRingBuffer(capacity=5)
+    for i in range(3):
+        buffer.append(make_entry(f"msg {i}"))
+    assert len(buffer) == 0 and buffer.pending == 3
+
+    assert buffer.flush() == (0, list(buffer))
+    assert texts(buffer) == ["msg 0", "msg 1", "msg 2"]
+    assert buffer.flush() == (0, [])
+
+    for i in range(3, 7):
+        buffer.append(make_entry(f"msg {i}"))
+    removed, inserted = buffer.flush()
+    assert removed == 2 and [e.text for e in inserted] == ["msg 3", "msg 4", "msg 5", "msg 6"]
+    assert texts(buffer) == ["msg 2", "msg 3", "msg 4", "msg 5", "msg 6"]
+    assert buffer.dropped == 2
+
+    # Lote maior que a capacidade: só as últimas entradas chegam à visão
+    for i in range(7, 20):
+        buffer.append(make_entry(f"msg {i}"))
+    removed, inserted = buffer.flush()
+    assert removed == 5 and len(inserted) == 5
+    assert texts(buffer) == [f"msg {i}" for i in range(15, 20)]
+    assert buffer.dropped == 15
+
+
+@pytest.mark.hlr91
+@pytest.mark.functional
+def test_filter_by_level_and_target():
+    buffer = LogRingBuffer(capacity=4)
+    for message in [
+        "[10.0.0.1] [ARINC] PASSO 1/5",
+        "[10.0.0.2] [TFTP-ERRO] Erro ao criar socket",
+        "[TFTP-AVISO] Timeout ACK",
+        "[10.0.0.1] [TFTP-AVISO] Lacuna reportada",
+    ]:
+        buffer.append(make_entry(message))
+    buffer.flush()
+
+    buffer.set_filter(WARN)
+    assert len(buffer) == 3
+    buffer.set_filter(WARN, "10.0.0.1")
+    assert texts(buffer) == ["[TFTP-AVISO] Lacuna reportada"]
+    assert buffer.sources() == ["10.0.0.1", "10.0.0.2", DEFAULT_SOURCE]
+
+    # Entradas descartadas fora do filtro não removem linhas visíveis
+    buffer.append(make_entry("[10.0.0.3] [ARINC] PASSO 2/5"))
+    assert buffer.flush() == (0, [])
+    buffer.append(make_entry("[10.0.0.1] [erro] fim"))
+    removed, inserted = buffer.flush()
+    assert removed == 0 and [e.level for e in inserted] == [ERROR]
+
+    buffer.set_filter(TRACE)
+    assert buffer.total == len(buffer) == 4
+
+
+@pytest.mark.hlr91
+@pytest.mark.functional
+def test_deferred_apply_matches_direct_flush():
+    direct, deferred = LogRingBuffer(capacity=3), LogRingBuffer(capacity=3)
+    for i in range(8):
+        for buffer in (direct, deferred):
+            buffer.append(make_entry(f"[TFTP-AVISO] {i}", timestamp=float(i)))
+        if i % 3 == 2:
+            direct.flush()
+            removed, inserted = deferred.flush(apply=False)
+            deferred.remove_visible(removed)
+            deferred.extend_visible(inserted)
+            assert list(direct) == list(deferred)
+
+
+@pytest.mark.hlr91
+@pytest.mark.functional
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        LogRingBuffer(capacity=0)
@@ -0,0 +1,142 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.logsGSE.gse_logger import GseLogger  # noqa: E402
+from backend.logsGSE.log_index import LogIndex, main  # noqa: E402
+from backend.logsGSE.log_levels import ERROR  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-92 – Logs estruturados e índice de consulta
+# Descrição: Cada sessão deve gravar, junto ao log de texto, um arquivo JSON
+# Lines com sessão, alvo, PN, fase, nível e métricas de upload; um índice
+# SQLite mantido incrementalmente sobre logs/ deve responder consultas por
+# PN, alvo e período sem reler as sessões já indexadas.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+def read_records(path):
+    return [json.loads(line) for line in Path(path).read_text(encoding="utf-8").splitlines()]
+
+
+def write_session(log_dir, target, pn, success=True):
+    logger = GseLogger(log_dir=log_dir)
+    logger.set_context(target=target, pn=pn)
+    logger.set_context(phase="bin")
+    logger.write_log("[ARINC] PASSO 4/5: Enviando imagem...")
+    logger.write_record(
+        "upload_result", success=success, duration_s=1.5, bytes=4096, retries=2,
+        phases={"bin": 1.2},
+    )
+    logger.close()
+    return logger
+
+
+@pytest.mark.hlr92
+@pytest.mark.functional
+def test_session_writes_json_lines_with_context(tmp_path):
+    logger = GseLogger(log_dir=tmp_path)
+    logger.write_log("--- SESSÃO GSE INICIADA ---")
+    logger.set_context(target="10.0.0.5", pn="EMB-0001", phase="lui")
+    logger.write_log("[TFTP-AVISO] Timeout ACK")
+    logger.write_log("[10.0.0.9] [FROTA-ERRO] sem resposta")
+    logger.set_context(phase=None)
+    logger.write_record("upload_result", ERROR, success=False, duration_s=0.5, phases={})
+    logger.close()
+
+    assert logger.jsonl_path == str(Path(logger.get_log_path()).with_suffix(".jsonl"))
+    records = read_records(logger.jsonl_path)
+    assert all(record["session"] == logger.session_id for record in records)
+    assert records[0]["msg"] == "--- SESSÃO GSE INICIADA ---"
+    assert records[0]["target"] is None and records[0]["level"] == "INFO"
+    assert records[1]["level"] == "WARN" and records[1]["phase"] == "lui"
+    assert records[1]["target"] == "10.0.0.5" and records[1]["pn"] == "EMB-0001"
+    assert records[2]["target"] == "10.0.0.9" and records[2]["msg"] == "[FROTA-ERRO] sem resposta"
+    assert records[3] == {
+        "ts": records[3]["ts"], "session": logger.session_id, "target": "10.0.0.5",
+        "pn": "EMB-0001", "success": False, "duration_s": 0.5, "phases": {},
+        "event": "upload_result", "level": "ERROR",
+    }
+    assert records[-1]["msg"] == "--- SESSÃO GSE FINALIZADA ---"
+
+    # Registros de evento não aparecem no log de texto
+    text = Path(logger.get_log_path()).read_text(encoding="utf-8")
+    assert "upload_result" not in text and len(text.splitlines()) == 4
+
+
+@pytest.mark.hlr92
+@pytest.mark.functional
+def test_index_is_incremental(tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    first = log_dir / "GSE_Sessao_2025-01-01_10-00-00.jsonl"
+    first.write_text(
+        '{"ts": 100.0, "session": "a", "level": "INFO", "pn": "EMB-1", "msg": "um"}\n'
+        '{"ts": 101.0, "session": "a", "level": "INFO", "pn": "EMB-1", "event": "upload_result",'
+        ' "target": "10.0.0.1", "success": true, "duration_s": 2.0, "phases": {"bin": 1.5}}\n'
+        '{"ts": 102.0, "session": "a", "msg": "linha incomp',
+        encoding="utf-8",
+    )
+
+    with LogIndex(log_dir=log_dir) as index:
+        assert index.update() == 2
+        assert index.update() == 0
+        assert index.uploads(pn="EMB-1") == [
+            {
+                "ts": 101.0, "session": "a", "level": "INFO", "event": "upload_result",
+                "target": "10.0.0.1", "pn": "EMB-1", "success": True, "duration_s": 2.0,
+                "phases": {"bin": 1.5},
+            }
+        ]
+
+        # Só o restante da linha incompleta e as linhas novas são lidos
+        with first.open("a", encoding="utf-8") as file:
+            file.write('leta"}\n{"ts": 103.0, "session": "a", "msg": "dois"}\n')
+        assert index.update() == 2
+        assert [r["msg"] for r in index.query(since=102.0)] == ["linha incompleta", "dois"]
+
+        # Arquivo truncado é reindexado; arquivo apagado sai do índice
+        first.write_text('{"ts": 200.0, "session": "b", "msg": "novo"}\n', encoding="utf-8")
+        assert index.update() == 1
+        assert [r["msg"] for r in index.query()] == ["novo"]
+        first.unlink()
+        index.update()
+        assert index.query() == []
+
+
+@pytest.mark.hlr92
+@pytest.mark.functional
+def test_index_queries_sessions_by_pn_and_target(tmp_path, capsys):
+    write_session(tmp_path, "10.0.0.1", "EMB-0001")
+    write_session(tmp_path, "10.0.0.2", "EMB-0002", success=False)
+
+    with LogIndex(log_dir=tmp_path) as index:
+        assert index.update() > 0
+        uploads = index.uploads()
+        assert {(u["target"], u["pn"], u["success"]) for u in uploads} == {
+            ("10.0.0.1", "EMB-0001", True),
+            ("10.0.0.2", "EMB-0002", False),
+        }
+        assert [u["retries"] for u in index.uploads(target="10.0.0.1", pn="EMB-0001")] == [2]
+        phases = index.query(pn="EMB-0002", phase="bin")
+        assert phases and all(r["target"] == "10.0.0.2" for r in phases)
+
+    capsys.readouterr()
+    assert main(["--log-dir", str(tmp_path), "--pn", "EMB-0002", "--event", "upload_result"]) == 0
+    printed = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["bytes"] for r in printed] == [4096]
+
+
+@pytest.mark.hlr92
+@pytest.mark.functional
+def test_cli_help_describes_the_tool(capsys):
+    with pytest.raises(SystemExit):
+        main(["--help"])
+    assert "Consulta os logs estruturados" in capsys.readouterr().out
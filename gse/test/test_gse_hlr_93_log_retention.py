@@ -0,0 +1,160 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.logsGSE import log_retention  # noqa: E402
+from backend.logsGSE.gse_logger import GseLogger  # noqa: E402
+from backend.logsGSE.log_index import LogIndex  # noqa: E402
+from backend.logsGSE.log_retention import (  # noqa: E402
+    LogMaintenance,
+    available_codec,
+    compress_log,
+    open_log,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-93 – Rotação, compressão e retenção dos logs
+# Descrição: O GseLogger deve dividir a sessão em segmentos por tamanho e
+# idade, comprimir em segundo plano os segmentos fechados e limitar a idade e
+# o espaço dos logs; os logs comprimidos continuam consultáveis pelo índice.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def make_log(path, text, age_days=0.0):
+    path.write_text(text, encoding="utf-8")
+    stamp = time.time() - age_days * 86400
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+@pytest.mark.hlr93
+@pytest.mark.functional
+def test_size_rotation_compresses_closed_segments(tmp_path):
+    logger = GseLogger(log_dir=tmp_path, rotate_bytes=2000)
+    for i in range(60):
+        logger.write_log(f"mensagem {i:02d} " + "x" * 40)
+        if i % 10 == 9:
+            logger.flush()
+    active = {Path(path).name for path in logger.session_paths()}
+    assert logger.part >= 3 and Path(logger.get_log_path()).name.endswith(f"_parte{logger.part}.txt")
+
+    closed = lambda: [p for p in tmp_path.glob("GSE_Sessao_*") if p.name not in active]
+    assert wait_for(lambda: all(p.suffix == ".gz" for p in closed()))
+    assert len(closed()) == 2 * (logger.part - 1)
+    logger.close()
+
+    def part(path):
+        stem = path.name.split(".")[0]
+        return int(stem.rsplit("_parte", 1)[1]) if "_parte" in stem else 1
+
+    lines = []
+    for path in sorted(tmp_path.glob("GSE_Sessao_*.txt*"), key=part):
+        with open_log(path) as file:
+            lines += file.read().splitlines()
+    messages = [line[15:26] for line in lines if "] mensagem" in line]
+    assert messages == [f"mensagem {i:02d}" for i in range(60)]
+    assert sum("--- LOG CONTINUA EM GSE_Sessao_" in line for line in lines) == logger.part - 1
+
+
+@pytest.mark.hlr93
+@pytest.mark.functional
+def test_failed_rotation_stops_writer_cleanly(tmp_path, capsys):
+    logger = GseLogger(log_dir=tmp_path, rotate_bytes=200, compression=None)
+
+    def fail():
+        raise OSError("disco cheio")
+
+    logger._open_segment = fail
+    logger.write_log("antes da rotação " + "x" * 200)
+    logger.flush()
+    assert wait_for(lambda: not logger._writer.is_alive())
+    assert logger.log_file is None and logger.jsonl_file is None
+
+    logger.write_log("depois da rotação")
+    logger.flush()
+    logger.close()
+    out = capsys.readouterr().out
+    assert "Falha ao abrir o próximo segmento do log: disco cheio" in out
+    assert "LOG (sem arquivo): depois da rotação" in out
+    assert "Falha ao escrever no log" not in out
+
+
+@pytest.mark.hlr93
+@pytest.mark.functional
+def test_age_rotation(tmp_path):
+    logger = GseLogger(log_dir=tmp_path, flush_interval=0.01, rotate_age=0.05, compression=None)
+    try:
+        logger.write_log("primeira")
+        logger.flush()
+        time.sleep(0.1)
+        logger.write_log("segunda")
+        logger.flush()
+        assert logger.part == 2
+        assert Path(logger.get_log_path()).name.endswith("_parte2.txt")
+    finally:
+        logger.close()
+
+
+@pytest.mark.hlr93
+@pytest.mark.functional
+def test_retention_by_age_and_quota(tmp_path):
+    old = make_log(tmp_path / "GSE_Sessao_2024-01-01_10-00-00.txt", "antigo\n", age_days=120)
+    mid = make_log(tmp_path / "GSE_Sessao_2025-01-01_10-00-00.txt", "m" * 3000, age_days=10)
+    new = make_log(tmp_path / "GSE_Sessao_2025-02-01_10-00-00.txt", "n" * 3000, age_days=1)
+    active = make_log(tmp_path / "GSE_Sessao_2025-03-01_10-00-00.txt", "a" * 9000)
+    other = make_log(tmp_path / "notas.txt", "não é log", age_days=400)
+
+    maintenance = LogMaintenance(tmp_path, codec=None, max_age_days=90, max_bytes=4000, logger=lambda m: None)
+    removed = maintenance.enforce_retention(active=[active])
+    assert removed == [old, mid]
+    assert new.exists() and active.exists() and other.exists()
+
+
+@pytest.mark.hlr93
+@pytest.mark.functional
+def test_compressed_logs_stay_queryable(tmp_path):
+    assert available_codec("zstd") == ("zstd" if log_retention.zstandard else "gzip")
+    record = {"ts": 10.0, "session": "s", "pn": "EMB-0001", "event": "upload_result", "success": True}
+    indexed = make_log(tmp_path / "GSE_Sessao_2025-01-01_10-00-00.jsonl", json.dumps(record) + "\n")
+    record = dict(record, ts=20.0, pn="EMB-0002")
+    fresh = make_log(tmp_path / "GSE_Sessao_2025-01-02_10-00-00.jsonl", json.dumps(record) + "\n")
+
+    with LogIndex(log_dir=tmp_path) as index:
+        assert index.update() == 2
+        LogMaintenance(tmp_path, logger=lambda m: None).run()
+        assert sorted(p.name for p in tmp_path.glob("GSE_Sessao_*")) == [
+            indexed.name + ".gz", fresh.name + ".gz",
+        ]
+        # Já indexados: só trocam de caminho, sem releitura
+        assert index.update() == 0
+        assert [u["pn"] for u in index.uploads()] == ["EMB-0001", "EMB-0002"]
+
+    # Índice novo lê os arquivos comprimidos diretamente
+    with LogIndex(db_path=tmp_path / "outro.sqlite3", log_dir=tmp_path) as index:
+        assert index.update() == 2
+        assert index.uploads(pn="EMB-0002")[0]["ts"] == 20.0
+
+    plain = make_log(tmp_path / "GSE_Sessao_2025-01-03_10-00-00.txt", "linha\n", age_days=2)
+    mtime = plain.stat().st_mtime_ns
+    packed = compress_log(plain)
+    assert not plain.exists() and packed.stat().st_mtime_ns == mtime
+    with open_log(packed) as file:
+        assert file.read() == "linha\n"
@@ -0,0 +1,137 @@
+import hashlib
+import io
+import mmap
+import socket
+import struct
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.hash_utils import calculate_image_hash  # noqa: E402
+from backend.protocols.image_source import open_image_view  # noqa: E402
+from backend.protocols.tftp_client import TFTP_OPCODE, TFTPClient  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-94 – Imagem servida sem cópia
+# Descrição: O BIN pode ser servido a partir de caminho, arquivo ou mmap, com
+# fatias memoryview, sem carregar a imagem inteira na memória.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+PAYLOAD = bytes(range(256)) * 64  # 16 KiB
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "fw.bin"
+    path.write_bytes(PAYLOAD)
+    return path
+
+
+@pytest.mark.hlr94
+@pytest.mark.functional
+def test_open_image_view_accepts_every_source(image_path):
+    with open(image_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        sources = [
+            image_path,
+            str(image_path),
+            f,
+            mapped,
+            io.BytesIO(PAYLOAD),
+            PAYLOAD,
+            bytearray(PAYLOAD),
+        ]
+        for source in sources:
+            with open_image_view(source) as view:
+                assert isinstance(view, memoryview)
+                assert view.readonly
+                assert view[:16].tobytes() == PAYLOAD[:16]
+                assert len(view) == len(PAYLOAD)
+
+
+@pytest.mark.hlr94
+@pytest.mark.functional
+def test_open_image_view_handles_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with open_image_view(path) as view:
+        assert len(view) == 0
+
+
+@pytest.mark.hlr94
+@pytest.mark.functional
+def test_calculate_image_hash_matches_sha256(image_path):
+    assert calculate_image_hash(image_path) == hashlib.sha256(PAYLOAD).digest()
+
+
+@pytest.mark.hlr94
+@pytest.mark.functional
+def test_serve_file_on_rrq_from_path_does_not_copy_image(tmp_path):
+    """Servir um caminho não deve alocar memória proporcional à imagem."""
+    image = tmp_path / "big.bin"
+    size = 8 * 1024 * 1024
+    with open(image, "wb") as f:
+        for _ in range(size // len(PAYLOAD)):
+            f.write(PAYLOAD)
+
+    client = TFTPClient(
+        "127.0.0.1", timeout=2, logger=lambda _msg: None, windowsize=32
+    )
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    gse_addr = client.sock.getsockname()
+    received = {}
+
+    def target():
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.settimeout(2)
+        rrq = struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0windowsize\x0032\0"
+        peer.sendto(rrq, gse_addr)
+        _, tid = peer.recvfrom(2048)
+        peer.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, 0), tid)
+        digest, expected, in_window = hashlib.sha256(), 1, 0
+        while True:
+            pkt, _ = peer.recvfrom(2048)
+            block = struct.unpack("!H", pkt[2:4])[0]
+            if block != expected:
+                peer.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, expected - 1), tid)
+                in_window = 0
+                continue
+            expected = (expected + 1) & 0xFFFF
+            in_window += 1
+            digest.update(pkt[4:])
+            last = len(pkt) - 4 < 512
+            if last or in_window == 32:
+                peer.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, block), tid)
+                in_window = 0
+            if last:
+                break
+        received["digest"] = digest.digest()
+        pkt, _ = peer.recvfrom(2048)
+        received["hash"] = pkt[4:]
+        peer.sendto(struct.pack("!HH", TFTP_OPCODE.ACK.value, expected), tid)
+        peer.close()
+
+    t = threading.Thread(target=target)
+    tracemalloc.start()
+    t.start()
+    try:
+        assert client.serve_file_on_rrq("fw.bin", image, b"H" * 32) is True
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        t.join(timeout=30)
+        client.close()
+
+    assert received["hash"] == b"H" * 32
+    assert received["digest"] == hashlib.sha256(image.read_bytes()).digest()
+    assert peak < size // 8
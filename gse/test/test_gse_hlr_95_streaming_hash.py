@@ -0,0 +1,114 @@
+import hashlib
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols import hash_utils  # noqa: E402
+from backend.protocols.tftp_client import (  # noqa: E402
+    BLOCK_SIZE,
+    TFTP_OPCODE,
+    TFTPClient,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-95 – Hash calculado durante o envio
+# Descrição: O SHA-256 da imagem deve ser acumulado bloco a bloco durante o
+# envio e transmitido como DATA final, em uma única passada pela imagem.
+# Tipo: Requisito Funcional
+# ============================================================================
+
+
+def make_ack_packet(block) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
+
+
+@pytest.mark.hlr95
+@pytest.mark.functional
+def test_streaming_hasher_matches_one_shot_digest():
+    data = bytes(range(256)) * 100
+    hasher = hash_utils.StreamingHasher()
+    view = memoryview(data)
+    for offset in range(0, len(data), 700):
+        hasher.update(view[offset : offset + 700])
+
+    assert hasher.digest() == hashlib.sha256(data).digest()
+    assert hasher.bytes_hashed == len(data)
+
+
+@pytest.mark.hlr95
+@pytest.mark.functional
+def test_streaming_hasher_failure_returns_null_hash(capsys):
+    hasher = hash_utils.StreamingHasher()
+    hasher.update("not-bytes")
+
+    assert hasher.digest() == bytes(32)
+    assert "[HASH-ERRO]" in capsys.readouterr().out
+
+
+@pytest.mark.hlr95
+@pytest.mark.functional
+def test_serve_file_on_rrq_hashes_each_block_once_despite_retransmission():
+    """Com hash_data=None, o HASH enviado é o SHA-256 da imagem, mesmo com perdas."""
+    client = TFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None, windowsize=4)
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    gse_addr = client.sock.getsockname()
+
+    file_data = bytes(range(256)) * 21  # 5376 bytes = 10 blocos cheios + 256
+    received = {}
+
+    def target():
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.settimeout(2)
+        rrq = struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0windowsize\x004\0"
+        peer.sendto(rrq, gse_addr)
+        _, tid = peer.recvfrom(2048)
+        peer.sendto(make_ack_packet(0), tid)
+
+        data, expected, in_window, dropped = b"", 1, 0, False
+        while True:
+            pkt, _ = peer.recvfrom(2048)
+            block = struct.unpack("!H", pkt[2:4])[0]
+            if block == 6 and not dropped:
+                dropped = True  # força retransmissão de blocos já hasheados
+                continue
+            if block != expected:
+                peer.sendto(make_ack_packet(expected - 1), tid)
+                in_window = 0
+                continue
+            data += pkt[4:]
+            expected += 1
+            in_window += 1
+            last = len(pkt) - 4 < BLOCK_SIZE
+            if last or in_window == 4:
+                peer.sendto(make_ack_packet(block), tid)
+                in_window = 0
+            if last:
+                break
+        pkt, _ = peer.recvfrom(2048)
+        while struct.unpack("!H", pkt[2:4])[0] != expected:
+            pkt, _ = peer.recvfrom(2048)  # descarta retransmissões atrasadas
+        peer.sendto(make_ack_packet(expected), tid)
+        received["data"] = data
+        received["hash"] = pkt[4:]
+        peer.close()
+
+    t = threading.Thread(target=target)
+    t.start()
+    try:
+        assert client.serve_file_on_rrq("fw.bin", file_data) is True
+    finally:
+        t.join(timeout=5)
+        client.close()
+
+    assert received["data"] == file_data
+    assert received["hash"] == hashlib.sha256(file_data).digest()
+    assert client.last_served_hash == received["hash"]
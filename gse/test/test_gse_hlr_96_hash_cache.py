@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.hash_cache import HashCache  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-96 – Cache persistente de hash das imagens
+# Descrição: O digest SHA-256 de uma imagem deve ser reutilizado enquanto
+# (caminho, tamanho, mtime_ns, inode) não mudar, com invalidação e limite de
+# entradas.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "EMB-0001.bin"
+    path.write_bytes(b"firmware" * 100)
+    return path
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "gse_storage" / ".hash_cache.json"
+
+
+def digest_of(path):
+    return hashlib.sha256(Path(path).read_bytes()).digest()
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_cached_digest_survives_restart(image, cache_path):
+    HashCache(str(cache_path)).put(str(image), digest_of(image))
+
+    reloaded = HashCache(str(cache_path))
+    assert reloaded.get(str(image)) == digest_of(image)
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_modified_file_invalidates_entry(image, cache_path):
+    cache = HashCache(str(cache_path))
+    cache.put(str(image), digest_of(image))
+
+    image.write_bytes(b"new firmware")
+    st = image.stat()
+    os.utime(image, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert cache.get(str(image)) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_null_digest_is_never_cached(image, cache_path):
+    cache = HashCache(str(cache_path))
+    cache.put(str(image), bytes(32))
+    assert cache.get(str(image)) is None
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_eviction_keeps_most_recently_used(tmp_path, cache_path):
+    cache = HashCache(str(cache_path), max_entries=2)
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"img{i}.bin"
+        p.write_bytes(bytes([i]) * 10)
+        paths.append(p)
+
+    cache.put(str(paths[0]), digest_of(paths[0]))
+    cache.put(str(paths[1]), digest_of(paths[1]))
+    assert cache.get(str(paths[0])) is not None  # img0 passa a ser o mais recente
+    cache.put(str(paths[2]), digest_of(paths[2]))
+
+    assert len(cache) == 2
+    assert cache.get(str(paths[1])) is None
+    assert cache.get(str(paths[0])) == digest_of(paths[0])
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_corrupted_cache_file_starts_empty(image, cache_path):
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    cache = HashCache(str(cache_path))
+    assert len(cache) == 0
+    cache.put(str(image), digest_of(image))
+    assert str(image.resolve()) in json.loads(cache_path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_get_does_not_rewrite_cache_file(tmp_path, cache_path):
+    cache = HashCache(str(cache_path), max_entries=2)
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"img{i}.bin"
+        p.write_bytes(bytes([i]) * 10)
+        paths.append(p)
+    cache.put(str(paths[0]), digest_of(paths[0]))
+    cache.put(str(paths[1]), digest_of(paths[1]))
+    written = cache_path.stat().st_mtime_ns
+    os.utime(cache_path, ns=(written - 10**9, written - 10**9))
+
+    for _ in range(5):
+        assert cache.get(str(paths[0])) == digest_of(paths[0])
+    assert cache_path.stat().st_mtime_ns == written - 10**9
+
+    # A ordem de uso só chega ao disco no close() (ou no próximo put())
+    cache.close()
+    assert list(json.loads(cache_path.read_text(encoding="utf-8"))) == [
+        str(paths[1].resolve()), str(paths[0].resolve()),
+    ]
+    reloaded = HashCache(str(cache_path), max_entries=2)
+    reloaded.put(str(paths[2]), digest_of(paths[2]))
+    assert reloaded.get(str(paths[1])) is None
+    assert reloaded.get(str(paths[0])) == digest_of(paths[0])
+
+
+@pytest.mark.hlr96
+@pytest.mark.functional
+def test_failed_save_keeps_previous_file_and_no_tmp(image, cache_path, monkeypatch):
+    cache = HashCache(str(cache_path), logger=lambda _msg: None)
+    cache.put(str(image), digest_of(image))
+    before = cache_path.read_text(encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    other = image.with_name("EMB-0002.bin")
+    other.write_bytes(b"outro")
+    cache.put(str(other), digest_of(other))
+
+    assert cache_path.read_text(encoding="utf-8") == before
+    assert list(cache_path.parent.glob("*.tmp")) == []
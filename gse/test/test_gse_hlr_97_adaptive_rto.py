@@ -0,0 +1,175 @@
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.rtt_estimator import RttEstimator  # noqa: E402
+from backend.protocols.tftp_client import TFTP_OPCODE, TFTPClient  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-97 – Timeout de retransmissão adaptativo
+# Descrição: O RTO de cada bloco deve derivar do RTT medido na sessão
+# (SRTT/RTTVAR, regra de Karn), com orçamento de retentativas configurável,
+# de modo que a perda de um único pacote seja recuperada em milissegundos.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+SERVER = ("127.0.0.1", 50000)
+
+
+def make_ack_packet(block) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
+
+
+class MockSocket:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+        self.timeouts = []
+
+    def settimeout(self, t):
+        self.timeouts.append(t)
+
+    def gettimeout(self):
+        return self.timeouts[-1] if self.timeouts else None
+
+    def sendto(self, pkt, addr):
+        self.sent.append((pkt, addr))
+
+    def recvfrom(self, n):
+        if not self._responses:
+            raise socket.timeout()
+        return self._responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.mark.hlr97
+@pytest.mark.functional
+def test_estimator_follows_rfc6298():
+    est = RttEstimator(initial_rto=1.0, min_rto=0.01, max_rto=10.0)
+    assert est.rto == 1.0
+
+    est.sample(0.1)
+    assert est.srtt == pytest.approx(0.1)
+    assert est.rttvar == pytest.approx(0.05)
+    assert est.rto == pytest.approx(0.1 + 4 * 0.05)
+
+    est.sample(0.1)
+    assert est.srtt == pytest.approx(0.1)
+    assert est.rttvar == pytest.approx(0.0375)
+
+
+@pytest.mark.hlr97
+@pytest.mark.functional
+def test_estimator_backoff_doubles_until_next_sample():
+    est = RttEstimator(initial_rto=0.5, min_rto=0.05, max_rto=3.0)
+    est.backoff()
+    assert est.rto == pytest.approx(1.0)
+    est.backoff()
+    est.backoff()
+    assert est.rto == pytest.approx(3.0)  # teto max_rto
+
+    est.sample(0.001)
+    assert est.rto == pytest.approx(0.05)  # piso min_rto, backoff desfeito
+
+
+@pytest.mark.hlr97
+@pytest.mark.functional
+def test_duplicate_ack_of_previous_block_is_ignored():
+    """ACK atrasado do bloco anterior não conta como tentativa nem retransmite."""
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None, max_retries=1)
+    sock = MockSocket([(make_ack_packet(4), SERVER), (make_ack_packet(5), SERVER)])
+
+    client._send_data_and_wait_ack(sock, 5, b"x" * 10, SERVER)
+
+    assert len(sock.sent) == 1
+    assert client.retransmit_count == 0
+    assert client.rtt.srtt is not None
+
+
+@pytest.mark.hlr97
+@pytest.mark.functional
+def test_lockstep_without_options_waits_full_timeout_once():
+    """Sem opções negociadas, nada de retransmissão especulativa."""
+    client = TFTPClient("127.0.0.1", timeout=10, logger=lambda _msg: None, max_retries=3)
+    sock = MockSocket([])
+
+    with pytest.raises(Exception, match="após 1 tentativas"):
+        client._send_data_and_wait_ack(sock, 1, b"x", SERVER)
+
+    assert len(sock.sent) == 1
+    assert sock.timeouts == [10]
+    assert client.retransmit_count == 0
+
+
+@pytest.mark.hlr97
+@pytest.mark.functional
+def test_retry_budget_is_configurable():
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None, max_retries=3)
+    client.adaptive_rto = True  # blksize/windowsize aceitos em OACK
+    sock = MockSocket([])
+
+    with pytest.raises(Exception, match="após 3 tentativas"):
+        client._send_data_and_wait_ack(sock, 1, b"x", SERVER)
+
+    assert len(sock.sent) == 3
+    # O RTO dobra a cada timeout (regra de Karn: sem amostras novas)
+    assert sock.timeouts == sorted(sock.timeouts)
+    assert sock.timeouts[-1] > sock.timeouts[0]
+
+
+@pytest.mark.hlr97
+@pytest.mark.functional
+def test_single_loss_recovers_in_milliseconds():
+    """Com blksize negociado, a perda de um DATA é recuperada pelo RTO medido, não pelos 10 s."""
+    client = TFTPClient("127.0.0.1", timeout=10, logger=lambda _msg: None, blksize=1024)
+    assert client.connect()
+    client.sock.bind(("127.0.0.1", 0))
+    gse_addr = client.sock.getsockname()
+    file_data = bytes(range(256)) * 2 * 60 + b"tail"  # 60 blocos + resto
+
+    def target():
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.settimeout(5)
+        peer.sendto(
+            struct.pack("!H", TFTP_OPCODE.RRQ.value) + b"fw.bin\0octet\0blksize\x00512\0",
+            gse_addr,
+        )
+        dropped = False
+        while True:
+            pkt, tid = peer.recvfrom(2048)
+            opcode, block = struct.unpack("!HH", pkt[:4])
+            if opcode == TFTP_OPCODE.OACK.value:
+                peer.sendto(make_ack_packet(0), tid)
+                continue
+            if block == 40 and not dropped:
+                dropped = True
+                continue
+            peer.sendto(make_ack_packet(block), tid)
+            if len(pkt) - 4 == 32 and block == 62:  # HASH
+                break
+        peer.close()
+
+    t = threading.Thread(target=target)
+    t.start()
+    start = time.monotonic()
+    try:
+        assert client.serve_file_on_rrq("fw.bin", file_data, b"H" * 32) is True
+        elapsed = time.monotonic() - start
+    finally:
+        t.join(timeout=15)
+        client.close()
+
+    assert client.retransmit_count >= 1
+    assert elapsed < 1.0
+    assert client.rtt.rto < 0.5
@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.arinc615a import Arinc615ASession  # noqa: E402
+from backend.protocols.tftp_async import AsyncTFTPClient  # noqa: E402
+from backend.protocols.tftp_client import TFTP_OPCODE, TFTPClient  # noqa: E402
+from backend.simulation.bc_simulator import BCSimulator  # noqa: E402
+
+# ============================================================================
+# REQ: GSE-HLR-98 – Transporte TFTP assíncrono
+# Descrição: As operações do TFTPClient devem estar disponíveis como corrotinas
+# asyncio, com o mesmo comportamento do transporte bloqueante, permitindo
+# várias transferências simultâneas em um único laço de eventos.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+def make_data_packet(block, payload: bytes) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.DATA.value, block) + payload
+
+
+def make_ack_packet(block) -> bytes:
+    return struct.pack("!HH", TFTP_OPCODE.ACK.value, block)
+
+
+def rrq_peer(gse_addr, filename, received):
+    """Alvo que pede o BIN por RRQ (sem opções) e guarda dados + HASH."""
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.settimeout(5)
+    peer.sendto(struct.pack("!H", TFTP_OPCODE.RRQ.value) + filename + b"\0octet\0", gse_addr)
+    data = b""
+    expected = 1
+    while True:
+        pkt, tid = peer.recvfrom(2048)
+        block = struct.unpack("!H", pkt[2:4])[0]
+        peer.sendto(make_ack_packet(block), tid)
+        if block != expected:
+            continue
+        expected += 1
+        if received.get("done"):
+            received["hash"] = pkt[4:]
+            break
+        if len(pkt) - 4 < 512:
+            received["done"] = True
+        data += pkt[4:]
+    received["data"] = data
+    peer.close()
+
+
+@pytest.mark.hlr98
+@pytest.mark.functional
+def test_concurrent_serves_share_one_loop():
+    images = [bytes([i]) * (3000 + 700 * i) for i in range(4)]
+    results = [{} for _ in images]
+
+    async def serve_one(image, received):
+        client = AsyncTFTPClient("127.0.0.1", timeout=5, logger=lambda _msg: None)
+        assert await client.connect(("127.0.0.1", 0))
+        t = threading.Thread(
+            target=rrq_peer, args=(client.sock.getsockname(), b"fw.bin", received)
+        )
+        t.start()
+        try:
+            return await client.serve_file_on_rrq("fw.bin", image), client
+        finally:
+            await asyncio.get_running_loop().run_in_executor(None, t.join, 10)
+            client.close()
+
+    async def main():
+        return await asyncio.gather(
+            *(serve_one(image, received) for image, received in zip(images, results))
+        )
+
+    outcomes = asyncio.run(main())
+
+    for image, received, (ok, client) in zip(images, results, outcomes):
+        assert ok is True
+        assert received["data"] == image
+        assert received["hash"] == hashlib.sha256(image).digest()
+        assert client.last_served_hash == received["hash"]
+
+
+@pytest.mark.hlr98
+@pytest.mark.functional
+def test_read_and_write_file_against_stand_in_server():
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(5)
+    lui = b"L" * 700
+    received = {}
+
+    def stand_in_server():
+        # RRQ: dois blocos em lock-step
+        _rrq, client_addr = server.recvfrom(2048)
+        transfer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        transfer.settimeout(5)
+        for block, offset in ((1, 0), (2, 512)):
+            transfer.sendto(make_data_packet(block, lui[offset : offset + 512]), client_addr)
+            transfer.recvfrom(16)
+        transfer.close()
+
+        # WRQ: ACK(0) pela porta de transferência, depois DATA/ACK
+        _wrq, client_addr = server.recvfrom(2048)
+        transfer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        transfer.settimeout(5)
+        transfer.sendto(make_ack_packet(0), client_addr)
+        data = b""
+        while True:
+            pkt, addr = transfer.recvfrom(2048)
+            block = struct.unpack("!H", pkt[2:4])[0]
+            data += pkt[4:]
+            transfer.sendto(make_ack_packet(block), addr)
+            if len(pkt) - 4 < 512:
+                break
+        received["lur"] = data
+        transfer.close()
+
+    async def main():
+        client = AsyncTFTPClient("127.0.0.1", timeout=5, logger=lambda _msg: None)
+        client.server_port_69 = server.getsockname()[1]
+        assert await client.connect(("127.0.0.1", 0))
+        try:
+            data = await client.read_file("system.LUI")
+            ok = await client.write_file("test.LUR", b"R" * 600)
+        finally:
+            client.close()
+        return data, ok
+
+    t = threading.Thread(target=stand_in_server)
+    t.start()
+    try:
+        data, ok = asyncio.run(main())
+    finally:
+        t.join(timeout=10)
+        server.close()
+
+    assert data == lui
+    assert ok is True
+    assert received["lur"] == b"R" * 600
+
+
+@pytest.mark.hlr98
+@pytest.mark.functional
+def test_receive_wrq_timeout_raises_timeout_error():
+    async def main():
+        client = AsyncTFTPClient("127.0.0.1", timeout=0.2, logger=lambda _msg: None)
+        assert await client.connect(("127.0.0.1", 0))
+        try:
+            await client.receive_wrq_and_data()
+        finally:
+            client.close()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+
+
+@pytest.mark.hlr98
+@pytest.mark.functional
+def test_auth_helpers_are_coroutines():
+    async def main():
+        client = AsyncTFTPClient("127.0.0.1", timeout=2, logger=lambda _msg: None)
+        assert await client.connect(("127.0.0.1", 0))
+        peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        peer.bind(("127.0.0.1", 0))
+        peer.settimeout(2)
+        client.server_port_69 = peer.getsockname()[1]
+        try:
+            peer.sendto(make_ack_packet(1), client.sock.getsockname())
+            assert await client.recv_ack_packet() == 1
+            peer.sendto(make_data_packet(1, b"chave"), client.sock.getsockname())
+            assert await client.recv_data_packet() == (1, b"chave")
+            assert client.send_ack(1) is True
+            assert peer.recvfrom(16)[0] == make_ack_packet(1)
+
+            # Nenhum caminho herdado pode executar recvfrom síncrono no endpoint
+            with pytest.raises(TypeError):
+                TFTPClient.recv_ack_packet(client)
+        finally:
+            client.close()
+            peer.close()
+
+    asyncio.run(main())
+
+
+@pytest.mark.hlr98
+@pytest.mark.functional
+def test_upload_flow_async_runs_the_same_steps(tmp_path):
+    image = tmp_path / "EMB-0001.bin"
+    image.write_bytes(bytes(range(256)) * 40 + b"tail")
+
+    def steps(logs):
+        return [msg for msg in logs if msg.startswith("[ARINC]")]
+
+    sync_logs, async_logs = [], []
+    with BCSimulator() as sim:
+        client = TFTPClient(sim.host, server_port=sim.port, timeout=2, logger=lambda _msg: None)
+        assert client.connect()
+        try:
+            assert Arinc615ASession(client, logger=sync_logs.append).run_upload_flow(
+                str(image), "EMB-0001"
+            )
+        finally:
+            client.close()
+
+        async def main():
+            client = AsyncTFTPClient(
+                sim.host, server_port=sim.port, timeout=2, logger=lambda _msg: None
+            )
+            assert await client.connect(("127.0.0.1", 0))
+            try:
+                session = Arinc615ASession(client, logger=async_logs.append)
+                return await session.run_upload_flow_async(str(image), "EMB-0001")
+            finally:
+                client.close()
+
+        result = asyncio.run(main())
+        assert sim.wait_for_uploads(2, timeout=5)
+
+    assert result and list(result.phases)[-1] == "lus_final"
+    assert all(r["hash_ok"] for r in sim.results)
+    assert steps(async_logs) == steps(sync_logs)
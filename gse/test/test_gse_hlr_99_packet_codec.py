@@ -0,0 +1,69 @@
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.protocols.tftp_client import TFTP_OPCODE, TFTPClient  # noqa: E402
+from backend.protocols.tftp_codec import (  # noqa: E402
+    OP_ACK,
+    OP_DATA,
+    PacketWriter,
+    build_ack,
+    build_data,
+    parse_header,
+    parse_opcode,
+)
+
+# ============================================================================
+# REQ: GSE-HLR-99 – Codec de pacotes do caminho quente
+# Descrição: Cabeçalhos DATA/ACK devem ser lidos com structs pré-compilados
+# direto do buffer recebido e pacotes DATA montados em um buffer reutilizável,
+# com resultado idêntico ao formato RFC 1350.
+# Tipo: Requisito Não Funcional
+# ============================================================================
+
+
+@pytest.mark.hlr99
+@pytest.mark.functional
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_parse_header_reads_any_buffer(wrap):
+    pkt = wrap(struct.pack("!HH", TFTP_OPCODE.DATA.value, 513) + b"payload")
+    assert parse_header(pkt) == (OP_DATA, 513)
+    assert parse_opcode(pkt) == OP_DATA
+
+
+@pytest.mark.hlr99
+@pytest.mark.functional
+def test_short_packets_are_not_parsed():
+    assert parse_header(b"\x00\x04\x00") == (0, 0)
+    assert parse_opcode(b"\x00") == 0
+
+
+@pytest.mark.hlr99
+@pytest.mark.functional
+def test_builders_match_wire_format():
+    payload = bytes(range(100))
+    expected = struct.pack("!HH", TFTP_OPCODE.DATA.value, 7) + payload
+    assert build_ack(9) == struct.pack("!HH", TFTP_OPCODE.ACK.value, 9)
+    assert build_data(7, memoryview(payload)) == expected
+
+    writer = PacketWriter(128)
+    assert bytes(writer.data(7, payload)) == expected
+    # O buffer é reutilizado: o pacote seguinte pode ser menor
+    assert bytes(writer.data(8, b"end")) == struct.pack("!HH", OP_DATA, 8) + b"end"
+    with pytest.raises(ValueError):
+        writer.data(9, bytes(129))
+
+
+@pytest.mark.hlr99
+@pytest.mark.functional
+def test_client_parsers_keep_enum_interface():
+    client = TFTPClient("127.0.0.1", logger=lambda _msg: None)
+    assert client._parse_ack_packet(build_ack(3)) == (TFTP_OPCODE.ACK, 3)
+    assert client._parse_data_packet(build_data(4, b"xy")) == (TFTP_OPCODE.DATA, 4, b"xy")
+    assert parse_header(build_ack(3))[0] == OP_ACK